@@ -33,6 +33,8 @@ from .optimization import GradientBoostedRegressionTreeOptimization, GBRT
 from .optimization import RandomForestOptimization, RF
 from .optimization import ExtraTreesOptimization, ET
 from .optimization import DummySearch
+from .optimization import HyperbandOptimization
+from .pruners import MedianPruner, PercentilePruner, SuccessiveHalvingPruner
 from .space import Real
 from .space import Integer
 from .space import Categorical
@@ -53,6 +55,10 @@ __all__ = [
     "ExtraTreesOptimization",
     "ET",
     "DummySearch",
+    "HyperbandOptimization",
+    "MedianPruner",
+    "PercentilePruner",
+    "SuccessiveHalvingPruner",
     #################### Search Space ####################
     "Real",
     "Integer",
@@ -6,7 +6,7 @@ from hyperparameter_hunter.callbacks.bases import BaseAggregatorCallback
 ##################################################
 # Import Miscellaneous Assets
 ##################################################
-from datetime import datetime
+from datetime import datetime, timedelta
 import numpy as np
 
 
@@ -17,6 +17,7 @@ class AggregatorTimes(BaseAggregatorCallback):
         self._rep = None
         self._fold = None
         self._run = None
+        self._fit_time_offset = 0
         super().__init__()
 
     def on_experiment_start(self):
@@ -40,6 +41,17 @@ class AggregatorTimes(BaseAggregatorCallback):
         super().on_run_start()
 
     def on_run_end(self):
+        if self._fit_time_offset:
+            # Models fit in worker processes: Count the time spent fitting, rather than the time
+            # spent waiting for the fit, so times match those recorded when fitting serially
+            offset = timedelta(seconds=self._fit_time_offset)
+            times = self.stat_aggregates["times"]
+            for key in ["runs", "folds", "reps"]:
+                if times[key] and isinstance(times[key][-1], datetime):
+                    times[key][-1] -= offset
+            if isinstance(times["total_elapsed"], datetime):
+                times["total_elapsed"] -= offset
+
         self.__to_elapsed("runs")
         super().on_run_end()
 
@@ -68,6 +68,14 @@ class BaseCallback(object):
     #     if key == 'stat_aggregates':
     #         self.__dict__[key] = value
 
+    #: If True, the callback modifies the fold datasets (like :attr:`fold_train_input`) in-place,
+    #: so :class:`experiments.BaseCVExperiment` gives each fold copies, rather than views
+    mutates_fold_data = False
+    #: If True, the callback's `on_repetition_start`, `on_fold_start`, or `on_run_start` may change
+    #: what Models are fit on (like the fold datasets, :attr:`model_init_params`, or the seeds), so
+    #: :class:`experiments.BaseCVExperiment` fits Models serially, rather than in worker processes
+    affects_fit = False
+
     def __init__(self):
         """Uncalled - See 'Notes' section of :class:`callbacks.bases.BaseCallback` for details"""
         print("I should not be printed. Ever.")
@@ -118,6 +126,8 @@ def lambda_callback(
     on_run_start=None,
     on_run_end=None,
     agg_name=None,
+    mutates_fold_data=False,
+    affects_fit=None,
 ):
     """Utility for creating custom callbacks to be declared by :class:`Environment` and used by
     Experiments. The callable "on_<...>_<start/end>" parameters provided will receive as input
@@ -152,6 +162,14 @@ def lambda_callback(
         :attr:`hyperparameter_hunter.experiments.BaseExperiment.stat_aggregates`. The purpose of
         this parameter is to make it easier to understand an Experiment's description file, as
         `agg_name` will default to a UUID if it is not given
+    mutates_fold_data: Boolean, default=False
+        If True, the callables modify the Experiment's fold datasets in-place (like
+        `fold_train_input`), so each fold's datasets must be copies of the full datasets, rather
+        than views. See :attr:`BaseCallback.mutates_fold_data`
+    affects_fit: Boolean, or None, default=None
+        If True, the callables may change what Models are fit on before they are fit, so Models
+        cannot be fit ahead of time in worker processes. See :attr:`BaseCallback.affects_fit`. If
+        None, True if any of `on_repetition_start`, `on_fold_start`, or `on_run_start` is given
 
     Returns
     -------
@@ -219,7 +237,14 @@ def lambda_callback(
         ("on_experiment_end", on_experiment_end, "final"),
     ]
 
-    LambdaCallback = type("LambdaCallback", (BaseCallback,), dict())
+    if affects_fit is None:
+        affects_fit = any(_ is not None for _ in [on_repetition_start, on_fold_start, on_run_start])
+
+    LambdaCallback = type(
+        "LambdaCallback",
+        (BaseCallback,),
+        dict(mutates_fold_data=mutates_fold_data, affects_fit=affects_fit),
+    )
     agg_name = "_{}".format(agg_name or str(uuid()))
     does_aggregate = False
     aggregated_shapes = dict(runs=None, folds=None)
@@ -18,6 +18,8 @@ class PredictorOOF(BasePredictorCallback):
         self.run_validation_predictions = None
         self.validation_index = None
         self.experiment_params = None
+        self._final_oof_values = None
+        self._repetition_oof_values = None
         super().__init__()
 
     def on_experiment_start(self):
@@ -34,42 +36,52 @@ class PredictorOOF(BasePredictorCallback):
             if not hasattr(self, attr):
                 raise AttributeError("Missing required `PredictorOOF` attribute: {}".format(attr))
 
-        self.final_oof_predictions = self.__zeros_df()
+        shape = (len(self.train_dataset), len(self.target_column))
+        self._final_oof_values = np.zeros(shape)
+        self._repetition_oof_values = np.zeros(shape)
+        self.final_oof_predictions = _predictions_frame(self._final_oof_values, self.target_column)
         super().on_experiment_start()
 
     def on_repetition_start(self):
-        self.repetition_oof_predictions = self.__zeros_df()
+        self._repetition_oof_values.fill(0)
+        self.repetition_oof_predictions = _predictions_frame(
+            self._repetition_oof_values, self.target_column
+        )
         super().on_repetition_start()
 
     def on_run_end(self):
-        self.run_validation_predictions = self.model.predict(self.fold_validation_input)
-        self.run_validation_predictions = _format_predictions(
-            self.run_validation_predictions, self.target_column, index=self.validation_index
+        run_values = _format_prediction_values(
+            self.model.predict(self.fold_validation_input), self.target_column
+        )
+        # `run_values` is never modified, so the DataFrame can safely own it without a copy
+        self.run_validation_predictions = _predictions_frame(
+            run_values, self.target_column, index=self.validation_index, copy=False
         )
 
-        self.repetition_oof_predictions.iloc[
-            self.validation_index
-        ] += self.run_validation_predictions
-
+        self._repetition_oof_values[self.validation_index] += run_values
         super().on_run_end()
 
     def on_fold_end(self):
-        self.repetition_oof_predictions.iloc[self.validation_index] /= self.experiment_params[
-            "runs"
-        ]
+        self._repetition_oof_values[self.validation_index] /= self.experiment_params["runs"]
+        self.repetition_oof_predictions = _predictions_frame(
+            self._repetition_oof_values, self.target_column
+        )
         super().on_fold_end()
 
     def on_repetition_end(self):
-        self.final_oof_predictions += self.repetition_oof_predictions
+        # Rebuild from the array, which may have been restored from a checkpoint after `on_fold_end`
+        self.repetition_oof_predictions = _predictions_frame(
+            self._repetition_oof_values, self.target_column
+        )
+        self._final_oof_values += self._repetition_oof_values
+        self.final_oof_predictions = _predictions_frame(self._final_oof_values, self.target_column)
         super().on_repetition_end()
 
     def on_experiment_end(self):
-        self.final_oof_predictions /= self.cv_params.get("n_repeats", 1)
+        self._final_oof_values /= self.cv_params.get("n_repeats", 1)
+        self.final_oof_predictions = _predictions_frame(self._final_oof_values, self.target_column)
         super().on_experiment_end()
 
-    def __zeros_df(self):
-        return pd.DataFrame(0, index=np.arange(len(self.train_dataset)), columns=self.target_column)
-
 
 class PredictorHoldout(BasePredictorCallback):
     def __init__(self):
@@ -79,41 +91,45 @@ class PredictorHoldout(BasePredictorCallback):
         self.fold_holdout_predictions = None
         self.run_holdout_predictions = None
         self.experiment_params = None
+        self._holdout_values = None
         super().__init__()
 
     def on_experiment_start(self):
-        self.final_holdout_predictions = 0
+        self._holdout_values = _PredictionAccumulator(
+            len(self.holdout_input_data), self.target_column
+        )
+        self.final_holdout_predictions = self._holdout_values.frame("final")
         super().on_experiment_start()
 
     def on_repetition_start(self):
-        self.repetition_holdout_predictions = 0
+        self.repetition_holdout_predictions = self._holdout_values.reset("repetition")
         super().on_repetition_start()
 
     def on_fold_start(self):
-        self.fold_holdout_predictions = 0
+        self.fold_holdout_predictions = self._holdout_values.reset("fold")
         super().on_fold_start()
 
     def on_run_end(self):
-        self.run_holdout_predictions = self.model.predict(self.holdout_input_data)
-        self.run_holdout_predictions = _format_predictions(
-            self.run_holdout_predictions, self.target_column
+        self.run_holdout_predictions = self._holdout_values.add_run(
+            self.model.predict(self.holdout_input_data)
         )
-
-        self.fold_holdout_predictions += self.run_holdout_predictions
         super().on_run_end()
 
     def on_fold_end(self):
-        self.fold_holdout_predictions /= self.experiment_params["runs"]
-        self.repetition_holdout_predictions += self.fold_holdout_predictions
+        self._holdout_values.end_fold(self.experiment_params["runs"])
+        self.fold_holdout_predictions = self._holdout_values.frame("fold")
+        self.repetition_holdout_predictions = self._holdout_values.frame("repetition")
         super().on_fold_end()
 
     def on_repetition_end(self):
-        self.repetition_holdout_predictions /= self.cv_params["n_splits"]
-        self.final_holdout_predictions += self.repetition_holdout_predictions
+        self._holdout_values.end_repetition(self.cv_params["n_splits"])
+        self.repetition_holdout_predictions = self._holdout_values.frame("repetition")
+        self.final_holdout_predictions = self._holdout_values.frame("final")
         super().on_repetition_end()
 
     def on_experiment_end(self):
-        self.final_holdout_predictions /= self.cv_params.get("n_repeats", 1)
+        self._holdout_values.end_experiment(self.cv_params.get("n_repeats", 1))
+        self.final_holdout_predictions = self._holdout_values.frame("final")
         super().on_experiment_end()
 
 
@@ -125,46 +141,216 @@ class PredictorTest(BasePredictorCallback):
         self.fold_test_predictions = None
         self.run_test_predictions = None
         self.experiment_params = None
+        self._test_values = None
         super().__init__()
 
     def on_experiment_start(self):
-        self.final_test_predictions = 0
+        self._test_values = _PredictionAccumulator(len(self.test_input_data), self.target_column)
+        self.final_test_predictions = self._test_values.frame("final")
         super().on_experiment_start()
 
     def on_repetition_start(self):
-        self.repetition_test_predictions = 0
+        self.repetition_test_predictions = self._test_values.reset("repetition")
         super().on_repetition_start()
 
     def on_fold_start(self):
-        self.fold_test_predictions = 0
+        self.fold_test_predictions = self._test_values.reset("fold")
         super().on_fold_start()
 
     def on_run_end(self):
-        self.run_test_predictions = self.model.predict(self.test_input_data)
-        self.run_test_predictions = _format_predictions(
-            self.run_test_predictions, self.target_column
+        self.run_test_predictions = self._test_values.add_run(
+            self.model.predict(self.test_input_data)
         )
+        super().on_run_end()
+
+    def on_fold_end(self):
+        self._test_values.end_fold(self.experiment_params["runs"])
+        self.fold_test_predictions = self._test_values.frame("fold")
+        self.repetition_test_predictions = self._test_values.frame("repetition")
+        super().on_fold_end()
+
+    def on_repetition_end(self):
+        self._test_values.end_repetition(self.cv_params["n_splits"])
+        self.repetition_test_predictions = self._test_values.frame("repetition")
+        self.final_test_predictions = self._test_values.frame("final")
+        super().on_repetition_end()
+
+    def on_experiment_end(self):
+        self._test_values.end_experiment(self.cv_params.get("n_repeats", 1))
+        self.final_test_predictions = self._test_values.frame("final")
+        super().on_experiment_end()
+
 
-        self.fold_test_predictions += self.run_test_predictions
+class PredictorStaged(BasePredictorCallback):
+    def __init__(self):
+        """Uncalled - See 'Notes' section of :class:`callbacks.bases.BaseCallback` for details
+
+        Notes
+        -----
+        Added to Experiments given `staged_estimators`. After each run, the fitted model makes
+        out-of-fold, holdout, and test predictions using only its first boosting rounds (or the
+        weights of a Keras model after its first epochs), once for each number of rounds in
+        `staged_estimators`. These are averaged exactly like the
+        predictions of :class:`PredictorOOF`, :class:`PredictorHoldout`, and
+        :class:`PredictorTest`, producing the final predictions the Experiment would have made if
+        its number of boosting rounds had been each value in `staged_estimators`"""
+        self.staged_estimators = None
+        self.staged_predictions = None
+        self.validation_index = None
+        self.experiment_params = None
+        self._staged_values = None
+        super().__init__()
+
+    def on_experiment_start(self):
+        self._staged_values = dict()
+        for n_rounds in self.staged_estimators:
+            self._staged_values[n_rounds] = dict(
+                oof=_PredictionAccumulator(len(self.train_dataset), self.target_column)
+            )
+            if self.holdout_input_data is not None:
+                self._staged_values[n_rounds]["holdout"] = _PredictionAccumulator(
+                    len(self.holdout_input_data), self.target_column
+                )
+            if self.test_input_data is not None:
+                self._staged_values[n_rounds]["test"] = _PredictionAccumulator(
+                    len(self.test_input_data), self.target_column
+                )
+        self.staged_predictions = None
+        super().on_experiment_start()
+
+    def on_repetition_start(self):
+        for accumulators in self._staged_values.values():
+            for accumulator in accumulators.values():
+                accumulator.reset("repetition")
+        super().on_repetition_start()
+
+    def on_fold_start(self):
+        for accumulators in self._staged_values.values():
+            for accumulator in accumulators.values():
+                accumulator.reset("fold")
+        super().on_fold_start()
+
+    def on_run_end(self):
+        input_data = dict(oof=self.fold_validation_input)
+        input_data.update(holdout=self.holdout_input_data, test=self.test_input_data)
+        for data_type in self._staged_values[self.staged_estimators[0]]:
+            stages = self.model.staged_predict(input_data[data_type], self.staged_estimators)
+            index = self.validation_index if data_type == "oof" else None
+
+            for n_rounds, predictions in stages.items():
+                self._staged_values[n_rounds][data_type].add_run(predictions, index=index)
         super().on_run_end()
 
     def on_fold_end(self):
-        self.fold_test_predictions /= self.experiment_params["runs"]
-        self.repetition_test_predictions += self.fold_test_predictions
+        for accumulators in self._staged_values.values():
+            for accumulator in accumulators.values():
+                accumulator.end_fold(self.experiment_params["runs"])
         super().on_fold_end()
 
     def on_repetition_end(self):
-        self.repetition_test_predictions /= self.cv_params["n_splits"]
-        self.final_test_predictions += self.repetition_test_predictions
+        for accumulators in self._staged_values.values():
+            for data_type, accumulator in accumulators.items():
+                # Each row is predicted in only one fold out-of-fold, so OOF sums aren't averaged
+                accumulator.end_repetition(1 if data_type == "oof" else self.cv_params["n_splits"])
         super().on_repetition_end()
 
     def on_experiment_end(self):
-        self.final_test_predictions /= self.cv_params.get("n_repeats", 1)
+        self.staged_predictions = dict()
+        for n_rounds, accumulators in self._staged_values.items():
+            for accumulator in accumulators.values():
+                accumulator.end_experiment(self.cv_params.get("n_repeats", 1))
+            self.staged_predictions[n_rounds] = {
+                _k: _v.frame("final") for _k, _v in accumulators.items()
+            }
         super().on_experiment_end()
 
 
-def _format_predictions(predictions, target_column, index=None, dtype=np.float64):
-    """Organize predictions into a standard format, and one-hot encode predictions as necessary
+class _PredictionAccumulator(object):
+    def __init__(self, n_rows, target_column):
+        """Preallocated arrays in which the predictions of every run are summed and averaged for
+        each fold, repetition, and the entire Experiment. Used by :class:`PredictorHoldout`, and
+        :class:`PredictorTest`, whose predictions are made for the same rows in every run. The
+        arrays are updated in-place, so DataFrames of their values are built by :meth:`frame`
+        only when a division ends, rather than kept as views of the arrays
+
+        Parameters
+        ----------
+        n_rows: Int
+            The number of rows of input data for which predictions are made
+        target_column: List
+            A list of one or more strings corresponding to the name(s) of target output column(s)"""
+        self.target_column = target_column
+        shape = (n_rows, len(target_column))
+        self.values = {_: np.zeros(shape) for _ in ["fold", "repetition", "final"]}
+
+    def frame(self, division):
+        """Return a DataFrame of the current values of `division` ("fold", "repetition", or
+        "final"). It is a copy, so it is unaffected by later in-place updates of the array"""
+        return _predictions_frame(self.values[division], self.target_column)
+
+    def reset(self, division):
+        """Zero the array of `division` in-place, and return a DataFrame of its values"""
+        self.values[division].fill(0)
+        return self.frame(division)
+
+    def add_run(self, predictions, index=None):
+        """Add a run's raw `predictions` to the fold sum, and return them as a DataFrame. If
+        `index` is given, `predictions` are only for the rows at those positions, as is the case
+        for out-of-fold predictions"""
+        run_values = _format_prediction_values(predictions, self.target_column)
+        if index is None:
+            self.values["fold"] += run_values
+        else:
+            self.values["fold"][index] += run_values
+        return _predictions_frame(run_values, self.target_column, index=index, copy=False)
+
+    def end_fold(self, runs):
+        """Average the fold sum over `runs`, then add it to the repetition sum"""
+        self.values["fold"] /= runs
+        self.values["repetition"] += self.values["fold"]
+
+    def end_repetition(self, n_splits):
+        """Average the repetition sum over `n_splits`, then add it to the final sum"""
+        self.values["repetition"] /= n_splits
+        self.values["final"] += self.values["repetition"]
+
+    def end_experiment(self, n_repeats):
+        """Average the final sum over `n_repeats`"""
+        self.values["final"] /= n_repeats
+
+    def restore(self, other):
+        """Copy the values of another :class:`_PredictionAccumulator` into this one in-place, as
+        when resuming an Experiment from a checkpoint"""
+        for division, values in other.values.items():
+            self.values[division][...] = values
+
+
+def _predictions_frame(values, target_column, index=None, copy=True):
+    """Build a DataFrame of a 2-dimensional array of prediction values
+
+    Parameters
+    ----------
+    values: np.ndarray
+        Float array of shape (<number of rows>, `len(target_column)`)
+    target_column: List
+        A list of one or more strings corresponding to the name(s) of target output column(s)
+    index: Array-like, or None, default=None
+        Index to use for the resulting DataFrame. Defaults to `numpy.arange(len(values))`
+    copy: Boolean, default=True
+        If True, the DataFrame holds a copy of `values`. Only set to False if `values` is never
+        modified after this call. DataFrames are not kept as views of arrays that are updated
+        in-place, because pandas does not guarantee that views reflect such updates (as with
+        Copy-on-Write)
+
+    Returns
+    -------
+    pandas.DataFrame
+        DataFrame of `values`"""
+    return pd.DataFrame(data=values, index=index, columns=target_column, copy=copy)
+
+
+def _format_prediction_values(predictions, target_column, dtype=np.float64):
+    """Organize predictions into a 2-dimensional array, and one-hot encode them as necessary
 
     Parameters
     ----------
@@ -172,20 +358,17 @@ def _format_predictions(predictions, target_column, index=None, dtype=np.float64
         A model's predictions for a set of input data
     target_column: List
         A list of one or more strings corresponding to the name(s) of target output column(s)
-    index: Array-like, or None, default=None
-        Index to use for the resulting DataFrame. Defaults to `numpy.arange(len(predictions))`
-    dtype: Dtype, or None, default=`numpy.float64`
-        Datatype to force on `predictions`. If None, datatype will be inferred
+    dtype: Dtype, default=`numpy.float64`
+        Datatype to force on `predictions`
 
     Returns
     -------
-    predictions: `pandas.DataFrame`
-        Formatted DataFrame containing `predictions` that has been one-hot encoded if necessary"""
+    np.ndarray
+        Array of shape (<number of predictions>, `len(target_column)`)"""
     if (len(target_column) > 1) and ((len(predictions.shape) == 1) or (predictions.shape[1] == 1)):
-        predictions = pd.get_dummies(predictions).values
+        predictions = pd.get_dummies(np.ravel(predictions)).values
 
-    predictions = pd.DataFrame(data=predictions, index=index, columns=target_column, dtype=dtype)
-    return predictions
+    return np.asarray(predictions, dtype=dtype).reshape(len(predictions), len(target_column))
 
 
 if __name__ == "__main__":
@@ -28,13 +28,16 @@ from hyperparameter_hunter.settings import G, ASSETS_DIRNAME, RESULT_FILE_SUB_DI
 from hyperparameter_hunter.reporting import ReportingHandler
 from hyperparameter_hunter.key_handler import CrossExperimentKeyMaker
 from hyperparameter_hunter.utils.boltons_utils import remap
-from hyperparameter_hunter.utils.file_utils import make_dirs, read_json
+from hyperparameter_hunter.utils.file_utils import make_dirs, read_dataset, read_json
+from hyperparameter_hunter.utils.file_utils import validate_prediction_format
 from hyperparameter_hunter.utils.general_utils import Alias
 from hyperparameter_hunter.utils.result_utils import format_predictions, default_do_full_save
+from hyperparameter_hunter.utils.shared_memory_utils import SharedDataPlane
 
 ##################################################
 # Import Miscellaneous Assets
 ##################################################
+import atexit
 from inspect import signature, isclass
 import numpy as np
 import os.path
@@ -70,7 +73,10 @@ class Environment:
             heartbeat_path=None, float_format="{:.5f}", console_params=None, heartbeat_params=None
         ),
         to_csv_params=dict(),
+        data_loading_params=dict(),
+        prediction_format="csv",
         do_full_save=default_do_full_save,
+        n_jobs=1,
     )
 
     @Alias("cv_type", ["cross_validation_type"])
@@ -102,7 +108,10 @@ class Environment:
         file_blacklist=None,
         reporting_params=None,
         to_csv_params=None,
+        data_loading_params=None,
+        prediction_format=None,
         do_full_save=None,
+        n_jobs=None,
         experiment_callbacks=None,
         experiment_recorders=None,
     ):
@@ -113,9 +122,9 @@ class Environment:
         train_dataset: Pandas.DataFrame, or str path
             The training data for the experiment. Will be split into train/holdout data, if
             applicable, and train/validation data if cross-validation is to be performed. If str,
-            will attempt to read file at path via :func:`pandas.read_csv`. For more information on
-            which columns will be used during fitting/predicting, see the "Dataset columns" note
-            in the "Notes" section below
+            will attempt to read file at path via :func:`utils.file_utils.read_dataset`, according
+            to `data_loading_params`. For more information on which columns will be used during
+            fitting/predicting, see the "Dataset columns" note in the "Notes" section below
         environment_params_path: String path, or None, default=None
             If not None and is valid .json filepath containing an object (dict), the file's contents
             are treated as the default values for all keys that match any of the below kwargs used
@@ -164,15 +173,18 @@ class Environment:
             If pd.DataFrame, this is the holdout dataset. If callable, expects a function that takes
             (self.train: DataFrame, self.target_column: str) as input and returns the new
             (self.train: DataFrame, self.holdout: DataFrame). If str, will attempt to read file at
-            path via :func:`pandas.read_csv`. Else, there is no holdout set. For more information on
-            which columns will be used during fitting/predicting, see the "Dataset columns" note
-            in the "Notes" section below
+            path via :func:`utils.file_utils.read_dataset`, as for `train_dataset`. Else, there is
+            no holdout set. Splitting a memory-mapped `train_dataset` with a callable copies it into
+            memory, so large holdout datasets should be given as separate files. For more
+            information on which columns will be used during fitting/predicting, see the "Dataset
+            columns" note in the "Notes" section below
         test_dataset: Pandas.DataFrame, str path, or None, default=None
             The testing data for the experiment. Structure should be identical to that of
             `train_dataset`, except its `target_column` column can be empty or non-existent, because
             `test_dataset` predictions will never be evaluated. If str, will attempt to read file at
-            path via :func:`pandas.read_csv`. For more information on which columns will be used
-            during fitting/predicting, see the "Dataset columns" note in the "Notes" section below
+            path via :func:`utils.file_utils.read_dataset`, as for `train_dataset`. For more
+            information on which columns will be used during fitting/predicting, see the "Dataset
+            columns" note in the "Notes" section below
         target_column: Str, or list, default='target'
             If str, denotes the column name in all provided datasets (except test) that contains the
             target output. If list, should be a list of strs designating multiple target columns.
@@ -279,7 +291,35 @@ class Environment:
             are saved, so the values here will affect the format of the .csv prediction files.
             Warning: If `to_csv_params` contains the key "path_or_buf", it will be removed.
             Otherwise, all items are supplied directly to :meth:`to_csv`, including kwargs it might
-            not be expecting if they are given
+            not be expecting if they are given. Only used if `prediction_format` is "csv"
+        data_loading_params: Dict, default=dict()
+            Parameters given to :func:`utils.file_utils.read_dataset` to read the datasets given as
+            str paths. Parquet, Feather/Arrow, and pickle files are read directly, and all other
+            files are parsed as CSV files. Parsed CSV files are cached in a binary format (pickle,
+            by default) in the "DatasetCache" directory of `results_path`, so later Environments
+            read the cache file instead of parsing the CSV file again, until it changes. Useful keys
+            include: "cache_format", "cache_key" ("mtime" or "content"), "downcast" (to use the
+            smallest numeric dtypes), "categorical_threshold" (to convert string columns with few
+            unique values to categoricals), and "read_csv_params". Target and ID columns are never
+            downcast or converted. Add "dataset_cache" to `file_blacklist` to disable the cache.
+            Because datasets are hashed by their contents, `data_loading_params` is not included in
+            :attr:`cross_experiment_key`, but downcasting datasets does change it. For datasets
+            larger than memory, set "memory_map" to True, and give ".npy" (with "columns" naming
+            the columns of 2-dimensional arrays), uncompressed Feather/Arrow files, or CSV files
+            with "cache_format"="feather". Memory-mapped datasets are never copied by Experiments,
+            and their rows are only read when a fold (or a chunk of predictions) uses them. The
+            extra key "chunk_size" (default=100,000) sets the number of memory-mapped rows
+            predicted at once. Hashing a memory-mapped dataset for :attr:`cross_experiment_key`
+            reads it once, in chunks, and it is not saved in the "KeyAttributeLookup" directory
+        prediction_format: {"csv", "parquet", "npz", "memmap"}, default="csv"
+            The file format in which :mod:`recorders` save an Experiment's final OOF, holdout, and
+            test predictions. "csv" files are written by :meth:`pandas.DataFrame.to_csv`, given
+            `to_csv_params`. "parquet" requires "pyarrow", or "fastparquet". "npz" saves a
+            compressed NumPy archive, and "memmap" saves a float32 NumPy structured array that can
+            be mapped into memory. See :func:`utils.file_utils.save_predictions` for details.
+            Prediction files in any format can be read by :func:`utils.file_utils.read_predictions`.
+            Because it does not affect predictions, `prediction_format` is not included in
+            :attr:`cross_experiment_key`
         do_full_save: None, or callable, default=:func:`utils.result_utils.default_do_full_save`
             If callable, expected to take an Experiment's result description dict as input and
             return a boolean. If None, treated as a callable that returns True. This parameter is
@@ -291,6 +331,22 @@ class Environment:
             score does not meet some threshold you set, for example. `do_full_save` receives the
             Experiment description dict as input, so for help setting `do_full_save`, just look into
             one of your Experiment descriptions
+        n_jobs: Int, default=1
+            The number of worker processes used to fit the models of an Experiment's
+            repetitions/folds/runs in parallel. If 1, all fitting happens serially in the current
+            process. If -1, one worker is used for each CPU. Each fit still receives its seed from
+            `random_seeds`, and all predictions and evaluations are merged in the same order as the
+            serial path, so results are identical regardless of `n_jobs`. Because of this, `n_jobs`
+            is not included in :attr:`cross_experiment_key`. Keras models cannot be sent to worker
+            processes, so Keras Experiments are always fit serially. Experiments are also fit
+            serially if any callback may change Models before they are fit, like those in
+            `experiment_callbacks` with "on_<repetition/fold/run>_start" callables (see the
+            `affects_fit` argument of :func:`.callbacks.bases.lambda_callback`). Workers receive the
+            training data through shared memory, rather than pickled copies (Python >= 3.8), and map
+            memory-mapped datasets (see `data_loading_params`) from their files again. The data is
+            published once, and reused by later Experiments with the same training data until it
+            changes, or another Environment is activated (see :meth:`get_shared_data`). Recorded
+            times count each worker's time spent fitting, so they match times recorded serially
         experiment_callbacks: :class:`LambdaCallback`, list of :class:`LambdaCallback`, default=None
             If not None, should be a :class:`LambdaCallback` produced by
             :func:`.callbacks.bases.lambda_callback`, or a list of such classes. The contents will
@@ -353,6 +409,8 @@ class Environment:
         pass integers if you intend for the value to be used as a column index. Do not pass `0` to
         mean `False`, or `1` to mean `True`
         """
+        if G.Env is not None:  # Data shared for the previous Environment's workers is not needed
+            G.Env.release_shared_data()
         G.Env = self
         self.environment_params_path = environment_params_path
         self.results_path = results_path
@@ -382,7 +440,10 @@ class Environment:
         self.file_blacklist = file_blacklist
         self.reporting_params = reporting_params or {}
         self.to_csv_params = to_csv_params or {}
+        self.data_loading_params = data_loading_params
+        self.prediction_format = prediction_format
         self.do_full_save = do_full_save
+        self.n_jobs = n_jobs
         self.experiment_callbacks = experiment_callbacks or []
         self.experiment_recorders = experiment_recorders or []
 
@@ -396,14 +457,20 @@ class Environment:
             "predictions_oof": None,
             "predictions_test": None,
             "script_backup": None,
+            "experiment_index": None,
             "tested_keys": None,
+            "fold_indices": None,
             "key_attribute_lookup": None,
             "leaderboards": None,
             "global_leaderboard": None,
+            "global_leaderboard_log": None,
+            "optimization_state": None,
+            "dataset_cache": None,
             "current_heartbeat": None,
         }
         self.current_task = None
         self.cross_experiment_key = None
+        self._shared_data = None
 
         self.environment_workflow()
 
@@ -427,7 +494,7 @@ class Environment:
         self.update_custom_environment_params()
         self.validate_parameters()
         self.train_dataset, self.holdout_dataset = define_holdout_set(
-            self.train_dataset, self.holdout_dataset, self.target_column
+            self.train_dataset, self.holdout_dataset, self.target_column, loader=self.load_dataset
         )
         self.format_result_paths()
         self.generate_cross_experiment_key()
@@ -458,10 +525,8 @@ class Environment:
             self.file_blacklist = "ALL"
 
         #################### Train/Test Datasets ####################
-        if isinstance(self.train_dataset, str):
-            self.train_dataset = pd.read_csv(self.train_dataset)
-        if isinstance(self.test_dataset, str):
-            self.test_dataset = pd.read_csv(self.test_dataset)
+        self.train_dataset = self.load_dataset(self.train_dataset)
+        self.test_dataset = self.load_dataset(self.test_dataset)
 
         #################### metrics_params/metrics ####################
         if (self.metrics is not None) and ("metrics" in self.metrics_params.keys()):
@@ -487,9 +552,16 @@ class Environment:
             except AttributeError:
                 raise AttributeError(f"'{self.cv_type}' not in `sklearn.model_selection._split`")
 
+        #################### n_jobs ####################
+        if not isinstance(self.n_jobs, int) or isinstance(self.n_jobs, bool) or self.n_jobs == 0:
+            raise ValueError(f"n_jobs must be a nonzero int, not {self.n_jobs!r}")
+
         #################### to_csv_params ####################
         self.to_csv_params = {k: v for k, v in self.to_csv_params.items() if k != "path_or_buf"}
 
+        #################### prediction_format ####################
+        self.prediction_format = validate_prediction_format(self.prediction_format)
+
         #################### cross_experiment_params ####################
         self.cross_experiment_params = dict(
             cv_type=self.cv_type,
@@ -508,6 +580,32 @@ class Environment:
             if cb.__name__ != "LambdaCallback":
                 raise ValueError(f"experiment_callbacks must be LambdaCallback instances, not {cb}")
 
+    def load_dataset(self, dataset):
+        """Read `dataset` via :func:`utils.file_utils.read_dataset` if it is a str path, according
+        to :attr:`data_loading_params`. Parsed CSV files are cached in the "DatasetCache" directory
+        of :attr:`results_path`, unless "dataset_cache" is in :attr:`file_blacklist`
+
+        Parameters
+        ----------
+        dataset: Object
+            One of the datasets given to :class:`Environment`
+
+        Returns
+        -------
+        Object
+            The DataFrame read from `dataset` if it is a str. Else, `dataset`, unchanged"""
+        if not isinstance(dataset, str):
+            return dataset
+
+        cache_dir = None
+        if self.file_blacklist != "ALL" and "dataset_cache" not in self.file_blacklist:
+            cache_dir = os.path.join(self.results_path, RESULT_FILE_SUB_DIR_PATHS["dataset_cache"])
+
+        exclude_columns = [_ for _ in self.target_column + [self.id_column] if _ is not None]
+        params = dict(dict(exclude_columns=exclude_columns), **self.data_loading_params)
+        params.pop("chunk_size", None)  # Used by Experiments, rather than `read_dataset`
+        return read_dataset(dataset, cache_dir=cache_dir, **params)
+
     def format_result_paths(self):
         """Remove paths contained in file_blacklist, and format others to prepare for saving results"""
         if self.file_blacklist == "ALL" or self.results_path is None:
@@ -573,6 +671,41 @@ class Environment:
             if getattr(self, k) is None:
                 setattr(self, k, self.DEFAULT_PARAMS.get(k, None))
 
+    def get_shared_data(self, key, publish):
+        """Get the handles of data published in shared memory for worker processes, which are
+        reused by all Experiments asking for the same `key`. If a different `key` (or none) was
+        published, the old data is released, and `publish` is called to publish the new data
+
+        Parameters
+        ----------
+        key: Tuple
+            Identifies the published data, starting with :attr:`cross_experiment_key`, so data is
+            published again if an Environment budget (like those of `HyperbandOptimization`)
+            updates the Environment
+        publish: Callable
+            Given a :class:`utils.shared_memory_utils.SharedDataPlane`, publishes the data with it,
+            and returns the handles of the published data
+
+        Returns
+        -------
+        Object
+            The handles returned by `publish` when the data for `key` was published"""
+        if (self._shared_data is None) or (self._shared_data[0] != key):
+            self.release_shared_data()
+            plane = SharedDataPlane()
+            self._shared_data = (key, plane, publish(plane))
+            atexit.register(self.release_shared_data)
+        return self._shared_data[2]
+
+    def release_shared_data(self):
+        """Release the shared memory of the data published by :meth:`get_shared_data`. Called when
+        another Environment is activated, and when the process exits. While data is published, this
+        is the Environment's only exit handler, and it is unregistered once the data is released"""
+        if getattr(self, "_shared_data", None) is not None:
+            self._shared_data[1].close()
+            self._shared_data = None
+            atexit.unregister(self.release_shared_data)
+
     def generate_cross_experiment_key(self):
         """Generate a key to describe the current Environment's cross-experiment parameters"""
         parameters = dict(
@@ -593,7 +726,8 @@ class Environment:
         # If any aliases were used during call to `Environment.__init__`, replace the default names
         # in `parameters` with the alias used. This ensures compatibility with Environment keys
         # made in earlier versions
-        aliases_used = getattr(self, "__hh_aliases_used", {})
+        # Copied because `_visit` pops aliases, and the key may be generated again for new budgets
+        aliases_used = dict(getattr(self, "__hh_aliases_used", {}))
 
         # noinspection PyUnusedLocal
         def _visit(path, key, value):
@@ -740,8 +874,9 @@ def define_holdout_set(
     train_set: pd.DataFrame,
     holdout_set: Union[pd.DataFrame, callable, str, None],
     target_column: Union[str, List[str]],
+    loader: Optional[callable] = None,
 ) -> Tuple[pd.DataFrame, Optional[pd.DataFrame]]:
-    """Create `holdout_set` (if necessary) by loading a DataFrame from a .csv file, or by separating
+    """Create `holdout_set` (if necessary) by loading a DataFrame from a file, or by separating
     `train_set`, and return the updated (`train_set`, `holdout_set`) pair
 
     Parameters
@@ -751,10 +886,13 @@ def define_holdout_set(
     holdout_set: Pandas.DataFrame, callable, str, or None
         If pd.DataFrame, this is the holdout dataset. If callable, expects a function that takes
         (`train_set`, `target_column`) as input and returns the new (`train_set`, `holdout_set`). If
-        str, will attempt to read file at path via :func:`pandas.read_csv`. Else, no holdout set
+        str, will attempt to read file at path via `loader`. Else, no holdout set
     target_column: Str, or list
         If str, denotes the column name in provided datasets that contains the target output. If
         list, should be a list of strs designating multiple target columns
+    loader: Callable, or None, default=None
+        Reads the DataFrame at a file path if `holdout_set` is a str, like
+        :meth:`Environment.load_dataset`. If None, :func:`pandas.read_csv` is used
 
     Returns
     -------
@@ -767,7 +905,7 @@ def define_holdout_set(
     if callable(holdout_set):
         train_set, holdout_set = holdout_set(train_set, target_column)
     elif isinstance(holdout_set, str):
-        holdout_set = pd.read_csv(holdout_set)
+        holdout_set = (loader or pd.read_csv)(holdout_set)
     #################### Validate `holdout_set` ####################
     try:
         if holdout_set is None or np.array_equal(train_set.columns, holdout_set.columns):
@@ -811,6 +949,11 @@ def validate_file_blacklist(blacklist):
     extension, the Experiment proceeds as if "script_backup" had been added to `blacklist`. This
     means that backup files will not be created for Jupyter notebooks (or any other non-".py" files)
 
+    'checkpoint': After each fold, the state of a cross-validation Experiment is saved to a file in
+    "Experiments/Checkpoints", named after its keys. If the Experiment is interrupted, a later
+    Experiment with identical keys resumes from the fold following the last checkpoint. The file is
+    deleted once the Experiment's results are saved
+
     'description' and 'tested_keys': These two results types constitute a bare minimum of sorts for
     experiment recording. If either of these two are blacklisted, then as far as the library is
     concerned, the experiment never took place.
@@ -818,13 +961,26 @@ def validate_file_blacklist(blacklist):
     'tested_keys' (continued): If this string is included in the blacklist, then the contents of the
     "KeyAttributeLookup" directory will also be excluded from the list of files to update
 
+    'fold_indices': The cross-validation indices of an Environment are computed once, then saved to
+    a file in "TestedKeys/FoldIndices", named after its `cross_experiment_key`, so later Experiments
+    with the same `cross_experiment_key` reuse them without splitting the data again
+
+    'optimization_state': After each iteration, the state of an Optimization Protocol is saved to a
+    file in "OptimizationStates", named after its search. If the Optimization Protocol is
+    interrupted, a later Optimization Protocol with the same search resumes from the last saved
+    state. The file is deleted once the optimization loop is completed
+
+    'dataset_cache': When an Environment is given a CSV file path as a dataset, the parsed dataset
+    is saved in "DatasetCache", so later Environments can read it without parsing the CSV file
+    again. See the `data_loading_params` parameter of :class:`Environment`
+
     'current_heartbeat': The general heartbeat file that should be stored at
     'HyperparameterHunterAssets/Heartbeat.log'. If this value is blacklisted, then 'heartbeat' is
     also added to `blacklist` automatically out of necessity. This is done because the heartbeat
     file for the current experiment cannot be created as a copy of the general heartbeat file if the
     general heartbeat file is never created in the first place"""
     valid_values = [
-        # 'checkpoint',
+        "checkpoint",
         "description",
         "heartbeat",
         "predictions_holdout",
@@ -833,6 +989,9 @@ def validate_file_blacklist(blacklist):
         "predictions_test",
         "script_backup",
         "tested_keys",
+        "fold_indices",
+        "optimization_state",
+        "dataset_cache",
         "current_heartbeat",
     ]
     if blacklist == "ALL":
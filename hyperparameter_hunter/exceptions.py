@@ -104,6 +104,31 @@ class RepeatedExperimentError(Exception):
         super(RepeatedExperimentError, self).__init__(message + extra)
 
 
+class ExperimentPrunedError(Exception):
+    def __init__(self, step, score, target_metric=None, message=None, extra=""):
+        """Exception raised to stop an Experiment early when a Pruner decides that its interim
+        evaluations are unlikely to improve upon those of earlier Experiments
+
+        Parameters
+        ----------
+        step: Int
+            The number of folds completed by the Experiment when it was pruned
+        score: Number
+            The penalized score to report for the pruned Experiment
+        target_metric: Tuple, or None, default=None
+            Path of the metric to which `score` belongs, like ("oof", "roc_auc_score"). If None, the
+            pruned Experiment's own `target_metric` is used
+        message: String, or None, default=None
+            A message to provide upon raising `ExperimentPrunedError`
+        extra: String, default=''
+            Extra content to append onto the end of `message` before raising the Exception"""
+        self.step = step
+        self.score = score
+        self.target_metric = target_metric
+        if not message:
+            message = f"Experiment was pruned after {step} folds"
+        super(ExperimentPrunedError, self).__init__(message + extra)
+
 ##################################################
 # Deprecation Warnings
 ##################################################
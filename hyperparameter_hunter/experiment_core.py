@@ -39,6 +39,7 @@ from hyperparameter_hunter.callbacks.bases import BaseAggregatorCallback, BaseLo
 from hyperparameter_hunter.callbacks.evaluators import EvaluatorOOF, EvaluatorHoldout
 from hyperparameter_hunter.callbacks.loggers import LoggerFitStatus
 from hyperparameter_hunter.callbacks.predictors import PredictorOOF, PredictorHoldout, PredictorTest
+from hyperparameter_hunter.callbacks.predictors import PredictorStaged
 from hyperparameter_hunter.settings import G
 
 ##################################################
@@ -106,6 +107,9 @@ class ExperimentMeta(type):
         if G.Env.test_dataset is not None:
             instance_bases.append(PredictorTest)
 
+        if kwargs.get("staged_estimators", None):
+            instance_bases.append(PredictorStaged)
+
         # Add callbacks explicitly provided to the Environment
         if len(G.Env.experiment_callbacks) > 0:
             instance_bases.extend(G.Env.experiment_callbacks)
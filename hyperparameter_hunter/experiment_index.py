@@ -0,0 +1,184 @@
+"""This module defines :class:`ExperimentIndex`, which maintains an SQLite database in the
+'HyperparameterHunterAssets/Experiments' subdirectory containing the identifying attributes,
+hyperparameters, final evaluations, and execution times of every saved Experiment. This allows the
+results of all Experiments conducted with a particular algorithm and `cross_experiment_key` to be
+retrieved in a single query, instead of reading the description file of each Experiment
+individually
+
+Related
+-------
+:mod:`hyperparameter_hunter.recorders`
+    This module initiates the saving of Experiment entries to the index via
+    :class:`recorders.DescriptionRecorder`
+:mod:`hyperparameter_hunter.result_reader`
+    This module queries the index to locate Experiments similar to those being optimized"""
+##################################################
+# Import Own Assets
+##################################################
+from hyperparameter_hunter.utils.boltons_utils import get_path
+from hyperparameter_hunter.utils.file_utils import default_json_write
+
+##################################################
+# Import Miscellaneous Assets
+##################################################
+from contextlib import closing
+import os.path
+import simplejson as json
+import sqlite3
+
+
+class ExperimentIndex(object):
+    # Keys of Experiment description dicts stored by the index. The first five are stored as-is, and
+    # ... the rest are stored as JSON strings. "total_elapsed" is nested in the description at the
+    # ... path given by `path_columns`. "pruned" is only in the descriptions of pruned Experiments,
+    # ... so the value in `optional_columns` is stored for the others
+    columns = [
+        "experiment_id",
+        "algorithm_name",
+        "module_name",
+        "hyperparameter_key",
+        "cross_experiment_key",
+        "final_evaluations",
+        "hyperparameters",
+        "total_elapsed",
+        "pruned",
+    ]
+    json_columns = ["final_evaluations", "hyperparameters", "total_elapsed", "pruned"]
+    path_columns = dict(total_elapsed=("aggregates", "times", "total_elapsed"))
+    optional_columns = dict(pruned=False)
+
+    def __init__(self, path):
+        """Persistent index of saved Experiment descriptions, stored in an SQLite database
+
+        Parameters
+        ----------
+        path: String
+            Path to the SQLite database file of the index. The file is created when the first entry
+            is added, if it does not already exist"""
+        self.path = path
+
+    def _connect(self):
+        """Open a connection to the database at :attr:`path`, ensuring the index table exists
+
+        Returns
+        -------
+        sqlite3.Connection
+            Connection to the database at :attr:`path`. Waits up to 30 seconds for other processes
+            to release their locks on the database before raising `sqlite3.OperationalError`
+
+        Notes
+        -----
+        Columns missing from an index made by an older version are added, with NULL values for
+        existing entries. :meth:`get_entries` skips these entries until they are added again"""
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS experiments ({}, PRIMARY KEY (experiment_id))".format(
+                ", ".join(f"{_} TEXT" for _ in self.columns)
+            )
+        )
+
+        existing_columns = [_[1] for _ in connection.execute("PRAGMA table_info(experiments)")]
+        for column in self.columns:
+            if column not in existing_columns:
+                connection.execute(f"ALTER TABLE experiments ADD COLUMN {column} TEXT")
+
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS experiments_by_key "
+            "ON experiments (cross_experiment_key, algorithm_name)"
+        )
+        return connection
+
+    def add_entry(self, description):
+        """Add an entry for the Experiment described by `description` to the index. If the index
+        already contains an entry for the Experiment, it is replaced
+
+        Parameters
+        ----------
+        description: Dict
+            An Experiment description, as formatted by
+            :meth:`recorders.DescriptionRecorder.format_result`, or read from a saved description
+            file. Must contain all keys in :attr:`columns`, except :attr:`optional_columns`"""
+        self.add_entries([description])
+
+    def add_entries(self, descriptions):
+        """Add entries for multiple Experiments to the index in a single transaction
+
+        Parameters
+        ----------
+        descriptions: List
+            Experiment descriptions, each of which is as described in :meth:`add_entry`. Values of
+            :attr:`path_columns` missing from a description are stored as null"""
+        rows = []
+        for description in descriptions:
+            row = []
+            for column in self.columns:
+                if column in self.path_columns:
+                    value = get_path(description, self.path_columns[column], default=None)
+                elif column in self.optional_columns:
+                    value = description.get(column, self.optional_columns[column])
+                else:
+                    value = description[column]
+                if column in self.json_columns:
+                    value = json.dumps(value, default=default_json_write)
+                row.append(value)
+            rows.append(row)
+
+        with closing(self._connect()) as connection, connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO experiments VALUES ({})".format(
+                    ", ".join("?" for _ in self.columns)
+                ),
+                rows,
+            )
+
+    def get_entries(self, cross_experiment_key, algorithm_name=None):
+        """Get all entries in the index that match `cross_experiment_key` and `algorithm_name`
+
+        Parameters
+        ----------
+        cross_experiment_key: String
+            The `cross_experiment_key` of the Experiments to retrieve
+        algorithm_name: String, or None, default=None
+            If string, only Experiments conducted with this algorithm are retrieved
+
+        Returns
+        -------
+        Dict
+            Mapping of experiment_ids to partial Experiment description dicts, containing the keys
+            in :attr:`columns`, except values of :attr:`path_columns` are nested at their paths.
+            Empty if the index file does not exist. Entries added before :attr:`path_columns`
+            existed are excluded, so their descriptions are read and added again by the caller.
+            Values of :attr:`optional_columns` that are missing from older entries are defaulted"""
+        if not os.path.exists(self.path):
+            return {}
+
+        query = "SELECT {} FROM experiments WHERE cross_experiment_key = ?".format(
+            ", ".join(self.columns)
+        )
+        query += "".join(f" AND {_} IS NOT NULL" for _ in self.path_columns)
+        parameters = [cross_experiment_key]
+
+        if algorithm_name is not None:
+            query += " AND algorithm_name = ?"
+            parameters.append(algorithm_name)
+
+        with closing(self._connect()) as connection:
+            rows = connection.execute(query, parameters).fetchall()
+
+        entries = {}
+        for row in rows:
+            entry = dict(zip(self.columns, row))
+            for column in self.json_columns:
+                if entry[column] is None and column in self.optional_columns:
+                    entry[column] = self.optional_columns[column]
+                else:
+                    entry[column] = json.loads(entry[column])
+
+            for column, path in self.path_columns.items():
+                value, location = entry.pop(column), entry
+                for key in path[:-1]:
+                    location = location.setdefault(key, {})
+                location[path[-1]] = value
+
+            entries[entry["experiment_id"]] = entry
+        return entries
@@ -30,29 +30,41 @@ from hyperparameter_hunter.algorithm_handlers import (
 from hyperparameter_hunter.exceptions import (
     EnvironmentInactiveError,
     EnvironmentInvalidError,
+    ExperimentPrunedError,
     RepeatedExperimentError,
 )
 from hyperparameter_hunter.experiment_core import ExperimentMeta
-from hyperparameter_hunter.key_handler import HyperparameterKeyMaker
+from hyperparameter_hunter.key_handler import HyperparameterKeyMaker, hash_dataframe
 from hyperparameter_hunter.metrics import ScoringMixIn, get_formatted_target_metric
-from hyperparameter_hunter.models import model_selector
-from hyperparameter_hunter.recorders import RecorderList
+from hyperparameter_hunter.models import get_staged_location, model_selector
+from hyperparameter_hunter.recorders import RecorderList, PRUNED_RECORDERS
+from hyperparameter_hunter.sentinels import locate_sentinels
 from hyperparameter_hunter.settings import G
 
 # from hyperparameter_hunter.tracers import TranslateTrace  # TODO: Add when tested with `Mirror`
-from hyperparameter_hunter.utils.file_utils import make_dirs
-from hyperparameter_hunter.utils.general_utils import Deprecated
+from hyperparameter_hunter.utils.file_utils import make_dirs, atomic_write, is_memory_mapped
+from hyperparameter_hunter.utils.general_utils import Deprecated, LRUCache
+from hyperparameter_hunter.utils.shared_memory_utils import SharedDataPlane
 
 ##################################################
 # Import Miscellaneous Assets
 ##################################################
 from abc import abstractmethod
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from functools import partial
 from inspect import isclass
 import numpy as np
+from os import cpu_count
+import os.path
 import pandas as pd
+import pickle
 import random
 import shutil
 from sys import exc_info
+from time import perf_counter
 from uuid import uuid4 as uuid
 import warnings
 
@@ -88,6 +100,7 @@ class BaseExperiment(ScoringMixIn):
         do_raise_repeated=False,
         auto_start=True,
         target_metric=None,
+        staged_estimators=None,
     ):
         # TODO: When `TranslateTrace` added document `model` below with expectation that if `model`
         # TODO: ... given, (`model_initializer`, `model_init_params`) should not be, and vice versa
@@ -139,7 +152,28 @@ class BaseExperiment(ScoringMixIn):
             :attr:`environment.Environment.metrics_params`. See the documentation for
             :func:`metrics.get_formatted_target_metric` for more info. Any values returned by, or
             used as the `target_metric` input to this function are acceptable values for
-            :attr:`BaseExperiment.target_metric`"""
+            :attr:`BaseExperiment.target_metric`
+        staged_estimators: List of int, or None, default=None
+            If given, results are also recorded for each of these numbers of boosting rounds, using
+            the models fit with the number of boosting rounds in `model_init_params`, rather than
+            fitting new models. Each value must be less than the fitted number of rounds. Each
+            result is saved as a separate Experiment, whose hyperparameter key is made with its
+            number of rounds, as if it had been executed directly. Requires an algorithm for which
+            :func:`models.supports_staged_predictions` is True, or a Keras model, for which the
+            values are numbers of epochs, less than `model_extra_params["epochs"]`. Must be given
+            as a keyword argument
+
+        Notes
+        -----
+        Staged results are evaluated only on their final out-of-fold (and holdout) predictions, so
+        their descriptions contain no run/fold/repetition evaluations. Their recorded execution
+        time is the Experiment's execution time scaled by the fraction of boosting rounds they use.
+        After the Experiment is executed, the staged results saved are described in
+        :attr:`staged_results`
+
+        The staged results of Keras models are predicted with the weights saved at the end of each
+        epoch in `staged_estimators`. Keras callbacks that restore other weights after fitting (like
+        `ModelCheckpoint`) only affect the Experiment's own result"""
         # self._model_original = model  # TODO: Add for `TranslateTrace`
         self.model_initializer = model_initializer
         self.model_init_params = identify_algorithm_hyperparameters(self.model_initializer)
@@ -157,20 +191,17 @@ class BaseExperiment(ScoringMixIn):
         self.do_raise_repeated = do_raise_repeated
         self.auto_start = auto_start
         self.target_metric = target_metric
+        self.staged_estimators = staged_estimators
 
         #################### Attributes From Active Environment ####################
         G.Env.initialize_reporting()
         self._validate_environment()
 
-        self.train_dataset = G.Env.train_dataset.copy()
-        try:
-            self.holdout_dataset = G.Env.holdout_dataset.copy()
-        except AttributeError:
-            self.holdout_dataset = G.Env.holdout_dataset
-        try:
-            self.test_dataset = G.Env.test_dataset.copy()
-        except AttributeError:
-            self.test_dataset = G.Env.test_dataset
+        # The full datasets are only read, so they are shared with the Environment, not copied. The
+        # ... new frames made by `_initial_preprocessing` are what folds are sliced from
+        self.train_dataset = G.Env.train_dataset
+        self.holdout_dataset = G.Env.holdout_dataset
+        self.test_dataset = G.Env.test_dataset
 
         self.target_column = G.Env.target_column
         self.id_column = G.Env.id_column
@@ -193,6 +224,9 @@ class BaseExperiment(ScoringMixIn):
         self.metrics = None  # Set by :class:`metrics.ScoringMixIn`
         self.stat_aggregates = dict()
         self.result_description = None
+        self.staged_predictions = None  # Set by :class:`callbacks.predictors.PredictorStaged`
+        self.staged_results = []
+        self.pruned = False  # Set by :meth:`_save_pruned_result`
 
         #################### Experiment Identification Attributes ####################
         self.experiment_id = None
@@ -236,16 +270,138 @@ class BaseExperiment(ScoringMixIn):
 
         self._initialize_random_seeds()
         self._initial_preprocessing()
-        self.execute()
+        try:
+            self.execute()
+        except ExperimentPrunedError as _ex:
+            self._save_pruned_result(_ex)
+            self._remove_checkpoint()
+            self._clean_up()
+            raise
 
         #################### Save Experiment Results ####################
+        self._save_result()
+        self._save_staged_results()
+        self._remove_checkpoint()
+        self._clean_up()
+
+    def _save_result(self):
+        """Format and save the Experiment's result files with all recorders that were not
+        blacklisted by the active Environment"""
         recorders = RecorderList(
             file_blacklist=G.Env.file_blacklist, extra_recorders=G.Env.experiment_recorders
         )
-        recorders.format_result()
-        G.log(f"Saving results for Experiment: '{self.experiment_id}'")
-        recorders.save_result()
-        self._clean_up()
+        with G.save_lock:
+            recorders.format_result()
+            G.log(f"Saving results for Experiment: '{self.experiment_id}'")
+            recorders.save_result()
+
+    def _save_pruned_result(self, exception):
+        """Save the keys, leaderboard entry, and description of an Experiment stopped early by a
+        pruner, so it is not repeated, and later Optimization Protocols learn from it. Its
+        `last_evaluation_results` only contain the penalized score of the pruner's target metric,
+        with the other dataset types set to None, and its "total_elapsed" time is estimated for all
+        folds, as if it had not been pruned
+
+        Parameters
+        ----------
+        exception: :class:`exceptions.ExperimentPrunedError`
+            The exception raised to stop the Experiment"""
+        self.pruned = True
+        data_type, *metric_path = exception.target_metric or self.target_metric
+        score = exception.score
+        for key in reversed(metric_path):
+            score = {key: score}
+        self.last_evaluation_results = dict(in_fold=None, oof=None, holdout=None)
+        self.last_evaluation_results[data_type] = score
+
+        #################### Convert Start Times of Unfinished Divisions ####################
+        times, now = self.stat_aggregates["times"], datetime.now()
+        for key in ["runs", "folds", "reps"]:
+            times[key] = [
+                (now - _).total_seconds() if isinstance(_, datetime) else _ for _ in times[key]
+            ]
+        times["end"] = str(now)
+        if isinstance(times["total_elapsed"], datetime):  # Still the start time
+            n_steps = self.cv_params["n_splits"] * self.cv_params.get("n_repeats", 1)
+            elapsed_time = (now - times["total_elapsed"]).total_seconds()
+            times["total_elapsed"] = elapsed_time * n_steps / exception.step
+
+        recorders = RecorderList(file_blacklist=G.Env.file_blacklist, recorders=PRUNED_RECORDERS)
+        with G.save_lock:
+            recorders.format_result()
+            G.log(f"Saving pruned result for Experiment: '{self.experiment_id}'")
+            recorders.save_result()
+
+    #: Attributes replaced by those of each staged result while it is saved by
+    #: :meth:`_save_staged_results`, then restored
+    staged_attributes = [
+        "experiment_id",
+        "hyperparameter_key",
+        "model_init_params",
+        "model_extra_params",
+        "last_evaluation_results",
+        "stat_aggregates",
+        "final_oof_predictions",
+        "final_holdout_predictions",
+        "final_test_predictions",
+    ]
+
+    def _save_staged_results(self):
+        """Save a separate Experiment result for each number of boosting rounds (or epochs) in
+        :attr:`staged_estimators`, using the staged predictions made by
+        :class:`callbacks.predictors.PredictorStaged`. Staged results whose hyperparameter keys
+        already exist are skipped. Like the Experiment itself, each saved result has a backup of the
+        script that produced it. Each saved result is described by a dict in
+        :attr:`staged_results`. Its keys are "n_rounds", "experiment_id", "hyperparameter_key",
+        "final_evaluations", and "total_elapsed" (estimated seconds of execution)"""
+        self.staged_results = []
+        if not self.staged_estimators or self.staged_predictions is None:
+            return
+
+        original = {_: getattr(self, _) for _ in self.staged_attributes}
+        params_name, param = self._get_staged_location()
+        n_fit_rounds = original[params_name][param]
+        times = original["stat_aggregates"]["times"]
+
+        try:
+            for n_rounds in self.staged_estimators:
+                setattr(self, params_name, dict(original[params_name], **{param: n_rounds}))
+                self._generate_hyperparameter_key()
+                if self.hyperparameter_key.exists is True:
+                    G.debug(f"Skipping staged result with existing key: {self.hyperparameter_key}")
+                    continue
+
+                self.experiment_id = str(uuid())
+                self._create_script_backup()
+                self.last_evaluation_results = dict(in_fold=None, oof=None, holdout=None)
+                staged_from = dict(experiment_id=original["experiment_id"], n_rounds=n_fit_rounds)
+                self.stat_aggregates = dict(
+                    times=dict(total_elapsed=times["total_elapsed"] * n_rounds / n_fit_rounds),
+                    staged_from=staged_from,
+                )
+
+                predictions = self.staged_predictions[n_rounds]
+                self.final_oof_predictions = predictions["oof"]
+                self.evaluate("oof", self.train_target_data, self.final_oof_predictions)
+                if "holdout" in predictions:
+                    self.final_holdout_predictions = predictions["holdout"]
+                    self.evaluate("holdout", self.holdout_target_data, predictions["holdout"])
+                if "test" in predictions:
+                    self.final_test_predictions = predictions["test"]
+
+                self._save_result()
+                self.staged_results.append(
+                    dict(
+                        n_rounds=n_rounds,
+                        experiment_id=self.experiment_id,
+                        hyperparameter_key=self.hyperparameter_key.key,
+                        final_evaluations=self.last_evaluation_results,
+                        total_elapsed=self.stat_aggregates["times"]["total_elapsed"],
+                    )
+                )
+        finally:
+            for name, value in original.items():
+                setattr(self, name, value)
 
     def preparation_workflow(self):
         """Execute all tasks that must take place before the experiment is actually started. Such
@@ -302,15 +458,16 @@ class BaseExperiment(ScoringMixIn):
         #     G.log('Dataset: "{}" {} updated'.format(dataset_name, 'was not' if old_val.equals(new_val) else 'was'))
         #     setattr(self, dataset_name, new_val)
 
-        self.train_input_data = self.train_dataset.copy().loc[:, self.feature_selector]
-        self.train_target_data = self.train_dataset.copy().loc[:, self.target_column]
+        # Selecting a list of columns already produces a new DataFrame, so no extra copy is needed
+        self.train_input_data = select_columns(self.train_dataset, self.feature_selector)
+        self.train_target_data = select_columns(self.train_dataset, self.target_column)
 
         if isinstance(self.holdout_dataset, pd.DataFrame):
-            self.holdout_input_data = self.holdout_dataset.copy().loc[:, self.feature_selector]
-            self.holdout_target_data = self.holdout_dataset.copy().loc[:, self.target_column]
+            self.holdout_input_data = select_columns(self.holdout_dataset, self.feature_selector)
+            self.holdout_target_data = select_columns(self.holdout_dataset, self.target_column)
 
         if isinstance(self.test_dataset, pd.DataFrame):
-            self.test_input_data = self.test_dataset.copy().loc[:, self.feature_selector]
+            self.test_input_data = select_columns(self.test_dataset, self.feature_selector)
 
         G.log("Initial preprocessing stage complete", 4)
 
@@ -323,12 +480,50 @@ class BaseExperiment(ScoringMixIn):
         self.target_metric = get_formatted_target_metric(self.target_metric, self.metrics)
 
         #################### feature_selector ####################
-        self.feature_selector = self.feature_selector or self.train_dataset.columns.values
-        restricted_cols = [_ for _ in self.target_column + [self.id_column] if _ is not None]
-        self.feature_selector = [_ for _ in self.feature_selector if _ not in restricted_cols]
+        self.feature_selector = format_feature_selector(
+            self.feature_selector, self.train_dataset, self.target_column, self.id_column
+        )
+
+        #################### staged_estimators ####################
+        if self.staged_estimators:
+            self._validate_staged_estimators()
 
         G.debug("Experiment parameters have been validated")
 
+    def _validate_staged_estimators(self):
+        """Ensure :attr:`staged_estimators` can be predicted by the models of the Experiment, then
+        sort them and remove duplicates
+
+        Raises
+        ------
+        ValueError
+            If :attr:`model_initializer` cannot make staged predictions, or if any value in
+            :attr:`staged_estimators` is not in the range (0, <number of boosting rounds>)"""
+        location = self._get_staged_location()
+        if location is None:
+            raise ValueError(f"{self.algorithm_name} cannot make predictions for staged_estimators")
+
+        params_name, param = location
+        n_rounds = getattr(self, params_name)[param]
+        invalid = [_ for _ in self.staged_estimators if not 0 < _ < n_rounds]
+        if invalid:
+            raise ValueError(f"staged_estimators must be in (0, {param}={n_rounds}), not {invalid}")
+
+        self.staged_estimators = sorted(set(int(_) for _ in self.staged_estimators))
+
+    def _get_staged_location(self):
+        """Find the hyperparameter that sets the number of boosting rounds (or epochs) of the
+        Experiment's models. See :func:`models.get_staged_location`
+
+        Returns
+        -------
+        Tuple, or None
+            Pair of the name of the attribute containing the hyperparameter ("model_init_params", or
+            "model_extra_params"), and the hyperparameter's name"""
+        return get_staged_location(
+            self.model_initializer, self.model_init_params, self.model_extra_params
+        )
+
     def _validate_environment(self):
         """Ensure there is a currently active Environment instance that is not already occupied"""
         if G.Env is None:
@@ -344,6 +539,27 @@ class BaseExperiment(ScoringMixIn):
         """Clean up after experiment to prepare for next experiment"""
         G.Env.current_task = None
 
+    ##################################################
+    # Checkpoint Methods:
+    ##################################################
+    @property
+    def _checkpoint_path(self):
+        """Path of the file containing the Experiment's checkpoint, named after its
+        :attr:`hyperparameter_key`, in a directory named after its :attr:`cross_experiment_key`.
+        None if "checkpoint" was blacklisted by the active Environment"""
+        if self.result_paths.get("checkpoint") is None:
+            return None
+        return os.path.join(
+            self.result_paths["checkpoint"],
+            self.cross_experiment_key.key,
+            f"{self.hyperparameter_key.key}.pkl",
+        )
+
+    def _remove_checkpoint(self):
+        """Delete the Experiment's checkpoint, if one exists, after its results are saved"""
+        if self._checkpoint_path is not None and os.path.exists(self._checkpoint_path):
+            os.remove(self._checkpoint_path)
+
     ##################################################
     # Key/ID Methods:
     ##################################################
@@ -354,14 +570,13 @@ class BaseExperiment(ScoringMixIn):
 
     def _generate_hyperparameter_key(self):
         """Set :attr:`hyperparameter_key` to a key to describe the experiment's hyperparameters"""
-        parameters = dict(
-            model_initializer=self.model_initializer,
-            model_init_params=self.model_init_params,
-            model_extra_params=self.model_extra_params,
-            preprocessing_pipeline=self.preprocessing_pipeline,
-            preprocessing_params=self.preprocessing_params,
-            feature_selector=self.feature_selector,
-            # FLAG: Should probably add :attr:`target_metric` to key - With option to ignore it?
+        parameters = get_hyperparameter_key_parameters(
+            self.model_initializer,
+            self.model_init_params,
+            self.model_extra_params,
+            self.preprocessing_pipeline,
+            self.preprocessing_params,
+            self.feature_selector,
         )
 
         self.hyperparameter_key = HyperparameterKeyMaker(parameters, self.cross_experiment_key)
@@ -381,7 +596,7 @@ class BaseExperiment(ScoringMixIn):
                 try:
                     self._source_copy_helper()
                 except FileNotFoundError:
-                    make_dirs(self.result_paths["script_backup"], exist_ok=False)
+                    make_dirs(self.result_paths["script_backup"], exist_ok=True)
                     self._source_copy_helper()
                 G.log("Created source backup:  '{}'".format(self.source_script), 4)
             else:
@@ -467,6 +682,7 @@ class BaseCVExperiment(BaseExperiment):
         do_raise_repeated=False,
         auto_start=True,
         target_metric=None,
+        staged_estimators=None,
     ):
         self._rep = 0
         self._fold = 0
@@ -475,6 +691,8 @@ class BaseCVExperiment(BaseExperiment):
         self.train_index = None
         self.validation_index = None
         self.folds = None
+        self._copy_fold_data = False
+        self._completed_fold = None
 
         self.fold_train_input = None
         self.fold_validation_input = None
@@ -492,6 +710,11 @@ class BaseCVExperiment(BaseExperiment):
         self.run_holdout_predictions = None
         self.run_test_predictions = None
 
+        self._fitted_models = None
+        self._pending_fits = None
+        self._fit_pool = None
+        self._fit_time_offset = 0
+
         #################### Initialize Result Placeholders ####################
         # self.full_oof_predictions = None  # (n_repeats * runs) intermediate columns
         # self.full_test_predictions = 0  # (n_splits * n_repeats * runs) intermediate columns
@@ -517,6 +740,7 @@ class BaseCVExperiment(BaseExperiment):
             do_raise_repeated=do_raise_repeated,
             auto_start=auto_start,
             target_metric=target_metric,
+            staged_estimators=staged_estimators,
         )
 
     def _additional_preparation_steps(self):
@@ -536,19 +760,37 @@ class BaseCVExperiment(BaseExperiment):
         performing `cv_fold_workflow` for each, 3) Average accumulated predictions over fold
         splits, 4) Evaluate final predictions, 5) Format final predictions to prepare for saving"""
         self.on_experiment_start()
-
-        reshaped_indices = get_cv_indices(
-            self.folds, self.cv_params, self.train_input_data, self.train_target_data.iloc[:, 0]
+        self._copy_fold_data = self._do_copy_fold_data()
+        checkpoint = self._load_checkpoint()
+
+        reshaped_indices = get_fold_indices(
+            self.folds,
+            self.cv_params,
+            self.train_input_data,
+            self.train_target_data.iloc[:, 0],
+            cache_key=self.cross_experiment_key.key,
+            cache_dir=self.result_paths.get("fold_indices", None),
         )
 
-        for self._rep, rep_indices in enumerate(reshaped_indices):
-            self.on_repetition_start()
+        with self._fit_in_parallel(reshaped_indices):
+            for self._rep, rep_indices in enumerate(reshaped_indices):
+                if self._is_fold_completed(self._rep, None):
+                    continue
+
+                self.on_repetition_start()
+                if checkpoint is not None and self._rep == checkpoint["rep"]:
+                    # Restore after `on_repetition_start`, which would reset repetition predictions
+                    self._restore_checkpoint(checkpoint)
 
-            for self._fold, (self.train_index, self.validation_index) in enumerate(rep_indices):
-                self.cv_fold_workflow()
+                for self._fold, (self.train_index, self.validation_index) in enumerate(rep_indices):
+                    if self._is_fold_completed(self._rep, self._fold):
+                        continue
+                    self.cv_fold_workflow()
+                    self._save_checkpoint()
 
-            self.on_repetition_end()
+                self.on_repetition_end()
         self.on_experiment_end()
+        self._completed_fold = None
 
         G.log("")
 
@@ -557,15 +799,23 @@ class BaseCVExperiment(BaseExperiment):
     ##################################################
     def on_fold_start(self):
         """Override :meth:`on_fold_start` tasks set by :class:`experiment_core.ExperimentMeta`,
-        consisting of: 1) Log start, 2) Execute original tasks, 3) Split train/validation data"""
+        consisting of: 1) Log start, 2) Execute original tasks, 3) Split train/validation data.
+        Contiguous fold datasets are views of the full datasets, and are only copied if
+        :meth:`_do_copy_fold_data` found a Model or callback that modifies them in-place. Other
+        folds are copied once. See :func:`slice_fold_data`"""
         super().on_fold_start()
 
         #################### Split Train and Validation Data ####################
-        self.fold_train_input = self.train_input_data.iloc[self.train_index, :].copy()
-        self.fold_validation_input = self.train_input_data.iloc[self.validation_index, :].copy()
+        # Release the previous fold's datasets before making the next, to limit peak memory
+        self.fold_train_input, self.fold_validation_input = None, None
+        self.fold_train_target, self.fold_validation_target = None, None
 
-        self.fold_train_target = self.train_target_data.iloc[self.train_index].copy()
-        self.fold_validation_target = self.train_target_data.iloc[self.validation_index].copy()
+        _slice = partial(slice_fold_data, do_copy=self._copy_fold_data)
+        self.fold_train_input = _slice(self.train_input_data, self.train_index)
+        self.fold_validation_input = _slice(self.train_input_data, self.validation_index)
+
+        self.fold_train_target = _slice(self.train_target_data, self.train_index)
+        self.fold_validation_target = _slice(self.train_target_data, self.validation_index)
 
     def cv_fold_workflow(self):
         """Execute workflow for individual fold, consisting of the following tasks: Execute
@@ -592,23 +842,361 @@ class BaseCVExperiment(BaseExperiment):
 
     def cv_run_workflow(self):
         """Execute run workflow, consisting of: 1) Execute overridden :meth:`on_run_start` tasks,
-        2) Initialize and fit Model, 3) Execute overridden :meth:`on_run_end` tasks"""
+        2) Initialize and fit Model (or collect the Model fit by :meth:`_fit_in_parallel`),
+        3) Execute overridden :meth:`on_run_end` tasks"""
         self.on_run_start()
-        self.model = model_selector(self.model_initializer)(
-            self.model_initializer,
-            self.model_init_params,
-            self.model_extra_params,
-            train_input=self.fold_train_input,
-            train_target=self.fold_train_target,
-            validation_input=self.fold_validation_input,
-            validation_target=self.fold_validation_target,
-            do_predict_proba=self.do_predict_proba,
-            target_metric=self.target_metric,
-            metrics=self.metrics,
-        )
-        self.model.fit()
+        if self._fitted_models is not None:
+            waiting = perf_counter()
+            future = self._fitted_models.pop((self._rep, self._fold, self._run))
+            self.model, fit_time = future.result()
+            # Count the worker's time spent fitting in the run's time, rather than the time waited
+            self._fit_time_offset = fit_time - (perf_counter() - waiting)
+            self._submit_fits()
+
+            self.model.train_input = self.fold_train_input
+            self.model.train_target = self.fold_train_target
+            self.model.validation_input = self.fold_validation_input
+            self.model.validation_target = self.fold_validation_target
+        else:
+            self._fit_time_offset = 0
+            self.model = model_selector(self.model_initializer)(
+                self.model_initializer,
+                self.model_init_params,
+                self.model_extra_params,
+                train_input=self.fold_train_input,
+                train_target=self.fold_train_target,
+                validation_input=self.fold_validation_input,
+                validation_target=self.fold_validation_target,
+                do_predict_proba=self.do_predict_proba,
+                target_metric=self.target_metric,
+                metrics=self.metrics,
+            )
+            self.model.staged_rounds = self.staged_estimators
+            self.model.dataset_key = self._get_dataset_key(self._rep, self._fold)
+            self.model.fit()
+
+        chunk_size = G.Env.data_loading_params.get("chunk_size", None)
+        if chunk_size is not None:
+            self.model.predict_chunk_size = chunk_size
         self.on_run_end()
 
+    ##################################################
+    # Fold Checkpoint Methods:
+    ##################################################
+    #: Attributes saved in fold checkpoints. Arrays, and objects with a `restore` method (like
+    #: :class:`callbacks.predictors._PredictionAccumulator`) are restored in-place, so callbacks
+    #: holding them keep using the same objects. Other attributes are replaced. Missing attributes
+    #: are skipped
+    checkpoint_attributes = [
+        "stat_aggregates",
+        "last_evaluation_results",
+        "_final_oof_values",
+        "_repetition_oof_values",
+        "_holdout_values",
+        "_test_values",
+        "_staged_values",
+    ]
+
+    def _save_checkpoint(self):
+        """Save the state accumulated by the Experiment's callbacks after completing the current
+        fold, so an interrupted Experiment with the same keys can resume from the next fold. If the
+        state cannot be pickled (as may happen with custom callbacks' aggregates), checkpointing is
+        disabled for the rest of the Experiment"""
+        if self._checkpoint_path is None:
+            return
+
+        attributes = {_: self.__dict__[_] for _ in self.checkpoint_attributes if _ in self.__dict__}
+        checkpoint = dict(rep=self._rep, fold=self._fold, run=self._run, attributes=attributes)
+
+        try:
+            make_dirs(os.path.dirname(self._checkpoint_path), exist_ok=True)
+            with atomic_write(self._checkpoint_path, mode="wb") as f:
+                pickle.dump(checkpoint, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as _ex:
+            G.warn(f"Disabling fold checkpoints. Failed to pickle Experiment state: {_ex!r}")
+            self.result_paths = dict(self.result_paths, checkpoint=None)
+
+    def _load_checkpoint(self):
+        """Load the checkpoint left by an interrupted Experiment with the same keys, if one exists,
+        and set :attr:`_completed_fold` to the (`rep`, `fold`) at which it was saved
+
+        Returns
+        -------
+        Dict, or None
+            The checkpoint saved by :meth:`_save_checkpoint`, or None if there is no checkpoint"""
+        self._completed_fold = None
+        if self._checkpoint_path is None or not os.path.exists(self._checkpoint_path):
+            return None
+
+        with open(self._checkpoint_path, "rb") as f:
+            checkpoint = pickle.load(f)
+
+        self._completed_fold = (checkpoint["rep"], checkpoint["fold"])
+        G.log(f"Resuming Experiment after repetition/fold: {self._completed_fold}")
+        return checkpoint
+
+    def _restore_checkpoint(self, checkpoint):
+        """Restore the attributes saved in `checkpoint` by :meth:`_save_checkpoint`
+
+        Parameters
+        ----------
+        checkpoint: Dict
+            Checkpoint returned by :meth:`_load_checkpoint`"""
+        self._run = checkpoint["run"]
+
+        for name, value in checkpoint["attributes"].items():
+            current = self.__dict__.get(name, None)
+            if isinstance(current, np.ndarray):
+                current[...] = value
+            elif hasattr(current, "restore"):
+                current.restore(value)
+            else:
+                setattr(self, name, value)
+
+    def _is_fold_completed(self, rep, fold):
+        """Determine whether a fold was completed before the Experiment resumed from a checkpoint
+
+        Parameters
+        ----------
+        rep: Int
+            The repetition to check
+        fold: Int, or None
+            The fold to check. If None, check whether the entire repetition was completed
+
+        Returns
+        -------
+        Boolean
+            True if the fold (or repetition) was completed, and should be skipped"""
+        if self._completed_fold is None:
+            return False
+        if fold is None:
+            return rep < self._completed_fold[0]
+        return (rep, fold) <= self._completed_fold
+
+    def _get_dataset_key(self, rep, fold):
+        """Identify the datasets of a fold, so that Models fit on them (in this, or any later
+        Experiment) can reuse anything they build from them, like the native datasets of
+        :class:`models.NativeBoostingModel`. The datasets of a fold are determined by the
+        Environment's `cross_experiment_key` (which determines the fold splits), the contents of
+        :attr:`train_input_data` and :attr:`train_target_data`, and the fold. The contents are
+        hashed by :func:`key_handler.hash_dataframe`, so datasets replaced by callbacks (or by
+        Environment budgets, like the "train_rows" budget of Hyperband) get different keys
+
+        Parameters
+        ----------
+        rep: Int
+            The repetition of the fold
+        fold: Int
+            The index of the fold in its repetition
+
+        Returns
+        -------
+        Tuple, or None
+            Hashable key of the fold datasets. None if :meth:`_do_copy_fold_data` found that they
+            may be modified in-place, or if any callback declares `affects_fit`, so it may replace
+            them before each fit. In either case, nothing built from them should be reused"""
+        if self._copy_fold_data:
+            return None
+        if any(vars(_).get("affects_fit", False) for _ in type(self).__mro__):
+            return None
+        return (*self._get_data_key(), rep, fold)
+
+    def _get_data_key(self):
+        """Identify the training data of the Experiment by the Environment's `cross_experiment_key`,
+        and the hashes of :attr:`train_input_data`, and :attr:`train_target_data`. Hashes are cached
+        by :func:`key_handler.hash_dataframe`, so the datasets are only hashed once
+
+        Returns
+        -------
+        Tuple
+            Hashable key of the training data"""
+        data_hashes = [hash_dataframe(_) for _ in [self.train_input_data, self.train_target_data]]
+        return (self.cross_experiment_key.key, *data_hashes)
+
+    def _do_copy_fold_data(self):
+        """Determine whether fold datasets must be copies of the full datasets, rather than views,
+        because the Model, or any callback declares that it modifies them in-place via its
+        `mutates_fold_data` attribute
+
+        Returns
+        -------
+        Boolean
+            True if :attr:`models.Model.mutates_fold_data` is True for the algorithm's Model class,
+            or if :attr:`callbacks.bases.BaseCallback.mutates_fold_data` is True for any callback"""
+        if model_selector(self.model_initializer).mutates_fold_data:
+            return True
+        return any(vars(_).get("mutates_fold_data", False) for _ in type(self).__mro__)
+
+    ##################################################
+    # Parallel Fitting Methods:
+    ##################################################
+    def _do_fit_in_parallel(self):
+        """Determine whether Models should be fit in worker processes according to
+        :attr:`environment.Environment.n_jobs`
+
+        Returns
+        -------
+        Boolean
+            True if `n_jobs` != 1, the algorithm's Models can be sent to worker processes, and no
+            callback declares that it changes what Models are fit on via its `affects_fit`
+            attribute (see :attr:`callbacks.bases.BaseCallback.affects_fit`)"""
+        if getattr(G.Env, "n_jobs", 1) == 1:
+            return False
+        if self.module_name == "keras":
+            G.warn("Keras models cannot be fit in worker processes. Ignoring `n_jobs`")
+            return False
+        if any(vars(_).get("affects_fit", False) for _ in type(self).__mro__):
+            G.warn("Callbacks may change Models before they are fit. Ignoring `n_jobs`")
+            return False
+        return True
+
+    @contextmanager
+    def _fit_in_parallel(self, reshaped_indices):
+        """Fit the Models of all repetitions/folds/runs in a pool of worker processes while the
+        cross-validation loop is executed, if :meth:`_do_fit_in_parallel`. Only the fitting is done
+        by the workers. Predicting, evaluating, and all other callbacks are still executed in order
+        by :meth:`cv_run_workflow`, which ensures results are identical to those produced when
+        fitting serially. Fits are submitted in order, and at most two per worker are submitted
+        ahead of the run being executed, so fitted Models are collected fold by fold, rather than
+        all held in memory at once. The indices of all folds are published once in shared memory by
+        a :class:`utils.shared_memory_utils.SharedDataPlane`, and so is the training data, by the
+        plane of the active Environment (see :meth:`environment.Environment.get_shared_data`), so
+        later Experiments with the same training data reuse it. Workers are only sent handles of
+        them, from which they slice their own fold datasets
+
+        Parameters
+        ----------
+        reshaped_indices: List
+            Cross validation indices in the shape of (<n_repeats or 1>, <n_splits>), as produced by
+            :func:`get_fold_indices`
+
+        Yields
+        ------
+        None
+            While the worker processes are open. :attr:`_fitted_models` holds the futures of the
+            submitted fits, keyed by tuples of (`rep`, `fold`, `run`)"""
+        if not self._do_fit_in_parallel():
+            yield
+            return
+
+        n_jobs = G.Env.n_jobs
+        n_workers = n_jobs if n_jobs > 0 else max(cpu_count() + 1 + n_jobs, 1)
+        # Sentinels are located in this process, so fold datasets must be made here to find them
+        do_share = SharedDataPlane.available and not G.sentinel_registry
+
+        folds = [
+            (rep, fold, train_index, validation_index)
+            for rep, rep_indices in enumerate(reshaped_indices)
+            for fold, (train_index, validation_index) in enumerate(rep_indices)
+            if not self._is_fold_completed(rep, fold)
+        ]
+
+        with SharedDataPlane() as plane, ProcessPoolExecutor(max_workers=n_workers) as executor:
+            shared_data = None
+            fold_indices = [_[2:] for _ in folds]
+            if do_share:
+                # The datasets are published once for all Experiments with the same training data,
+                # and the indices of this Experiment's folds are published once. Workers are only
+                # sent handles, with which they attach to them without copying
+                shared_data = G.Env.get_shared_data(self._get_data_key(), self._publish_datasets)
+                shared_indices = plane.publish_arrays([_ for f in fold_indices for _ in f])
+                fold_indices = list(zip(shared_indices[::2], shared_indices[1::2]))
+
+            self._pending_fits = deque(
+                ((rep, fold, run), indices)
+                for (rep, fold, *_), indices in zip(folds, fold_indices)
+                for run in range(self.experiment_params.get("runs", 1))
+            )
+            self._fit_pool = (executor, 2 * n_workers, shared_data)
+            self._fitted_models = dict()
+            G.log(f"Fitting {len(self._pending_fits)} models with {n_workers} worker processes", 4)
+
+            try:
+                self._submit_fits()
+                yield
+            finally:
+                for future in self._fitted_models.values():
+                    future.cancel()  # Stop fits that are no longer needed, as when pruned
+                self._pending_fits, self._fit_pool, self._fitted_models = None, None, None
+
+    def _publish_datasets(self, plane):
+        """Publish :attr:`train_input_data`, and :attr:`train_target_data` in shared memory for the
+        worker processes of :meth:`_fit_in_parallel`
+
+        Parameters
+        ----------
+        plane: :class:`utils.shared_memory_utils.SharedDataPlane`
+            The plane with which to publish, owned by the active Environment
+
+        Returns
+        -------
+        List
+            Handles of :attr:`train_input_data`, and :attr:`train_target_data`"""
+        return [plane.publish_frame(_) for _ in [self.train_input_data, self.train_target_data]]
+
+    def _submit_fits(self):
+        """Submit fits from :attr:`_pending_fits` to the worker processes opened by
+        :meth:`_fit_in_parallel`, until the maximum number of fits are in progress, or awaiting
+        collection by :meth:`cv_run_workflow`. The seed, and fold datasets of the current run are
+        restored after submitting"""
+        executor, max_submitted, shared_data = self._fit_pool
+        current_seed = self.current_seed
+        current_data = [
+            self.fold_train_input,
+            self.fold_validation_input,
+            self.fold_train_target,
+            self.fold_validation_target,
+        ]
+
+        while self._pending_fits and len(self._fitted_models) < max_submitted:
+            (rep, fold, run), (train_index, validation_index) = self._pending_fits.popleft()
+
+            if shared_data is not None:
+                fold_data = dict(
+                    shared_fold=(*shared_data, train_index, validation_index, self._copy_fold_data)
+                )
+            else:
+                # Set fold datasets, so `locate_sentinels` can find them
+                # Fold datasets are pickled for workers, so they never need to be copied here
+                self.fold_train_input = slice_fold_data(self.train_input_data, train_index)
+                self.fold_validation_input = slice_fold_data(
+                    self.train_input_data, validation_index
+                )
+                self.fold_train_target = slice_fold_data(self.train_target_data, train_index)
+                self.fold_validation_target = slice_fold_data(
+                    self.train_target_data, validation_index
+                )
+                fold_data = dict(
+                    train_input=self.fold_train_input,
+                    train_target=self.fold_train_target,
+                    validation_input=self.fold_validation_input,
+                    validation_target=self.fold_validation_target,
+                )
+
+            self.current_seed = self.experiment_params["random_seeds"][rep][fold][run]
+            self._update_model_params()
+            # Copy, since submitted arguments are pickled lazily, after the next update
+            init_params = dict(locate_sentinels(self.model_init_params))
+
+            self._fitted_models[(rep, fold, run)] = executor.submit(
+                _fit_model,
+                self.model_initializer,
+                init_params,
+                locate_sentinels(self.model_extra_params),
+                self.current_seed,
+                dataset_key=self._get_dataset_key(rep, fold),
+                do_predict_proba=self.do_predict_proba,
+                target_metric=self.target_metric,
+                metrics=self.metrics,
+                **fold_data,
+            )
+
+        self.current_seed = current_seed
+        self.fold_train_input, self.fold_validation_input = current_data[:2]
+        self.fold_train_target, self.fold_validation_target = current_data[2:]
+        if self.current_seed is not None:
+            self._update_model_params()
+
 
 ##################################################
 # Core CV Experiment Classes:
@@ -630,6 +1218,7 @@ class CVExperiment(BaseCVExperiment, metaclass=ExperimentMeta):
         do_raise_repeated=False,
         auto_start=True,
         target_metric=None,
+        staged_estimators=None,
     ):
         BaseCVExperiment.__init__(
             self,
@@ -647,6 +1236,7 @@ class CVExperiment(BaseCVExperiment, metaclass=ExperimentMeta):
             do_raise_repeated=do_raise_repeated,
             auto_start=auto_start,
             target_metric=target_metric,
+            staged_estimators=staged_estimators,
         )
 
     def _initialize_folds(self):
@@ -692,6 +1282,382 @@ def get_cv_indices(folds, cv_params, input_data, target_data):
         yield (next(indices) for _ in range(cv_params["n_splits"]))
 
 
+def select_columns(data, columns):
+    """Select `columns` of `data`, without reading memory-mapped datasets into memory
+
+    Parameters
+    ----------
+    data: pandas.DataFrame
+        The full dataset from which to select columns
+    columns: List
+        Names of the columns to select
+
+    Returns
+    -------
+    pandas.DataFrame
+        The `columns` of `data`. If `data` is memory-mapped (see
+        :func:`utils.file_utils.is_memory_mapped`), the selected columns are views of the columns of
+        `data`, and remain mapped. Otherwise, they are copies
+
+    Examples
+    --------
+    >>> select_columns(pd.DataFrame(dict(a=[0, 1], b=[2, 3], c=[4, 5])), ["c", "a"])
+       c  a
+    0  4  0
+    1  5  1"""
+    if not is_memory_mapped(data):
+        return data.loc[:, columns]
+
+    # Building the DataFrame without copying keeps each column in its own (mapped) block
+    selected = pd.DataFrame({_: data[_] for _ in columns}, copy=False)
+    selected.attrs.update(data.attrs)
+    return selected
+
+
+def format_feature_selector(feature_selector, train_dataset, target_column, id_column):
+    """Determine the columns of `train_dataset` that are used as input data
+
+    Parameters
+    ----------
+    feature_selector: List, or None
+        Names of the input columns. If empty or None, all columns of `train_dataset` are used
+    train_dataset: pandas.DataFrame
+        The training dataset of the active `Environment`
+    target_column: List
+        Names of the target columns, which are never input columns
+    id_column: String, or None
+        Name of the ID column, which is never an input column
+
+    Returns
+    -------
+    List
+        Names of the input columns, excluding `target_column` and `id_column`"""
+    feature_selector = feature_selector or train_dataset.columns.values
+    restricted_cols = [_ for _ in target_column + [id_column] if _ is not None]
+    return [_ for _ in feature_selector if _ not in restricted_cols]
+
+
+def get_hyperparameter_key_parameters(
+    model_initializer,
+    model_init_params,
+    model_extra_params,
+    preprocessing_pipeline,
+    preprocessing_params,
+    feature_selector,
+):
+    """Assemble the parameters hashed by :class:`key_handler.HyperparameterKeyMaker` to make an
+    Experiment's hyperparameter key. Used both by :class:`BaseExperiment`, and by Optimization
+    Protocols to make the key of an Experiment before initializing it
+
+    Parameters
+    ----------
+    model_initializer: Class, or String
+        The algorithm class, or a hash of it
+    model_init_params: Dict
+        Parameters given to `model_initializer` on initialization
+    model_extra_params: Dict
+        Extra parameters used to fit the model, like those given to its `fit` method
+    preprocessing_pipeline: Dict
+        Preprocessing steps to apply to the datasets
+    preprocessing_params: Dict
+        Parameters given to the steps of `preprocessing_pipeline`
+    feature_selector: List
+        Names of the input columns. See :func:`format_feature_selector`
+
+    Returns
+    -------
+    Dict
+        The parameters that make up the hyperparameter key"""
+    return dict(
+        model_initializer=model_initializer,
+        model_init_params=model_init_params,
+        model_extra_params=model_extra_params,
+        preprocessing_pipeline=preprocessing_pipeline,
+        preprocessing_params=preprocessing_params,
+        feature_selector=feature_selector,
+        # FLAG: Should probably add :attr:`target_metric` to key - With option to ignore it?
+    )
+
+
+#: Cross validation indices computed by :func:`get_fold_indices`, keyed by `cross_experiment_key`.
+#: They are shared by all Experiments in the process, so the indices of an Environment are computed
+#: once, then reused by each of its Experiments, like those of an Optimization Protocol
+FOLD_INDICES_CACHE = LRUCache(max_size=4)
+
+
+def get_fold_indices(folds, cv_params, input_data, target_data, cache_key=None, cache_dir=None):
+    """Compute the cross validation indices of all folds at once, as compact integer arrays. If
+    `cache_key` is given, the indices are computed only once for all Experiments with the same key,
+    and are reused from :data:`FOLD_INDICES_CACHE`, or from the file saved in `cache_dir`
+
+    Parameters
+    ----------
+    folds: Instance of `cv_type`
+        Cross validation folds object, whose :meth:`split` receives `input_data` and `target_data`
+    cv_params: Dict
+        Parameters given to instantiate `folds`. Must contain `n_splits`. May contain `n_repeats`
+    input_data: pandas.DataFrame
+        Input data to be split by `folds`, to which the indices will correspond
+    target_data: pandas.DataFrame
+        Target data to be split by `folds`, to which the indices will correspond
+    cache_key: String, or None, default=None
+        Identifies the indices, which must be fully determined by it. For Experiments, this is the
+        Environment's `cross_experiment_key`, which includes `cv_type`, `cv_params`, and the
+        datasets. If None, indices are computed every time
+    cache_dir: String, or None, default=None
+        Directory in which indices are saved as "<cache_key>.npz" files, so they are reused by
+        later processes. If None, indices are only cached in memory
+
+    Returns
+    -------
+    List
+        Cross validation indices in the shape of (<n_repeats or 1>, <n_splits>), in which each fold
+        is a tuple of (<train indices>, <validation indices>). Indices are int32 arrays, unless
+        `input_data` has too many rows for int32, in which case they are int64
+
+    Notes
+    -----
+    Indices are assumed to depend only on the number of rows of `input_data`, and on
+    `target_data`, as is the case for all of scikit-learn's splitters, so Experiments with different
+    `feature_selector` values share the same indices. Cached indices are only reused for datasets
+    with the same number of rows. Indices of splitters that shuffle without a `random_state` (see
+    :func:`_is_random_split`) differ each time they are computed, so they are never cached"""
+    n_rows = len(input_data)
+    if _is_random_split(folds, cv_params):
+        cache_key = None
+
+    def compute_indices():
+        file_path = None
+        if cache_key is not None and cache_dir is not None:
+            file_path = os.path.join(cache_dir, f"{cache_key}.npz")
+            if os.path.exists(file_path):
+                indices = _read_fold_indices(file_path, cv_params, n_rows)
+                if indices is not None:
+                    return indices
+
+        dtype = np.int32 if n_rows <= np.iinfo(np.int32).max else np.int64
+        indices = [
+            [(np.asarray(_t, dtype=dtype), np.asarray(_v, dtype=dtype)) for _t, _v in rep_indices]
+            for rep_indices in get_cv_indices(folds, cv_params, input_data, target_data)
+        ]
+
+        if file_path is not None:
+            arrays = dict(n_rows=np.array(n_rows))
+            for rep, rep_indices in enumerate(indices):
+                for fold, (train_index, validation_index) in enumerate(rep_indices):
+                    arrays[f"{rep}_{fold}_train"] = train_index
+                    arrays[f"{rep}_{fold}_validation"] = validation_index
+
+            make_dirs(cache_dir, exist_ok=True)
+            with atomic_write(file_path, mode="wb") as f:
+                np.savez(f, **arrays)
+        return indices
+
+    if cache_key is None:
+        return compute_indices()
+    return FOLD_INDICES_CACHE.get_or_set((cache_key, n_rows), compute_indices)
+
+
+def _is_random_split(folds, cv_params):
+    """Determine whether the splits made by `folds` are random, and not reproducible, because it
+    shuffles (or always splits randomly, like `RepeatedKFold`, and `ShuffleSplit`) without a
+    `random_state`
+
+    Parameters
+    ----------
+    folds: Instance of `cv_type`, or None
+        Cross validation folds object. If None, only `cv_params` are checked
+    cv_params: Dict
+        Parameters given to instantiate `folds`
+
+    Returns
+    -------
+    Boolean
+        True if the indices of `folds` would differ each time they are computed
+
+    Examples
+    --------
+    >>> from sklearn.model_selection import KFold, RepeatedKFold
+    >>> _is_random_split(KFold(n_splits=3), dict(n_splits=3))
+    False
+    >>> _is_random_split(KFold(n_splits=3, shuffle=True), dict(n_splits=3, shuffle=True))
+    True
+    >>> _is_random_split(RepeatedKFold(n_splits=3), dict(n_splits=3))
+    True
+    >>> _is_random_split(RepeatedKFold(random_state=32), dict(random_state=32))
+    False"""
+    if cv_params.get("random_state", getattr(folds, "random_state", None)) is not None:
+        return False
+    if "shuffle" in cv_params or hasattr(folds, "shuffle"):
+        return bool(cv_params.get("shuffle", getattr(folds, "shuffle", False)))
+    return hasattr(folds, "random_state")
+
+
+def _read_fold_indices(file_path, cv_params, n_rows):
+    """Read the cross validation indices saved by :func:`get_fold_indices`
+
+    Parameters
+    ----------
+    file_path: String
+        Path of the ".npz" file containing the indices
+    cv_params: Dict
+        Parameters used to instantiate the cross validation folds. Must contain `n_splits`. May
+        contain `n_repeats`
+    n_rows: Int
+        Number of rows in the data to be split, which must match the number saved with the indices
+
+    Returns
+    -------
+    List, or None
+        Cross validation indices in the shape of (<n_repeats or 1>, <n_splits>). None if the
+        indices were saved for a different number of rows, or for fewer folds, so they must be
+        computed again"""
+    n_splits, n_repeats = cv_params["n_splits"], cv_params.get("n_repeats", 1)
+    with np.load(file_path) as npz:
+        if ("n_rows" not in npz.files) or (int(npz["n_rows"]) != n_rows):
+            return None
+        try:
+            return [
+                [(npz[f"{_r}_{_f}_train"], npz[f"{_r}_{_f}_validation"]) for _f in range(n_splits)]
+                for _r in range(n_repeats)
+            ]
+        except KeyError:
+            return None
+
+
+def slice_fold_data(data, index, do_copy=False):
+    """Select the rows of `data` at the positions in `index` for a cross validation fold, without
+    copying `data` when possible
+
+    Parameters
+    ----------
+    data: pandas.DataFrame, or pandas.Series
+        The full dataset from which to select rows
+    index: Array-like
+        Integer positions of the rows to select, as yielded by a cross validation `split` method
+    do_copy: Boolean, default=False
+        If True, the result is always a copy that can be safely modified in-place
+
+    Returns
+    -------
+    pandas.DataFrame, or pandas.Series
+        The rows of `data` at `index`. If `index` is a contiguous, ascending range (as are the
+        validation indices of unshuffled folds), this is a view of `data`, unless `do_copy` is True.
+        Otherwise, the rows are taken with exactly one copy, regardless of `do_copy`
+
+    Notes
+    -----
+    Only contiguous folds can be views. The folds of shuffled splitters (like `KFold` with
+    `shuffle=True`, or `StratifiedKFold`), and the train folds of unshuffled `KFold` (other than
+    those of the first and last folds) are not contiguous, so they are always copied. For these
+    folds, the memory saved is only that of the redundant copies made by earlier versions
+
+    Examples
+    --------
+    >>> df = pd.DataFrame(dict(a=[0, 1, 2, 3]))
+    >>> slice_fold_data(df, np.array([1, 2]))
+       a
+    1  1
+    2  2
+    >>> slice_fold_data(df, np.array([3, 0]))
+       a
+    3  3
+    0  0"""
+    index = np.asarray(index)
+    if len(index) and index[-1] - index[0] == len(index) - 1 and np.all(np.diff(index) == 1):
+        sliced = data.iloc[index[0] : index[0] + len(index)]
+        return sliced.copy() if do_copy else sliced
+    return data.take(index)  # Taking an array of positions always copies, so never copy again
+
+
+def _fit_model(
+    model_initializer,
+    initialization_params,
+    extra_params,
+    seed,
+    dataset_key=None,
+    shared_fold=None,
+    **kwargs,
+):
+    """Initialize and fit a :class:`models.Model` in a worker process. This mirrors the fitting done
+    by :meth:`BaseCVExperiment.cv_run_workflow` after :meth:`BaseCVExperiment.on_run_start` has set
+    the random seed for the run
+
+    Parameters
+    ----------
+    model_initializer: Class
+        The algorithm class being used to initialize a model
+    initialization_params: Dict
+        Parameters used to initialize `model_initializer`, with random seeds already updated
+    extra_params: Dict
+        Extra parameters for :class:`models.Model`
+    seed: Int
+        The random seed of the run for which the Model is fit
+    dataset_key: Tuple, or None, default=None
+        Identifies the fold datasets, so the worker process can reuse native datasets built from
+        them by earlier fits. See :meth:`BaseCVExperiment._get_dataset_key`
+    shared_fold: Tuple, or None, default=None
+        If given, the fold datasets are sliced from datasets published in shared memory, rather
+        than given in `kwargs`. See :func:`_attach_fold_data`, which receives its contents
+    **kwargs: Dict
+        Additional arguments supplied to :class:`models.Model`, such as the fold datasets
+
+    Returns
+    -------
+    Tuple
+        The fitted Model, with its datasets removed to avoid sending them back to the main process,
+        and the number of seconds spent fitting it"""
+    if shared_fold is not None:
+        kwargs.update(_attach_fold_data(*shared_fold))
+
+    np.random.seed(seed)
+    model = model_selector(model_initializer)(
+        model_initializer, initialization_params, extra_params, **kwargs
+    )
+    model.dataset_key = dataset_key
+    fit_start = perf_counter()
+    model.fit()
+    fit_time = perf_counter() - fit_start
+
+    model.train_input, model.train_target = None, None
+    model.validation_input, model.validation_target = None, None
+    return model, fit_time
+
+
+def _attach_fold_data(input_data, target_data, train_index, validation_index, do_copy=False):
+    """Attach to the datasets, and fold indices published in shared memory by
+    :meth:`BaseCVExperiment._fit_in_parallel`, and slice the datasets of the fold from them
+
+    Parameters
+    ----------
+    input_data: :class:`utils.shared_memory_utils.SharedFrame`, or `MappedFrame`
+        Handle of the full input dataset
+    target_data: :class:`utils.shared_memory_utils.SharedFrame`, or `MappedFrame`
+        Handle of the full target dataset
+    train_index: :class:`utils.shared_memory_utils.SharedArray`
+        Handle of the fold's train indices
+    validation_index: :class:`utils.shared_memory_utils.SharedArray`
+        Handle of the fold's validation indices
+    do_copy: Boolean, default=False
+        If True, the fold datasets are always copies. See :func:`slice_fold_data`
+
+    Returns
+    -------
+    Dict
+        The fold datasets, keyed by the names of the :class:`models.Model` parameters to which
+        they are given (like "train_input", and "validation_target")"""
+    input_data, target_data = input_data.attach(), target_data.attach()
+    train_index, validation_index = train_index.attach(), validation_index.attach()
+
+    _slice = partial(slice_fold_data, do_copy=do_copy)
+    return dict(
+        train_input=_slice(input_data, train_index),
+        train_target=_slice(target_data, train_index),
+        validation_input=_slice(input_data, validation_index),
+        validation_target=_slice(target_data, validation_index),
+    )
+
+
 ##################################################
 # Other Experiment Classes:
 ##################################################
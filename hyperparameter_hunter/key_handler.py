@@ -27,7 +27,15 @@ from hyperparameter_hunter.library_helpers.keras_optimization_helper import init
 from hyperparameter_hunter.metrics import Metric
 from hyperparameter_hunter.sentinels import Sentinel
 from hyperparameter_hunter.settings import G
-from hyperparameter_hunter.utils.file_utils import write_json, read_json, add_to_json, make_dirs
+from hyperparameter_hunter.utils.file_utils import (
+    write_json,
+    read_json,
+    add_to_json,
+    make_dirs,
+    atomic_write,
+    file_lock,
+    is_memory_mapped,
+)
 from hyperparameter_hunter.utils.general_utils import subdict
 from hyperparameter_hunter.utils.boltons_utils import remap, default_enter
 
@@ -44,10 +52,11 @@ from inspect import getsourcelines, isclass, getsource
 from os import listdir
 import os.path
 import pandas as pd
-from pickle import PicklingError
+from pickle import PicklingError, HIGHEST_PROTOCOL, dump as pickle_dump
 import re
 import shelve
 import sys
+import weakref
 
 ##################################################
 # Import Learning Assets
@@ -64,7 +73,7 @@ except ModuleNotFoundError:
 # KeyMaker Base Class:
 ##################################################
 class KeyMaker(metaclass=ABCMeta):
-    def __init__(self, parameters, **kwargs):
+    def __init__(self, parameters, dry_run=False, **kwargs):
         """Base class to handle making key hashes and checking for their existence. Additionally,
         this class handles saving entries for complex-typed parameters, along with their hashes to
         ensure experiments are reproducible
@@ -74,6 +83,9 @@ class KeyMaker(metaclass=ABCMeta):
         parameters: Dict
             All the parameters to be included when creating the key hash. Keys should correspond to
             parameter names, and values should be the values of the corresponding keys
+        dry_run: Boolean, default=False
+            If True, only :attr:`key` is made. Lookup entries for complex-typed parameters are not
+            saved, and :meth:`does_key_exist` is not called, so :attr:`exists` remains False
         **kwargs: Dict
             Additional arguments
 
@@ -89,9 +101,11 @@ class KeyMaker(metaclass=ABCMeta):
             The directory in which complex-typed parameter entries will be saved
         tested_keys_dir: Str, or None
             The directory is which `key` will be saved if it does not already contain `key`"""
-        self.parameters = deepcopy(parameters)
+        # DataFrames are shared, rather than copied, since they are replaced by their hashes
+        self.parameters = deepcopy(parameters, memo=_dataframe_memo(parameters))
         self.key = None
         self.exists = False
+        self.dry_run = dry_run
 
         self.lookup_dir = None
         self.tested_keys_dir = None
@@ -100,7 +114,8 @@ class KeyMaker(metaclass=ABCMeta):
         self.handle_complex_types()
         self.make_key()
 
-        self.does_key_exist()
+        if not self.dry_run:
+            self.does_key_exist()
 
     def __repr__(self):
         return f"{self.__class__.__name__}(key={self.key!r})"
@@ -135,7 +150,7 @@ class KeyMaker(metaclass=ABCMeta):
         except TypeError:  # Key-making blacklisted
             if self.tested_keys_dir is None:
                 return
-            make_dirs(self.tested_keys_dir)
+            make_dirs(self.tested_keys_dir, exist_ok=True)
 
     def handle_complex_types(self):
         """Locate complex types in :attr:`parameters`, create hashes for them, add lookup entries
@@ -185,11 +200,12 @@ class KeyMaker(metaclass=ABCMeta):
                 if isinstance(value, pd.DataFrame):
                     dataframe_hashes.setdefault(hashed_value, []).append(key)
 
-                if self.tested_keys_dir is not None:  # Key-making not blacklisted
+                # Key-making not blacklisted, and not a dry run
+                if (self.tested_keys_dir is not None) and not self.dry_run:
                     try:
                         self.add_complex_type_lookup_entry(path, key, value, hashed_value)
                     except (FileNotFoundError, OSError):
-                        make_dirs(os.path.join(self.lookup_dir, *path), exist_ok=False)
+                        make_dirs(os.path.join(self.lookup_dir, *path), exist_ok=True)
                         self.add_complex_type_lookup_entry(path, key, value, hashed_value)
 
                 return (key, hashed_value)
@@ -220,7 +236,9 @@ class KeyMaker(metaclass=ABCMeta):
         lookup_path = partial(os.path.join, self.lookup_dir, *path)
 
         if isclass(value) or (key in shelve_params):
-            with shelve.open(lookup_path(f"{key}"), flag="c") as s:
+            # Shelve files can't be replaced atomically, so writers must hold the file's lock
+            shelve_lock = file_lock(lookup_path(f"{key}"))
+            with shelve_lock, shelve.open(lookup_path(f"{key}"), flag="c") as s:
                 # NOTE: When reading from shelve file, DO NOT add the ".db" file extension
                 try:
                     s[hashed_value] = value
@@ -232,8 +250,14 @@ class KeyMaker(metaclass=ABCMeta):
                 except Exception:
                     raise
         elif isinstance(value, pd.DataFrame):
-            make_dirs(lookup_path(key), exist_ok=True)
-            value.to_csv(lookup_path(key, f"{hashed_value}.csv"), index=False)
+            # Pickling memory-mapped DataFrames would read them entirely into memory
+            if is_memory_mapped(value):
+                return
+            # DataFrame hashes are content-based, so an existing entry never needs to be rewritten
+            if not os.path.exists(lookup_path(key, f"{hashed_value}.pkl")):
+                make_dirs(lookup_path(key), exist_ok=True)
+                with atomic_write(lookup_path(key, f"{hashed_value}.pkl"), mode="wb") as f:
+                    pickle_dump(value, f, protocol=HIGHEST_PROTOCOL)
         else:  # Possible types: partial, function, *other
             add_to_json(
                 file_path=lookup_path(f"{key}.json"),
@@ -310,9 +334,15 @@ class CrossExperimentKeyMaker(KeyMaker):
         return self.exists
 
     def save_key(self):
-        """Create a new file for this cross_experiment_key if :attr:`exists` is False"""
-        if not self.exists:
-            write_json(f"{self.tested_keys_dir}/{self.key}.json", {})
+        """Create a new file for this cross_experiment_key if :attr:`exists` is False, and no file
+        has since been created by another process (as when Experiments are executed in parallel)"""
+        if not (self.exists or self.does_key_exist()):
+            key_path = f"{self.tested_keys_dir}/{self.key}.json"
+
+            # Check again while locked, so a file created by another process is never overwritten
+            with file_lock(key_path):
+                if not os.path.exists(key_path):
+                    write_json(key_path, {})
             self.exists = True
             G.log(f'Saved {self.key_type}_key: "{self.key}"', 4)
         else:
@@ -406,6 +436,9 @@ class HyperparameterKeyMaker(KeyMaker):
         Returns
         -------
         Boolean"""
+        if (self.cross_experiment_key.exists is not True) and (self.tested_keys_dir is not None):
+            self.cross_experiment_key.does_key_exist()  # May have been saved by another process
+
         if self.cross_experiment_key.exists is True:
             records = read_json(f"{self.tested_keys_dir}/{self.cross_experiment_key.key}.json")
 
@@ -453,6 +486,80 @@ def make_hash_sha256(obj, **kwargs):
     return base64.urlsafe_b64encode(hasher.digest()).decode()
 
 
+#: Hashes made by :func:`hash_dataframe`, keyed by the `id` of each DataFrame still in memory
+_DATAFRAME_HASHES = {}
+
+
+def hash_dataframe(df, chunk_size=100_000):
+    """Create an sha256 hash of the full contents of `df`. Hashes are cached for as long as `df`
+    exists, so hashing the same DataFrame object again is free
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        DataFrame for which a hash will be created
+    chunk_size: Int, default=100_000
+        The number of rows of `df` hashed at once by :func:`pandas.util.hash_pandas_object`. Limits
+        the extra memory used for large DataFrames
+
+    Returns
+    -------
+    Stringified sha256 hash
+
+    Notes
+    -----
+    Unlike the `repr` of `df`, which is truncated for large DataFrames, the hash includes every
+    value, as well as the index, column names, and dtypes of `df`. Because hashes are cached by
+    object identity, a DataFrame modified in-place after being hashed keeps its original hash"""
+    try:
+        df_ref, df_hash = _DATAFRAME_HASHES[id(df)]
+        if df_ref() is df:
+            return df_hash
+    except KeyError:
+        pass
+
+    hasher = hashlib.sha256()
+    hasher.update(repr((df.shape, list(df.columns), [str(_) for _ in df.dtypes])).encode())
+    for start in range(0, len(df), chunk_size):
+        chunk = df.iloc[start : start + chunk_size]
+        hasher.update(pd.util.hash_pandas_object(chunk, index=True).values.tobytes())
+    df_hash = base64.urlsafe_b64encode(hasher.digest()).decode()
+
+    df_id = id(df)
+    _DATAFRAME_HASHES[df_id] = (
+        weakref.ref(df, lambda _: _DATAFRAME_HASHES.pop(df_id, None)),
+        df_hash,
+    )
+    return df_hash
+
+
+def _dataframe_memo(obj, memo=None):
+    """Build a :func:`copy.deepcopy` `memo` that maps each DataFrame in `obj` to itself, so the
+    DataFrames are not copied
+
+    Parameters
+    ----------
+    obj: Object
+        Object, possibly containing DataFrames in nested dicts, lists, or tuples
+    memo: Dict, or None, default=None
+        Memo to which DataFrames are added. If None, a new dict is used
+
+    Returns
+    -------
+    memo: Dict
+        Mapping of the `id` of each DataFrame in `obj` to the DataFrame"""
+    memo = {} if memo is None else memo
+    if isinstance(obj, pd.DataFrame):
+        memo[id(obj)] = obj
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            _dataframe_memo(value, memo)
+    elif isinstance(obj, (list, tuple)):
+        for value in obj:
+            _dataframe_memo(value, memo)
+    return memo
+
+
 def to_hashable(obj, **kwargs):
     """Format the input `obj` to be hashable
 
@@ -467,6 +574,8 @@ def to_hashable(obj, **kwargs):
     -------
     obj: object
         Hashable object"""
+    if isinstance(obj, pd.DataFrame):
+        return hash_dataframe(obj)
     if callable(obj):
         return hash_callable(obj, **kwargs)
     if isinstance(obj, (tuple, list)):
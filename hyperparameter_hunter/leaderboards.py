@@ -2,15 +2,34 @@
 'HyperparameterHunterAssets/Leaderboards' subdirectory. It provides the ability to compare all
 Experiment results at a glance
 
+Leaderboard entries are first appended to a :class:`LeaderboardLog`, which never needs to be read
+in order to add an entry. :func:`compact_leaderboard` later merges all of the log's entries into
+the sorted 'GlobalLeaderboard.csv' file at once, then clears the log. Optimization Protocols compact
+the log before reading the leaderboard, and after their Experiments end. Standalone Experiments
+compact the log as soon as their entry is appended
+
 Related
 -------
 :mod:`hyperparameter_hunter.recorders`
     This module initiates the saving of Experiment entries to Leaderboards"""
+##################################################
+# Import Own Assets
+##################################################
+from hyperparameter_hunter.utils.file_utils import (
+    atomic_write,
+    default_json_write,
+    file_lock,
+    make_dirs,
+)
+
 ##################################################
 # Import Miscellaneous Assets
 ##################################################
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+import os
 import pandas as pd
+import simplejson as json
 
 
 class Leaderboard(metaclass=ABCMeta):
@@ -57,7 +76,8 @@ class Leaderboard(metaclass=ABCMeta):
         raise NotImplementedError()
 
     def save(self, path, **kwargs):
-        """Save the Leaderboard instance
+        """Save the Leaderboard instance. The file at `path` is replaced atomically, so concurrent
+        readers never see a partially written Leaderboard
 
         Parameters
         ----------
@@ -65,7 +85,8 @@ class Leaderboard(metaclass=ABCMeta):
             The file to which the Leaderboard instance should be saved
         **kwargs: Dict
             Additional arguments to supply to :meth:`pandas.DataFrame.to_csv`"""
-        self.data.to_csv(path_or_buf=path, index=False, **kwargs)
+        with atomic_write(path, newline="") as f:
+            self.data.to_csv(path_or_buf=f, index=False, **kwargs)
 
     def sort(self, by, ascending=False):
         """Sort the rows in :attr:`data` according to the values of a column
@@ -80,6 +101,13 @@ class Leaderboard(metaclass=ABCMeta):
 
 
 class GlobalLeaderboard(Leaderboard):
+    identifier_cols = [
+        "experiment_id",
+        "hyperparameter_key",
+        "cross_experiment_key",
+        "algorithm_name",
+    ]
+
     def add_entry(self, experiment, **kwargs):
         """Add an entry row to :attr:`Leaderboard.data` (pandas.DataFrame). This method also handles
         column conflicts to an extent
@@ -90,38 +118,188 @@ class GlobalLeaderboard(Leaderboard):
             An Experiment instance for which a leaderboard entry row should be added
         **kwargs: Dict
             Extra keyword arguments"""
+        self.add_entries([self.format_entry(experiment)])
+
+    @classmethod
+    def format_entry(cls, experiment):
+        """Build the leaderboard entry of `experiment`, excluding its "experiment_#", which is only
+        known once the entry is added to the leaderboard
+
+        Parameters
+        ----------
+        experiment: Instance of :class:`experiments.BaseExperiment` descendant
+            An Experiment instance for which a leaderboard entry should be built
+
+        Returns
+        -------
+        entry: OrderedDict
+            Mapping of leaderboard column names to values. Evaluation columns are first, followed
+            by a "pruned" column of True if `experiment` was stopped early by a pruner, then the
+            columns in :attr:`identifier_cols`"""
         final_evaluations = experiment.last_evaluation_results
-        entry_columns, entry_data = [], []
         # TODO: Resolve cases where `data` contains an aliased column for a metric, but the current experiment uses the
         # TODO: ... standard metric name. EX) 'oof_roc' vs 'oof_roc_auc_score' - They should be considered the same - Use alias
-        evaluation_columns, evaluation_values = list(
-            zip(*evaluations_to_columns(final_evaluations))
-        )
-        entry_columns.extend(evaluation_columns)
-        entry_data.extend(evaluation_values)
-
-        identifier_cols = [
-            "experiment_id",
-            "hyperparameter_key",
-            "cross_experiment_key",
-            "algorithm_name",
-        ]
-        entry_columns.extend(identifier_cols)
-        for id_col in identifier_cols:
+        entry = OrderedDict(evaluations_to_columns(final_evaluations))
+        if getattr(experiment, "pruned", False):
+            entry["pruned"] = True
+
+        for id_col in cls.identifier_cols:
             val = getattr(experiment, id_col)
             if id_col in ["hyperparameter_key", "cross_experiment_key"]:
                 val = val.key
-            entry_data.append(val)
+            entry[id_col] = val
+
+        return entry
+
+    def add_entries(self, entries):
+        """Add multiple entry rows to :attr:`Leaderboard.data` at once, numbering them consecutively
+        in the "experiment_#" column. Entries may have evaluation columns that :attr:`data` does
+        not, in which case the new columns are added, and are null for all other rows
+
+        Parameters
+        ----------
+        entries: List of dicts
+            Leaderboard entries, as produced by :meth:`format_entry`"""
+        if not entries:
+            return
+
+        both_cols = self.identifier_cols + ["experiment_#"]
+        column_order = list(self.data.columns)
+        rows = []
+
+        for i, entry in enumerate(entries):
+            row = OrderedDict(entry)
+            row["experiment_#"] = self.data.shape[0] + i
+            rows.append(row)
+
+            # Column order only changes if `row` has new columns, so most entries are skipped
+            if i == 0 or not set(row.keys()).issubset(column_order):
+                column_order = combine_column_order(
+                    pd.DataFrame(columns=column_order), pd.DataFrame(columns=list(row)), both_cols
+                )
+
+        self.data = pd.concat([self.data, pd.DataFrame(rows)], ignore_index=True, sort=False)
+        self.data = self.data[column_order]
+
+
+class LeaderboardLog(object):
+    def __init__(self, path):
+        """Append-only log of leaderboard entries, stored as a file containing one JSON object per
+        line. Adding an entry to the log never requires reading existing entries, so its cost does
+        not grow with the number of Experiments conducted. Entries are merged into the leaderboard
+        file by :func:`compact_leaderboard`
+
+        Parameters
+        ----------
+        path: String
+            Path to the log file. The file is created when the first entry is appended"""
+        self.path = path
+
+    def append(self, entry):
+        """Add `entry` to the end of the log
+
+        Parameters
+        ----------
+        entry: Dict
+            A leaderboard entry, as produced by :meth:`GlobalLeaderboard.format_entry`. Entries in
+            the same log do not need to have the same keys"""
+        line = json.dumps(entry, default=default_json_write) + "\n"
+
+        try:
+            self._append_line(line)
+        except FileNotFoundError:
+            make_dirs(os.path.split(self.path)[0], exist_ok=True)
+            self._append_line(line)
+
+    def _append_line(self, line):
+        """Write `line` to the end of the log, while holding the log's :func:`file_lock`"""
+        with file_lock(self.path), open(self.path, "a") as f:
+            f.write(line)
+
+    def read(self):
+        """Read all entries in the log, in the order in which they were appended
+
+        Returns
+        -------
+        List of OrderedDicts
+            Entries in the log. Empty if the log file does not exist"""
+        try:
+            with open(self.path, "r") as f:
+                return [json.loads(_, object_pairs_hook=OrderedDict) for _ in f if _.strip()]
+        except FileNotFoundError:
+            return []
 
-        entry_columns.append("experiment_#")
-        entry_data.append(self.data.shape[0])
-        identifier_cols.append("experiment_#")
+    def clear(self):
+        """Remove all entries from the log by deleting its file"""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def compact_leaderboard(leaderboard_path, log_path, ascending=False):
+    """Merge all entries in the :class:`LeaderboardLog` at `log_path` into the
+    :class:`GlobalLeaderboard` at `leaderboard_path`, sort the leaderboard, then clear the log. The
+    leaderboard file is only read and written if the log contains entries
+
+    Parameters
+    ----------
+    leaderboard_path: String
+        Path to the .csv file of the :class:`GlobalLeaderboard`. Created if it does not exist
+    log_path: String
+        Path to the file of the :class:`LeaderboardLog` whose entries should be compacted
+    ascending: Boolean, default=False
+        Direction in which to sort the leaderboard's first column, which holds the target metric.
+        Should be True if the target metric is minimized. Ties are broken by descending
+        "experiment_#" (newest first)
 
-        entry = pd.DataFrame(data=[entry_data], columns=entry_columns)
+    Returns
+    -------
+    GlobalLeaderboard, or None
+        The updated leaderboard if `log_path` contained entries not already in the leaderboard.
+        Else None
+
+    Notes
+    -----
+    The log's :func:`utils.file_utils.file_lock` is held throughout compaction, so entries appended
+    by other processes are never lost between reading and clearing the log, and two processes
+    never compact the same entries. Entries whose "experiment_id" is already in the leaderboard are
+    skipped, so compaction is idempotent, even if a process is stopped after saving the leaderboard,
+    but before clearing the log"""
+    log = LeaderboardLog(log_path)
+    if not os.path.exists(log_path):
+        return None
+
+    with file_lock(log_path):
+        entries = log.read()
+        if not entries:
+            return None
+
+        leaderboard = GlobalLeaderboard.from_path(path=leaderboard_path)
+        merged_ids = set(leaderboard.data.get("experiment_id", []))
+        new_entries = []
+        for entry in entries:
+            if entry["experiment_id"] not in merged_ids:
+                merged_ids.add(entry["experiment_id"])
+                new_entries.append(entry)
+
+        if not new_entries:
+            log.clear()
+            return None
+
+        leaderboard.add_entries(new_entries)
+        leaderboard.sort(
+            by=[list(leaderboard.data.columns)[0], "experiment_#"], ascending=[ascending, False]
+        )
+
+        try:
+            leaderboard.save(path=leaderboard_path)
+        except FileNotFoundError:
+            make_dirs(os.path.split(leaderboard_path)[0], exist_ok=True)
+            leaderboard.save(path=leaderboard_path)
 
-        self.data = self.data.append(entry, ignore_index=True)[
-            combine_column_order(self.data, entry, both_cols=identifier_cols)
-        ]
+        log.clear()
+    return leaderboard
 
 
 # class AlgorithmLeaderboard(Leaderboard):
@@ -1,8 +1,8 @@
 """This module provides wrapper classes around the raw algorithms being executed to facilitate use
 by :class:`hyperparameter_hunter.experiments.BaseExperiment`. The algorithms created by most
 libraries can be handled by :class:`hyperparameter_hunter.models.Model`, but some need special
-attention, hence :class:`KerasModel`, and :class:`XGBoostModel`. The model classes defined herein
-handle algorithm instantiation, as well as fitting and predicting
+attention, hence :class:`KerasModel`, :class:`XGBoostModel`, and :class:`LightGBMModel`. The model
+classes defined herein handle algorithm instantiation, as well as fitting and predicting
 
 Related
 -------
@@ -16,20 +16,25 @@ Related
 ##################################################
 from hyperparameter_hunter.sentinels import locate_sentinels
 from hyperparameter_hunter.settings import G
+from hyperparameter_hunter.utils.file_utils import is_memory_mapped
+from hyperparameter_hunter.utils.general_utils import LRUCache
 
 # from hyperparameter_hunter.utils.metrics_utils import wrap_xgboost_metric
 
 ##################################################
 # Import Miscellaneous Assets
 ##################################################
+from abc import ABCMeta, abstractmethod
 from contextlib import suppress
 import inspect
+import numpy as np
 import sys
 import warnings
 
 ##################################################
 # Import Learning Assets
 ##################################################
+from sklearn.base import is_classifier
 import sklearn.utils as sklearn_utils
 
 load_model = lambda _: _
@@ -54,6 +59,9 @@ def model_selector(model_initializer):
     True
     >>> model_selector(KerasRegressor) == KerasModel
     True
+    >>> from lightgbm import LGBMClassifier
+    >>> model_selector(LGBMClassifier) == LightGBMModel
+    True
     >>> from sklearn.svm import SVC
     >>> model_selector(SVC) == Model
     True
@@ -65,13 +73,253 @@ def model_selector(model_initializer):
             return KerasModel
         elif model_initializer.__name__ in ("XGBClassifier", "XGBRegressor"):
             return XGBoostModel
+        elif model_initializer.__name__ in ("LGBMClassifier", "LGBMRegressor"):
+            return LightGBMModel
         else:
             return Model
     except AttributeError:
         return Model
 
 
+##################################################
+# Staged Predictions
+##################################################
+#: Names of the hyperparameters that set the number of boosting rounds of an algorithm, in the order
+#: in which they are checked by :func:`get_boosting_rounds_param`
+BOOSTING_ROUNDS_PARAMS = ["n_estimators", "num_boost_round", "num_iterations", "iterations"]
+
+#: Names of the `predict` arguments that limit the number of boosting rounds used for predictions by
+#: XGBoost (>=1.4), XGBoost (<1.4), LightGBM, and CatBoost, respectively
+STAGED_PREDICT_ARGS = ["iteration_range", "ntree_limit", "num_iteration", "ntree_end"]
+
+
+def get_boosting_rounds_param(model_init_params):
+    """Find the name of the hyperparameter that sets the number of boosting rounds
+
+    Parameters
+    ----------
+    model_init_params: Dict
+        The parameters used to initialize an algorithm
+
+    Returns
+    -------
+    String, or None
+        The first name in :data:`BOOSTING_ROUNDS_PARAMS` whose value in `model_init_params` is not
+        None. None if there is no such name
+
+    Examples
+    --------
+    >>> get_boosting_rounds_param(dict(max_depth=3, n_estimators=100))
+    'n_estimators'
+    >>> get_boosting_rounds_param(dict(n_estimators=None, iterations=500))
+    'iterations'
+    >>> get_boosting_rounds_param(dict(C=1.0)) is None
+    True"""
+    for param in BOOSTING_ROUNDS_PARAMS:
+        if model_init_params.get(param, None) is not None:
+            return param
+    return None
+
+
+def supports_staged_predictions(model_initializer):
+    """Determine whether the models created by `model_initializer` can predict with only their
+    first boosting rounds, as required by :meth:`Model.staged_predict`. This is the case for
+    algorithms with a `staged_predict` method (like SKLearn's gradient boosting), and for those
+    whose `predict` method accepts one of the arguments in :data:`STAGED_PREDICT_ARGS` (like
+    XGBoost, LightGBM, and CatBoost)
+
+    Parameters
+    ----------
+    model_initializer: Class
+        The algorithm class being used to initialize a model
+
+    Returns
+    -------
+    Boolean
+        True if models created by `model_initializer` can make staged predictions. Else False
+
+    Examples
+    --------
+    >>> from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+    >>> supports_staged_predictions(GradientBoostingClassifier)
+    True
+    >>> supports_staged_predictions(RandomForestClassifier)
+    False"""
+    if hasattr(model_initializer, "staged_predict"):
+        return True
+
+    try:
+        expected_parameters = inspect.signature(model_initializer.predict).parameters
+    except (AttributeError, TypeError, ValueError):
+        return False
+    return any(_ in expected_parameters for _ in STAGED_PREDICT_ARGS)
+
+
+def get_staged_location(model_initializer, model_init_params, model_extra_params):
+    """Find the hyperparameter that sets the number of stages at which the models created by
+    `model_initializer` can make staged predictions. Stages are boosting rounds for algorithms
+    supported by :func:`supports_staged_predictions`, and epochs for Keras models
+
+    Parameters
+    ----------
+    model_initializer: Class
+        The algorithm class being used to initialize a model
+    model_init_params: Dict
+        The parameters used to initialize `model_initializer`
+    model_extra_params: Dict, or None
+        The extra parameters of the model, which contain "epochs" for Keras models
+
+    Returns
+    -------
+    Tuple, or None
+        Path to the hyperparameter, like ("model_init_params", "n_estimators"), or
+        ("model_extra_params", "epochs"). None if `model_initializer` cannot make staged
+        predictions, or if the number of stages is not given
+
+    Examples
+    --------
+    >>> from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+    >>> get_staged_location(GradientBoostingClassifier, dict(n_estimators=100), {})
+    ('model_init_params', 'n_estimators')
+    >>> get_staged_location(RandomForestClassifier, dict(n_estimators=100), {}) is None
+    True"""
+    if model_selector(model_initializer) is KerasModel:
+        if (model_extra_params or {}).get("epochs", None) is not None:
+            return ("model_extra_params", "epochs")
+        return None
+
+    param = get_boosting_rounds_param(model_init_params)
+    if (param is not None) and supports_staged_predictions(model_initializer):
+        return ("model_init_params", param)
+    return None
+
+
+##################################################
+# Native Boosters
+##################################################
+#: Native training datasets (like XGBoost's `DMatrix`, and LightGBM's `Dataset`) built from fold
+#: data by :class:`NativeBoostingModel`, keyed by :meth:`NativeBoostingModel.get_dataset_cache_key`.
+#: They are shared by all Models in the process, so the native dataset of a fold is built once, then
+#: reused by each of its runs, and by later Experiments with the same `cross_experiment_key` and
+#: training data, like those of an Optimization Protocol. Set its `max_size` to limit the datasets
+#: held in memory
+NATIVE_DATASET_CACHE = LRUCache(max_size=10)
+
+
+class NativeBoosterEstimator(object, metaclass=ABCMeta):
+    def __init__(self, estimator, booster, classes=None):
+        """Wrapper around a booster trained by a library's native training function, which provides
+        the `predict` and `predict_proba` methods of the library's SKLearn estimators
+
+        Parameters
+        ----------
+        estimator: Object
+            The unfitted SKLearn estimator whose parameters were used to train `booster`
+        booster: Object
+            The trained booster, like :class:`xgboost.Booster`, or :class:`lightgbm.Booster`
+        classes: `numpy.ndarray`, or None, default=None
+            The sorted class labels of a classifier, whose positions are the labels on which
+            `booster` was trained. None for regressors"""
+        self.estimator = estimator
+        self.booster = booster
+        self.classes_ = classes
+
+    def get_params(self, deep=True):
+        return self.estimator.get_params(deep=deep)
+
+    def predict(self, X, num_iteration=None):
+        """Predict target values, or class labels if :attr:`classes_` is given
+
+        Parameters
+        ----------
+        X: Array-like
+            Input data containing the same features as were trained on
+        num_iteration: Int, or None, default=None
+            The number of boosting rounds with which to predict. If None, all rounds are used
+
+        Returns
+        -------
+        numpy.ndarray
+            Predictions of shape (<num_samples>,)"""
+        prediction = self.predict_booster(X, num_iteration)
+        if self.classes_ is None:
+            return prediction
+        if prediction.ndim == 1:
+            return self.classes_[(prediction > 0.5).astype(int)]
+        return self.classes_[np.argmax(prediction, axis=1)]
+
+    def predict_proba(self, X, num_iteration=None):
+        """Predict the probabilities of each class in :attr:`classes_`
+
+        Parameters
+        ----------
+        X: Array-like
+            Input data containing the same features as were trained on
+        num_iteration: Int, or None, default=None
+            The number of boosting rounds with which to predict. If None, all rounds are used
+
+        Returns
+        -------
+        numpy.ndarray
+            Class probabilities of shape (<num_samples>, <num_classes>)"""
+        prediction = self.predict_booster(X, num_iteration)
+        if prediction.ndim == 1:
+            return np.vstack((1.0 - prediction, prediction)).T
+        return prediction
+
+    @abstractmethod
+    def predict_booster(self, X, num_iteration=None):
+        """Make the raw predictions of :attr:`booster`, which are probabilities of the positive
+        class for binary classifiers, and probabilities of each class for multiclass classifiers"""
+        raise NotImplementedError()
+
+
+class XGBoostBoosterEstimator(NativeBoosterEstimator):
+    def __init__(self, estimator, booster, classes=None, dmatrix_params=None):
+        """Wrapper around an :class:`xgboost.Booster`. Consider documentation to be identical to
+        that of :class:`NativeBoosterEstimator`, except where noted
+
+        Parameters
+        ----------
+        estimator: See :class:`NativeBoosterEstimator`
+        booster: See :class:`NativeBoosterEstimator`
+        classes: See :class:`NativeBoosterEstimator`
+        dmatrix_params: Dict, or None, default=None
+            Parameters used to build the `DMatrix` on which `booster` was trained, which are also
+            used to build the `DMatrix` of prediction input data"""
+        super().__init__(estimator, booster, classes=classes)
+        self.dmatrix_params = dmatrix_params or {}
+
+    def predict_booster(self, X, num_iteration=None):
+        from xgboost import DMatrix
+
+        kwargs = dict()
+        if num_iteration is not None:
+            if "iteration_range" in inspect.signature(self.booster.predict).parameters:
+                kwargs["iteration_range"] = (0, num_iteration)
+            else:
+                kwargs["ntree_limit"] = num_iteration
+        return self.booster.predict(DMatrix(X, **self.dmatrix_params), **kwargs)
+
+
+class LightGBMBoosterEstimator(NativeBoosterEstimator):
+    """Wrapper around a :class:`lightgbm.Booster`. See :class:`NativeBoosterEstimator`"""
+
+    def predict_booster(self, X, num_iteration=None):
+        return self.booster.predict(X, num_iteration=num_iteration)
+
+
+##################################################
+# Model Classes
+##################################################
 class Model(object):
+    #: If True, the algorithm modifies its input datasets in-place during fitting or predicting, so
+    #: :class:`experiments.BaseCVExperiment` gives it copies of the fold datasets, rather than views
+    mutates_fold_data = False
+    #: The number of rows of memory-mapped input data predicted at once. Predicting in chunks limits
+    #: the input data read into memory to one chunk. See :func:`utils.file_utils.is_memory_mapped`
+    predict_chunk_size = 100_000
+
     def __init__(
         self,
         model_initializer,
@@ -153,6 +401,13 @@ class Model(object):
 
         self.model = None
         self.epochs_elapsed = None
+        #: Numbers of stages for which :meth:`staged_predict` will be called after fitting. Set
+        #: before :meth:`fit` by Experiments given `staged_estimators`
+        self.staged_rounds = None
+        #: Hashable identifier of the fold datasets given to the Model, which is the same for all
+        #: Models fit on the same data. Set before :meth:`fit` by Experiments, so
+        #: :class:`NativeBoostingModel` can reuse the native datasets it builds. None if unknown
+        self.dataset_key = None
 
         self.initialization_params = locate_sentinels(self.initialization_params)
         self.extra_params = locate_sentinels(self.extra_params)
@@ -206,11 +461,100 @@ class Model(object):
         if input_data is None:
             return None
 
+        chunks = self._get_predict_chunks(input_data)
+        if chunks is not None:
+            return np.concatenate([self.predict(_) for _ in chunks])
+
         if (self.do_predict_proba is True) or type(self.do_predict_proba) == int:
             prediction = self.model.predict_proba(input_data)
         else:
             prediction = self.model.predict(input_data)
 
+        return self._select_prediction_column(prediction)
+
+    def staged_predict(self, input_data, n_rounds):
+        """Generate model predictions for `input_data` using only the first boosting rounds of the
+        fitted model, once for each number of rounds in `n_rounds`. See
+        :func:`supports_staged_predictions` for the algorithms that can make staged predictions
+
+        Parameters
+        ----------
+        input_data: Array-like
+            Data containing the same number of features as were trained on, for which the model will
+            predict output values
+        n_rounds: List of int
+            Numbers of boosting rounds with which to predict. Each should be less than the number of
+            rounds with which the model was fit
+
+        Returns
+        -------
+        Dict
+            Mapping of each value in `n_rounds` to the predictions made with that many rounds"""
+        if input_data is None:
+            return {_: None for _ in n_rounds}
+
+        chunks = self._get_predict_chunks(input_data)
+        if chunks is not None:
+            stages = [self.staged_predict(_, n_rounds) for _ in chunks]
+            return {_n: np.concatenate([_[_n] for _ in stages]) for _n in n_rounds}
+
+        do_proba = (self.do_predict_proba is True) or type(self.do_predict_proba) == int
+        predictions = dict()
+
+        if hasattr(self.model, "staged_predict"):
+            # Stages are generated one round at a time, so all rounds are collected in one pass
+            if do_proba:
+                stages = self.model.staged_predict_proba(input_data)
+            else:
+                stages = self.model.staged_predict(input_data)
+
+            for i, prediction in enumerate(stages, start=1):
+                if i in n_rounds:
+                    predictions[i] = prediction
+                if len(predictions) == len(n_rounds):
+                    break
+        else:
+            predict = self.model.predict_proba if do_proba else self.model.predict
+            expected_parameters = inspect.signature(predict).parameters
+            arg = next(_ for _ in STAGED_PREDICT_ARGS if _ in expected_parameters)
+
+            for n in n_rounds:
+                value = (0, n) if arg == "iteration_range" else n
+                predictions[n] = predict(input_data, **{arg: value})
+
+        return {_k: self._select_prediction_column(_v) for _k, _v in predictions.items()}
+
+    def _get_predict_chunks(self, input_data):
+        """Split memory-mapped `input_data` into chunks of consecutive rows, which are views of
+        `input_data`, so only one chunk is read into memory at a time when predicting
+
+        Parameters
+        ----------
+        input_data: Array-like
+            Data for which the model will predict output values
+
+        Returns
+        -------
+        List, or None
+            Chunks of at most :attr:`predict_chunk_size` rows of `input_data`. None if `input_data`
+            is not memory-mapped, or is small enough to be predicted at once"""
+        size = self.predict_chunk_size
+        if not is_memory_mapped(input_data) or not size or len(input_data) <= size:
+            return None
+        return [input_data.iloc[_ : _ + size] for _ in range(0, len(input_data), size)]
+
+    def _select_prediction_column(self, prediction):
+        """Select the column of `prediction` given by :attr:`do_predict_proba` if it is an int
+
+        Parameters
+        ----------
+        prediction: Array-like
+            Predictions made by :attr:`model`
+
+        Returns
+        -------
+        Array-like
+            `prediction`, or only its column at index :attr:`do_predict_proba`"""
         with suppress(IndexError):
             _index = self.do_predict_proba if type(self.do_predict_proba) == int else ...
             prediction = prediction[:, _index]
@@ -218,7 +562,149 @@ class Model(object):
         return prediction
 
 
-class XGBoostModel(Model):
+class NativeBoostingModel(Model, metaclass=ABCMeta):
+    #: Keys of :attr:`extra_params['fit']` that are ignored when fitting with a native dataset. If
+    #: any other key (like "eval_set", or "sample_weight") is given, the algorithm's `fit` is used
+    native_fit_params = ["verbose", "silent"]
+    #: Names of the algorithm's parameters that change how native datasets are built. Their values
+    #: are part of the keys of native datasets in :data:`NATIVE_DATASET_CACHE`
+    dataset_params = []
+
+    def fit(self):
+        """Train model with its library's native training function on a native dataset of the
+        training data, which is built once, then reused from :data:`NATIVE_DATASET_CACHE` by all
+        Models with the same :attr:`dataset_key`. :attr:`model` is then a
+        :class:`NativeBoosterEstimator` around the trained booster. Native training is only used if
+        :attr:`extra_params['native_training']` is True, and :meth:`can_fit_native` is True.
+        Otherwise, or if the library raises one of :meth:`get_native_errors` while training
+        natively, :meth:`Model.fit` is used instead"""
+        params = self.get_native_params()
+        if not (self.extra_params.get("native_training", False) and self.can_fit_native(params)):
+            return super().fit()
+
+        try:
+            dataset, classes = NATIVE_DATASET_CACHE.get_or_set(
+                self.get_dataset_cache_key(), lambda: self.build_native_dataset(params)
+            )
+            self.model = self.train_native(params, dataset, classes)
+        except self.get_native_errors() as _ex:
+            G.warn(f"Native fit failed with Exception: {_ex!r}\nAttempting standard fit method")
+            super().fit()
+
+    def can_fit_native(self, params):
+        """Determine whether the model can be trained by :meth:`train_native`
+
+        Parameters
+        ----------
+        params: Dict
+            Native training parameters, as returned by :meth:`get_native_params`
+
+        Returns
+        -------
+        Boolean
+            True if :attr:`dataset_key` is given, :attr:`extra_params['fit']` contains only keys in
+            :attr:`native_fit_params`, no parameter is callable (like custom objectives, whose
+            signatures differ in native training), and there is a single target column"""
+        if self.dataset_key is None:
+            return False
+        if any(_ not in self.native_fit_params for _ in self.extra_params.get("fit", {})):
+            return False
+        if any(callable(_) for _ in params.values()):
+            return False
+        return (np.ndim(self.train_target) == 1) or (np.shape(self.train_target)[1] == 1)
+
+    def get_dataset_cache_key(self):
+        """Get the key of the native dataset built from the training data in
+        :data:`NATIVE_DATASET_CACHE`
+
+        Returns
+        -------
+        Tuple
+            The Model class, :attr:`dataset_key`, whether :attr:`model` is a classifier (whose
+            labels are encoded), and the values of the parameters in :attr:`dataset_params`"""
+        model_params = self.model.get_params()
+        return (
+            type(self).__name__,
+            self.dataset_key,
+            is_classifier(self.model),
+            tuple((_, repr(model_params.get(_, None))) for _ in self.dataset_params),
+        )
+
+    def get_native_target(self):
+        """Get :attr:`train_target` as a 1-dimensional array of labels for native training. The
+        labels of classifiers are encoded as the positions of their classes in the sorted classes
+
+        Returns
+        -------
+        target: numpy.ndarray
+            Training labels of shape (<num_samples>,)
+        classes: numpy.ndarray, or None
+            The sorted unique class labels if :attr:`model` is a classifier. Else None"""
+        target = np.asarray(self.train_target).ravel()
+        if not is_classifier(self.model):
+            return target, None
+        classes, target = np.unique(target, return_inverse=True)
+        return target, classes
+
+    @abstractmethod
+    def get_native_errors(self):
+        """Get the exception classes raised by the library when it cannot build a native dataset,
+        or train on it. Only these cause :meth:`fit` to fall back to :meth:`Model.fit`
+
+        Returns
+        -------
+        Tuple
+            Exception classes of the library"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_native_params(self):
+        """Get the parameters of :attr:`model` for the library's native training function
+
+        Returns
+        -------
+        Dict
+            Native training parameters, as they would be given by :attr:`model`'s `fit` method"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def build_native_dataset(self, params):
+        """Build the library's native dataset from :attr:`train_input` and :attr:`train_target`
+
+        Parameters
+        ----------
+        params: Dict
+            Native training parameters, as returned by :meth:`get_native_params`
+
+        Returns
+        -------
+        dataset: Object
+            The native dataset, which is cached and reused by Models with the same dataset key
+        classes: numpy.ndarray, or None
+            The class labels encoded in `dataset`, as returned by :meth:`get_native_target`"""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def train_native(self, params, dataset, classes):
+        """Train a booster with the library's native training function
+
+        Parameters
+        ----------
+        params: Dict
+            Native training parameters, as returned by :meth:`get_native_params`
+        dataset: Object
+            The native dataset built by :meth:`build_native_dataset`
+        classes: numpy.ndarray, or None
+            The class labels encoded in `dataset`
+
+        Returns
+        -------
+        :class:`NativeBoosterEstimator`
+            The trained booster, wrapped to predict like :attr:`model`"""
+        raise NotImplementedError()
+
+
+class XGBoostModel(NativeBoostingModel):
     def __init__(
         self,
         model_initializer,
@@ -233,7 +719,10 @@ class XGBoostModel(Model):
         metrics=None,
     ):
         """A special Model class for handling XGBoost algorithms. Consider documentation to be
-        identical to that of :class:`Model`, except where noted
+        identical to that of :class:`Model`, except where noted. If
+        :attr:`extra_params['native_training']` is True, and :attr:`dataset_key` is given, models
+        are trained by :func:`xgboost.train` on a `DMatrix` that is reused by all Models with the
+        same :attr:`dataset_key`. See :class:`NativeBoostingModel`
 
         Parameters
         ----------
@@ -241,11 +730,13 @@ class XGBoostModel(Model):
             See :class:`Model`
         initialization_params: See :class:`Model`
         extra_params: Dict, default={}
-            Useful keys: ['fit', 'predict']. If 'fit' is a key with a dict value, its contents will
-            be provided to :meth:`xgboost.sklearn.XGBModel.fit`, with the exception of the
-            following: ['X', 'y']. If any of the aforementioned keys are in
+            Useful keys: ['fit', 'predict', 'native_training']. If 'fit' is a key with a dict value,
+            its contents will be provided to :meth:`xgboost.sklearn.XGBModel.fit`, with the
+            exception of the following: ['X', 'y']. If any of the aforementioned keys are in
             :attr:`extra_params['fit']` or if :attr:`extra_params['fit']` is provided, but is not a
-            dict, an Exception will be raised
+            dict, an Exception will be raised. If 'native_training' is True, models are trained
+            natively, as described in the Notes below. Because it is part of `model_extra_params`,
+            it is part of the `hyperparameter_key`, so native and standard results are never mixed
         train_input: See :class:`Model`
         train_target: See :class:`Model`
         validation_input: See :class:`Model`
@@ -254,7 +745,22 @@ class XGBoostModel(Model):
         target_metric: Tuple
             Used to determine the 'eval_metric' argument to :meth:`xgboost.sklearn.XGBModel.fit`.
             See the documentation for :attr:`XGBoostModel.extra_params` for more information
-        metrics: See :class:`Model`"""
+        metrics: See :class:`Model`
+
+        Notes
+        -----
+        Native training is given the parameters of :meth:`xgboost.sklearn.XGBModel.get_xgb_params`,
+        with `n_estimators` (or 100, if None) as `num_boost_round`, but its results are not
+        guaranteed to be identical to those of the wrapper's `fit`:
+
+        * No evaluation sets are used. Fits needing them (with `early_stopping_rounds`, `callbacks`,
+          or an "eval_set" in :attr:`extra_params['fit']`) use the wrapper's `fit`
+        * Only "missing", and "enable_categorical" are given to the `DMatrix`, and a
+          `QuantileDMatrix` is only built if `tree_method`="hist". Some XGBoost versions' wrappers
+          also build a `QuantileDMatrix` for the default `tree_method`, which may bin differently
+        * Labels of classifiers are encoded by :meth:`NativeBoostingModel.get_native_target`
+
+        Native training is therefore opt-in, through :attr:`extra_params['native_training']`"""
         if model_initializer.__name__ not in ("XGBClassifier", "XGBRegressor"):
             raise ValueError(f"Invalid `model_initializer`: {model_initializer}")
 
@@ -271,6 +777,64 @@ class XGBoostModel(Model):
             metrics=metrics,
         )
 
+    #: Parameters of the `DMatrix`, or those that determine whether a `QuantileDMatrix` is built
+    dataset_params = ["missing", "enable_categorical", "tree_method", "max_bin"]
+
+    def can_fit_native(self, params):
+        """See :meth:`NativeBoostingModel.can_fit_native`. Also False if early stopping or callbacks
+        are given to :attr:`model`, since they require evaluation sets"""
+        if getattr(self.model, "early_stopping_rounds", None) is not None:
+            return False
+        if getattr(self.model, "callbacks", None):
+            return False
+        return super().can_fit_native(params)
+
+    def get_native_errors(self):
+        from xgboost.core import XGBoostError
+
+        return (XGBoostError,)
+
+    def get_native_params(self):
+        return self.model.get_xgb_params()
+
+    def build_native_dataset(self, params):
+        import xgboost
+
+        target, classes = self.get_native_target()
+        dmatrix_params = self._get_dmatrix_params()
+
+        if (params.get("tree_method", None) == "hist") and hasattr(xgboost, "QuantileDMatrix"):
+            # Quantize features once, rather than each time a booster is trained on the dataset
+            if params.get("max_bin", None) is not None:
+                dmatrix_params["max_bin"] = params["max_bin"]
+            dataset = xgboost.QuantileDMatrix(self.train_input, label=target, **dmatrix_params)
+        else:
+            dataset = xgboost.DMatrix(self.train_input, label=target, **dmatrix_params)
+        return dataset, classes
+
+    def train_native(self, params, dataset, classes):
+        import xgboost
+
+        if (classes is not None) and (len(classes) > 2):
+            params = dict(params, objective="multi:softprob", num_class=len(classes))
+        n_rounds = getattr(self.model, "n_estimators", None) or 100
+
+        booster = xgboost.train(params, dataset, num_boost_round=n_rounds, verbose_eval=False)
+        return XGBoostBoosterEstimator(self.model, booster, classes, self._get_dmatrix_params())
+
+    def _get_dmatrix_params(self):
+        """Get the parameters of :attr:`model` used to build a `DMatrix`
+
+        Returns
+        -------
+        Dict
+            Contains "missing", and "enable_categorical" if it is True"""
+        missing = getattr(self.model, "missing", None)
+        dmatrix_params = dict(missing=np.nan if missing is None else missing)
+        if getattr(self.model, "enable_categorical", False):
+            dmatrix_params["enable_categorical"] = True
+        return dmatrix_params
+
     # def fit(self):
     #     #################### Build eval_set ####################
     #     eval_set = [(self.train_input, self.train_target)]
@@ -293,6 +857,162 @@ class XGBoostModel(Model):
     #     self.model.fit(self.train_input, self.train_target, **fit_kwargs)
 
 
+class LightGBMModel(NativeBoostingModel):
+    #: Parameters (and their aliases) that LightGBM does not allow to change after a `Dataset` is
+    #: constructed, since they determine how features are binned
+    dataset_params = [
+        "max_bin",
+        "max_bin_by_feature",
+        "min_data_in_bin",
+        "subsample_for_bin",
+        "bin_construct_sample_cnt",
+        "min_child_samples",
+        "min_data_in_leaf",
+        "min_child_weight",
+        "min_sum_hessian_in_leaf",
+        "feature_pre_filter",
+        "use_missing",
+        "zero_as_missing",
+        "categorical_feature",
+        "forcedbins_filename",
+        "linear_tree",
+        "data_random_seed",
+    ]
+    #: Objectives accepted by LightGBM for multiclass classification. Others are replaced by
+    #: "multiclass" if there are more than two classes
+    multiclass_objectives = [
+        "multiclass",
+        "softmax",
+        "multiclassova",
+        "multiclass_ova",
+        "ova",
+        "ovr",
+    ]
+
+    def __init__(
+        self,
+        model_initializer,
+        initialization_params,
+        extra_params,
+        train_input=None,
+        train_target=None,
+        validation_input=None,
+        validation_target=None,
+        do_predict_proba=False,
+        target_metric=None,
+        metrics=None,
+    ):
+        """A special Model class for handling LightGBM algorithms. Consider documentation to be
+        identical to that of :class:`Model`, except where noted. If
+        :attr:`extra_params['native_training']` is True, and :attr:`dataset_key` is given, models
+        are trained by :func:`lightgbm.train` on a constructed (binned) `Dataset` that is reused by
+        all Models with the same :attr:`dataset_key`. See :class:`NativeBoostingModel`
+
+        Parameters
+        ----------
+        model_initializer: :class:`lightgbm.LGBMClassifier`, or :class:`lightgbm.LGBMRegressor`
+            See :class:`Model`
+        initialization_params: See :class:`Model`
+        extra_params: Dict, default={}
+            See :class:`Model`. If 'native_training' is a key with a True value, models are trained
+            natively, as described in the Notes below. Because it is part of `model_extra_params`,
+            it is part of the `hyperparameter_key`, so native and standard results are never mixed
+        train_input: See :class:`Model`
+        train_target: See :class:`Model`
+        validation_input: See :class:`Model`
+        validation_target: See :class:`Model`
+        do_predict_proba: See :class:`Model`
+        target_metric: See :class:`Model`
+        metrics: See :class:`Model`
+
+        Notes
+        -----
+        Native training is given the non-None parameters of :attr:`model`, without "n_estimators"
+        (given as `num_boost_round`, or 100 if None), "importance_type", and "class_weight", but its
+        results are not guaranteed to be identical to those of the wrapper's `fit`:
+
+        * No evaluation sets are used, and the `Dataset` is not given the wrapper's
+          `feature_name`, or `categorical_feature` arguments, so LightGBM infers them from the
+          training data (as with their default "auto" values)
+        * "objective" defaults to "regression", "binary", or "multiclass", as in the wrapper, but
+          other defaults the wrapper fills in from its constructor arguments are not set
+        * Fits with `class_weight`, or with keys other than "verbose" or "silent" in
+          :attr:`extra_params['fit']` use the wrapper's `fit`
+
+        Native training is therefore opt-in, through :attr:`extra_params['native_training']`"""
+        if model_initializer.__name__ not in ("LGBMClassifier", "LGBMRegressor"):
+            raise ValueError(f"Invalid `model_initializer`: {model_initializer}")
+
+        super().__init__(
+            model_initializer,
+            initialization_params,
+            extra_params,
+            train_input=train_input,
+            train_target=train_target,
+            validation_input=validation_input,
+            validation_target=validation_target,
+            do_predict_proba=do_predict_proba,
+            target_metric=target_metric,
+            metrics=metrics,
+        )
+
+    def can_fit_native(self, params):
+        """See :meth:`NativeBoostingModel.can_fit_native`. Also False if `class_weight` is given to
+        :attr:`model`, since it is converted to sample weights by :attr:`model`'s `fit` method"""
+        if self.model.get_params().get("class_weight", None) is not None:
+            return False
+        return super().can_fit_native(params)
+
+    def get_dataset_cache_key(self):
+        """See :meth:`NativeBoostingModel.get_dataset_cache_key`. If there are more training rows
+        than are sampled to find bin boundaries, the random seed is also part of the key"""
+        key = super().get_dataset_cache_key()
+        model_params = self.model.get_params()
+        n_sampled = model_params.get("subsample_for_bin", None) or 200000
+
+        if len(self.train_input) > n_sampled:
+            key += tuple(repr(model_params.get(_, None)) for _ in ["random_state", "seed"])
+        return key
+
+    def get_native_errors(self):
+        from lightgbm.basic import LightGBMError
+
+        return (LightGBMError,)
+
+    def get_native_params(self):
+        params = {_k: _v for _k, _v in self.model.get_params().items() if _v is not None}
+        if params.pop("silent", True) and not any(_ in params for _ in ["verbose", "verbosity"]):
+            params["verbose"] = -1
+        for key in ["n_estimators", "importance_type", "class_weight"]:
+            params.pop(key, None)
+        return params
+
+    def build_native_dataset(self, params):
+        import lightgbm
+
+        target, classes = self.get_native_target()
+        dataset = lightgbm.Dataset(self.train_input, label=target, params=params)
+        # Bin features now, so the raw data is released before the dataset is cached
+        return dataset.construct(), classes
+
+    def train_native(self, params, dataset, classes):
+        import lightgbm
+
+        params = dict(params)
+        if classes is None:
+            params.setdefault("objective", "regression")
+        elif len(classes) > 2:
+            if params.get("objective", None) not in self.multiclass_objectives:
+                params["objective"] = "multiclass"
+            params["num_class"] = len(classes)
+        else:
+            params.setdefault("objective", "binary")
+        n_rounds = self.model.get_params().get("n_estimators", None) or 100
+
+        booster = lightgbm.train(params, dataset, num_boost_round=n_rounds)
+        return LightGBMBoosterEstimator(self.model, booster, classes)
+
+
 class KerasModel(Model):
     def __init__(
         self,
@@ -362,6 +1082,7 @@ class KerasModel(Model):
             raise ValueError(f"Invalid `model_initializer`: {model_initializer}")
 
         self.model_history = None
+        self.staged_weights = dict()
 
         super().__init__(
             model_initializer,
@@ -386,9 +1107,16 @@ class KerasModel(Model):
         self.model = self.initialize_keras_neural_network()
 
     def fit(self):
-        """Train model according to :attr:`extra_params['fit']` (if appropriate) on training data"""
+        """Train model according to :attr:`extra_params['fit']` (if appropriate) on training data.
+        If :attr:`staged_rounds` is given, the model's weights are also saved in
+        :attr:`staged_weights` at the end of each of those epochs"""
+        fit_kwargs = dict()
+        if self.staged_rounds:
+            callbacks = list(self.extra_params.get("callbacks", []))
+            fit_kwargs["callbacks"] = callbacks + [self._get_staged_weights_callback()]
+
         try:
-            self.model_history = self.model.fit(self.train_input, self.train_target)
+            self.model_history = self.model.fit(self.train_input, self.train_target, **fit_kwargs)
         except Exception as _ex:
             G.warn(f"KerasModel.fit() failed with Exception: {_ex}\nAttempting standard fit method")
             super().fit()
@@ -403,6 +1131,54 @@ class KerasModel(Model):
                 if callback.__class__.__name__ == "ModelCheckpoint":
                     self.model.model.load_weights(callback.filepath)
 
+    def staged_predict(self, input_data, n_rounds):
+        """Generate model predictions for `input_data` using the weights the model had at the end
+        of each number of epochs in `n_rounds`, which must have been given as :attr:`staged_rounds`
+        before fitting. If training stopped early, before an epoch in `n_rounds`, the final weights
+        are used, as they would have been by a model fit with that many epochs
+
+        Parameters
+        ----------
+        input_data: Array-like
+            Data containing the same number of features as were trained on, for which the model will
+            predict output values
+        n_rounds: List of int
+            Numbers of epochs with which to predict
+
+        Returns
+        -------
+        Dict
+            Mapping of each value in `n_rounds` to the predictions made with that many epochs"""
+        if input_data is None:
+            return {_: None for _ in n_rounds}
+
+        final_weights = self.model.model.get_weights()
+        predictions = dict()
+
+        try:
+            for n in n_rounds:
+                self.model.model.set_weights(self.staged_weights.get(n, final_weights))
+                predictions[n] = self.predict(input_data)
+        finally:
+            self.model.model.set_weights(final_weights)
+
+        return predictions
+
+    def _get_staged_weights_callback(self):
+        """Create a Keras callback that saves the model's weights in :attr:`staged_weights` at the
+        end of each epoch in :attr:`staged_rounds`
+
+        Returns
+        -------
+        :class:`keras.callbacks.LambdaCallback`"""
+        from keras.callbacks import LambdaCallback
+
+        def on_epoch_end(epoch, logs=None):
+            if epoch + 1 in self.staged_rounds:
+                self.staged_weights[epoch + 1] = self.model.model.get_weights()
+
+        return LambdaCallback(on_epoch_end=on_epoch_end)
+
     def get_input_shape(self, get_dim=False):
         """Calculate the shape of the input that should be expected by the model
 
@@ -10,8 +10,19 @@ Related
 ##################################################
 # Import Own Assets
 ##################################################
-from hyperparameter_hunter.optimization_core import SKOptimizationProtocol
-from hyperparameter_hunter.space import normalize_dimensions
+from hyperparameter_hunter.optimization_core import BaseOptimizationProtocol, SKOptimizationProtocol
+from hyperparameter_hunter.settings import G
+from hyperparameter_hunter.space import normalize_dimensions, Space
+from hyperparameter_hunter.utils.boltons_utils import get_path, PathAccessError
+from hyperparameter_hunter.utils.file_utils import read_json
+from hyperparameter_hunter.utils.optimization_utils import get_hyperband_brackets
+
+##################################################
+# Import Miscellaneous Assets
+##################################################
+from contextlib import contextmanager
+import numpy as np
+from os.path import join
 
 ##################################################
 # Import Learning Assets
@@ -44,6 +55,10 @@ class BayesianOptimization(SKOptimizationProtocol):
         n_random_starts=10,
         callbacks=None,
         base_estimator_kwargs=None,
+        n_parallel=1,
+        parallel_strategy="cl_min",
+        pruner=None,
+        n_stages=0,
     ):
         if base_estimator.upper() != "GP" and not isinstance(
             base_estimator, GaussianProcessRegressor
@@ -71,6 +86,10 @@ class BayesianOptimization(SKOptimizationProtocol):
             n_random_starts=n_random_starts,
             callbacks=callbacks,
             base_estimator_kwargs=base_estimator_kwargs,
+            n_parallel=n_parallel,
+            parallel_strategy=parallel_strategy,
+            pruner=pruner,
+            n_stages=n_stages,
         )
 
     def go(self):
@@ -98,6 +117,10 @@ class GradientBoostedRegressionTreeOptimization(SKOptimizationProtocol):
         n_random_starts=10,
         callbacks=None,
         base_estimator_kwargs=None,
+        n_parallel=1,
+        parallel_strategy="cl_min",
+        pruner=None,
+        n_stages=0,
     ):
         if base_estimator.upper() != "GBRT" and not isinstance(
             base_estimator, GradientBoostingQuantileRegressor
@@ -124,6 +147,10 @@ class GradientBoostedRegressionTreeOptimization(SKOptimizationProtocol):
             n_random_starts=n_random_starts,
             callbacks=callbacks,
             base_estimator_kwargs=base_estimator_kwargs,
+            n_parallel=n_parallel,
+            parallel_strategy=parallel_strategy,
+            pruner=pruner,
+            n_stages=n_stages,
         )
 
 
@@ -147,6 +174,10 @@ class RandomForestOptimization(SKOptimizationProtocol):
         n_random_starts=10,
         callbacks=None,
         base_estimator_kwargs=None,
+        n_parallel=1,
+        parallel_strategy="cl_min",
+        pruner=None,
+        n_stages=0,
     ):
         if base_estimator.upper() != "RF" and not isinstance(base_estimator, RandomForestRegressor):
             raise TypeError(
@@ -171,6 +202,10 @@ class RandomForestOptimization(SKOptimizationProtocol):
             n_random_starts=n_random_starts,
             callbacks=callbacks,
             base_estimator_kwargs=base_estimator_kwargs,
+            n_parallel=n_parallel,
+            parallel_strategy=parallel_strategy,
+            pruner=pruner,
+            n_stages=n_stages,
         )
 
 
@@ -194,6 +229,10 @@ class ExtraTreesOptimization(SKOptimizationProtocol):
         n_random_starts=10,
         callbacks=None,
         base_estimator_kwargs=None,
+        n_parallel=1,
+        parallel_strategy="cl_min",
+        pruner=None,
+        n_stages=0,
     ):
         if base_estimator.upper() != "ET" and not isinstance(base_estimator, ExtraTreesRegressor):
             raise TypeError(
@@ -218,6 +257,10 @@ class ExtraTreesOptimization(SKOptimizationProtocol):
             n_random_starts=n_random_starts,
             callbacks=callbacks,
             base_estimator_kwargs=base_estimator_kwargs,
+            n_parallel=n_parallel,
+            parallel_strategy=parallel_strategy,
+            pruner=pruner,
+            n_stages=n_stages,
         )
 
 
@@ -241,6 +284,10 @@ class DummySearch(SKOptimizationProtocol):
         n_random_starts=10,
         callbacks=None,
         base_estimator_kwargs=None,
+        n_parallel=1,
+        parallel_strategy="cl_min",
+        pruner=None,
+        n_stages=0,
     ):
         if base_estimator.upper() != "DUMMY":
             raise TypeError(f'Expected `base_estimator`="DUMMY", not {base_estimator}')
@@ -263,6 +310,465 @@ class DummySearch(SKOptimizationProtocol):
             n_random_starts=n_random_starts,
             callbacks=callbacks,
             base_estimator_kwargs=base_estimator_kwargs,
+            n_parallel=n_parallel,
+            parallel_strategy=parallel_strategy,
+            pruner=pruner,
+            n_stages=n_stages,
+        )
+
+
+##################################################
+# Multi-Fidelity Optimization Protocols
+##################################################
+class HyperbandOptimization(BaseOptimizationProtocol):
+    """Hyperband optimization by successive halving of randomly sampled hyperparameters"""
+
+    def __init__(
+        self,
+        budget,
+        min_budget,
+        max_budget,
+        reduction_factor=3,
+        target_metric=None,
+        iterations=1,
+        verbose=1,
+        reporter_parameters=None,
+        random_state=32,
+    ):
+        """Evaluate many randomly sampled sets of hyperparameters with small budgets, and promote
+        only the best of them to Experiments with larger budgets. Budgets increase geometrically
+        from `min_budget` to `max_budget` in the successive-halving brackets given by
+        :func:`utils.optimization_utils.get_hyperband_brackets`
+
+        Parameters
+        ----------
+        budget: String in ['train_rows', 'runs'], or tuple
+            The resource allocated to each Experiment. 'train_rows': the fraction of the rows of the
+            Environment's `train_dataset` used to execute the Experiment. 'runs': the number of
+            times each fold is fit, in place of the Environment's `runs`. Tuple paths beginning with
+            "cv_params" replace a value in the Environment's `cv_params`, like
+            ("cv_params", "n_splits"). Tuple paths beginning with "model_init_params", or
+            "model_extra_params" replace a hyperparameter given to
+            :meth:`set_experiment_guidelines`, like ("model_init_params", "n_estimators")
+        min_budget: Number
+            The smallest budget with which a set of hyperparameters is evaluated
+        max_budget: Number
+            The full budget. Only Experiments executed with `max_budget` can become
+            :attr:`best_experiment`. If `budget`='train_rows', must be <= 1
+        reduction_factor: Int, default=3
+            The factor by which budgets increase from one rung of a bracket to the next. Only the
+            best 1/`reduction_factor` of the sets of hyperparameters in each rung are promoted
+        target_metric: Tuple, default=('oof', <first key in `environment.Environment.metrics`>)
+            A path denoting the metric used to compare completed Experiments. See
+            :meth:`optimization_core.BaseOptimizationProtocol.__init__`
+        iterations: Int, default=1
+            The number of brackets to execute. Brackets are executed in the order given by
+            :func:`utils.optimization_utils.get_hyperband_brackets`, starting over after the last
+            one, so one full round of Hyperband takes as many iterations as there are brackets
+        verbose: Int 0, 1, or 2, default=1
+            Verbosity mode for console logging. See
+            :meth:`optimization_core.BaseOptimizationProtocol.__init__`
+        reporter_parameters: Dict, or None, default=None
+            Additional parameters passed to :meth:`reporting.OptimizationReporter.__init__`
+        random_state: Int, or None, default=32
+            Seed used to sample sets of hyperparameters, and to subsample the rows of
+            `train_dataset` if `budget`='train_rows'
+
+        Notes
+        -----
+        Environment budgets ('train_rows', 'runs', and "cv_params" paths) temporarily replace the
+        Environment's `cross_experiment_key` while Experiments with budgets other than the
+        Environment's own are executed. Their keys are saved in separate "TestedKeys" files, and
+        their leaderboard entries have separate `cross_experiment_key` values, so they are never
+        mixed with full-budget results, or read by other Optimization Protocols. Hyperparameter
+        budgets are part of each Experiment's `hyperparameter_key` instead.
+
+        If a set of hyperparameters was already evaluated with a budget, it is not executed again.
+        Its saved score is read from its description file instead, so an interrupted protocol
+        quickly catches up to where it stopped. Experiments whose description files were not
+        saved are treated as the worst in their rung"""
+        self.budget = tuple(budget) if isinstance(budget, list) else budget
+        self.min_budget = min_budget
+        self.max_budget = max_budget
+        self.reduction_factor = reduction_factor
+        self.random_state = random_state
+
+        self.rng = np.random.RandomState(random_state)
+        self.brackets = []
+        self.current_budget = None
+        self.current_hyperparameters_list = None
+        self.current_experiment_id = None
+        self._train_subsamples = dict()
+
+        super().__init__(
+            target_metric=target_metric,
+            iterations=iterations,
+            verbose=verbose,
+            read_experiments=False,
+            reporter_parameters=reporter_parameters,
+        )
+
+    #: The random state used to sample hyperparameters is saved, so the sets of hyperparameters
+    #: sampled by an interrupted bracket are sampled again when it is resumed
+    state_attributes = BaseOptimizationProtocol.state_attributes + ["rng"]
+
+    def _get_state_parameters(self):
+        """Collect the parameters that define the search performed by the Optimization Protocol,
+        including those that determine its budgets
+
+        Returns
+        -------
+        Dict
+            Parameters hashed by :meth:`_get_state_path` to name the protocol's state file"""
+        return dict(
+            super()._get_state_parameters(),
+            budget=self.budget,
+            min_budget=self.min_budget,
+            max_budget=self.max_budget,
+            reduction_factor=self.reduction_factor,
+            random_state=self.random_state,
+        )
+
+    def _set_hyperparameter_space(self):
+        """Initialize :attr:`space` according to the provided hyperparameter search dimensions, and
+        check that hyperparameter budgets are given, but not searched"""
+        self.space = Space(dimensions=self.dimensions)
+
+        if not self._is_hyperparameter_budget():
+            return
+        if self.budget in self.space.names(use_location=False):
+            raise ValueError(f"Budget {self.budget} cannot also be a search dimension")
+
+        guidelines = dict(
+            model_init_params=self.model_init_params, model_extra_params=self.model_extra_params
+        )
+        try:
+            get_path(guidelines, self.budget)
+        except PathAccessError:
+            raise ValueError(f"Budget {self.budget} must be a path in the Experiment guidelines")
+
+    def _get_current_hyperparameters(self):
+        """Format :attr:`current_hyperparameters_list` to be used in the next Experiment, along with
+        :attr:`current_budget` if :attr:`budget` is a hyperparameter
+
+        Returns
+        -------
+        current_hyperparameters: Dict
+            The next set of hyperparameters that will be searched"""
+        current_hyperparameters = dict(
+            zip(self.space.names(use_location=False), self.current_hyperparameters_list)
+        )
+
+        if self._is_hyperparameter_budget():
+            current_hyperparameters[self.budget] = self.current_budget
+        return current_hyperparameters
+
+    @property
+    def search_space_size(self):
+        """The number of different hyperparameter permutations possible given the current
+        hyperparameter search dimensions, not including :attr:`budget`
+
+        Returns
+        -------
+        :attr:`_search_space_size`: Int, or `numpy.inf`
+            Infinity returned if the search space size is incalculable"""
+        if self._search_space_size is None:
+            self._search_space_size = len(self.space)
+        return self._search_space_size
+
+    def _find_similar_experiments(self):
+        """Do nothing, since sets of hyperparameters are sampled at random, rather than suggested by
+        a model of the results of saved Experiments"""
+        pass
+
+    ##################################################
+    # Hyperband Methods:
+    ##################################################
+    def _optimization_loop(self, iteration=0):
+        """Execute the next bracket of :attr:`brackets` at each iteration, while `iteration` <
+        :attr:`iterations`
+
+        Parameters
+        ----------
+        iteration: Int, default=0
+            The current iteration in the optimization loop"""
+        self.logger.print_optimization_header()
+
+        while iteration < self.iterations:
+            self._execute_bracket(self.brackets[iteration % len(self.brackets)])
+            iteration += 1
+            self._save_state(iteration)
+
+    def _execute_bracket(self, bracket):
+        """Evaluate randomly sampled sets of hyperparameters with the budget of each rung in
+        `bracket`, promoting only the best sets from one rung to the next
+
+        Parameters
+        ----------
+        bracket: List
+            Tuples of (<number of configurations>, <budget>) for each rung of the bracket"""
+        configurations = self._sample_configurations(bracket[0][0])
+        scores = []
+
+        for rung, (n_configurations, budget) in enumerate(bracket):
+            if rung > 0:
+                n_promoted = max(1, len(configurations) // self.reduction_factor)
+                ranking = self._rank(scores)[: min(n_configurations, n_promoted)]
+                configurations = [configurations[_] for _ in ranking]
+
+            G.log_(
+                f"Rung {rung + 1}/{len(bracket)}: Evaluating {len(configurations)} sets of "
+                f"hyperparameters with {self.budget} budget: {budget}"
+            )
+            scores = [self._evaluate(_, budget) for _ in configurations]
+
+    def _sample_configurations(self, n_configurations):
+        """Randomly sample up to `n_configurations` distinct sets of hyperparameters from
+        :attr:`space`
+
+        Parameters
+        ----------
+        n_configurations: Int
+            The number of sets of hyperparameters to sample. Fewer are sampled if :attr:`space`
+            does not contain enough distinct sets
+
+        Returns
+        -------
+        configurations: List
+            Lists of hyperparameter values in the same order as the dimensions of :attr:`space`"""
+        n_configurations = min(n_configurations, self.search_space_size)
+        configurations = []
+
+        for _ in range(10 * n_configurations):
+            if len(configurations) >= n_configurations:
+                break
+            configuration = self.space.rvs(random_state=self.rng)[0]
+            if configuration not in configurations:
+                configurations.append(configuration)
+
+        return configurations
+
+    def _rank(self, scores):
+        """Sort the indexes of `scores` from best to worst, placing missing scores last
+
+        Parameters
+        ----------
+        scores: List
+            Evaluations of :attr:`target_metric`, which may include `numpy.nan`
+
+        Returns
+        -------
+        List
+            Indexes of `scores`, ordered from best to worst"""
+        scores = np.array(scores, dtype=float)
+        scores = scores if self.do_maximize else -scores
+        scores[np.isnan(scores)] = -np.inf
+        return np.argsort(-scores, kind="stable").tolist()
+
+    def _evaluate(self, hyperparameters, budget):
+        """Execute an Experiment with `hyperparameters` and `budget`, or read the saved score of an
+        identical Experiment that was already executed, then report its result
+
+        Parameters
+        ----------
+        hyperparameters: List
+            Hyperparameter values in the same order as the dimensions of :attr:`space`
+        budget: Number
+            The budget with which to execute the Experiment
+
+        Returns
+        -------
+        Number
+            The Experiment's evaluation of :attr:`target_metric`. `numpy.nan` if the Experiment was
+            already executed, but its score could not be read"""
+        self.current_hyperparameters_list = hyperparameters
+        self.current_budget = budget
+
+        with self._budget_environment(budget):
+            self._prepare_experiment()
+
+            if self.do_raise_repeated and self.current_experiment.hyperparameter_key.exists:
+                self.current_experiment._clean_up()
+                self.current_experiment_id, self.current_score = self._read_saved_result()
+                self.skipped_iterations += 1
+            else:
+                self.current_experiment.experiment_workflow()
+                self.current_experiment_id = self.current_experiment.experiment_id
+                self.current_score = get_path(
+                    self.current_experiment.last_evaluation_results, self.target_metric
+                )
+                self.successful_iterations += 1
+            self._clean_up_experiment()
+
+        self._report_current_result()
+        return self.current_score
+
+    def _report_current_result(self):
+        """Log the result of the Experiment just evaluated, and update :attr:`best_experiment` and
+        :attr:`best_score` if it was executed with :attr:`max_budget`, and its score is the best
+        yet"""
+        self.logger.print_result(
+            self.current_hyperparameters_list,
+            self.current_score,
+            experiment_id=self.current_experiment_id,
+        )
+
+        if self.current_budget != self.max_budget or np.isnan(self.current_score):
+            return
+
+        if (
+            (self.best_experiment is None)  # First evaluation
+            or (self.do_maximize and (self.best_score < self.current_score))  # New best max
+            or (not self.do_maximize and (self.best_score > self.current_score))  # New best min
+        ):
+            self.best_experiment = self.current_experiment_id
+            self.best_score = self.current_score
+
+    def _can_check_repeated_key(self):
+        """Disable the pre-check of repeated keys, since :meth:`_evaluate` reads the saved scores of
+        repeated Experiments by way of their :attr:`current_experiment`
+
+        Returns
+        -------
+        Boolean
+            False"""
+        return False
+
+    def _read_saved_result(self):
+        """Read the score of the most recent saved Experiment with the same keys as
+        :attr:`current_experiment`
+
+        Returns
+        -------
+        Tuple
+            The ID of the saved Experiment, and its evaluation of :attr:`target_metric`. If its
+            description file could not be read, (None, `numpy.nan`)"""
+        hyperparameter_key = self.current_experiment.hyperparameter_key
+        cross_experiment_key = hyperparameter_key.cross_experiment_key.key
+
+        try:
+            tested_keys_dir, description_dir = [
+                G.Env.result_paths[_] for _ in ["tested_keys", "description"]
+            ]
+            tested_keys = read_json(join(tested_keys_dir, f"{cross_experiment_key}.json"))
+            experiment_id = tested_keys[hyperparameter_key.key][-1]
+            description = read_json(join(description_dir, f"{experiment_id}.json"))
+            return experiment_id, get_path(description["final_evaluations"], self.target_metric)
+        except (OSError, ValueError, KeyError, IndexError, TypeError):
+            G.warn_(f"Failed to read score of saved Experiment with key: {hyperparameter_key.key}")
+            return None, np.nan
+
+    @contextmanager
+    def _budget_environment(self, budget):
+        """Context manager that sets `budget` on the active Environment, along with the matching
+        `cross_experiment_key`, then restores the Environment's original attributes on exit
+
+        Parameters
+        ----------
+        budget: Number
+            The budget with which to execute the upcoming Experiment"""
+        updates = self._get_environment_updates(budget)
+        original = {_: getattr(G.Env, _) for _ in list(updates) + ["cross_experiment_key"]}
+
+        try:
+            if updates:
+                for name, value in updates.items():
+                    setattr(G.Env, name, value)
+                G.Env.generate_cross_experiment_key()
+            yield
+        finally:
+            for name, value in original.items():
+                setattr(G.Env, name, value)
+
+    def _get_environment_updates(self, budget):
+        """Determine the attributes of the active Environment that must change in order to execute
+        an Experiment with `budget`
+
+        Parameters
+        ----------
+        budget: Number
+            The budget with which to execute the upcoming Experiment
+
+        Returns
+        -------
+        Dict
+            Maps the names of Environment attributes to their values with `budget`. Empty if
+            :attr:`budget` is a hyperparameter, or if `budget` is the Environment's own"""
+        if self._is_hyperparameter_budget():
+            return {}
+
+        updates = dict()
+        cv_params = G.Env.cv_params
+        # Experiments fill in missing `random_seeds` in place, so start from the given value
+        experiment_params = dict(G.Env.cross_experiment_params, random_seeds=G.Env.random_seeds)
+
+        if self.budget == "train_rows":
+            if budget >= 1:
+                return {}
+            if budget not in self._train_subsamples:
+                self._train_subsamples[budget] = G.Env.train_dataset.sample(
+                    frac=budget, random_state=self.random_state
+                ).sort_index()
+            updates["train_dataset"] = self._train_subsamples[budget]
+        elif self.budget == "runs":
+            if budget == G.Env.cross_experiment_params["runs"]:
+                return {}
+            experiment_params["runs"] = budget
+        else:
+            if budget == G.Env.cv_params.get(self.budget[1]):
+                return {}
+            cv_params = dict(G.Env.cv_params, **{self.budget[1]: budget})
+            updates["cv_params"] = cv_params
+
+        #################### Discard Random Seeds That Don't Fit Budget ####################
+        n_repeats, n_splits = cv_params.get("n_repeats", 1), cv_params["n_splits"]
+        seeds_shape = (n_repeats, n_splits, experiment_params["runs"])
+        if np.shape(experiment_params["random_seeds"]) != seeds_shape:
+            experiment_params["random_seeds"] = None
+
+        updates["cross_experiment_params"] = experiment_params
+        return updates
+
+    def _is_hyperparameter_budget(self):
+        """Determine whether :attr:`budget` is a hyperparameter, rather than an Environment budget
+
+        Returns
+        -------
+        Boolean
+            True if :attr:`budget` is a path in the Experiment guidelines. Else False"""
+        return isinstance(self.budget, tuple) and self.budget[0] in [
+            "model_init_params",
+            "model_extra_params",
+        ]
+
+    def _validate_parameters(self):
+        """Ensure provided input parameters are properly formatted, and build :attr:`brackets`"""
+        super()._validate_parameters()
+
+        #################### budget ####################
+        is_cv_budget = isinstance(self.budget, tuple) and self.budget[0] == "cv_params"
+        if is_cv_budget and len(self.budget) != 2:
+            raise ValueError("'cv_params' budgets must be of the form ('cv_params', <key>)")
+        if not (self.budget in ["train_rows", "runs"] or is_cv_budget):
+            if not (self._is_hyperparameter_budget() and len(self.budget) > 1):
+                raise ValueError(f"Invalid budget: {self.budget!r}")
+
+        #################### min_budget/max_budget ####################
+        if not 0 < self.min_budget <= self.max_budget:
+            _err = f"Expected 0 < min_budget ({self.min_budget}) <= max_budget ({self.max_budget})"
+            raise ValueError(_err)
+        if self.budget == "train_rows" and self.max_budget > 1:
+            raise ValueError(f"'train_rows' max_budget must be <= 1, not {self.max_budget}")
+
+        #################### reduction_factor ####################
+        if not isinstance(self.reduction_factor, int) or self.reduction_factor < 2:
+            raise ValueError(f"reduction_factor must be an int >= 2, not {self.reduction_factor!r}")
+
+        self.brackets = get_hyperband_brackets(
+            self.min_budget,
+            self.max_budget,
+            self.reduction_factor,
+            integer=(self.budget != "train_rows"),
         )
 
 
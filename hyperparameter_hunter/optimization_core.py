@@ -28,20 +28,30 @@ from hyperparameter_hunter.algorithm_handlers import (
 from hyperparameter_hunter.exceptions import (
     EnvironmentInactiveError,
     EnvironmentInvalidError,
+    ExperimentPrunedError,
     RepeatedExperimentError,
 )
-from hyperparameter_hunter.experiments import CVExperiment
+from hyperparameter_hunter.experiments import (
+    CVExperiment,
+    format_feature_selector,
+    get_hyperparameter_key_parameters,
+)
+from hyperparameter_hunter.key_handler import HyperparameterKeyMaker, make_hash_sha256
+from hyperparameter_hunter.leaderboards import compact_leaderboard
 from hyperparameter_hunter.library_helpers.keras_helper import reinitialize_callbacks
 from hyperparameter_hunter.library_helpers.keras_optimization_helper import (
     keras_prep_workflow,
     link_choice_ids,
 )
 from hyperparameter_hunter.metrics import get_formatted_target_metric
+from hyperparameter_hunter.models import get_staged_location
+from hyperparameter_hunter.pruners import pruning_callback
 from hyperparameter_hunter.reporting import OptimizationReporter
 from hyperparameter_hunter.result_reader import finder_selector
 from hyperparameter_hunter.settings import G, TEMP_MODULES_DIR_PATH
-from hyperparameter_hunter.space import Space, dimension_subset
+from hyperparameter_hunter.space import Integer, Space, dimension_subset
 from hyperparameter_hunter.utils.boltons_utils import get_path
+from hyperparameter_hunter.utils.file_utils import atomic_write, make_dirs, read_json
 from hyperparameter_hunter.utils.general_utils import deep_restricted_update
 from hyperparameter_hunter.utils.optimization_utils import AskingOptimizer, get_choice_dimensions
 
@@ -51,8 +61,12 @@ from hyperparameter_hunter.utils.optimization_utils import AskingOptimizer, get_
 from abc import ABCMeta, abstractmethod
 from datetime import datetime
 from inspect import currentframe, getframeinfo
+from multiprocessing import get_all_start_methods, get_context
+import numpy as np
 from os import walk, remove, rmdir
-from os.path import abspath
+from os.path import abspath, dirname, exists, join
+import pickle
+import traceback
 
 ##################################################
 # Import Learning Assets
@@ -100,6 +114,7 @@ class BaseOptimizationProtocol(metaclass=MergedOptimizationMeta):
         verbose=1,
         read_experiments=True,
         reporter_parameters=None,
+        pruner=None,
     ):
         """Base class for intermediate base optimization protocol classes
 
@@ -128,6 +143,14 @@ class BaseOptimizationProtocol(metaclass=MergedOptimizationMeta):
             `reporter_params`, with a value inferred from the `direction` of :attr:`target_metric`
             in `G.Env.metrics`. In nearly all cases, the "do_maximize" key should be ignored,
             as there are very few reasons to explicitly include it
+        pruner: :class:`pruners.BasePruner`, or None, default=None
+            If given, the interim evaluation of :attr:`target_metric` after each fold of an
+            Experiment is reported to `pruner`, which may stop the Experiment early if it is
+            unlikely to improve upon earlier Experiments. Pruned Experiments are scored with
+            :meth:`pruners.BasePruner.penalized_score`, and their IDs are added to
+            :attr:`pruned_experiments`. Only their keys, leaderboard entries, and descriptions are
+            saved, with the penalized score and a "pruned" marker, so they are not repeated, and
+            later Optimization Protocols learn from them as similar Experiments
 
         Notes
         -----
@@ -141,6 +164,7 @@ class BaseOptimizationProtocol(metaclass=MergedOptimizationMeta):
         self.verbose = verbose
         self.read_experiments = read_experiments
         self.reporter_parameters = reporter_parameters or {}
+        self.pruner = pruner
 
         #################### Experiment Guidelines ####################
         self.model_initializer = None
@@ -162,8 +186,13 @@ class BaseOptimizationProtocol(metaclass=MergedOptimizationMeta):
         self.best_score = None
         self.successful_iterations = 0
         self.skipped_iterations = 0
+        self.pruned_experiments = []
         self.tested_keys = []
+        self._tested_keys_set = None  # Lookup for :attr:`tested_keys`. See :meth:`_add_tested_key`
+        self._saved_keys = dict()  # Saved hyperparameter keys. See :meth:`_get_saved_keys`
+        self._model_initializer_hash = None
         self._search_space_size = None
+        self._state_path = None
 
         self.current_init_params = None
         self.current_extra_params = None
@@ -319,7 +348,15 @@ class BaseOptimizationProtocol(metaclass=MergedOptimizationMeta):
         search dimensions are in place. This process includes the following: setting the
         hyperparameter space; locating similar experiments to be used as learning material for
         :class:`SKOptimizationProtocol` s; and executing :meth:`_optimization_loop`, which
-        actually sets off the Experiment execution process"""
+        actually sets off the Experiment execution process
+
+        Notes
+        -----
+        The state of the protocol is saved after each iteration. If an Optimization Protocol with
+        the same search was interrupted, its saved state is restored instead of locating similar
+        Experiments, and the optimization loop resumes from the iteration at which it stopped.
+        Experiments executed by other means since the interruption are not learned from. To start
+        over, add "optimization_state" to the `file_blacklist` of the active `Environment`"""
         if self.model_initializer is None:
             raise ValueError("Experiment guidelines must be set before starting optimization")
 
@@ -327,12 +364,36 @@ class BaseOptimizationProtocol(metaclass=MergedOptimizationMeta):
         self.logger = OptimizationReporter([_.name for _ in self.dimensions], **_reporter_params)
 
         self.tested_keys = []
+        self._tested_keys_set = None
+        self._saved_keys = dict()
+        self._state_path = self._get_state_path()
         self._set_hyperparameter_space()
-        self._find_similar_experiments()
+        state = self._load_state()
+
+        # Experiments only append to the leaderboard log - It is compacted once they are all done
+        G.defer_leaderboard_compaction = True
+        experiment_callbacks = G.Env.experiment_callbacks
+        try:
+            if state is None:
+                self._find_similar_experiments()
+                iteration = 0
+            else:
+                iteration = self._restore_state(state)
+
+            if self._do_prune():
+                self.pruner.do_maximize = self.do_maximize
+                _callback = pruning_callback(self.pruner, self.target_metric)
+                G.Env.experiment_callbacks = experiment_callbacks + [_callback]
+
+            loop_start_time = datetime.now()
+            self._optimization_loop(iteration=iteration)
+            loop_end_time = datetime.now()
+            self._remove_state()
+        finally:
+            G.Env.experiment_callbacks = experiment_callbacks
+            G.defer_leaderboard_compaction = False
+            self._compact_leaderboard()
 
-        loop_start_time = datetime.now()
-        self._optimization_loop()
-        loop_end_time = datetime.now()
         G.log_(f"Optimization loop completed in {loop_end_time - loop_start_time}")
         G.log_(f'Best score was {self.best_score} from Experiment "{self.best_experiment}"')
         self._clean_up_optimization()
@@ -369,21 +430,29 @@ class BaseOptimizationProtocol(metaclass=MergedOptimizationMeta):
                 self._set_hyperparameter_space()
                 continue
 
-            self.logger.print_result(
-                self.current_hyperparameters_list,
-                self.current_score,
-                experiment_id=self.current_experiment.experiment_id,
-            )
+            self._report_current_result()
+            iteration += 1
+            self._save_state(iteration)
+
+    def _report_current_result(self):
+        """Log the result of :attr:`current_experiment`, and update :attr:`best_experiment` and
+        :attr:`best_score` if :attr:`current_score` is the best score yet"""
+        self.logger.print_result(
+            self.current_hyperparameters_list,
+            self.current_score,
+            experiment_id=self.current_experiment.experiment_id,
+        )
 
-            if (
-                (self.best_experiment is None)  # First evaluation
-                or (self.do_maximize and (self.best_score < self.current_score))  # New best max
-                or (not self.do_maximize and (self.best_score > self.current_score))  # New best min
-            ):
-                self.best_experiment = self.current_experiment.experiment_id
-                self.best_score = self.current_score
+        if self.current_experiment.experiment_id in self.pruned_experiments:
+            return
 
-            iteration += 1
+        if (
+            (self.best_experiment is None)  # First evaluation
+            or (self.do_maximize and (self.best_score < self.current_score))  # New best max
+            or (not self.do_maximize and (self.best_score > self.current_score))  # New best min
+        ):
+            self.best_experiment = self.current_experiment.experiment_id
+            self.best_score = self.current_score
 
     def _execute_experiment(self):
         """Instantiate and run a :class:`experiments.CVExperiment` after checking for duplicate keys
@@ -393,7 +462,53 @@ class BaseOptimizationProtocol(metaclass=MergedOptimizationMeta):
         As described in the Notes of :meth:`BaseOptimizationProtocol.set_experiment_guidelines`, the
         `auto_start` kwarg of :meth:`experiments.CVExperiment.__init__` is set to False in order to
         check for duplicated keys"""
+        self._prepare_experiment()
+
+        try:
+            self.current_experiment.experiment_workflow()
+        except ExperimentPrunedError:
+            self._handle_pruned_experiment()
+        else:
+            self.current_score = get_path(
+                self.current_experiment.last_evaluation_results, self.target_metric
+            )
+            self.successful_iterations += 1
+            self._get_saved_keys().add(self.current_experiment.hyperparameter_key.key)
+
+        if self._do_prune():
+            self.pruner.end_experiment()
+        self._clean_up_experiment()
+
+    def _handle_pruned_experiment(self):
+        """Record :attr:`current_experiment`, which was stopped early by :attr:`pruner`, as pruned,
+        and set :attr:`current_score` to the penalized score that it saved in its
+        `last_evaluation_results`. Its key is saved, so it is never repeated"""
+        experiment = self.current_experiment
+        self.current_score = get_path(experiment.last_evaluation_results, self.target_metric)
+        self.pruned_experiments.append(experiment.experiment_id)
+        self._get_saved_keys().add(experiment.hyperparameter_key.key)
+        G.log_(f'Pruned Experiment "{experiment.experiment_id}". Penalized: {self.current_score}')
+
+    def _do_prune(self):
+        """Determine whether Experiments should report their fold evaluations to :attr:`pruner`
+
+        Returns
+        -------
+        Boolean
+            True if :attr:`pruner` was given. Else False"""
+        return self.pruner is not None
+
+    def _prepare_experiment(self):
+        """Set :attr:`current_experiment` to a :class:`experiments.CVExperiment` using the upcoming
+        set of hyperparameters, and execute its `preparation_workflow`, without starting it
+
+        Raises
+        ------
+        RepeatedExperimentError
+            If the upcoming set of hyperparameters is found to have been tested by
+            :meth:`_check_repeated_key`, before :attr:`current_experiment` is initialized"""
         self._update_current_hyperparameters()
+        self._check_repeated_key()
 
         self.current_experiment = CVExperiment(
             # model=None,  # TODO: May need to pass `model` from `set_experiment_guidelines`
@@ -406,20 +521,136 @@ class BaseOptimizationProtocol(metaclass=MergedOptimizationMeta):
             notes=self.notes,
             do_raise_repeated=self.do_raise_repeated,
             auto_start=False,
+            staged_estimators=self._get_staged_estimators(),
         )
 
         self.current_experiment.preparation_workflow()
 
         # Future Hunter, if multi-cross_experiment_keys ever supported, this will be a problem. Should've fixed it earlier, dummy
-        if self.current_experiment.hyperparameter_key.key not in self.tested_keys:
-            self.tested_keys.append(self.current_experiment.hyperparameter_key.key)
+        self._add_tested_key(self.current_experiment.hyperparameter_key.key)
+
+    def _add_tested_key(self, key):
+        """Append `key` to :attr:`tested_keys` if it is not already there, checking a set of
+        :attr:`tested_keys`, rather than scanning the list
+
+        Parameters
+        ----------
+        key: String
+            A hyperparameter key"""
+        if self._tested_keys_set is None:  # Rebuilt after `tested_keys` is replaced
+            self._tested_keys_set = set(self.tested_keys)
+        if key not in self._tested_keys_set:
+            self._tested_keys_set.add(key)
+            self.tested_keys.append(key)
 
-        self.current_experiment.experiment_workflow()
-        self.current_score = get_path(
-            self.current_experiment.last_evaluation_results, self.target_metric
+    ##################################################
+    # Repeated Key Pre-Check Methods:
+    ##################################################
+    def _check_repeated_key(self):
+        """Make the hyperparameter key of the upcoming set of hyperparameters, and check it against
+        the keys of saved Experiments before a :class:`experiments.CVExperiment` is initialized,
+        which would select dataset columns, hash its parameters, save lookup entries, and read the
+        "TestedKeys" file. Keys that cannot be found here are still checked by the Experiment
+
+        Raises
+        ------
+        RepeatedExperimentError
+            If the key is in :meth:`_get_saved_keys`. The key is added to :attr:`tested_keys`"""
+        if not self._can_check_repeated_key():
+            return
+
+        key = self._make_current_hyperparameter_key()
+        if key in self._get_saved_keys():
+            self._add_tested_key(key)
+            raise RepeatedExperimentError(f"Hyperparameter key '{key}' has already been tested")
+
+    def _can_check_repeated_key(self):
+        """Determine whether :meth:`_check_repeated_key` can check the upcoming hyperparameters
+
+        Returns
+        -------
+        Boolean
+            True if repeated Experiments should raise `RepeatedExperimentError`, keys are saved by
+            the active `Environment`, and the algorithm is not a Keras model, whose keys can only be
+            made by building it. Else False"""
+        return (
+            self.do_raise_repeated
+            and (G.Env.result_paths["tested_keys"] is not None)
+            and (self.module_name != "keras")
+        )
+
+    def _make_current_hyperparameter_key(self):
+        """Make the hyperparameter key of the upcoming set of hyperparameters, as it would be made
+        by :meth:`experiments.BaseExperiment._generate_hyperparameter_key`, without saving lookup
+        entries or checking for its existence. The hash of :attr:`model_initializer` is only made
+        once, since it is the same for all Experiments
+
+        Returns
+        -------
+        String
+            The hyperparameter key of the upcoming Experiment"""
+        if self._model_initializer_hash is None:
+            self._model_initializer_hash = make_hash_sha256(self.model_initializer)
+
+        model_init_params = identify_algorithm_hyperparameters(self.model_initializer)
+        model_init_params.update(self.current_init_params)
+
+        parameters = get_hyperparameter_key_parameters(
+            self._model_initializer_hash,
+            model_init_params,
+            self.current_extra_params or {},
+            self.preprocessing_pipeline or {},
+            self.preprocessing_params or {},
+            format_feature_selector(
+                self.feature_selector, G.Env.train_dataset, G.Env.target_column, G.Env.id_column
+            ),
+        )
+        return HyperparameterKeyMaker(parameters, G.Env.cross_experiment_key, dry_run=True).key
+
+    def _get_saved_keys(self):
+        """Get the hyperparameter keys of saved Experiments under the active `Environment`'s
+        `cross_experiment_key`. They are read from its "TestedKeys" file once, then kept up to date
+        as Experiments are executed
+
+        Returns
+        -------
+        Set
+            Hyperparameter keys of Experiments with saved results. Empty if "tested_keys" was
+            blacklisted by the active `Environment`"""
+        cross_experiment_key = G.Env.cross_experiment_key.key
+        if cross_experiment_key not in self._saved_keys:
+            records = {}
+            if G.Env.result_paths["tested_keys"] is not None:
+                try:
+                    path = join(G.Env.result_paths["tested_keys"], f"{cross_experiment_key}.json")
+                    records = read_json(path)
+                except FileNotFoundError:
+                    pass
+            self._saved_keys[cross_experiment_key] = {_k for _k, _v in records.items() if _v}
+        return self._saved_keys[cross_experiment_key]
+
+    def _get_staged_estimators(self):
+        """Determine the smaller numbers of boosting rounds for which the upcoming Experiment should
+        also record results. Overridden by :class:`SKOptimizationProtocol`
+
+        Returns
+        -------
+        None
+            Staged results are not recorded by default"""
+        return None
+
+    def _compact_leaderboard(self):
+        """Merge the entries that Experiments appended to the global leaderboard log into the
+        global leaderboard, so it can be read by :meth:`_find_similar_experiments`, or by the
+        user"""
+        if G.Env.result_paths["global_leaderboard_log"] is None:
+            return
+
+        compact_leaderboard(
+            G.Env.result_paths["global_leaderboard"],
+            G.Env.result_paths["global_leaderboard_log"],
+            ascending=(G.Env.metrics[self.target_metric[-1]].direction == "min"),
         )
-        self.successful_iterations += 1
-        self._clean_up_experiment()
 
     @staticmethod
     def _clean_up_optimization():
@@ -470,6 +701,125 @@ class BaseOptimizationProtocol(metaclass=MergedOptimizationMeta):
 
         # No need to reinitialize Keras `initializers` - Their values are passed to `build_fn` via extra `params`
 
+    ##################################################
+    # Optimization State Methods:
+    ##################################################
+    #: Attributes saved in snapshots of the protocol's state, which are restored when an interrupted
+    #: Optimization Protocol with the same search is resumed
+    state_attributes = [
+        "similar_experiments",
+        "tested_keys",
+        "best_experiment",
+        "best_score",
+        "successful_iterations",
+        "skipped_iterations",
+        "pruned_experiments",
+        "pruner",
+    ]
+
+    def _get_state_parameters(self):
+        """Collect the parameters that define the search performed by the Optimization Protocol.
+        Protocols with identical state parameters share saved states
+
+        Returns
+        -------
+        Dict
+            Parameters hashed by :meth:`_get_state_path` to name the protocol's state file"""
+        return dict(
+            protocol=self.__class__.__name__,
+            algorithm_name=self.algorithm_name,
+            module_name=self.module_name,
+            model_initializer=self.model_initializer,
+            model_init_params=self.model_init_params,
+            model_extra_params=self.model_extra_params,
+            feature_selector=self.feature_selector,
+            preprocessing_pipeline=self.preprocessing_pipeline,
+            preprocessing_params=self.preprocessing_params,
+            target_metric=self.target_metric,
+            read_experiments=self.read_experiments,
+            pruner=self.pruner,
+        )
+
+    def _get_state_path(self):
+        """Determine the path of the file containing the protocol's saved state, named after the
+        hash of :meth:`_get_state_parameters`, in a directory named after the active Environment's
+        `cross_experiment_key`
+
+        Returns
+        -------
+        String, or None
+            Path of the state file, or None if "optimization_state" was blacklisted by the active
+            Environment"""
+        if G.Env.result_paths.get("optimization_state") is None:
+            return None
+        return join(
+            G.Env.result_paths["optimization_state"],
+            G.Env.cross_experiment_key.key,
+            f"{make_hash_sha256(self._get_state_parameters())}.pkl",
+        )
+
+    def _save_state(self, iteration):
+        """Save a snapshot of the protocol's state after completing an iteration, so an interrupted
+        Optimization Protocol with the same search can resume without reading saved Experiments
+        again. If the state cannot be pickled, saving states is disabled for the rest of the search
+
+        Parameters
+        ----------
+        iteration: Int
+            The number of iterations completed"""
+        if self._state_path is None:
+            return
+
+        attributes = {_: self.__dict__[_] for _ in self.state_attributes if _ in self.__dict__}
+        state = dict(iteration=iteration, random_state=np.random.get_state(), attributes=attributes)
+
+        try:
+            make_dirs(dirname(self._state_path), exist_ok=True)
+            with atomic_write(self._state_path, mode="wb") as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as _ex:
+            G.warn_(f"Disabling optimization states. Failed to pickle protocol state: {_ex!r}")
+            self._state_path = None
+
+    def _load_state(self):
+        """Load the state saved by an interrupted Optimization Protocol with the same search
+
+        Returns
+        -------
+        Dict, or None
+            The state saved by :meth:`_save_state`, or None if there is no saved state"""
+        if self._state_path is None or not exists(self._state_path):
+            return None
+
+        with open(self._state_path, "rb") as f:
+            return pickle.load(f)
+
+    def _restore_state(self, state):
+        """Restore the attributes saved in `state` by :meth:`_save_state`, in place of locating
+        similar Experiments
+
+        Parameters
+        ----------
+        state: Dict
+            State returned by :meth:`_load_state`
+
+        Returns
+        -------
+        Int
+            The number of iterations completed before the protocol was interrupted"""
+        for name, value in state["attributes"].items():
+            setattr(self, name, value)
+        np.random.set_state(state["random_state"])
+        self._tested_keys_set = None
+
+        G.log_(f"Resuming optimization after iteration {state['iteration']}")
+        return state["iteration"]
+
+    def _remove_state(self):
+        """Delete the protocol's saved state, if one exists, after the optimization loop is done"""
+        if self._state_path is not None and exists(self._state_path):
+            remove(self._state_path)
+
     ##################################################
     # Abstract Methods:
     ##################################################
@@ -523,13 +873,9 @@ class BaseOptimizationProtocol(metaclass=MergedOptimizationMeta):
 
     def _validate_guidelines(self):
         """Ensure provided Experiment guideline parameters are properly formatted"""
-        target_column = G.Env.target_column
-        id_column = G.Env.id_column
-        train_dataset = G.Env.train_dataset.copy()
-
-        self.feature_selector = self.feature_selector or train_dataset.columns.values
-        restricted_cols = [_ for _ in target_column + [id_column] if _ is not None]
-        self.feature_selector = [_ for _ in self.feature_selector if _ not in restricted_cols]
+        self.feature_selector = format_feature_selector(
+            self.feature_selector, G.Env.train_dataset, G.Env.target_column, G.Env.id_column
+        )
 
     def _find_similar_experiments(self):
         """Look for Experiments that were performed under similar conditions (algorithm and
@@ -537,6 +883,7 @@ class BaseOptimizationProtocol(metaclass=MergedOptimizationMeta):
         if self.read_experiments is False:
             return
 
+        self._compact_leaderboard()
         self.logger.print_saved_results_header()
 
         model_params = dict(
@@ -560,6 +907,7 @@ class BaseOptimizationProtocol(metaclass=MergedOptimizationMeta):
             G.Env.result_paths["global_leaderboard"],
             G.Env.result_paths["description"],
             model_params,
+            experiment_index_path=G.Env.result_paths["experiment_index"],
         )
         experiment_finder.find()
         self.similar_experiments = experiment_finder.similar_experiments
@@ -595,6 +943,10 @@ class SKOptimizationProtocol(BaseOptimizationProtocol, metaclass=ABCMeta):
         callbacks=None,
         #################### Other Parameters ####################
         base_estimator_kwargs=None,
+        n_parallel=1,
+        parallel_strategy="cl_min",
+        pruner=None,
+        n_stages=0,
     ):
         """Base class for SKOpt-based Optimization Protocols
 
@@ -628,11 +980,14 @@ class SKOptimizationProtocol(BaseOptimizationProtocol, metaclass=ABCMeta):
             approximated with `base_estimator`. Any valid Experiment records found will count as
             initialization points. If enough Experiment records are not found, additional points
             will be randomly sampled
-        acquisition_function: String in ['LCB', 'EI', 'PI', 'gp_hedge'], default='gp_hedge'
-            Function to minimize over the posterior distribution. 'LCB': lower confidence bound.
-            'EI': negative expected improvement. 'PI': negative probability of improvement.
-            'gp_hedge': Probabilistically choose one of the preceding three acquisition functions at
-            each iteration
+        acquisition_function: String, default='gp_hedge'
+            One of ['LCB', 'EI', 'PI', 'gp_hedge', 'EIps', 'PIps']. Function to minimize over the
+            posterior distribution. 'LCB': lower confidence bound. 'EI': negative expected
+            improvement. 'PI': negative probability of improvement. 'gp_hedge': Probabilistically
+            choose one of the preceding three acquisition functions at each iteration. 'EIps',
+            'PIps': 'EI', or 'PI' per second of Experiment execution time, which is learned by a
+            second surrogate model from the `total_elapsed` times recorded by Experiments (including
+            saved Experiments). These favor cheap, promising hyperparameters
         acquisition_optimizer: String in ['sampling', 'lbfgs', 'auto'], default='auto'
             Method to minimize the acquisition function. The fit model is updated with the optimal
             value obtained by optimizing `acquisition_function` with `acquisition_optimizer`.
@@ -655,6 +1010,28 @@ class SKOptimizationProtocol(BaseOptimizationProtocol, metaclass=ABCMeta):
             :attr:`optimizer`. If list, then each callable is called
         base_estimator_kwargs: Dict, or None, default={}
             Additional arguments passed to `base_estimator` when it is initialized
+        n_parallel: Int, default=1
+            The number of Experiments to execute concurrently in worker processes. If > 1,
+            `n_parallel` sets of hyperparameters are asked of :attr:`optimizer` at once, and the
+            results of their Experiments are told to :attr:`optimizer` as they finish. Requires the
+            "fork" multiprocessing start method, and is ignored for Keras models
+        parallel_strategy: String in ['cl_min', 'cl_mean', 'cl_max'], default='cl_min'
+            Constant liar strategy used to ask for several sets of hyperparameters at once if
+            `n_parallel` > 1. Until its Experiment is actually executed, the score of each set
+            asked is assumed to be the minimum, mean, or maximum of the scores observed so far
+        pruner: :class:`pruners.BasePruner`, or None, default=None
+            If given, used to stop unpromising Experiments early. See
+            :meth:`BaseOptimizationProtocol.__init__`. If Experiments are executed in worker
+            processes because `n_parallel` > 1, each is compared to the interim scores of the
+            Experiments that finished before its batch started
+        n_stages: Int, default=0
+            If > 0, and the number of boosting rounds (like "n_estimators") of an algorithm that can
+            make staged predictions (or the "epochs" of a Keras model) is an `Integer` search
+            dimension, each Experiment also records results for `n_stages` smaller numbers of
+            boosting rounds, evenly spaced between the dimension's lower bound and the number of
+            rounds being fit. These are computed from the same fitted models by
+            :class:`callbacks.predictors.PredictorStaged`, saved as separate Experiments, and all
+            told to :attr:`optimizer` with the Experiment's own result
 
         Notes
         -----
@@ -665,8 +1042,6 @@ class SKOptimizationProtocol(BaseOptimizationProtocol, metaclass=ABCMeta):
         :class:`.SKOptimizationProtocol` and its children in :mod:`.optimization` rely heavily
         on the utilities provided by the `Scikit-Optimize` library, so thank you to the creators and
         contributors for their excellent work."""
-        # TODO: Add 'EIps', and 'PIps' to the allowable `acquisition_function` values - Will need to return execution times
-
         #################### Optimizer Parameters ####################
         self.base_estimator = base_estimator
         self.n_initial_points = n_initial_points
@@ -686,11 +1061,16 @@ class SKOptimizationProtocol(BaseOptimizationProtocol, metaclass=ABCMeta):
 
         #################### Other Parameters ####################
         self.base_estimator_kwargs = base_estimator_kwargs or {}
+        self.n_parallel = n_parallel
+        self.parallel_strategy = parallel_strategy
+        self.n_stages = n_stages
 
         #################### Placeholder Attributes ####################
         self.optimizer = None
         self.optimizer_result = None
         self.current_hyperparameters_list = None
+        self._asked_hyperparameters = []
+        self._staged_dimension_index = None
 
         super().__init__(
             target_metric=target_metric,
@@ -698,15 +1078,112 @@ class SKOptimizationProtocol(BaseOptimizationProtocol, metaclass=ABCMeta):
             verbose=verbose,
             read_experiments=read_experiments,
             reporter_parameters=reporter_parameters,
+            pruner=pruner,
+        )
+
+    #: The fitted :attr:`optimizer` holds the observed points (`Xi`, `yi`), surrogate models, and
+    #: random state, so restoring it continues the same search trajectory without refitting
+    state_attributes = BaseOptimizationProtocol.state_attributes + [
+        "optimizer",
+        "optimizer_result",
+        "current_hyperparameters_list",
+    ]
+
+    def _get_state_parameters(self):
+        """Collect the parameters that define the search performed by the Optimization Protocol,
+        including those used to initialize :attr:`optimizer`
+
+        Returns
+        -------
+        Dict
+            Parameters hashed by :meth:`_get_state_path` to name the protocol's state file"""
+        return dict(
+            super()._get_state_parameters(),
+            base_estimator=self.base_estimator,
+            n_initial_points=self.n_initial_points,
+            acquisition_function=self.acquisition_function,
+            acquisition_optimizer=self.acquisition_optimizer,
+            random_state=self.random_state,
+            acquisition_function_kwargs=self.acquisition_function_kwargs,
+            acquisition_optimizer_kwargs=self.acquisition_optimizer_kwargs,
+            base_estimator_kwargs=self.base_estimator_kwargs,
+            n_stages=self.n_stages,
         )
 
     def _set_hyperparameter_space(self):
         """Initialize :attr:`space` according to the provided hyperparameter search dimensions, and
         :attr:`base_estimator`, and :attr:`optimizer`"""
         self.space = Space(dimensions=self.dimensions)
+        self._staged_dimension_index = self._find_staged_dimension()
         self._prepare_estimator()
         self._build_optimizer()
 
+    def _find_staged_dimension(self):
+        """Locate the search dimension of the number of boosting rounds (or Keras epochs), for
+        which Experiments record staged results if :attr:`n_stages` > 0
+
+        Returns
+        -------
+        Int, or None
+            The index in :attr:`space` of the dimension of the number of boosting rounds. None if
+            :attr:`n_stages` is 0, or if the dimension cannot be used for staged results"""
+        if not self.n_stages:
+            return None
+
+        location = get_staged_location(
+            self.model_initializer, self.model_init_params, self.model_extra_params
+        )
+        names = self.space.names()
+        if location in names:
+            index = names.index(location)
+            if isinstance(self.space.dimensions[index], Integer):
+                return index
+
+        G.warn_("`n_stages` requires an `Integer` dimension of boosting rounds or epochs. Ignoring")
+        return None
+
+    def _get_staged_estimators(self):
+        """Determine the smaller numbers of boosting rounds for which the upcoming Experiment should
+        record staged results, evenly spaced between the lower bound of the dimension of boosting
+        rounds and its current value
+
+        Returns
+        -------
+        List, or None
+            The `staged_estimators` of the upcoming Experiment. None if staged results are not
+            recorded"""
+        if self._staged_dimension_index is None:
+            return None
+
+        low = self.space.dimensions[self._staged_dimension_index].low
+        n_rounds = self.current_hyperparameters_list[self._staged_dimension_index]
+        stages = np.linspace(low, n_rounds, self.n_stages + 1)[:-1]
+        return sorted(set(int(round(_)) for _ in stages if 0 < round(_) < n_rounds)) or None
+
+    def _get_staged_observations(self, experiment):
+        """Collect the staged results recorded by `experiment` as observations of the objective
+
+        Parameters
+        ----------
+        experiment: :class:`experiments.CVExperiment`
+            An executed Experiment, whose `staged_results` may be empty
+
+        Returns
+        -------
+        List
+            Tuples of (<hyperparameters>, <score>, <experiment_id>, <elapsed time>) for each staged
+            result, whose hyperparameters are :attr:`current_hyperparameters_list`, with the number
+            of boosting rounds replaced by that of the staged result"""
+        observations = []
+        for result in getattr(experiment, "staged_results", []):
+            hyperparameters = list(self.current_hyperparameters_list)
+            hyperparameters[self._staged_dimension_index] = result["n_rounds"]
+            score = get_path(result["final_evaluations"], self.target_metric)
+            observations.append(
+                (hyperparameters, score, result["experiment_id"], result["total_elapsed"])
+            )
+        return observations
+
     def _prepare_estimator(self):
         """Initialize :attr:`base_estimator` with :attr:`space` via `skopt.utils.cook_estimator`"""
         self.base_estimator = cook_estimator(
@@ -728,7 +1205,7 @@ class SKOptimizationProtocol(BaseOptimizationProtocol, metaclass=ABCMeta):
             acq_optimizer_kwargs=self.acquisition_optimizer_kwargs,
         )
 
-    def _update_optimizer(self, hyperparameters, score, fit=True):
+    def _update_optimizer(self, hyperparameters, score, fit=True, elapsed_time=None):
         """Record an observation (or set of observations) of the objective function
 
         To add observations without fitting a new model, `fit`=False. To add multiple observations
@@ -742,19 +1219,330 @@ class SKOptimizationProtocol(BaseOptimizationProtocol, metaclass=ABCMeta):
             Value of the objective function at `hyperparameters` in the hyperparameter space
         fit: Boolean, default=True
             Fit a model to observed evaluations of the objective. Regardless of `fit`, a model will
-            only be fitted after telling :attr:`n_initial_points` points to :attr:`optimizer`"""
+            only be fitted after telling :attr:`n_initial_points` points to :attr:`optimizer`
+        elapsed_time: Number, list, or None, default=None
+            Execution time(s) in seconds of the Experiment(s) that evaluated `hyperparameters`, in
+            the same format as `score`. Required if :meth:`_is_cost_aware`. Else ignored"""
         if self.do_maximize:
-            score = -score
+            score = [-_ for _ in score] if isinstance(score, list) else -score
+
+        if self._is_cost_aware():
+            # Per-second acquisition functions model the log of times, so they must be positive
+            elapsed_time = np.maximum(elapsed_time, 1e-6).tolist()
+            if isinstance(score, list):
+                score = [list(_) for _ in zip(score, elapsed_time)]
+            else:
+                score = [score, elapsed_time]
+
         self.optimizer_result = self.optimizer.tell(hyperparameters, score, fit=fit)
 
+    def _is_cost_aware(self):
+        """Determine whether :attr:`acquisition_function` is a per-second acquisition function,
+        which requires the execution times of Experiments to be told to :attr:`optimizer`
+
+        Returns
+        -------
+        Boolean
+            True if :attr:`acquisition_function` is 'EIps', or 'PIps'. Else False"""
+        return self.acquisition_function in ["EIps", "PIps"]
+
+    @staticmethod
+    def _get_elapsed_time(experiment):
+        """Get the execution time of `experiment`, as recorded by
+        :class:`callbacks.aggregators.AggregatorTimes`
+
+        Parameters
+        ----------
+        experiment: :class:`experiments.BaseExperiment`
+            An Experiment that has been executed, or that was stopped early by a pruner
+
+        Returns
+        -------
+        Float
+            Seconds elapsed while executing `experiment`. If it was pruned, the estimated seconds to
+            execute all of its folds, saved by `_save_pruned_result`. If it was otherwise stopped
+            early, seconds elapsed from its start until now"""
+        elapsed_time = experiment.stat_aggregates["times"]["total_elapsed"]
+        if isinstance(elapsed_time, datetime):  # Still the start time if `experiment` didn't end
+            elapsed_time = (datetime.now() - elapsed_time).total_seconds()
+        return elapsed_time
+
     def _execute_experiment(self):
         """After executing parent's :meth:`_execute_experiment`, fit :attr:`optimizer` with the set
         of hyperparameters that were used, and the utility of those hyperparameters"""
         super()._execute_experiment()
-        self._update_optimizer(self.current_hyperparameters_list, self.current_score)
+        self._tell_current_result(self._get_elapsed_time(self.current_experiment))
         if eval_callbacks(self.callbacks, self.optimizer_result):
             return
 
+    def _tell_current_result(self, elapsed_time):
+        """Tell :attr:`optimizer` the result of :attr:`current_experiment`, along with any staged
+        results it recorded, so its surrogate model is only fitted once
+
+        Parameters
+        ----------
+        elapsed_time: Number
+            Execution time of :attr:`current_experiment` in seconds"""
+        staged = self._get_staged_observations(self.current_experiment)
+        if not staged:
+            self._update_optimizer(
+                self.current_hyperparameters_list, self.current_score, elapsed_time=elapsed_time
+            )
+            return
+
+        self._update_optimizer(
+            [self.current_hyperparameters_list] + [_[0] for _ in staged],
+            [self.current_score] + [_[1] for _ in staged],
+            elapsed_time=[elapsed_time] + [_[3] for _ in staged],
+        )
+
+    def _report_current_result(self):
+        """After reporting :attr:`current_experiment` by way of the parent's
+        :meth:`_report_current_result`, report each staged result it recorded, add their keys to
+        :attr:`tested_keys`, and update :attr:`best_experiment` if any of them is the best yet"""
+        super()._report_current_result()
+
+        for result in getattr(self.current_experiment, "staged_results", []):
+            self._add_tested_key(result["hyperparameter_key"])
+            self._get_saved_keys().add(result["hyperparameter_key"])
+
+        staged = self._get_staged_observations(self.current_experiment)
+        for hyperparameters, score, experiment_id, _ in staged:
+            self.logger.print_result(hyperparameters, score, experiment_id=experiment_id)
+
+            if (
+                (self.best_experiment is None)
+                or (self.do_maximize and (self.best_score < score))
+                or (not self.do_maximize and (self.best_score > score))
+            ):
+                self.best_experiment = experiment_id
+                self.best_score = score
+
+    def _optimization_loop(self, iteration=0):
+        """Perform Experiment execution loop while `iteration` < `iterations`. If :attr:`n_parallel`
+        is 1, this is just the parent's :meth:`_optimization_loop`. Otherwise, batches of up to
+        :attr:`n_parallel` Experiments are concurrently executed by
+        :meth:`_execute_experiment_batch`
+
+        Parameters
+        ----------
+        iteration: Int, default=0
+            The current iteration in the optimization loop"""
+        if not self._do_execute_in_parallel():
+            return super()._optimization_loop(iteration=iteration)
+
+        self.logger.print_optimization_header()
+        save_lock, G.save_lock = G.save_lock, get_context("fork").Lock()
+
+        try:
+            while iteration < self.iterations:
+                n_executed = 0
+
+                for _ in self._execute_experiment_batch(self.iterations - iteration):
+                    self._report_current_result()
+                    n_executed += 1
+
+                n_tested = len(self.similar_experiments) + len(self.tested_keys)
+                if (n_executed == 0) and (n_tested >= self.search_space_size):
+                    G.log_(f"Hyperparameter search space has been exhausted")
+                    break
+                iteration += n_executed
+                self._save_state(iteration)
+        finally:
+            G.save_lock = save_lock
+
+    def _execute_experiment_batch(self, max_experiments):
+        """Ask :attr:`optimizer` for up to :attr:`n_parallel` sets of hyperparameters at once, then
+        concurrently execute an Experiment for each set in worker processes. Keys are generated,
+        checked for duplicates, and added to :attr:`tested_keys` in this process before execution.
+        Every set asked is told to :attr:`optimizer`, so it never asks for the same batch again:
+        sets skipped as repeated are told their saved score (or :meth:`_get_penalty_observation`),
+        and sets whose Experiments failed are told the penalty. The other Experiments of the batch
+        continue if one fails. If all of them fail, `RuntimeError` is raised
+
+        Parameters
+        ----------
+        max_experiments: Int
+            The maximum number of Experiments to execute in the batch
+
+        Yields
+        ------
+        None
+            After each Experiment finishes, in order of completion. :attr:`current_experiment`,
+            :attr:`current_hyperparameters_list`, and :attr:`current_score` are set to those of the
+            finished Experiment, and :attr:`optimizer` has been told its score"""
+        n_untested = self.search_space_size - len(self.similar_experiments) - len(self.tested_keys)
+        if n_untested <= 0:
+            return
+
+        n_points = min(self.n_parallel, max_experiments, n_untested)
+        asked = self.optimizer.ask(n_points=n_points, strategy=self.parallel_strategy)
+
+        #################### Replace Repeated Points With Random Points ####################
+        for i, point in enumerate(asked):
+            if self.optimizer.is_evaluated(point) or (point in asked[:i]):
+                asked[i] = self.space.rvs(random_state=None)[0]
+                G.debug_("REPEATED  asked={}  new={}".format(point, asked[i]))
+
+        self._asked_hyperparameters = asked
+        batch, skipped = [], []
+
+        for _ in range(n_points):
+            try:
+                self._prepare_experiment()
+            except RepeatedExperimentError:
+                self.skipped_iterations += 1
+                skipped.append((self.current_hyperparameters_list, None))
+                continue
+            self.current_experiment._clean_up()  # Release `Environment` for next Experiment
+
+            hyperparameter_key = self.current_experiment.hyperparameter_key
+            batch_keys = [_[0].hyperparameter_key.key for _ in batch]
+            is_repeated = hyperparameter_key.exists or (hyperparameter_key.key in batch_keys)
+            if is_repeated and self.do_raise_repeated:
+                self.skipped_iterations += 1
+                skipped.append((self.current_hyperparameters_list, hyperparameter_key.key))
+                continue
+            batch.append((self.current_experiment, self.current_hyperparameters_list))
+
+        # Workers are forked after `_PENDING_EXPERIMENTS` is set, so Experiments need not be pickled
+        _PENDING_EXPERIMENTS[:] = [_[0] for _ in batch]
+        _PENDING_PRUNER[:] = [self.pruner]  # Each worker's Experiment reports to its forked copy
+        batch_results, errors = dict(), []
+        try:
+            if batch:
+                with get_context("fork").Pool(len(batch)) as pool:
+                    results = pool.imap_unordered(_execute_pending_experiment, range(len(batch)))
+
+                    for i, error, evaluations, elapsed_time, staged_results, pruning in results:
+                        self.current_experiment, self.current_hyperparameters_list = batch[i]
+                        if error is not None:
+                            G.warn_(f"Experiment {self.current_experiment!r} failed:\n{error}")
+                            errors.append(error)
+                            self._tell_penalty([self.current_hyperparameters_list])
+                            continue
+
+                        self.current_experiment.last_evaluation_results = evaluations
+                        self.current_experiment.staged_results = staged_results
+                        is_pruned, interim_scores = pruning
+                        if self._do_prune():
+                            self.pruner.end_experiment(interim_scores)
+
+                        key = self.current_experiment.hyperparameter_key.key
+                        if is_pruned:
+                            self._handle_pruned_experiment()
+                        else:
+                            self.current_score = get_path(evaluations, self.target_metric)
+                            self.successful_iterations += 1
+                            self._get_saved_keys().add(key)
+                        batch_results[key] = (self.current_score, elapsed_time)
+
+                        self._tell_current_result(elapsed_time)
+                        eval_callbacks(self.callbacks, self.optimizer_result)
+                        yield
+        finally:
+            _PENDING_EXPERIMENTS.clear()
+            _PENDING_PRUNER.clear()
+
+        self._tell_skipped_points(skipped, batch_results)
+        if batch and len(errors) == len(batch):
+            raise RuntimeError(f"All Experiments in the batch failed. Last error:\n{errors[-1]}")
+
+    def _tell_skipped_points(self, skipped, batch_results):
+        """Tell :attr:`optimizer` the sets of hyperparameters skipped by
+        :meth:`_execute_experiment_batch` because they were repeated. Each is told the score of the
+        saved (or just executed) Experiment with the same hyperparameters, if one can be found.
+        Otherwise, it is told the penalty of :meth:`_get_penalty_observation`
+
+        Parameters
+        ----------
+        skipped: List
+            Tuples of (<hyperparameters>, <hyperparameter key, or None>) of the skipped sets
+        batch_results: Dict
+            Tuples of (<score>, <elapsed time>) of the Experiments executed in the batch, keyed by
+            their hyperparameter keys"""
+        saved = [
+            (dimension_subset(_[0], self.space.names()), _[1], _[3] if len(_) > 3 else None)
+            for _ in self.similar_experiments
+        ]
+
+        observations, unknown = [], []
+        for hyperparameters, key in skipped:
+            score, elapsed_time = batch_results.get(key, (None, None))
+            if score is None:
+                match = [_[1:] for _ in saved if _[0] == hyperparameters]
+                score, elapsed_time = match[0] if match else (None, None)
+
+            if score is None or (self._is_cost_aware() and elapsed_time is None):
+                unknown.append(hyperparameters)
+            else:
+                observations.append((hyperparameters, score, elapsed_time))
+
+        if observations:
+            self._update_optimizer(
+                [_[0] for _ in observations],
+                [_[1] for _ in observations],
+                elapsed_time=[_[2] for _ in observations],
+            )
+        self._tell_penalty(unknown)
+
+    def _tell_penalty(self, points):
+        """Tell :attr:`optimizer` the penalty of :meth:`_get_penalty_observation` for each of
+        `points`, whose Experiments failed, or whose scores are unknown. If :attr:`optimizer` has
+        not been told any scores, there is no penalty, so its cached points are discarded instead
+
+        Parameters
+        ----------
+        points: List
+            Sets of hyperparameters in :attr:`space`"""
+        if not points:
+            return
+
+        score, elapsed_time = self._get_penalty_observation()
+        if score is None:
+            self.optimizer.cache_ = {}  # Ensure the next `ask` does not return the same points
+            return
+
+        self._update_optimizer(
+            points, [score] * len(points), elapsed_time=[elapsed_time] * len(points)
+        )
+
+    def _get_penalty_observation(self):
+        """Determine the score, and execution time told to :attr:`optimizer` for sets of
+        hyperparameters whose Experiments failed, or whose scores are unknown
+
+        Returns
+        -------
+        Tuple
+            The worst score, and the longest execution time told to :attr:`optimizer` so far. The
+            time is None if not :meth:`_is_cost_aware`. (None, None) if nothing was told yet"""
+        values = self.optimizer.objective_values
+        if not values:
+            return None, None
+
+        score = -max(values) if self.do_maximize else max(values)
+        elapsed_time = None
+        if self._is_cost_aware():
+            elapsed_time = float(np.exp(max(_[1] for _ in self.optimizer.yi)))  # Told log times
+        return score, elapsed_time
+
+    def _do_execute_in_parallel(self):
+        """Determine whether Experiments should be executed concurrently in worker processes
+
+        Returns
+        -------
+        Boolean
+            True if :attr:`n_parallel` > 1, and parallel execution is possible. Else False"""
+        if self.n_parallel == 1:
+            return False
+        if self.module_name == "keras":
+            G.warn_("Keras Experiments can't be executed in worker processes - Ignoring n_parallel")
+            return False
+        if "fork" not in get_all_start_methods():
+            G.warn_("`n_parallel` requires the 'fork' start method. Ignoring `n_parallel`")
+            return False
+        return True
+
     def _get_current_hyperparameters(self):
         """Ask :attr:`optimizer` for the upcoming set of hyperparameters that should be searched,
         then format them to be used in the next Experiment
@@ -763,7 +1551,10 @@ class SKOptimizationProtocol(BaseOptimizationProtocol, metaclass=ABCMeta):
         -------
         current_hyperparameters: Dict
             The next set of hyperparameters that will be searched"""
-        _current_hyperparameters = self.optimizer.ask()
+        if self._asked_hyperparameters:
+            _current_hyperparameters = self._asked_hyperparameters.pop(0)
+        else:
+            _current_hyperparameters = self.optimizer.ask()
 
         if _current_hyperparameters == self.current_hyperparameters_list:
             new_parameters = self.space.rvs(random_state=None)[0]
@@ -781,23 +1572,40 @@ class SKOptimizationProtocol(BaseOptimizationProtocol, metaclass=ABCMeta):
     def _find_similar_experiments(self):
         """After locating similar experiments by way of the parent's
         :meth:`_find_similar_experiments`, fit :attr:`optimizer` with the hyperparameters and
-        results of each located experiment"""
+        results of all located experiments at once, so its surrogate model is only fitted once. If
+        :meth:`_is_cost_aware`, located experiments without recorded execution times are skipped"""
         super()._find_similar_experiments()
 
+        all_hyperparameters, all_evaluations, all_elapsed_times = [], [], []
+        n_untimed = 0
+
         # TODO: Remove below reversal of `similar_experiments` when `result_reader.ResultFinder.sort` finished
-        for _i, _experiment in enumerate(self.similar_experiments[::-1]):
+        for _experiment in self.similar_experiments[::-1]:
             _hyperparameters = dimension_subset(_experiment[0], self.space.names())
             _evaluation = _experiment[1]
             _experiment_id = _experiment[2] if len(_experiment) > 2 else None
+            _elapsed_time = _experiment[3] if len(_experiment) > 3 else None
+
+            if self._is_cost_aware() and _elapsed_time is None:
+                n_untimed += 1
+                continue
+
             self.logger.print_result(_hyperparameters, _evaluation, experiment_id=_experiment_id)
-            self._update_optimizer(_hyperparameters, _evaluation)
+            all_hyperparameters.append(_hyperparameters)
+            all_evaluations.append(_evaluation)
+            all_elapsed_times.append(_elapsed_time)
 
-            # self.optimizer_result = self.optimizer.tell(
-            #     _hyperparameters, _evaluation, fit=(_i == len(self.similar_experiments) - 1))
+        if n_untimed:
+            G.warn_(f"Skipped {n_untimed} saved Experiments without recorded execution times")
+        if not all_hyperparameters:
+            return
+
+        self._update_optimizer(all_hyperparameters, all_evaluations, elapsed_time=all_elapsed_times)
+        # FLAG: Could wrap above `tell` call in try/except, then attempt `_tell` with improper
+        # ... dimensions
 
-            if eval_callbacks(self.callbacks, self.optimizer_result):
-                return self.optimizer_result
-            # FLAG: Could wrap above `tell` call in try/except, then attempt `_tell` with improper dimensions
+        if eval_callbacks(self.callbacks, self.optimizer_result):
+            return self.optimizer_result
 
     def _validate_parameters(self):
         """Ensure provided input parameters are properly formatted"""
@@ -806,6 +1614,18 @@ class SKOptimizationProtocol(BaseOptimizationProtocol, metaclass=ABCMeta):
         #################### callbacks ####################
         self.callbacks = check_callback(self.callbacks)
 
+        #################### n_parallel ####################
+        if not isinstance(self.n_parallel, int) or isinstance(self.n_parallel, bool):
+            raise TypeError(f"n_parallel must be an int, not {self.n_parallel!r}")
+        if self.n_parallel < 1:
+            raise ValueError(f"n_parallel must be >= 1, not {self.n_parallel}")
+
+        #################### n_stages ####################
+        if not isinstance(self.n_stages, int) or isinstance(self.n_stages, bool):
+            raise TypeError(f"n_stages must be an int, not {self.n_stages!r}")
+        if self.n_stages < 0:
+            raise ValueError(f"n_stages must be >= 0, not {self.n_stages}")
+
     @property
     def search_space_size(self):
         """The number of different hyperparameter permutations possible given the current
@@ -822,5 +1642,51 @@ class SKOptimizationProtocol(BaseOptimizationProtocol, metaclass=ABCMeta):
         return self._search_space_size
 
 
+##################################################
+# Parallel Experiment Execution Helpers
+##################################################
+_PENDING_EXPERIMENTS = []
+_PENDING_PRUNER = []
+
+
+def _execute_pending_experiment(index):
+    """Execute the `experiment_workflow` of a prepared Experiment in a forked worker process
+
+    Parameters
+    ----------
+    index: Int
+        Index in `_PENDING_EXPERIMENTS` of the Experiment to execute. `_PENDING_EXPERIMENTS` is
+        populated by :meth:`SKOptimizationProtocol._execute_experiment_batch` before forking
+
+    Returns
+    -------
+    Tuple
+        `index`, the formatted traceback if the Experiment raised an exception (else None), the
+        `last_evaluation_results` of the executed Experiment, its execution time in seconds, its
+        `staged_results`, and a pair of (<whether it was pruned>, <interim scores reported to the
+        worker's copy of the pruner, or None if there is no pruner>). If the Experiment failed,
+        the last four are None. Pruned Experiments have already saved their penalized results"""
+    experiment = _PENDING_EXPERIMENTS[index]
+    pruner = _PENDING_PRUNER[0] if _PENDING_PRUNER else None
+    G.Env.current_task = experiment
+    try:
+        experiment.experiment_workflow()
+    except ExperimentPrunedError:
+        pass
+    except Exception:  # Reported by the protocol, which collects the rest of the batch
+        return index, traceback.format_exc(), None, None, None, None
+
+    elapsed_time = SKOptimizationProtocol._get_elapsed_time(experiment)
+    pruning = (experiment.pruned, None if pruner is None else pruner.current_scores)
+    return (
+        index,
+        None,
+        experiment.last_evaluation_results,
+        elapsed_time,
+        experiment.staged_results,
+        pruning,
+    )
+
+
 if __name__ == "__main__":
     pass
@@ -0,0 +1,321 @@
+"""This module defines Pruners, which are used by Optimization Protocols to stop Experiments early
+when their evaluations on the first folds show they are unlikely to improve upon the Experiments
+already executed. Interim fold evaluations are compared to the evaluations of earlier Experiments
+after the same number of folds
+
+Related
+-------
+:mod:`hyperparameter_hunter.optimization_core`
+    Defines :class:`optimization_core.BaseOptimizationProtocol`, whose `pruner` argument accepts the
+    Pruners defined herein. The protocol adds the callback made by :func:`pruning_callback` to each
+    Experiment it executes, then tells its optimizer a penalized score for pruned Experiments
+:mod:`hyperparameter_hunter.callbacks.bases`
+    Defines :func:`callbacks.bases.lambda_callback`, which is used by :func:`pruning_callback` to
+    report the fold evaluations of Experiments to a Pruner"""
+##################################################
+# Import Own Assets
+##################################################
+from hyperparameter_hunter.callbacks.bases import lambda_callback
+from hyperparameter_hunter.exceptions import ExperimentPrunedError
+from hyperparameter_hunter.settings import G
+from hyperparameter_hunter.utils.boltons_utils import get_path, PathAccessError
+
+##################################################
+# Import Miscellaneous Assets
+##################################################
+from abc import ABCMeta, abstractmethod
+import numpy as np
+
+
+##################################################
+# Pruner Base Class
+##################################################
+class BasePruner(metaclass=ABCMeta):
+    def __init__(self, n_startup_experiments=5, n_warmup_steps=0):
+        """Base class for Pruners, which decide whether to stop an Experiment early by comparing its
+        interim fold evaluations to the interim evaluations of earlier Experiments
+
+        Parameters
+        ----------
+        n_startup_experiments: Int, default=5
+            The number of Experiments that must be completed (or pruned) before any Experiment can
+            be pruned. Until then, evaluations are only recorded
+        n_warmup_steps: Int, default=0
+            The number of folds an Experiment must complete before it can be pruned. A step is one
+            fold, counted across repetitions, so the first fold of the second repetition of 5-fold
+            cross-validation is step 6
+
+        Notes
+        -----
+        Steps only count the folds completed by an Experiment, so a Pruner should only be used by
+        Optimization Protocols whose Experiments share the same cross-validation scheme, as is the
+        case for all Experiments executed in a single `Environment`"""
+        self.n_startup_experiments = n_startup_experiments
+        self.n_warmup_steps = n_warmup_steps
+
+        #: Maximize or minimize the target metric. Set by the Optimization Protocol using the Pruner
+        self.do_maximize = True
+        #: Interim scores of all earlier Experiments, keyed by step
+        self.history = {}
+        #: Interim scores of the Experiment in progress, keyed by step
+        self.current_scores = {}
+        self.n_experiments = 0
+
+    def __repr__(self):
+        return "{}(n_startup_experiments={}, n_warmup_steps={})".format(
+            type(self).__name__, self.n_startup_experiments, self.n_warmup_steps
+        )
+
+    def start_experiment(self):
+        """Prepare to receive the interim scores of a new Experiment"""
+        self.current_scores = {}
+
+    def end_experiment(self, scores=None):
+        """Add the interim scores of the Experiment that just ended (or was pruned) to
+        :attr:`history`, making them available for comparison with later Experiments
+
+        Parameters
+        ----------
+        scores: Dict, or None, default=None
+            Interim scores of the Experiment, keyed by step. If None, :attr:`current_scores` is
+            used. Given for Experiments executed in worker processes, whose interim scores were
+            reported to the worker's copy of the Pruner"""
+        scores = self.current_scores if scores is None else scores
+        for step, score in scores.items():
+            self.history.setdefault(step, []).append(score)
+        self.current_scores = {}
+        self.n_experiments += 1
+
+    def report(self, step, score):
+        """Record an interim score of the Experiment in progress, and decide whether to prune it
+
+        Parameters
+        ----------
+        step: Int
+            The number of folds completed by the Experiment
+        score: Number
+            The Experiment's evaluation of the target metric after `step` folds
+
+        Returns
+        -------
+        Boolean
+            True if the Experiment should be pruned. Else False"""
+        self.current_scores[step] = score
+
+        if self.n_experiments < self.n_startup_experiments or step <= self.n_warmup_steps:
+            return False
+        if not self.history.get(step):
+            return False
+        if np.isnan(score):
+            return True
+        return bool(self._should_prune(step, self._orient(score), self._orient(self.history[step])))
+
+    def penalized_score(self, step, score):
+        """Determine the score to report for an Experiment pruned at `step` with interim `score`.
+        This is the worse of `score`, and the worst interim score of earlier Experiments at `step`
+
+        Parameters
+        ----------
+        step: Int
+            The number of folds completed by the Experiment when it was pruned
+        score: Number
+            The Experiment's evaluation of the target metric after `step` folds
+
+        Returns
+        -------
+        Number
+            Penalized score, in the same orientation as the target metric"""
+        scores = [_ for _ in self.history.get(step, []) + [score] if not np.isnan(_)]
+        if not scores:
+            return score
+        return min(scores) if self.do_maximize else max(scores)
+
+    def _orient(self, scores):
+        """Orient `scores` so that larger values are always better
+
+        Parameters
+        ----------
+        scores: Number, or list
+
+        Returns
+        -------
+        Number, or `numpy.ndarray`"""
+        scores = np.asarray(scores, dtype=float)
+        return scores if self.do_maximize else -scores
+
+    @abstractmethod
+    def _should_prune(self, step, score, history):
+        """Decide whether to prune the Experiment in progress
+
+        Parameters
+        ----------
+        step: Int
+            The number of folds completed by the Experiment
+        score: Float
+            The Experiment's interim score at `step`, oriented so that larger is better
+        history: numpy.ndarray
+            Interim scores of earlier Experiments at `step`, oriented so that larger is better
+
+        Returns
+        -------
+        Boolean
+            True if the Experiment should be pruned. Else False"""
+        raise NotImplementedError()
+
+
+##################################################
+# Pruners
+##################################################
+class PercentilePruner(BasePruner):
+    def __init__(self, percentile=25.0, n_startup_experiments=5, n_warmup_steps=0):
+        """Prune Experiments whose interim scores are not among the best `percentile` percent of
+        the interim scores of earlier Experiments at the same step
+
+        Parameters
+        ----------
+        percentile: Float in the range (0, 100], default=25.0
+            The percentage of best interim scores to keep. If 25.0, Experiments are pruned if their
+            interim score is worse than the 25th-best percentile of earlier interim scores
+        n_startup_experiments: Int, default=5
+            See :class:`BasePruner`
+        n_warmup_steps: Int, default=0
+            See :class:`BasePruner`"""
+        if not 0 < percentile <= 100:
+            raise ValueError(f"percentile must be in the range (0, 100], not {percentile}")
+        self.percentile = percentile
+        super().__init__(n_startup_experiments=n_startup_experiments, n_warmup_steps=n_warmup_steps)
+
+    def __repr__(self):
+        return "{}(percentile={}, n_startup_experiments={}, n_warmup_steps={})".format(
+            type(self).__name__, self.percentile, self.n_startup_experiments, self.n_warmup_steps
+        )
+
+    def _should_prune(self, step, score, history):
+        history = history[~np.isnan(history)]
+        if history.size == 0:
+            return False
+        return score < np.percentile(history, 100 - self.percentile)
+
+
+class MedianPruner(PercentilePruner):
+    def __init__(self, n_startup_experiments=5, n_warmup_steps=0):
+        """Prune Experiments whose interim scores are worse than the median of the interim scores of
+        earlier Experiments at the same step. This is the median-stopping rule
+
+        Parameters
+        ----------
+        n_startup_experiments: Int, default=5
+            See :class:`BasePruner`
+        n_warmup_steps: Int, default=0
+            See :class:`BasePruner`"""
+        super().__init__(
+            percentile=50.0,
+            n_startup_experiments=n_startup_experiments,
+            n_warmup_steps=n_warmup_steps,
+        )
+
+    def __repr__(self):
+        return BasePruner.__repr__(self)
+
+
+class SuccessiveHalvingPruner(BasePruner):
+    def __init__(self, min_steps=1, reduction_factor=3, n_startup_experiments=0, n_warmup_steps=0):
+        """Prune Experiments at rungs of increasing numbers of folds, unless their interim scores
+        are among the best 1/`reduction_factor` of the interim scores of all Experiments that
+        reached the same rung. Rungs are at steps `min_steps` * (`reduction_factor` ** k)
+
+        Parameters
+        ----------
+        min_steps: Int, default=1
+            The number of folds an Experiment completes before reaching its first rung
+        reduction_factor: Int, default=3
+            The factor by which the number of folds increases between rungs, and the inverse of the
+            fraction of Experiments promoted from each rung to the next
+        n_startup_experiments: Int, default=0
+            See :class:`BasePruner`
+        n_warmup_steps: Int, default=0
+            See :class:`BasePruner`"""
+        if min_steps < 1:
+            raise ValueError(f"min_steps must be >= 1, not {min_steps}")
+        if reduction_factor < 2:
+            raise ValueError(f"reduction_factor must be >= 2, not {reduction_factor}")
+        self.min_steps = min_steps
+        self.reduction_factor = reduction_factor
+        super().__init__(n_startup_experiments=n_startup_experiments, n_warmup_steps=n_warmup_steps)
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(min_steps={self.min_steps}, "
+            f"reduction_factor={self.reduction_factor}, "
+            f"n_startup_experiments={self.n_startup_experiments}, "
+            f"n_warmup_steps={self.n_warmup_steps})"
+        )
+
+    def is_rung(self, step):
+        """Determine whether `step` is one of the rungs at which Experiments may be pruned
+
+        Parameters
+        ----------
+        step: Int
+            The number of folds completed by an Experiment
+
+        Returns
+        -------
+        Boolean
+            True if `step` is `min_steps` * (`reduction_factor` ** k) for some integer k >= 0"""
+        if step < self.min_steps or step % self.min_steps:
+            return False
+        rung = step // self.min_steps
+        while rung % self.reduction_factor == 0:
+            rung //= self.reduction_factor
+        return rung == 1
+
+    def _should_prune(self, step, score, history):
+        if not self.is_rung(step):
+            return False
+
+        scores = np.append(history[~np.isnan(history)], score)
+        n_promoted = max(1, len(scores) // self.reduction_factor)
+        return score < np.sort(scores)[::-1][n_promoted - 1]
+
+
+##################################################
+# Pruning Callback
+##################################################
+def pruning_callback(pruner, target_metric):
+    """Create a callback that reports an Experiment's interim evaluations of `target_metric` to
+    `pruner` after each fold, and raises :class:`exceptions.ExperimentPrunedError` if `pruner`
+    decides the Experiment should be pruned
+
+    Parameters
+    ----------
+    pruner: :class:`BasePruner`
+        The Pruner to which interim evaluations are reported
+    target_metric: Tuple
+        Path to the metric in an Experiment's `last_evaluation_results` that is compared by
+        `pruner`, like ("oof", "roc_auc_score")
+
+    Returns
+    -------
+    LambdaCallback: :class:`LambdaCallback`
+        Uninitialized callback class to be inherited by Experiments"""
+
+    def on_experiment_start():
+        pruner.start_experiment()
+
+    def on_fold_end(_rep, _fold, cv_params, last_evaluation_results):
+        try:
+            score = get_path(last_evaluation_results, target_metric)
+        except (KeyError, PathAccessError):
+            return
+
+        step = _rep * cv_params["n_splits"] + _fold + 1
+        if pruner.report(step, score):
+            G.log(f"Pruning Experiment after {step} folds with interim score: {score}")
+            raise ExperimentPrunedError(step, pruner.penalized_score(step, score), target_metric)
+
+    return lambda_callback(on_experiment_start=on_experiment_start, on_fold_end=on_fold_end)
+
+
+if __name__ == "__main__":
+    pass
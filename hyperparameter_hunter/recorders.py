@@ -10,9 +10,21 @@ Related
 # Import Own Assets
 ##################################################
 from hyperparameter_hunter.exceptions import EnvironmentInactiveError, EnvironmentInvalidError
-from hyperparameter_hunter.leaderboards import GlobalLeaderboard
+from hyperparameter_hunter.experiment_index import ExperimentIndex
+from hyperparameter_hunter.leaderboards import (
+    GlobalLeaderboard,
+    LeaderboardLog,
+    compact_leaderboard,
+)
 from hyperparameter_hunter.settings import G
-from hyperparameter_hunter.utils.file_utils import write_json, add_to_json, make_dirs, read_json
+from hyperparameter_hunter.utils.file_utils import (
+    write_json,
+    add_to_json,
+    file_lock,
+    make_dirs,
+    read_json,
+    save_predictions,
+)
 from hyperparameter_hunter.utils.general_utils import subdict
 
 ##################################################
@@ -20,6 +32,7 @@ from hyperparameter_hunter.utils.general_utils import subdict
 ##################################################
 from abc import ABCMeta, abstractmethod
 from collections import OrderedDict
+import os.path
 from platform import node
 import shutil
 from sys import exc_info
@@ -109,7 +122,7 @@ class BaseRecorder(metaclass=ABCMeta):
 
 
 class RecorderList(object):
-    def __init__(self, file_blacklist=None, extra_recorders=None):
+    def __init__(self, file_blacklist=None, extra_recorders=None, recorders=None):
         """Collection of :class:`BaseRecorder` subclasses to facilitate executing group methods
 
         Parameters
@@ -125,7 +138,11 @@ class RecorderList(object):
             appended to the list of default `recorders` and used to create/update result files for
             an Experiment. The contents of `extra_recorders` are blacklisted in the same way as
             normal `recorders`. That is, if `file_blacklist` contains the `result_path_key` of a
-            recorder in `extra_recorders`, that recorder is blacklisted"""
+            recorder in `extra_recorders`, that recorder is blacklisted
+        recorders: List, or None, default=None
+            If not None, the :class:`BaseRecorder` subclasses to use instead of the default
+            `recorders`, like :data:`PRUNED_RECORDERS`. These are still filtered by
+            `file_blacklist`"""
         # WARNING: Take care if modifying the order/contents of :attr:`recorders`. See :meth:`save_result` documentation for info
         self.recorders = [
             TestedKeyRecorder,
@@ -137,6 +154,8 @@ class RecorderList(object):
             PredictionsTestRecorder,
             HeartbeatRecorder,
         ]
+        if recorders is not None:
+            self.recorders = list(recorders)
 
         #################### Add `extra_recorders` ####################
         if extra_recorders:
@@ -203,11 +222,14 @@ class DescriptionRecorder(BaseRecorder):
         "model",
         "algorithm_name",
         "module_name",
+        "result_paths",
+        "pruned",
     ]
 
     def format_result(self):
         """Format an OrderedDict containing the Experiment's identifying attributes, results,
-        hyperparameters used, and other stats or information that may be useful"""
+        hyperparameters used, and other stats or information that may be useful. Experiments
+        stopped early by a pruner are marked by a "pruned" value of True"""
         self.result = OrderedDict(
             [
                 ("experiment_id", self.experiment_id),
@@ -225,6 +247,8 @@ class DescriptionRecorder(BaseRecorder):
                 ("aggregates", self.stat_aggregates),
             ]
         )
+        if self.pruned:
+            self.result["pruned"] = True
 
         #################### Filter Hyperparameters' model_init_params ####################
         self.result["hyperparameters"]["model_init_params"] = subdict(
@@ -232,9 +256,10 @@ class DescriptionRecorder(BaseRecorder):
         )
 
     def save_result(self):
-        """Save the Experiment description as a .json file, named after :attr:`experiment_id`. If
-        :attr:`do_full_save` is a callable and returns False when given the description object, the
-        result recording loop will be broken, and the remaining result files will not be saved
+        """Save the Experiment description as a .json file, named after :attr:`experiment_id`, and
+        add it to the :class:`experiment_index.ExperimentIndex`. If :attr:`do_full_save` is a
+        callable and returns False when given the description object, the result recording loop
+        will be broken, and the remaining result files will not be saved
 
         Returns
         -------
@@ -245,9 +270,12 @@ class DescriptionRecorder(BaseRecorder):
         try:
             write_json(f"{self.result_path}/{self.experiment_id}.json", self.result, do_clear=False)
         except FileNotFoundError:
-            make_dirs(self.result_path, exist_ok=False)
+            make_dirs(self.result_path, exist_ok=True)
             write_json(f"{self.result_path}/{self.experiment_id}.json", self.result, do_clear=False)
 
+        if self.result_paths.get("experiment_index") is not None:
+            ExperimentIndex(self.result_paths["experiment_index"]).add_entry(self.result)
+
         if (self.do_full_save is not None) and (not self.do_full_save(self.result)):
             G.warn("Breaking result-saving loop early! Remaining result files will not be saved")
             return "break"
@@ -269,7 +297,7 @@ class HeartbeatRecorder(BaseRecorder):
         try:
             self._copy_heartbeat()
         except FileNotFoundError:
-            make_dirs(self.result_path, exist_ok=False)
+            make_dirs(self.result_path, exist_ok=True)
             self._copy_heartbeat()
 
     def _copy_heartbeat(self):
@@ -288,10 +316,32 @@ prediction_requirements = [
     "target_column",
     "id_column",
     "to_csv_params",
+    "prediction_format",
 ]
 
 
-class PredictionsHoldoutRecorder(BaseRecorder):
+class BasePredictionsRecorder(BaseRecorder):
+    def save_result(self):
+        """Save predictions to a file named after :attr:`experiment_id`, in the format given by
+        :attr:`environment.Environment.prediction_format`"""
+        try:
+            self._save_predictions()
+        except FileNotFoundError:
+            make_dirs(self.result_path, exist_ok=True)
+            self._save_predictions()
+
+    def _save_predictions(self):
+        """Helper method to save :attr:`result` via :func:`utils.file_utils.save_predictions`"""
+        save_predictions(
+            self.result,
+            f"{self.result_path}/{self.experiment_id}",
+            prediction_format=self.prediction_format,
+            id_column=self.id_column,
+            **(self.to_csv_params if self.prediction_format == "csv" else {}),
+        )
+
+
+class PredictionsHoldoutRecorder(BasePredictionsRecorder):
     result_path_key = "predictions_holdout"
     required_attributes = ["final_holdout_predictions", "holdout_dataset"] + prediction_requirements
 
@@ -301,16 +351,8 @@ class PredictionsHoldoutRecorder(BaseRecorder):
             self.final_holdout_predictions, self.holdout_dataset, self.target_column, self.id_column
         )
 
-    def save_result(self):
-        """Save holdout predictions to a .csv file, named after :attr:`experiment_id`"""
-        try:
-            self.result.to_csv(f"{self.result_path}/{self.experiment_id}.csv", **self.to_csv_params)
-        except FileNotFoundError:
-            make_dirs(self.result_path, exist_ok=False)
-            self.result.to_csv(f"{self.result_path}/{self.experiment_id}.csv", **self.to_csv_params)
-
 
-class PredictionsOOFRecorder(BaseRecorder):
+class PredictionsOOFRecorder(BasePredictionsRecorder):
     result_path_key = "predictions_oof"
     required_attributes = ["final_oof_predictions", "train_dataset"] + prediction_requirements
 
@@ -320,16 +362,8 @@ class PredictionsOOFRecorder(BaseRecorder):
             self.final_oof_predictions, self.train_dataset, self.target_column, self.id_column
         )
 
-    def save_result(self):
-        """Save out-of-fold predictions to a .csv file, named after :attr:`experiment_id`"""
-        try:
-            self.result.to_csv(f"{self.result_path}/{self.experiment_id}.csv", **self.to_csv_params)
-        except FileNotFoundError:
-            make_dirs(self.result_path, exist_ok=False)
-            self.result.to_csv(f"{self.result_path}/{self.experiment_id}.csv", **self.to_csv_params)
-
 
-class PredictionsTestRecorder(BaseRecorder):
+class PredictionsTestRecorder(BasePredictionsRecorder):
     result_path_key = "predictions_test"
     required_attributes = ["final_test_predictions", "test_dataset"] + prediction_requirements
 
@@ -339,14 +373,6 @@ class PredictionsTestRecorder(BaseRecorder):
             self.final_test_predictions, self.test_dataset, self.target_column, self.id_column
         )
 
-    def save_result(self):
-        """Save test predictions to a .csv file, named after :attr:`experiment_id`"""
-        try:
-            self.result.to_csv(f"{self.result_path}/{self.experiment_id}.csv", **self.to_csv_params)
-        except FileNotFoundError:
-            make_dirs(self.result_path, exist_ok=False)
-            self.result.to_csv(f"{self.result_path}/{self.experiment_id}.csv", **self.to_csv_params)
-
 
 # class PredictionsInFoldRecorder(BaseRecorder):
 #     result_path_key = 'predictions_in_fold'
@@ -387,26 +413,32 @@ class LeaderboardEntryRecorder(BaseRecorder):
     # ... blacklist value - "tested_keys" must be used, instead
     result_path_key = "tested_keys"
     required_attributes = ["result_paths", "current_task", "target_metric", "metrics"]
-    # Despite not being allowed in the blacklist, the "leaderboards" and "global_leaderboard" keys
-    # ... of `result_paths` are still referenced herein
+    # Despite not being allowed in the blacklist, the "leaderboards", "global_leaderboard", and
+    # ... "global_leaderboard_log" keys of `result_paths` are still referenced herein
 
     def format_result(self):
-        """Read existing global leaderboard, add current entry, then sort the updated leaderboard"""
-        self.result = GlobalLeaderboard.from_path(path=self.result_paths["global_leaderboard"])
-        self.result.add_entry(self.current_task)
-        # Sort rows by first column (target metric), then descending "experiment_#" (newest first)
-        self.result.sort(
-            by=[list(self.result.data.columns)[0], "experiment_#"],
-            ascending=[(self.metrics[self.target_metric[-1]].direction == "min"), False],
-        )
+        """Build the current Experiment's leaderboard entry, without reading the leaderboard"""
+        self.result = GlobalLeaderboard.format_entry(self.current_task)
 
     def save_result(self):
-        """Save the updated leaderboard file"""
-        try:
-            self.result.save(path=self.result_paths["global_leaderboard"])
-        except FileNotFoundError:
-            make_dirs(self.result_paths["leaderboards"], exist_ok=False)
-            self.result.save(path=self.result_paths["global_leaderboard"])
+        """Append the entry to the global leaderboard log. Unless compaction is deferred by
+        :attr:`settings.G.defer_leaderboard_compaction`, then merge the log into the global
+        leaderboard, sorting rows by first column (target metric), then descending "experiment_#"
+        (newest first)"""
+        LeaderboardLog(self.result_paths["global_leaderboard_log"]).append(self.result)
+
+        if not G.defer_leaderboard_compaction:
+            compact_leaderboard(
+                self.result_paths["global_leaderboard"],
+                self.result_paths["global_leaderboard_log"],
+                ascending=(self.metrics[self.target_metric[-1]].direction == "min"),
+            )
+
+
+#: Recorders used by Experiments stopped early by a pruner. Their keys, leaderboard entries, and
+#: descriptions (including the penalized target metric) are saved, so later Optimization Protocols
+#: can learn from them, but they have no final predictions to save
+PRUNED_RECORDERS = [TestedKeyRecorder, LeaderboardEntryRecorder, DescriptionRecorder]
 
 
 ##################################################
@@ -417,22 +449,25 @@ class UnsortedIDLeaderboardRecorder(BaseRecorder):
     required_attributes = ["result_paths", "current_task", "target_metric", "metrics"]
 
     def format_result(self):
-        """Read existing global leaderboard, add current entry, then sort the updated leaderboard"""
-        self.result = GlobalLeaderboard.from_path(path=self.result_paths["unsorted_id_leaderboard"])
-        self.result.add_entry(self.current_task)
-        no_sort = ["experiment_id", "hyperparameter_key", "cross_experiment_key", "algorithm_name"]
-        self.result.sort(
-            by=[_ for _ in list(self.result.data.columns) if _ not in no_sort],
-            ascending=(self.metrics[self.target_metric[-1]].direction == "min"),
-        )
+        """Build the current Experiment's leaderboard entry. The existing leaderboard is read by
+        :meth:`save_result`, while its file is locked"""
+        self.result = GlobalLeaderboard.format_entry(self.current_task)
 
     def save_result(self):
-        """Save the updated leaderboard file"""
-        try:
-            self.result.save(path=self.result_paths["unsorted_id_leaderboard"])
-        except FileNotFoundError:
-            make_dirs(self.result_paths["leaderboards"], exist_ok=False)
-            self.result.save(path=self.result_paths["unsorted_id_leaderboard"])
+        """Read the existing leaderboard, add the current entry, sort the updated leaderboard, then
+        save it. The leaderboard's :func:`utils.file_utils.file_lock` is held throughout, so entries
+        saved concurrently by other processes are never lost"""
+        path = self.result_paths["unsorted_id_leaderboard"]
+        make_dirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        with file_lock(path):
+            leaderboard = GlobalLeaderboard.from_path(path=path)
+            leaderboard.add_entries([self.result])
+            leaderboard.sort(
+                by=[_ for _ in leaderboard.data.columns if _ not in leaderboard.identifier_cols],
+                ascending=(self.metrics[self.target_metric[-1]].direction == "min"),
+            )
+            leaderboard.save(path=path)
 
 
 class YAMLDescriptionRecorder(BaseRecorder):
@@ -1,15 +1,17 @@
 ##################################################
 # Import Own Assets
 ##################################################
+from hyperparameter_hunter.experiment_index import ExperimentIndex
 from hyperparameter_hunter.library_helpers.keras_helper import (
     keras_callback_to_dict,
     keras_initializer_to_dict,
 )
 from hyperparameter_hunter.settings import G
 from hyperparameter_hunter.utils.boltons_utils import remap, get_path
+from hyperparameter_hunter.utils.file_utils import read_json, PREDICTION_FILE_EXTENSIONS
 from hyperparameter_hunter.utils.optimization_utils import (
     get_ids_by,
-    get_scored_params,
+    get_description_scored_params,
     filter_by_space,
     filter_by_guidelines,
 )
@@ -57,6 +59,7 @@ class ResultFinder:
         descriptions_dir,
         model_params,
         sort=None,  # TODO: Unfinished - To be used in `_get_scored_params`/`_get_ids`
+        experiment_index_path=None,
     ):
         """Locate saved Experiments that are compatible with the given constraints
 
@@ -90,7 +93,12 @@ class ResultFinder:
               those with the lowest
             * "chronological": Sort from oldest experiments to newest
             * "reverse_chronological": Sort from newest experiments to oldest
-            * int: Random seed with which to shuffle experiments"""
+            * int: Random seed with which to shuffle experiments
+        experiment_index_path: String, or None, default=None
+            Path to the database of an :class:`experiment_index.ExperimentIndex`, from which the
+            descriptions of saved Experiments are read in a single query. Experiments missing from
+            the index are read from `descriptions_dir`, then added to the index. If None, all
+            descriptions are read from `descriptions_dir`"""
         self.algorithm_name = algorithm_name
         self.module_name = module_name
         self.cross_experiment_key = cross_experiment_key
@@ -100,6 +108,7 @@ class ResultFinder:
         self.descriptions_dir = descriptions_dir
         self.model_params = model_params
         self.sort = sort  # TODO: Unfinished - To be used in `_get_scored_params`/`_get_ids`
+        self.experiment_index_path = experiment_index_path
 
         self.experiment_ids = []
         self.hyperparameters_and_scores = []
@@ -134,12 +143,33 @@ class ResultFinder:
         )
 
     def _get_scored_params(self):
-        """For all :attr:`experiment_ids`, add a tuple of the Experiment's hyperparameters, and its
-        :attr:`target_metric` value"""
+        """For all :attr:`experiment_ids`, add a tuple of the Experiment's hyperparameters, its
+        :attr:`target_metric` value, its ID, and its execution time in seconds (None if the
+        description doesn't include one). Descriptions are read from the index at
+        :attr:`experiment_index_path` if possible, and from :attr:`descriptions_dir` otherwise"""
+        index, indexed_descriptions = None, {}
+        if self.experiment_index_path is not None:
+            index = ExperimentIndex(self.experiment_index_path)
+            indexed_descriptions = index.get_entries(
+                str(self.cross_experiment_key), self.algorithm_name
+            )
+
+        descriptions, unindexed_descriptions = [], []
         for _id in self.experiment_ids:
-            # TODO: Receive `description` from `get_scored_params` and extract whatever value is required by :attr:`sort`
-            vals = get_scored_params(f"{self.descriptions_dir}/{_id}.json", self.target_metric)
-            self.hyperparameters_and_scores.append(vals + (_id,))
+            try:
+                descriptions.append(indexed_descriptions[_id])
+            except KeyError:  # Not indexed - Probably saved before the index was introduced
+                descriptions.append(read_json(f"{self.descriptions_dir}/{_id}.json"))
+                unindexed_descriptions.append(descriptions[-1])
+
+        if index is not None and unindexed_descriptions:
+            index.add_entries(unindexed_descriptions)
+
+        for _id, description in zip(self.experiment_ids, descriptions):
+            # TODO: Extract whatever value is required by :attr:`sort` from `description`
+            vals = get_description_scored_params(description, self.target_metric)
+            elapsed = get_path(description, ("aggregates", "times", "total_elapsed"), default=None)
+            self.hyperparameters_and_scores.append(vals + (_id, elapsed))
 
     def _filter_by_space(self):
         """Remove any elements of :attr:`hyperparameters_and_scores` whose values are declared in
@@ -224,6 +254,7 @@ class KerasResultFinder(ResultFinder):
         descriptions_dir,
         model_params,
         sort=None,  # TODO: Unfinished - To be used in `_get_scored_params`/`_get_ids`
+        experiment_index_path=None,
     ):
         """ResultFinder for locating saved Keras Experiments compatible with the given constraints
 
@@ -257,7 +288,12 @@ class KerasResultFinder(ResultFinder):
               those with the lowest
             * "chronological": Sort from oldest experiments to newest
             * "reverse_chronological": Sort from newest experiments to oldest
-            * int: Random seed with which to shuffle experiments"""
+            * int: Random seed with which to shuffle experiments
+        experiment_index_path: String, or None, default=None
+            Path to the database of an :class:`experiment_index.ExperimentIndex`, from which the
+            descriptions of saved Experiments are read in a single query. Experiments missing from
+            the index are read from `descriptions_dir`, then added to the index. If None, all
+            descriptions are read from `descriptions_dir`"""
         super().__init__(
             algorithm_name=algorithm_name,
             module_name=module_name,
@@ -268,6 +304,7 @@ class KerasResultFinder(ResultFinder):
             descriptions_dir=descriptions_dir,
             model_params=model_params,
             sort=sort,  # TODO: Unfinished - To be used in `_get_scored_params`/`_get_ids`
+            experiment_index_path=experiment_index_path,
         )
 
         from keras.callbacks import Callback as BaseKerasCallback
@@ -336,15 +373,15 @@ def has_experiment_result_file(results_dir, experiment_id, result_type=None):
         result_type = [result_type]
 
     for subdir in result_type:
-        #################### Select Result File Suffix ####################
+        #################### Select Result File Suffixes ####################
         if subdir == "Descriptions":
-            suffix = ".json"
+            suffixes = [".json"]
         elif subdir == "Heartbeats":
-            suffix = ".log"
+            suffixes = [".log"]
         elif subdir == "ScriptBackups":
-            suffix = ".py"
+            suffixes = [".py"]
         elif subdir.startswith("Predictions"):
-            suffix = ".csv"
+            suffixes = list(PREDICTION_FILE_EXTENSIONS.values())
         else:
             raise ValueError(f"Cannot resolve suffix for subdir `result_type`: {subdir}")
 
@@ -354,7 +391,7 @@ def has_experiment_result_file(results_dir, experiment_id, result_type=None):
         else:
             experiments_dir = Path(results_dir) / "HyperparameterHunterAssets" / "Experiments"
 
-        if not (experiments_dir / subdir / f"{experiment_id}{suffix}").exists():
+        if not any((experiments_dir / subdir / f"{experiment_id}{_}").exists() for _ in suffixes):
             return False
 
     return True
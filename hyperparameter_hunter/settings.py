@@ -13,6 +13,7 @@ Related
 # Import Miscellaneous Assets
 ##################################################
 import os.path
+from threading import Lock
 import warnings
 
 
@@ -25,6 +26,8 @@ ASSETS_EXPERIMENTS_DIRNAME = "Experiments"
 ASSETS_TESTED_KEYS_DIRNAME = "TestedKeys"
 ASSETS_KEY_ATTRIBUTE_LOOKUP_DIRNAME = "KeyAttributeLookup"
 ASSETS_LEADERBOARDS_DIRNAME = "Leaderboards"
+ASSETS_OPTIMIZATION_STATES_DIRNAME = "OptimizationStates"
+ASSETS_DATASET_CACHE_DIRNAME = "DatasetCache"
 
 RESULT_FILE_SUB_DIR_PATHS = {
     #################### Experiments ####################
@@ -36,13 +39,20 @@ RESULT_FILE_SUB_DIR_PATHS = {
     "predictions_oof": "{}/PredictionsOOF".format(ASSETS_EXPERIMENTS_DIRNAME),
     "predictions_test": "{}/PredictionsTest".format(ASSETS_EXPERIMENTS_DIRNAME),
     "script_backup": "{}/ScriptBackups".format(ASSETS_EXPERIMENTS_DIRNAME),
+    "experiment_index": "{}/ExperimentIndex.db".format(ASSETS_EXPERIMENTS_DIRNAME),
     #################### Tested Keys ####################
     "tested_keys": "{}".format(ASSETS_TESTED_KEYS_DIRNAME),
+    "fold_indices": "{}/FoldIndices".format(ASSETS_TESTED_KEYS_DIRNAME),
     #################### Key Attribute Lookup ####################
     "key_attribute_lookup": "{}".format(ASSETS_KEY_ATTRIBUTE_LOOKUP_DIRNAME),
     #################### Leaderboards ####################
     "leaderboards": "{}".format(ASSETS_LEADERBOARDS_DIRNAME),
     "global_leaderboard": "{}/GlobalLeaderboard.csv".format(ASSETS_LEADERBOARDS_DIRNAME),
+    "global_leaderboard_log": "{}/GlobalLeaderboardLog.jsonl".format(ASSETS_LEADERBOARDS_DIRNAME),
+    #################### Optimization States ####################
+    "optimization_state": "{}".format(ASSETS_OPTIMIZATION_STATES_DIRNAME),
+    #################### Dataset Cache ####################
+    "dataset_cache": "{}".format(ASSETS_DATASET_CACHE_DIRNAME),
     #################### Other ####################
     "current_heartbeat": "Heartbeat.log",
     # 'analytics': '{}'.format(),
@@ -89,6 +99,17 @@ class G(object):
         ...
     mirror_registry: List
         ...
+    save_lock: `threading.Lock`, or `multiprocessing.Lock`
+        Held by :meth:`experiments.BaseExperiment.experiment_workflow` while formatting and saving
+        result files. Replaced with a `multiprocessing.Lock` by
+        :class:`optimization_core.SKOptimizationProtocol` when Experiments are executed in parallel
+        worker processes, so that updates to shared files (like the global leaderboard) are atomic
+    defer_leaderboard_compaction: Boolean
+        If False, :class:`recorders.LeaderboardEntryRecorder` compacts the global leaderboard log
+        into the global leaderboard at the end of each Experiment. Set to True by
+        :meth:`optimization_core.BaseOptimizationProtocol.go` while executing Experiments, which
+        only append their leaderboard entries to the log. The protocol compacts the log itself
+        before reading the leaderboard, and after its Experiments are complete
     """
 
     Env = None
@@ -121,6 +142,9 @@ class G(object):
     sentinel_registry = []
     mirror_registry = []
 
+    save_lock = Lock()
+    defer_leaderboard_compaction = False
+
     @classmethod
     def reset_attributes(cls):
         """Return the attributes of :class:`settings.G` to their original values"""
@@ -1,11 +1,28 @@
-"""This module defines utilities for reading, writing, and modifying different types of files"""
+"""This module defines utilities for reading, writing, and modifying different types of files
+
+Files that may be modified by multiple processes at once (like those in the "TestedKeys",
+"KeyAttributeLookup", and "Leaderboards" subdirectories of a shared `results_path`) are protected
+by :func:`file_lock`, and rewritten atomically by :func:`atomic_write`, so that concurrent writers
+never interleave their read-modify-write cycles, and readers never see partially written files"""
 ##################################################
 # Import Miscellaneous Assets
 ##################################################
+from contextlib import contextmanager, suppress
+from glob import glob, escape as glob_escape
+from hashlib import sha256
+from importlib.util import find_spec
 import numpy as np
 import os
 import os.path
+import pandas as pd
 import simplejson as json
+from uuid import uuid4
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 
 ##################################################
@@ -62,7 +79,7 @@ def write_json(file_path, data, do_clear=False):
     if do_clear is True:
         clear_file(file_path)
 
-    with open(file_path, "w") as f:
+    with atomic_write(file_path) as f:
         json.dump(data, f, default=default_json_write)
 
 
@@ -118,25 +135,636 @@ def add_to_json(file_path, data_to_add, key=None, condition=None, default=None,
         the error will be raised
     append_value: Boolean, default=False
         If True and the original data at `file_path` is a dict, then `data_to_add` will be appended
-        as a list to the value of the original data at key `key`"""
-    try:
-        original_data = read_json(file_path)
-    except FileNotFoundError:
-        if default is not None:
-            original_data = default
+        as a list to the value of the original data at key `key`
+
+    Notes
+    -----
+    The file at `file_path` is locked by :func:`file_lock` from the time it is read until the time
+    its new contents are written, so concurrent calls from multiple processes do not lose updates"""
+    with file_lock(file_path):
+        try:
+            original_data = read_json(file_path)
+        except FileNotFoundError:
+            if default is not None:
+                original_data = default
+            else:
+                raise
+
+        if condition is None or original_data is None or condition(original_data):
+            if key is None and isinstance(original_data, list):
+                original_data.append(data_to_add)
+            elif isinstance(key, str) and isinstance(original_data, dict):
+                if append_value is True:
+                    original_data[key] = original_data[key] + [data_to_add]
+                else:
+                    original_data[key] = data_to_add
+
+            write_json(file_path, original_data)
+
+
+##################################################
+# Concurrent Writing Utilities
+##################################################
+@contextmanager
+def file_lock(file_path):
+    """Context manager that holds an exclusive, inter-process lock for `file_path` while active.
+    The lock is held on a separate lock file in a hidden ".locks" subdirectory of the directory of
+    `file_path`, so `file_path` itself may be replaced (as by :func:`atomic_write`) while the lock
+    is held, and lock files are kept apart from the result files beside `file_path`. Locks are not
+    reentrant, so a process must not attempt to lock a file it has already locked
+
+    Parameters
+    ----------
+    file_path: String
+        Path of the file to lock. The file does not need to exist, but its directory does
+
+    Raises
+    ------
+    FileNotFoundError
+        If the directory of `file_path` does not exist"""
+    directory, name = os.path.split(file_path)
+    lock_dir = os.path.join(directory, ".locks")
+    with suppress(FileExistsError):
+        os.mkdir(lock_dir)
+    lock_path = os.path.join(lock_dir, f"{name}.lock")
+
+    with open(lock_path, "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
         else:
-            raise
-
-    if condition is None or original_data is None or condition(original_data):
-        if key is None and isinstance(original_data, list):
-            original_data.append(data_to_add)
-        elif isinstance(key, str) and isinstance(original_data, dict):
-            if append_value is True:
-                original_data[key] = original_data[key] + [data_to_add]
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:  # `LK_LOCK` gives up after 10 seconds - Keep waiting
+                    continue
+
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
             else:
-                original_data[key] = data_to_add
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def atomic_write(file_path, mode="w", **kwargs):
+    """Context manager that yields a file object to which the new contents of `file_path` should
+    be written. The contents are written to a temporary file in the same directory, which replaces
+    `file_path` only after the context exits without error. Readers of `file_path` therefore see
+    either its old contents, or its new contents, but never a partially written file
+
+    Parameters
+    ----------
+    file_path: String
+        Path of the file to write. The file does not need to exist, but its directory does
+    mode: String, default="w"
+        Mode in which to open the temporary file. Should be one of "w", or "wb"
+    **kwargs: Dict
+        Extra keyword arguments given to :func:`open` for the temporary file
+
+    Raises
+    ------
+    FileNotFoundError
+        If the directory of `file_path` does not exist"""
+    directory, name = os.path.split(file_path)
+    temp_path = os.path.join(directory, f".{name}.{uuid4().hex}.tmp")
+
+    try:
+        with open(temp_path, mode, **kwargs) as f:
+            yield f
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+##################################################
+# Prediction File Functions
+##################################################
+#: Extensions of the prediction files saved in each of the formats accepted by
+#: :func:`save_predictions`. Keys are values of :attr:`environment.Environment.prediction_format`
+PREDICTION_FILE_EXTENSIONS = dict(csv=".csv", parquet=".parquet", npz=".npz", memmap=".npy")
+
+
+def validate_prediction_format(prediction_format):
+    """Ensure that `prediction_format` is a known prediction file format that can be saved
+
+    Parameters
+    ----------
+    prediction_format: String
+        Expected to be a key in :data:`PREDICTION_FILE_EXTENSIONS`
+
+    Returns
+    -------
+    prediction_format: String
+        The unchanged `prediction_format`
+
+    Raises
+    ------
+    ValueError
+        If `prediction_format` is not a key in :data:`PREDICTION_FILE_EXTENSIONS`
+    ImportError
+        If `prediction_format` is "parquet", and neither "pyarrow", nor "fastparquet" is installed
+
+    Examples
+    --------
+    >>> validate_prediction_format("npz")
+    'npz'
+    >>> validate_prediction_format("hdf")
+    Traceback (most recent call last):
+        File "file_utils.py", line ?, in validate_prediction_format
+    ValueError: prediction_format must be one of ['csv', 'parquet', 'npz', 'memmap'], not 'hdf'"""
+    if prediction_format not in PREDICTION_FILE_EXTENSIONS:
+        raise ValueError(
+            f"prediction_format must be one of {list(PREDICTION_FILE_EXTENSIONS)}, not "
+            f"{prediction_format!r}"
+        )
+    if prediction_format == "parquet" and not (find_spec("pyarrow") or find_spec("fastparquet")):
+        raise ImportError("prediction_format='parquet' requires 'pyarrow', or 'fastparquet'")
+    return prediction_format
+
+
+def save_predictions(predictions, file_path, prediction_format="csv", id_column=None, **kwargs):
+    """Save a DataFrame of predictions in the file format given by `prediction_format`
+
+    Parameters
+    ----------
+    predictions: pd.DataFrame
+        Predictions to save, as produced by :attr:`environment.Environment.prediction_formatter`
+    file_path: String
+        Path of the file to save, without an extension. The extension for `prediction_format` in
+        :data:`PREDICTION_FILE_EXTENSIONS` is appended to `file_path`
+    prediction_format: {"csv", "parquet", "npz", "memmap"}, default="csv"
+        The format in which to save `predictions`:
+
+        * "csv": Text file written by :meth:`pandas.DataFrame.to_csv`, given `kwargs`
+        * "parquet": Columnar binary file written by :meth:`pandas.DataFrame.to_parquet`, given
+          `kwargs`. Requires "pyarrow", or "fastparquet"
+        * "npz": Compressed NumPy archive containing a separate array for each column, which can
+          be read individually. Column values are saved exactly
+        * "memmap": NumPy structured array file, which :func:`read_predictions` maps into memory,
+          rather than reading entirely. All columns are saved as float32, except `id_column`, and
+          any non-numeric columns
+    id_column: String, or None, default=None
+        If not None, the name of the column in `predictions` containing sample identifiers. Only
+        used if `prediction_format` is "memmap", in which case `id_column` keeps its original type
+    **kwargs: Dict
+        Extra keyword arguments given to :meth:`pandas.DataFrame.to_csv` if `prediction_format` is
+        "csv", or to :meth:`pandas.DataFrame.to_parquet` if `prediction_format` is "parquet"
+
+    Returns
+    -------
+    String
+        Path of the saved prediction file, including its extension
+
+    Notes
+    -----
+    Column names are converted to strings for all binary formats, and non-numeric columns are saved
+    as fixed-width strings in the "npz", and "memmap" formats, so they can be read without
+    pickling"""
+    validate_prediction_format(prediction_format)
+    file_path = file_path + PREDICTION_FILE_EXTENSIONS[prediction_format]
+
+    if prediction_format == "csv":
+        predictions.to_csv(file_path, **kwargs)
+    elif prediction_format == "parquet":
+        predictions.rename(columns=str).to_parquet(file_path, **dict(dict(index=False), **kwargs))
+    elif prediction_format == "npz":
+        columns = [_to_storable_array(predictions[_]) for _ in predictions.columns]
+        np.savez_compressed(file_path, np.array([str(_) for _ in predictions.columns]), *columns)
+    elif prediction_format == "memmap":
+        columns = [
+            _to_storable_array(predictions[_], float_dtype=None if _ == id_column else np.float32)
+            for _ in predictions.columns
+        ]
+        dtype = [(str(name), array.dtype) for name, array in zip(predictions.columns, columns)]
+        shape = (len(predictions),)
+        memmap = np.lib.format.open_memmap(file_path, mode="w+", dtype=dtype, shape=shape)
+        for (name, _), array in zip(dtype, columns):
+            memmap[name] = array
+        memmap.flush()
+        del memmap
+
+    return file_path
+
+
+def _to_storable_array(column, float_dtype=None):
+    """Convert a prediction DataFrame column to an array that NumPy can save without pickling
+
+    Parameters
+    ----------
+    column: pd.Series
+        The column to convert
+    float_dtype: Type, or None, default=None
+        If not None, numeric (and boolean) columns are cast to this type. Else, they are unchanged
+
+    Returns
+    -------
+    np.ndarray
+        Values of `column`. Non-numeric values are converted to fixed-width strings"""
+    values = column.values
+    if values.dtype.kind in "biuf":
+        return values.astype(float_dtype) if float_dtype is not None else values
+    return values.astype(str)
+
+
+def read_predictions(file_path, columns=None, copy=False, **kwargs):
+    """Read a prediction file saved by :func:`save_predictions` in any of its formats
+
+    Parameters
+    ----------
+    file_path: String
+        Path of the prediction file. If its extension is not in :data:`PREDICTION_FILE_EXTENSIONS`,
+        the extensions are tried in order, and the first existing file is read. This allows the
+        predictions of an Experiment to be read by "<prediction directory>/<experiment_id>",
+        regardless of the format in which they were saved
+    columns: List, or None, default=None
+        If not None, only the named columns are read. For binary formats, the other columns are
+        never loaded from disk
+    copy: Boolean, default=False
+        Only used for "memmap" files. If False, numeric columns of the returned DataFrame are
+        read-only views of the memory-mapped file, so their values are only read from disk when
+        accessed. If True, all columns are copied into memory, and can be modified. Non-numeric
+        columns are always copied, as pandas stores them as objects
+    **kwargs: Dict
+        Extra keyword arguments given to :func:`pandas.read_csv` for "csv" files, or to
+        :func:`pandas.read_parquet` for "parquet" files
+
+    Returns
+    -------
+    pd.DataFrame
+        The predictions saved at `file_path`
+
+    Raises
+    ------
+    FileNotFoundError
+        If no prediction file exists at `file_path`"""
+    extension = os.path.splitext(file_path)[1]
+
+    if extension not in PREDICTION_FILE_EXTENSIONS.values():
+        for candidate_extension in PREDICTION_FILE_EXTENSIONS.values():
+            if os.path.exists(file_path + candidate_extension):
+                file_path, extension = file_path + candidate_extension, candidate_extension
+                break
+        else:
+            raise FileNotFoundError(f"No prediction file found for: {file_path}")
+
+    if extension == PREDICTION_FILE_EXTENSIONS["csv"]:
+        return pd.read_csv(file_path, **dict(dict(usecols=columns), **kwargs))
+    elif extension == PREDICTION_FILE_EXTENSIONS["parquet"]:
+        return pd.read_parquet(file_path, **dict(dict(columns=columns), **kwargs))
+    elif extension == PREDICTION_FILE_EXTENSIONS["npz"]:
+        with np.load(file_path) as npz:
+            names = list(npz["arr_0"])
+            columns = names if columns is None else columns
+            data = {_: npz[f"arr_{names.index(_) + 1}"] for _ in columns}
+        return pd.DataFrame(data, columns=columns)
+    else:
+        memmap = np.load(file_path, mmap_mode="r")
+        columns = list(memmap.dtype.names) if columns is None else columns
+        if copy:
+            return pd.DataFrame({_: np.array(memmap[_]) for _ in columns}, columns=columns)
+        #################### Keep Columns as Views of `memmap` ####################
+        data = {_: pd.Series(np.asarray(memmap[_]), name=_, copy=False) for _ in columns}
+        return pd.DataFrame(data, columns=columns, copy=False)
+
+
+##################################################
+# Dataset File Functions
+##################################################
+#: Readers of the binary dataset files read directly by :func:`read_dataset`, keyed by extension.
+#: Files with any other extension are read as CSV files
+DATASET_FILE_READERS = {
+    ".parquet": pd.read_parquet,
+    ".pq": pd.read_parquet,
+    ".feather": pd.read_feather,
+    ".ftr": pd.read_feather,
+    ".arrow": pd.read_feather,
+    ".pkl": pd.read_pickle,
+    ".pickle": pd.read_pickle,
+}
+#: Extensions of the dataset files that :func:`read_dataset` can map into memory, rather than read
+MEMORY_MAP_EXTENSIONS = [".npy", ".feather", ".ftr", ".arrow"]
+#: Extensions of the cache files saved by :func:`read_dataset` in each of its `cache_format` values
+DATASET_CACHE_EXTENSIONS = dict(pickle=".pkl", parquet=".parquet", feather=".feather")
+#: Values of `downcast` accepted by :func:`downcast_dataset`
+DOWNCAST_OPTIONS = [None, "integer", "float", "all"]
+
+
+def read_dataset(
+    file_path,
+    cache_dir=None,
+    cache_format="pickle",
+    cache_key="mtime",
+    downcast=None,
+    categorical_threshold=None,
+    exclude_columns=None,
+    read_csv_params=None,
+    memory_map=False,
+    columns=None,
+):
+    """Read the dataset file at `file_path` as a DataFrame. Files with an extension in
+    :data:`DATASET_FILE_READERS` (Parquet, Feather/Arrow, and pickle files), and NumPy ".npy" files
+    are read directly. Others are parsed by :func:`pandas.read_csv`, which is slow for large files,
+    so if `cache_dir` is given, the parsed DataFrame is saved there in a binary format, and later
+    calls read the cache file instead, until the CSV file (or the parameters that change its
+    DataFrame) change
+
+    Parameters
+    ----------
+    file_path: String
+        Path of the dataset file
+    cache_dir: String, or None, default=None
+        Directory in which parsed CSV files are cached. If None, CSV files are parsed every time
+    cache_format: {"pickle", "parquet", "feather"}, default="pickle"
+        Format of cache files. "pickle" restores all dtypes exactly, and needs no extra libraries.
+        "parquet", and "feather" require "pyarrow". "feather" also requires the default index
+    cache_key: {"mtime", "content"}, default="mtime"
+        How CSV files are identified in the cache. "mtime" uses the absolute path, size, and
+        modification time of the file, which are checked instantly. "content" uses a SHA-256 hash
+        of the file's bytes, so the cache survives moving or touching the file, but each call reads
+        the entire file to hash it. In both cases, the other parameters are also part of the key
+    downcast: {None, "integer", "float", "all"}, default=None
+        Which numeric columns to downcast by :func:`downcast_dataset`
+    categorical_threshold: Float, or None, default=None
+        The maximum ratio of unique values to rows of the object columns converted to the
+        "category" dtype by :func:`downcast_dataset`. If None, no columns are converted
+    exclude_columns: List, or None, default=None
+        Names of columns that are never downcast or converted, like target and ID columns
+    read_csv_params: Dict, or None, default=None
+        Extra keyword arguments given to :func:`pandas.read_csv`. Their reprs are part of the cache
+        key, so they should not contain objects whose reprs change (like lambdas)
+    memory_map: Boolean, default=False
+        If True, the dataset is mapped into memory, rather than read, so its rows are only loaded
+        from disk when they are used, and the OS can release them again. Requires a file with an
+        extension in :data:`MEMORY_MAP_EXTENSIONS`, or a CSV file cached with
+        `cache_format="feather"`, in which case the cache file is saved uncompressed. Feather/Arrow
+        files must be uncompressed, and their columns free of nulls and strings to be mapped without
+        copying. If `cache_dir` is None, CSV files are read into memory, as usual. Mapped
+        DataFrames are read-only. They are marked for :func:`is_memory_mapped` by the "memory_map"
+        key of their `attrs`, which holds the parameters with which to map their files again
+    columns: List, or None, default=None
+        Names of the columns of a 2-dimensional ".npy" file. If None, columns are numbered. The
+        columns of structured ".npy" arrays are named by their fields
+
+    Returns
+    -------
+    pd.DataFrame
+        The dataset at `file_path`
+
+    Raises
+    ------
+    ValueError
+        If `cache_format`, `cache_key`, or `downcast` is not one of its accepted values, or if
+        `memory_map` is True, and the file cannot be mapped, or is given `downcast`, or
+        `categorical_threshold`, which would read the mapped dataset into memory
+
+    Notes
+    -----
+    Only one cache file is kept for each CSV file name in `cache_dir`. When a CSV file is cached
+    again because it (or the parameters) changed, older cache files of the same file name are
+    removed, so CSV files with the same name should not share a `cache_dir`"""
+    if cache_format not in DATASET_CACHE_EXTENSIONS:
+        raise ValueError(
+            f"cache_format must be one of {list(DATASET_CACHE_EXTENSIONS)}, not {cache_format!r}"
+        )
+    if cache_key not in ["mtime", "content"]:
+        raise ValueError(f"cache_key must be one of ['mtime', 'content'], not {cache_key!r}")
+    if downcast not in DOWNCAST_OPTIONS:
+        raise ValueError(f"downcast must be one of {DOWNCAST_OPTIONS}, not {downcast!r}")
+
+    read_csv_params = read_csv_params or {}
+    downcast_params = dict(downcast=downcast, categorical_threshold=categorical_threshold)
+    downcast_params["exclude_columns"] = exclude_columns
+    extension = os.path.splitext(file_path)[1].lower()
+    is_csv = extension not in MEMORY_MAP_EXTENSIONS + list(DATASET_FILE_READERS)
+
+    if memory_map:
+        if not (extension in MEMORY_MAP_EXTENSIONS or (is_csv and cache_format == "feather")):
+            raise ValueError(
+                f"memory_map requires a {MEMORY_MAP_EXTENSIONS} file, or a CSV file cached with "
+                f"cache_format='feather', not {file_path!r}"
+            )
+        if not is_csv and (downcast is not None or categorical_threshold is not None):
+            raise ValueError("downcast, and categorical_threshold cannot be used with memory_map")
+
+    if extension == ".npy":
+        dataset = _read_array_dataset(file_path, columns=columns, memory_map=memory_map)
+        return dataset if memory_map else downcast_dataset(dataset, **downcast_params)
+    if memory_map and not is_csv:
+        return _read_mapped_feather(file_path)
+    if extension in DATASET_FILE_READERS:
+        return downcast_dataset(DATASET_FILE_READERS[extension](file_path), **downcast_params)
+    if cache_dir is None:
+        return downcast_dataset(pd.read_csv(file_path, **read_csv_params), **downcast_params)
+
+    #################### Read Cache File ####################
+    cache_prefix = os.path.join(cache_dir, os.path.basename(file_path))
+    cache_extension = DATASET_CACHE_EXTENSIONS[cache_format]
+    identity = [_file_identity(file_path, cache_key), downcast_params]
+    identity += sorted(read_csv_params.items())  # Sorted by keys, which are unique
+    if memory_map:
+        identity.append("uncompressed")
+    cache_hash = sha256(repr(identity).encode()).hexdigest()[:20]
+    cache_path = f"{cache_prefix}.{cache_hash}{cache_extension}"
+
+    if os.path.exists(cache_path):
+        if memory_map:
+            return _read_mapped_feather(cache_path)
+        return DATASET_FILE_READERS[cache_extension](cache_path)
+
+    #################### Parse CSV File, and Save Cache File ####################
+    dataset = downcast_dataset(pd.read_csv(file_path, **read_csv_params), **downcast_params)
+
+    make_dirs(cache_dir, exist_ok=True)
+    for stale_path in glob(f"{glob_escape(cache_prefix)}.*{cache_extension}"):
+        with suppress(OSError):  # May have been removed by another process
+            os.remove(stale_path)
+
+    with atomic_write(cache_path, mode="wb") as f:
+        if cache_format == "pickle":
+            dataset.to_pickle(f)
+        elif cache_format == "parquet":
+            dataset.to_parquet(f)
+        elif memory_map:
+            dataset.to_feather(f, compression="uncompressed")
+        else:
+            dataset.to_feather(f)
+
+    if memory_map:  # Release the parsed dataset in favor of the mapped cache file
+        return _read_mapped_feather(cache_path)
+    return dataset
+
+
+def _read_array_dataset(file_path, columns=None, memory_map=False):
+    """Read the NumPy ".npy" file at `file_path` as a DataFrame whose columns are views of the
+    array in the file, rather than copies of it
+
+    Parameters
+    ----------
+    file_path: String
+        Path of the ".npy" file, containing a 2-dimensional, or a structured array
+    columns: List, or None, default=None
+        Names of the columns of a 2-dimensional array. If None, columns are numbered
+    memory_map: Boolean, default=False
+        If True, the array is mapped into memory as read-only, rather than read
+
+    Returns
+    -------
+    pd.DataFrame
+        The dataset in the array at `file_path`
+
+    Raises
+    ------
+    ValueError
+        If the array is neither 2-dimensional, nor structured, or if the length of `columns` does
+        not match its number of columns"""
+    array = np.load(file_path, mmap_mode="r" if memory_map else None)
+
+    if array.dtype.names:
+        data = {_: array[_] for _ in array.dtype.names}
+    elif array.ndim == 2:
+        columns = list(range(array.shape[1])) if columns is None else list(columns)
+        if len(columns) != array.shape[1]:
+            raise ValueError(f"Expected {array.shape[1]} columns, not {len(columns)}: {columns}")
+        data = {_: array[:, i] for i, _ in enumerate(columns)}
+    else:
+        raise ValueError(f"Expected a 2-dimensional, or structured array, not shape {array.shape}")
+
+    # Without copying, columns are not consolidated into a new array, and remain views of `array`
+    dataset = pd.DataFrame(data, copy=False)
+    if memory_map:
+        dataset.attrs["memory_map"] = dict(file_path=file_path, columns=columns)
+        dataset.attrs["memory_map_rows"] = len(dataset)
+    return dataset
+
+
+def _read_mapped_feather(file_path):
+    """Map the Feather/Arrow file at `file_path` into memory, and convert it to a DataFrame whose
+    columns are views of the mapped file, wherever Arrow can convert them without copying
+
+    Parameters
+    ----------
+    file_path: String
+        Path of the Feather/Arrow file
+
+    Returns
+    -------
+    pd.DataFrame
+        The dataset at `file_path`, marked for :func:`is_memory_mapped`, and with its number of
+        rows in the "memory_map_rows" key of its `attrs`"""
+    from pyarrow import feather
+
+    table = feather.read_table(file_path, memory_map=True)
+    # One block per column, so pandas does not consolidate (and copy) the mapped columns
+    dataset = table.to_pandas(split_blocks=True)
+    dataset.attrs["memory_map"] = dict(file_path=file_path)
+    dataset.attrs["memory_map_rows"] = len(dataset)
+    return dataset
+
+
+def is_memory_mapped(dataset):
+    """Determine whether `dataset` was mapped into memory by :func:`read_dataset`, or selected from
+    such a dataset by an operation that keeps its :attr:`pandas.DataFrame.attrs`. Memory-mapped
+    datasets should not be copied, or read entirely, since they may be larger than memory
+
+    Parameters
+    ----------
+    dataset: Object
+        The dataset to check
+
+    Returns
+    -------
+    Boolean
+        True if `dataset` is marked as memory-mapped. Else False
+
+    Examples
+    --------
+    >>> is_memory_mapped(pd.DataFrame(dict(a=[0, 1])))
+    False
+    >>> is_memory_mapped(None)
+    False"""
+    return bool(getattr(dataset, "attrs", {}).get("memory_map"))
+
+
+def _file_identity(file_path, cache_key):
+    """Identify the file at `file_path` by its metadata, or its contents
+
+    Parameters
+    ----------
+    file_path: String
+        Path of the file to identify
+    cache_key: {"mtime", "content"}
+        If "mtime", the file is identified by its absolute path, size, and modification time. If
+        "content", it is identified by the SHA-256 hash of its bytes
+
+    Returns
+    -------
+    List, or String
+        The identity of the file"""
+    if cache_key == "mtime":
+        stat = os.stat(file_path)
+        return [os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns]
+
+    file_hash = sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def downcast_dataset(dataset, downcast=None, categorical_threshold=None, exclude_columns=None):
+    """Reduce the memory used by `dataset` by downcasting numeric columns to the smallest dtypes
+    that can hold their values, and by converting object columns with few unique values to the
+    "category" dtype. `dataset` is modified in-place
+
+    Parameters
+    ----------
+    dataset: pd.DataFrame
+        The dataset to downcast
+    downcast: {None, "integer", "float", "all"}, default=None
+        Which numeric columns to downcast by :func:`pandas.to_numeric`. "integer" downcasts integer
+        columns, which is lossless. "float" downcasts float columns to float32, which loses
+        precision. "all" downcasts both. If None, numeric columns are unchanged
+    categorical_threshold: Float, or None, default=None
+        If not None, object columns whose ratio of unique values to rows is at most
+        `categorical_threshold` are converted to the "category" dtype. Categories are found
+        separately for each dataset, so they may differ between train and test datasets
+    exclude_columns: List, or None, default=None
+        Names of columns that are never downcast or converted
+
+    Returns
+    -------
+    pd.DataFrame
+        `dataset`, after downcasting
 
-        write_json(file_path, original_data)
+    Examples
+    --------
+    >>> df = pd.DataFrame(dict(a=[1, 2, 3, 4], b=[0.5, 1.0, 1.5, 2.0], c=["x", "y", "x", "x"]))
+    >>> downcast_dataset(df, "integer", categorical_threshold=0.5).dtypes.astype(str).tolist()
+    ['int8', 'float64', 'category']"""
+    exclude_columns = exclude_columns or []
+
+    for column in dataset.columns:
+        if column in exclude_columns:
+            continue
+        values = dataset[column]
+
+        if values.dtype.kind in "iu" and downcast in ["integer", "all"]:
+            kind = "signed" if values.dtype.kind == "i" else "unsigned"
+            dataset[column] = pd.to_numeric(values, downcast=kind)
+        elif values.dtype.kind == "f" and downcast in ["float", "all"]:
+            dataset[column] = pd.to_numeric(values, downcast="float")
+        elif values.dtype.kind == "O" and categorical_threshold is not None:
+            if values.nunique(dropna=False) <= categorical_threshold * len(values):
+                dataset[column] = values.astype("category")
+
+    return dataset
 
 
 ##################################################
@@ -15,6 +15,7 @@ from hyperparameter_hunter.utils.boltons_utils import remap, default_enter
 ##################################################
 # Import Miscellaneous Assets
 ##################################################
+from collections import OrderedDict
 from datetime import datetime
 from functools import wraps
 from inspect import Traceback
@@ -103,6 +104,71 @@ def extra_enter_attrs(iter_attrs):
     return _enter
 
 
+##################################################
+# Caching Utilities
+##################################################
+class LRUCache(object):
+    def __init__(self, max_size=8):
+        """Cache holding at most `max_size` values, which evicts its least recently used value when
+        a new value is added while it is full
+
+        Parameters
+        ----------
+        max_size: Int, default=8
+            The maximum number of values held. If 0, values are made, but never cached. Can be
+            changed at any time, and is enforced when the next value is added
+
+        Examples
+        --------
+        >>> cache = LRUCache(max_size=2)
+        >>> cache.get_or_set("a", lambda: 1), cache.get_or_set("b", lambda: 2)
+        (1, 2)
+        >>> cache.get_or_set("a", lambda: 10)  # Already cached, and now the most recently used
+        1
+        >>> cache.get_or_set("c", lambda: 3)  # Evicts "b", the least recently used
+        3
+        >>> "a" in cache, "b" in cache, len(cache)
+        (True, False, 2)"""
+        self.max_size = max_size
+        self._values = OrderedDict()
+
+    def __contains__(self, key):
+        return key in self._values
+
+    def __len__(self):
+        return len(self._values)
+
+    def get_or_set(self, key, make_value):
+        """Get the value cached for `key`, or make, cache, and return it if `key` is not cached
+
+        Parameters
+        ----------
+        key: Hashable
+            The key identifying the value
+        make_value: Callable
+            Called without arguments to make the value of `key` if it is not cached. If it raises
+            an exception, nothing is cached
+
+        Returns
+        -------
+        Object
+            The value of `key`"""
+        if key in self._values:
+            self._values.move_to_end(key)
+            return self._values[key]
+
+        value = make_value()
+        if self.max_size > 0:
+            self._values[key] = value
+            while len(self._values) > self.max_size:
+                self._values.popitem(last=False)
+        return value
+
+    def clear(self):
+        """Remove all cached values"""
+        self._values.clear()
+
+
 ##################################################
 # Miscellaneous Utilities
 ##################################################
@@ -25,6 +25,8 @@ from hyperparameter_hunter.utils.general_utils import extra_enter_attrs
 ##################################################
 # Import Miscellaneous Assets
 ##################################################
+from collections.abc import Mapping, Sequence, Set
+from numbers import Real as RealNumber
 import pandas as pd
 
 ##################################################
@@ -46,9 +48,8 @@ from sklearn.multioutput import MultiOutputRegressor
 from sklearn.utils import check_random_state
 
 # noinspection PyProtectedMember
-from skopt.acquisition import gaussian_acquisition_1D
+from skopt.acquisition import _gaussian_acquisition, gaussian_acquisition_1D
 from skopt.learning import GaussianProcessRegressor
-from hyperparameter_hunter.space import Space, Categorical
 from hyperparameter_hunter.space import normalize_dimensions
 
 # noinspection PyProtectedMember
@@ -105,7 +106,6 @@ class AskingOptimizer(Optimizer):
         acq_func_kwargs: See :class:`skopt.optimizer.optimizer.Optimizer.__init__`
         acq_optimizer_kwargs: See :class:`skopt.optimizer.optimizer.Optimizer.__init__`"""
         # TODO: Figure out way to override skopt Optimizer's use of skopt Space without having to rewrite __init__
-        self.__repeated_ask_kwargs = {}
         self.rng = check_random_state(random_state)
 
         # Configure acquisition function - Store and create acquisition function set
@@ -202,11 +202,16 @@ class AskingOptimizer(Optimizer):
                 self._cat_inds.append(ind)
             else:
                 self._non_cat_inds.append(ind)
+        self._has_real_dimensions = any(isinstance(_, Real) for _ in self.space.dimensions)
 
         # Initialize storage for optimization
         self.models = []
         self.Xi = []
-        self.yi = []
+        self.yi = _PerSecondObservations() if "ps" in self.acq_func else []
+
+        # Initialize index of evaluated points, and candidate points sampled to find `_next_x`
+        self._reset_Xi_index()
+        self._candidates = None
 
         # Initialize cache for `ask` method responses
         # This ensures that multiple calls to `ask` with n_points set return same sets of points. Reset to {} at call to `tell`
@@ -214,63 +219,278 @@ class AskingOptimizer(Optimizer):
 
     # FLAG: TEST ABOVE
 
-    def _ask(self):
-        # TODO: Add documentation
-        ask_result = super()._ask()
+    def copy(self, random_state=None):
+        """Create a shallow copy of an instance of the optimizer. This is nearly identical to
+        :meth:`skopt.optimizer.optimizer.Optimizer.copy`, except the copy is an instance of
+        :class:`AskingOptimizer`, rather than the original `skopt` `Optimizer`. The copies made by
+        :meth:`skopt.optimizer.optimizer.Optimizer.ask` to ask for multiple points at once are
+        therefore initialized with the signature of :meth:`AskingOptimizer.__init__`, and avoid
+        asking for points that have already been tested
 
-        do_retell = self.__repeated_ask_kwargs.get("do_retell", True)
-        return_val = self.__repeated_ask_kwargs.get("return_val", "ask")
-        persistent_check = self.__repeated_ask_kwargs.get("persistent_check", True)
+        Parameters
+        ----------
+        random_state: Int, `RandomState` instance, or None, default=None
+            Set the random state of the copy
 
-        if persistent_check is True:
-            counter = 100
-            while (ask_result in self.Xi) and (counter > 0):
-                ask_result = self.__ask_helper(ask_result, do_retell, return_val)
-                # print(F'{counter}     {ask_result}')
-                counter -= 1
+        Returns
+        -------
+        AskingOptimizer
+            A new optimizer that has been told all the points told to this optimizer"""
+        optimizer = AskingOptimizer(
+            dimensions=self.space.dimensions,
+            base_estimator=self.base_estimator_,
+            n_initial_points=self.n_initial_points_,
+            acq_func=self.acq_func,
+            acq_optimizer=self.acq_optimizer,
+            acq_func_kwargs=self.acq_func_kwargs,
+            acq_optimizer_kwargs=self.acq_optimizer_kwargs,
+            random_state=random_state,
+        )
 
-        return ask_result
+        if hasattr(self, "gains_"):
+            optimizer.gains_ = np.copy(self.gains_)
+        if self.Xi:
+            optimizer._tell(self.Xi, self.yi)
 
-    def __ask_helper(self, ask_result, do_retell=True, return_val="ask"):
-        """
+        return optimizer
+
+    def _tell(self, x, y, fit=True):
+        """Incorporate one or more new points. This is identical to
+        :meth:`skopt.optimizer.optimizer.Optimizer._tell`, except that the candidate points sampled
+        by :meth:`_get_unevaluated_candidate` are discarded when a new surrogate model is fit
 
         Parameters
         ----------
-        ask_result: Iterable of hyperparameters
-            The result of :meth:`skopt.optimizer.optimizer.Optimizer._ask`
-        do_retell: Boolean, default=True
-            If True and `ask_result` has already been tested, the optimizer will be re-`tell`ed the
-            hyperparameters and their original score
-        return_val: String in ['ask', 'random'], default='ask'
-            If 'ask', :meth:`skopt.optimizer.optimizer.Optimizer._ask` will be repeatedly called
-            for a new result. If 'random', :meth:`space.Space.rvs` will be used to retrieve the
-            next set of hyperparameters
+        x: List, or list of lists
+            Point, or points at which the objective was evaluated
+        y: Number, or list
+            Value(s) of the objective at `x`. If :attr:`acq_func` is "EIps" or "PIps", each value
+            is a pair of (<objective value>, <log time>)
+        fit: Boolean, default=True
+            See :meth:`skopt.optimizer.optimizer.Optimizer.tell`
 
         Returns
         -------
-        ask_result"""
-        # TODO: Fill in documentation description
+        `scipy.optimize.OptimizeResult`
+            The result of the optimization, as of the newly incorporated points"""
+        n_models = len(self.models)
+        result = super()._tell(x, y, fit=fit)
+        if len(self.models) > n_models:
+            self._candidates = None
+        return result
+
+    @property
+    def objective_values(self):
+        """The observed values of the objective in :attr:`yi`, without the log times recorded with
+        them if :attr:`acq_func` is "EIps" or "PIps"
+
+        Returns
+        -------
+        List"""
+        if "ps" in self.acq_func:
+            return self.yi.objective_values()
+        return self.yi
+
+    def _ask(self):
+        """Suggest the next point at which to evaluate the objective. This is nearly identical to
+        :meth:`skopt.optimizer.optimizer.Optimizer._ask`, except that points already evaluated
+        are avoided. Random points are redrawn. If the point suggested by the surrogate model was
+        already evaluated, it is replaced by the best unevaluated candidate point found by
+        :meth:`_get_unevaluated_candidate`, so the surrogate model is not refit
+
+        Returns
+        -------
+        List
+            The next point at which to evaluate the objective. This may have been evaluated already
+            if no unevaluated point could be found"""
         if self._n_initial_points > 0 or self.base_estimator_ is None:
-            ask_result = self.space.rvs(random_state=self.rng)[0]
-        else:
-            min_delta_x = min([self.space.distance(ask_result, _) for _ in self.Xi])
-            if abs(min_delta_x) <= 1e-8:
-                # G.debug_(F'Received repeated point:   {ask_result}')
+            for _ in range(100):
+                ask_result = self.space.rvs(random_state=self.rng)[0]
+                if not self.is_evaluated(ask_result):
+                    break
+            return ask_result
+
+        if not self.models:
+            raise RuntimeError("Random evaluations exhausted and no model has been fit")
+
+        if self.is_evaluated(self._next_x):
+            self._next_x = self._get_unevaluated_candidate(default=self._next_x)
+        return self._next_x
+
+    def _get_unevaluated_candidate(self, default):
+        """Find the best unevaluated point among candidate points sampled for the latest surrogate
+        model. Candidates are checked in order of their acquisition function values. They are only
+        sampled (by :meth:`_sample_candidates`) the first time a replacement is needed after each
+        fit, so optimizers that never suggest an evaluated point follow the same trajectory as
+        `skopt`, without paying for a second round of acquisition
+
+        Parameters
+        ----------
+        default: List
+            Point to return if all candidate points have been evaluated
+
+        Returns
+        -------
+        List
+            The unevaluated candidate with the best acquisition function value. Else `default`"""
+        if self._candidates is None:
+            self._candidates = self._sample_candidates()
+
+        X, values = self._candidates
+        order = np.argsort(values, kind="stable")
+
+        for start in range(0, len(order), 100):
+            for point in self.space.inverse_transform(X[order[start : start + 100]]):
+                if not self.is_evaluated(point):
+                    return point
+        return default
+
+    def _sample_candidates(self):
+        """Sample candidate points to replace :attr:`_next_x`, and compute their acquisition
+        function values under the latest surrogate model. If :attr:`acq_func` is "gp_hedge", the
+        acquisition function that suggested :attr:`_next_x` is used
+
+        Returns
+        -------
+        Tuple
+            Pair of (<transformed candidate points>, <acquisition function values>)"""
+        acq_func = self.cand_acq_funcs_[0]
+        if self.acq_func == "gp_hedge":
+            next_xs = [list(_) for _ in self.space.inverse_transform(np.vstack(self.next_xs_))]
+            if list(self._next_x) in next_xs:
+                acq_func = self.cand_acq_funcs_[next_xs.index(list(self._next_x))]
+
+        X = self.space.transform(self.space.rvs(n_samples=self.n_points, random_state=self.rng))
+        values = _gaussian_acquisition(
+            X=X,
+            model=self.models[-1],
+            y_opt=np.min(self.yi),
+            acq_func=acq_func,
+            acq_func_kwargs=self.acq_func_kwargs,
+        )
+        return X, values
+
+    def is_evaluated(self, point):
+        """Determine whether the objective has already been evaluated at `point`, using a hashed
+        index of :attr:`Xi`, rather than scanning it. If the space has `Real` dimensions, points
+        within a distance of 1e-8 of an evaluated point (as measured by
+        :meth:`skopt.space.space.Space.distance`) are also considered evaluated
+
+        Parameters
+        ----------
+        point: List
+            Point in :attr:`space`
+
+        Returns
+        -------
+        Boolean
+            True if the objective has been evaluated at `point`. Else False"""
+        self._update_Xi_index()
+
+        key = _hashable_point(point)
+        if key is None:
+            return list(point) in self.Xi
+        if key in self._Xi_keys:
+            return True
+        if not (self._has_real_dimensions and self._n_indexed):
+            return False
+
+        # Points with different categories are at least 1 apart, so compare only matching points
+        cat_code = self._Xi_cat_codes_map.get(_hashable_point([point[_] for _ in self._cat_inds]))
+        if cat_code is None:
+            return False
+        matches = self._Xi_cat_codes == cat_code
+
+        numeric = np.array([point[_] for _ in self._non_cat_inds], dtype=float)
+        distances = np.abs(self._Xi_numeric[matches] - numeric).sum(axis=1)
+        return bool(distances.min() <= 1e-8)
+
+    def _update_Xi_index(self):
+        """Add the points appended to :attr:`Xi` since the last update to the index used by
+        :meth:`is_evaluated`. The index is rebuilt if :attr:`Xi` was replaced by a shorter list"""
+        if len(self.Xi) < self._n_indexed:
+            self._reset_Xi_index()
+
+        new_points = self.Xi[self._n_indexed :]
+        if not new_points:
+            return
+
+        self._Xi_keys.update(_ for _ in map(_hashable_point, new_points) if _ is not None)
+
+        cat_codes = []
+        for point in new_points:
+            cat_key = _hashable_point([point[_] for _ in self._cat_inds])
+            if cat_key is None:
+                cat_codes.append(-1)  # Unhashable points are only found by scanning `Xi`
+            else:
+                cat_code = self._Xi_cat_codes_map.setdefault(cat_key, len(self._Xi_cat_codes_map))
+                cat_codes.append(cat_code)
+
+        numeric = [[point[_] for _ in self._non_cat_inds] for point in new_points]
+        numeric = np.array(numeric, dtype=float).reshape((len(new_points), -1))
+        self._Xi_numeric = np.vstack([self._Xi_numeric, numeric])
+        self._Xi_cat_codes = np.append(self._Xi_cat_codes, cat_codes)
+        self._n_indexed = len(self.Xi)
+
+    def _reset_Xi_index(self):
+        """Empty the index of :attr:`Xi` used by :meth:`is_evaluated`"""
+        self._Xi_keys = set()
+        self._Xi_cat_codes_map = dict()
+        self._Xi_cat_codes = np.empty(0, dtype=int)
+        self._Xi_numeric = np.empty((0, len(self._non_cat_inds)))
+        self._n_indexed = 0
+
+
+class _PerSecondObservations(list):
+    """List of the (<objective value>, <log time>) pairs observed by an :class:`AskingOptimizer`
+    whose `acq_func` is "EIps" or "PIps". `skopt` computes the best observed value given to its
+    acquisition functions, and the constant liar lies of its `ask`, with `numpy.min`,
+    `numpy.mean`, and `numpy.max` of `yi`. NumPy defers to the methods of the same names below, so
+    these are computed from the objective values alone, rather than from those and the log times"""
+
+    def objective_values(self):
+        """Get the objective values, without the log times
+
+        Returns
+        -------
+        List"""
+        return [_[0] for _ in self]
 
-                if do_retell is True:
-                    self.tell(ask_result, self.yi[self.Xi.index(ask_result)])
-                    # G.debug_(F'Optimizer was re-`tell`ed point:   {ask_result}   ->   {self.yi[self.Xi.index(ask_result)]}')
+    def min(self, axis=None, out=None, **kwargs):
+        return np.min(self.objective_values())
 
-                if return_val == "ask":
-                    ask_result = super()._ask()
-                    # G.debug_(F'Re-`ask`ed, and received point:   {ask_result}')
-                elif return_val == "random":
-                    ask_result = self.space.rvs(random_state=self.rng)[0]
-                    # G.debug_(F'Set repeated point to random:   {ask_result}')
-                else:
-                    raise ValueError(f"Received invalid value for `return_val`: {return_val}")
+    def mean(self, axis=None, dtype=None, out=None, **kwargs):
+        return np.mean(self.objective_values())
 
-        return ask_result
+    def max(self, axis=None, out=None, **kwargs):
+        return np.max(self.objective_values())
+
+
+def _hashable_point(point):
+    """Convert `point` to a tuple that can be added to a set
+
+    Parameters
+    ----------
+    point: List
+        Point in a search space
+
+    Returns
+    -------
+    Tuple, or None
+        The values of `point`. None if any of them cannot be hashed
+
+    Examples
+    --------
+    >>> _hashable_point([0.5, 3, "gini"])
+    (0.5, 3, 'gini')
+    >>> _hashable_point([0.5, [1, 2]]) is None
+    True"""
+    point = tuple(point)
+    try:
+        hash(point)
+    except TypeError:
+        return None
+    return point
 
 
 ##################################################
@@ -356,6 +576,26 @@ def get_scored_params(experiment_description_path, target_metric, get_descriptio
     evaluation: Float
         Value of the Experiment's `target_metric`"""
     description = read_json(file_path=experiment_description_path)
+    return get_description_scored_params(description, target_metric, get_description)
+
+
+def get_description_scored_params(description, target_metric, get_description=False):
+    """Retrieve the hyperparameters of a completed Experiment, along with its performance evaluation
+    from the Experiment's description, which has already been read
+
+    Parameters
+    ----------
+    description: Dict
+        An Experiment's description, containing at least the keys 'final_evaluations',
+        'hyperparameters', and 'module_name'. Modified in place if the Experiment used Keras
+    target_metric: Tuple
+        See :func:`get_scored_params`
+    get_description: Boolean, default=False
+        See :func:`get_scored_params`
+
+    Returns
+    -------
+    See :func:`get_scored_params`"""
     evaluation = get_path(description["final_evaluations"], target_metric)
     all_hyperparameters = description["hyperparameters"]
 
@@ -385,8 +625,26 @@ def filter_by_space(hyperparameters_and_scores, space):
     Returns
     -------
     hyperparameters_and_scores: List of tuples
-        Filtered to include only those whose hyperparameters fit within `space`"""
-    return [_ for _ in hyperparameters_and_scores if does_fit_in_space(_[0], space)]
+        Filtered to include only those whose hyperparameters fit within `space`
+
+    Notes
+    -----
+    Rather than checking each set of hyperparameters individually with :func:`does_fit_in_space`,
+    the hyperparameters at the locations of `space` dimensions are gathered once into columns by
+    :func:`get_hyperparameter_table`, and each dimension is checked against its entire column at
+    once by :func:`_fits_in_dimension`. The result is identical to filtering by
+    :func:`does_fit_in_space`"""
+    if not hyperparameters_and_scores:
+        return []
+
+    locations = [("model_init_params", _) if isinstance(_, str) else _ for _ in space.names()]
+    table = get_hyperparameter_table([_[0] for _ in hyperparameters_and_scores], paths=locations)
+    fits = np.ones(len(table), dtype=bool)
+
+    for dimension, location in zip(space.dimensions, locations):
+        fits &= _fits_in_dimension(table[location].values, dimension)
+
+    return [_ for (_, fit) in zip(hyperparameters_and_scores, fits) if fit]
 
 
 def does_fit_in_space(root, space):
@@ -410,6 +668,192 @@ def does_fit_in_space(root, space):
     return dimension_subset(root, space.names()) in space
 
 
+##################################################
+# Columnar Hyperparameter Tables
+##################################################
+class _TableMarker(object):
+    def __init__(self, name):
+        """Placeholder value in a table produced by :func:`get_hyperparameter_table`. Markers only
+        compare equal to themselves
+
+        Parameters
+        ----------
+        name: String
+            Description of the marker, used only for its representation"""
+        self.name = name
+
+    def __repr__(self):
+        return f"<{self.name}>"
+
+
+#: Value of paths in a hyperparameter table that do not exist in a set of hyperparameters
+MISSING = _TableMarker("missing")
+#: Value of paths in a hyperparameter table whose values are mappings (their items are flattened)
+MAPPING = _TableMarker("mapping")
+#: Value of paths in a hyperparameter table whose values are sequences (their items are flattened)
+SEQUENCE = _TableMarker("sequence")
+
+# Types of values that are never entered by :func:`flatten_hyperparameters`. Checked by identity to
+# ... avoid the cost of `isinstance` checks against abstract base classes for the most common values
+_LEAF_TYPES = {type(None), bool, int, float, str}
+
+
+def flatten_hyperparameters(hyperparameters, drop=None, prune=None):
+    """Flatten the nested structure `hyperparameters` into a dict of path tuples to leaf values.
+    Mappings are entered by key, and sequences and sets are entered by index, following the
+    traversal of :func:`utils.boltons_utils.remap`. The paths of entered values map to either
+    :data:`MAPPING`, or :data:`SEQUENCE`, so two structures are equal if and only if their
+    flattened dicts are equal (with tuples and sets being equal to lists of the same values)
+
+    Parameters
+    ----------
+    hyperparameters: Dict
+        Nested hyperparameters to flatten, like those found in Experiment description files
+    drop: Callable, or None, default=None
+        If callable, should accept a path tuple and return True if the value at that path (along
+        with all of its descendants) should be excluded from the result
+    prune: Callable, or None, default=None
+        If callable, should accept a path tuple and return True if the mapping at that path should
+        be excluded from the result when it is empty (after applying `drop` to its items)
+
+    Returns
+    -------
+    flat: Dict
+        Mapping of path tuples to leaf values, :data:`MAPPING`, or :data:`SEQUENCE`. The path of
+        `hyperparameters` itself is the empty tuple
+
+    Examples
+    --------
+    >>> flatten_hyperparameters(dict(a=dict(b=1), c=(2,)))
+    {(): <mapping>, ('a',): <mapping>, ('a', 'b'): 1, ('c',): <sequence>, ('c', 0): 2}
+    >>> flatten_hyperparameters(
+    ...     dict(a=dict(b=1), c=(2,), d=dict(e=dict(f=1))),
+    ...     drop=lambda path: path[-1] in ("c", "f"),
+    ...     prune=lambda path: path[0] == "d",
+    ... )
+    {(): <mapping>, ('a',): <mapping>, ('a', 'b'): 1}"""
+    flat = {}
+
+    def _flatten(path, value):
+        if type(value) in _LEAF_TYPES or isinstance(value, (str, bytes)):
+            flat[path] = value
+            return
+        elif isinstance(value, Mapping):
+            flat[path], items = MAPPING, value.items()
+        elif isinstance(value, (Sequence, Set)):
+            flat[path], items = SEQUENCE, enumerate(value)
+        else:
+            flat[path] = value
+            return
+
+        size = len(flat)
+        for key, child in items:
+            child_path = path + (key,)
+            if drop is not None and drop(child_path):
+                continue
+            elif type(child) in _LEAF_TYPES:
+                flat[child_path] = child  # Skip recursion for the most common leaves
+            else:
+                _flatten(child_path, child)
+
+        if flat[path] is MAPPING and len(flat) == size and prune is not None and prune(path):
+            del flat[path]
+
+    _flatten((), hyperparameters)
+    return flat
+
+
+def get_hyperparameter_table(hyperparameters, paths=None, drop=None, prune=None):
+    """Gather each of the nested dicts in `hyperparameters` into a single table, whose columns are
+    hyperparameter path tuples, enabling the hyperparameters of many Experiments to be compared with
+    vectorized column operations
+
+    Parameters
+    ----------
+    hyperparameters: List of dicts
+        Nested hyperparameters of Experiments, like those found in Experiment description files
+    paths: List of tuples, or None, default=None
+        If None, each element of `hyperparameters` is flattened by :func:`flatten_hyperparameters`,
+        and the table has a column for every path found in any of them. Else, the table has a
+        column for each path in `paths`, containing the value located at that path in each element
+        of `hyperparameters`. In this case, values are not flattened, so they may be sequences or
+        mappings, and `drop` and `prune` are ignored
+    drop: Callable, or None, default=None
+        Passed to :func:`flatten_hyperparameters` for each element of `hyperparameters`
+    prune: Callable, or None, default=None
+        Passed to :func:`flatten_hyperparameters` for each element of `hyperparameters`
+
+    Returns
+    -------
+    pd.DataFrame
+        Object-dtype table with a row for each element of `hyperparameters`. Column labels are path
+        tuples (not a `MultiIndex`), and paths that do not exist in a row have the value
+        :data:`MISSING`"""
+    if paths is not None:
+        columns = {_: [_lookup_path(h, _) for h in hyperparameters] for _ in paths}
+    else:
+        columns = {}
+        for i, hyperparameter_dict in enumerate(hyperparameters):
+            for path, value in flatten_hyperparameters(hyperparameter_dict, drop, prune).items():
+                try:
+                    columns[path][i] = value
+                except KeyError:
+                    columns[path] = [MISSING] * len(hyperparameters)
+                    columns[path][i] = value
+
+    table = pd.DataFrame(
+        {i: pd.Series(column, dtype=object) for i, column in enumerate(columns.values())},
+        index=range(len(hyperparameters)),
+        dtype=object,
+    )
+    table.columns = pd.Index(list(columns.keys()), dtype=object, tupleize_cols=False)
+    return table
+
+
+def _lookup_path(root, path):
+    """Retrieve the value in `root` at `path`, or :data:`MISSING` if `path` does not exist"""
+    for key in path:
+        try:
+            root = root[key]
+        except (KeyError, IndexError, TypeError):
+            return MISSING
+    return root
+
+
+def _fits_in_dimension(values, dimension):
+    """Determine which of `values` fit within `dimension`, with the same result as checking each
+    value with `dimension.__contains__`
+
+    Parameters
+    ----------
+    values: np.ndarray
+        Object-dtype column of a table produced by :func:`get_hyperparameter_table`
+    dimension: :class:`space.Real`, :class:`space.Integer`, or :class:`space.Categorical`
+        The dimension whose boundaries or categories `values` should fit in
+
+    Returns
+    -------
+    np.ndarray
+        Boolean array, whose values are True for each of `values` that fits within `dimension`"""
+    values = np.where(values == MISSING, None, values)  # Match `dimension_subset`'s default of None
+
+    if isinstance(dimension, Categorical):
+        if not all(np.ndim(_) == 0 and not isinstance(_, Mapping) for _ in dimension.categories):
+            # Non-scalar categories cannot be compared to a column - Check values one at a time
+            return np.array([_ in dimension for _ in values], dtype=bool)
+
+        fits = np.zeros(len(values), dtype=bool)
+        for category in dimension.categories:
+            fits |= np.asarray(values == category, dtype=bool)
+        return fits
+
+    # `Real` and `Integer` fit values in the inclusive range [low, high] - Non-numbers never fit
+    is_number = np.array([isinstance(_, RealNumber) for _ in values], dtype=bool)
+    numbers = np.where(is_number, values, np.nan).astype(float)
+    with np.errstate(invalid="ignore"):
+        return is_number & (dimension.low <= numbers) & (numbers <= dimension.high)
+
+
 def filter_by_guidelines(
     hyperparameters_and_scores,
     space,
@@ -470,30 +914,36 @@ def filter_by_guidelines(
         **kwargs,
     )
 
-    def _visit(path, key, value):
-        """Return False if element in space dimensions, or in dimensions being ignored. Else, return
-        True. If `value` is of type tuple or set, it will be converted to a list in order to
-        simplify comparisons to the JSON-formatted `hyperparameters_and_scores`"""
-        if path and path[0] == "model_extra_params" and value == {}:
-            # Remove empty dicts in ("model_extra_params"). Simplify comparison between experiments
-            # with no `model_extra_params` and, for example, `dict(fit=dict(verbose=True))`
-            return False
+    exact_drops = set(dimensions + dimensions_to_ignore)
+    key_drops = set(_[-1] for _ in dimensions + dimensions_to_ignore if _[0] is None)
+
+    def _drop(path):
+        """Return True if `path` is in space dimensions, or in dimensions being ignored"""
+        return path in exact_drops or path[-1] in key_drops
 
-        for dimension in dimensions + dimensions_to_ignore:
-            if (path + (key,) == dimension) or (dimension[0] is None and dimension[-1] == key):
-                return False
-        if isinstance(value, (tuple, set)):
-            return key, list(value)
-        return True
+    def _prune(path):
+        """Return True for dicts in ("model_extra_params"). Simplify comparison between experiments
+        with no `model_extra_params` and, for example, `dict(fit=dict(verbose=True))`"""
+        return len(path) > 1 and path[0] == "model_extra_params"
 
-    guidelines = remap(temp_guidelines, visit=_visit)
+    if not hyperparameters_and_scores:
+        return []
+
+    guidelines = flatten_hyperparameters(temp_guidelines, drop=_drop, prune=_prune)
     # `guidelines` = `temp_guidelines` that are neither `space` choices, nor `dimensions_to_ignore`
 
-    hyperparameters_and_scores = list(
-        filter(lambda _: remap(_[0], visit=_visit) == guidelines, hyperparameters_and_scores)
+    table = get_hyperparameter_table(
+        [_[0] for _ in hyperparameters_and_scores], drop=_drop, prune=_prune
     )
+    if not set(guidelines.keys()).issubset(table.columns):
+        return []
+
+    #################### Compare Each Hyperparameter Column to its Guideline ####################
+    matches = np.ones(len(table), dtype=bool)
+    for path in table.columns:
+        matches &= np.asarray(table[path].values == guidelines.get(path, MISSING), dtype=bool)
 
-    return hyperparameters_and_scores
+    return [_ for (_, match) in zip(hyperparameters_and_scores, matches) if match]
 
 
 def get_choice_dimensions(params, iter_attrs=None):
@@ -529,5 +979,52 @@ def get_choice_dimensions(params, iter_attrs=None):
     return choices
 
 
+def get_hyperband_brackets(min_budget, max_budget, reduction_factor=3, integer=True):
+    """Build the successive-halving brackets of the Hyperband schedule for the given budgets. In
+    each bracket, configurations are evaluated with the bracket's smallest budget, then only the
+    best 1/`reduction_factor` of them are promoted to the next rung, whose budget is
+    `reduction_factor` times larger, until `max_budget` is reached
+
+    Parameters
+    ----------
+    min_budget: Number
+        The smallest budget with which any configuration may be evaluated
+    max_budget: Number
+        The full budget, with which the configurations in the last rung of every bracket are
+        evaluated
+    reduction_factor: Int, default=3
+        The factor by which budgets increase, and the number of configurations decreases, from one
+        rung to the next
+    integer: Boolean, default=True
+        If True, budgets are rounded to the nearest integer
+
+    Returns
+    -------
+    brackets: List of lists
+        One list for each bracket, ordered from the bracket with the most configurations and the
+        smallest budgets, to the bracket that evaluates all of its configurations with
+        `max_budget`. Each bracket contains a tuple of (<number of configurations>, <budget>) for
+        each of its rungs
+
+    Examples
+    --------
+    >>> get_hyperband_brackets(10, 90)
+    [[(9, 10), (3, 30), (1, 90)], [(5, 30), (1, 90)], [(3, 90)]]"""
+    s_max = int(np.floor(np.log(max_budget / min_budget) / np.log(reduction_factor) + 1e-9))
+    brackets = []
+
+    for s in range(s_max, -1, -1):
+        n_configs = -(-(s_max + 1) * reduction_factor ** s // (s + 1))
+        rungs = []
+
+        for i in range(s + 1):
+            budget = max_budget / reduction_factor ** (s - i)
+            budget = int(round(budget)) if integer else budget
+            rungs.append((n_configs // reduction_factor ** i, budget))
+        brackets.append(rungs)
+
+    return brackets
+
+
 if __name__ == "__main__":
     pass
@@ -0,0 +1,319 @@
+"""This module defines the shared memory used to send datasets to worker processes without pickling
+them. :class:`SharedDataPlane` copies DataFrames, and arrays into shared memory once, and returns
+small, picklable handles (:class:`SharedArray`, and :class:`SharedFrame`), which worker processes
+use to attach to them without copying. Memory-mapped datasets are not copied into shared memory at
+all. Instead, their handles (:class:`MappedFrame`) tell workers to map their files again
+
+Related
+-------
+:mod:`hyperparameter_hunter.experiments`
+    Uses :class:`SharedDataPlane` in :meth:`experiments.BaseCVExperiment._fit_in_parallel` to send
+    the datasets, and cross-validation indices of all folds to worker processes once
+:mod:`hyperparameter_hunter.utils.file_utils`
+    Defines :func:`utils.file_utils.read_dataset`, which marks the datasets it maps into memory with
+    the parameters :class:`MappedFrame` uses to map them again"""
+##################################################
+# Import Own Assets
+##################################################
+from hyperparameter_hunter.utils.file_utils import read_dataset
+
+##################################################
+# Import Miscellaneous Assets
+##################################################
+from contextlib import suppress
+import numpy as np
+import pandas as pd
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8
+    shared_memory = None
+
+#: Kinds of NumPy dtypes whose arrays can be copied into shared memory. Arrays of other kinds (like
+#: objects), and pandas extension arrays (like categoricals) are pickled, as usual
+SHAREABLE_DTYPE_KINDS = "biufcmM"
+
+#: Segments of shared memory attached by this process, keyed by name. Attached segments stay open
+#: for the life of the process, since arrays attached to them may still be in use
+_ATTACHED_SEGMENTS = dict()
+#: Memory-mapped datasets mapped again by this process, keyed by the parameters used to read them
+_MAPPED_DATASETS = dict()
+
+
+##################################################
+# Shared Data Handles
+##################################################
+class SharedArray(object):
+    def __init__(self, name, shape, dtype, offset=0):
+        """Picklable reference to an array in a segment of shared memory, published by
+        :meth:`SharedDataPlane.publish_arrays`
+
+        Parameters
+        ----------
+        name: String
+            Name of the shared memory segment containing the array
+        shape: Tuple
+            Shape of the array
+        dtype: String
+            Dtype of the array
+        offset: Int, default=0
+            Position of the array's first byte in the segment"""
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+        self.offset = offset
+
+    def attach(self):
+        """Attach to the array in shared memory, without copying it
+
+        Returns
+        -------
+        numpy.ndarray
+            Read-only view of the shared array"""
+        buffer = _attach_segment(self.name).buf
+        array = np.ndarray(self.shape, dtype=self.dtype, buffer=buffer, offset=self.offset)
+        array.flags.writeable = False
+        return array
+
+
+class SharedFrame(object):
+    def __init__(self, columns, index, index_name=None):
+        """Picklable reference to a DataFrame whose columns were published in shared memory by
+        :meth:`SharedDataPlane.publish_frame`
+
+        Parameters
+        ----------
+        columns: List
+            Pairs of (<column name>, <column values>), in the order of the DataFrame's columns.
+            Column values are :class:`SharedArray` instances, unless they cannot be shared (see
+            :data:`SHAREABLE_DTYPE_KINDS`), in which case they are pickled with the SharedFrame
+        index: :class:`SharedArray`, or `pandas.Index`
+            The index of the DataFrame. `pandas.RangeIndex`, and indexes that cannot be shared are
+            pickled with the SharedFrame
+        index_name: Object, default=None
+            The name of the index, if `index` is a :class:`SharedArray`"""
+        self.columns = columns
+        self.index = index
+        self.index_name = index_name
+
+    def attach(self):
+        """Attach to the columns of the DataFrame in shared memory, without copying them
+
+        Returns
+        -------
+        pandas.DataFrame
+            The DataFrame, whose shared columns are read-only views of shared memory"""
+        index = self.index
+        if isinstance(index, SharedArray):
+            index = pd.Index(index.attach(), name=self.index_name, copy=False)
+
+        data = {_k: _v.attach() if isinstance(_v, SharedArray) else _v for _k, _v in self.columns}
+        # Without copying, columns are not consolidated into a new array, and remain shared
+        return pd.DataFrame(data, index=index, copy=False)
+
+
+class MappedFrame(object):
+    def __init__(self, read_params, columns):
+        """Picklable reference to columns of a dataset that was mapped into memory by
+        :func:`utils.file_utils.read_dataset`. Rather than copying the dataset, worker processes
+        map its file into memory again
+
+        Parameters
+        ----------
+        read_params: Dict
+            Parameters given to :func:`utils.file_utils.read_dataset` to map the dataset into
+            memory, as marked in the "memory_map" key of the dataset's `attrs`
+        columns: List
+            Names of the columns of the dataset to select"""
+        self.read_params = read_params
+        self.columns = columns
+
+    def attach(self):
+        """Map the dataset's file into memory, if it is not already mapped by this process, and
+        select its columns without copying them
+
+        Returns
+        -------
+        pandas.DataFrame
+            The selected columns of the memory-mapped dataset"""
+        key = repr(sorted(self.read_params.items()))
+        if key not in _MAPPED_DATASETS:
+            _MAPPED_DATASETS[key] = read_dataset(memory_map=True, **self.read_params)
+        dataset = _MAPPED_DATASETS[key]
+
+        selected = pd.DataFrame({_: dataset[_] for _ in self.columns}, copy=False)
+        selected.attrs.update(dataset.attrs)
+        return selected
+
+
+def _attach_segment(name):
+    """Attach to the segment of shared memory named `name`, if it is not already attached
+
+    Parameters
+    ----------
+    name: String
+        Name of the shared memory segment
+
+    Returns
+    -------
+    multiprocessing.shared_memory.SharedMemory
+        The attached segment"""
+    if name not in _ATTACHED_SEGMENTS:
+        try:
+            # Only the process that created the segment should track (and unlink) it
+            segment = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:  # Python < 3.13 always tracks segments
+            segment = shared_memory.SharedMemory(name=name)
+        _ATTACHED_SEGMENTS[name] = segment
+    return _ATTACHED_SEGMENTS[name]
+
+
+##################################################
+# Shared Data Plane
+##################################################
+class SharedDataPlane(object):
+    #: True if shared memory is supported (Python >= 3.8). Else, data must be pickled for workers
+    available = shared_memory is not None
+
+    def __init__(self):
+        """Publisher of datasets, and arrays for worker processes. Published objects are copied
+        into shared memory once, and workers are only sent their handles, so sending them to any
+        number of workers takes the same (constant) time, and memory. Should be used as a context
+        manager, which releases all published segments on exit. Workers still attached to a
+        segment keep it until they exit
+
+        Examples
+        --------
+        >>> with SharedDataPlane() as plane:  # doctest: +SKIP
+        ...     handle = plane.publish_arrays([np.arange(3)])[0]
+        ...     handle.attach()
+        array([0, 1, 2])"""
+        self.segments = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Release all segments of shared memory created by the SharedDataPlane"""
+        for segment in self.segments:
+            segment.close()
+            with suppress(FileNotFoundError):  # May have been released by the resource tracker
+                segment.unlink()
+        self.segments = []
+
+    def publish_arrays(self, arrays):
+        """Copy `arrays` into a new segment of shared memory
+
+        Parameters
+        ----------
+        arrays: List
+            Arrays to publish, whose dtypes are of the kinds in :data:`SHAREABLE_DTYPE_KINDS`
+
+        Returns
+        -------
+        List
+            :class:`SharedArray` handles of `arrays`, in the same order"""
+        arrays = [np.asarray(_) for _ in arrays]
+        offsets, size = [], 0
+        for array in arrays:
+            size += -size % 8  # Align arrays to 8 bytes
+            offsets.append(size)
+            size += array.nbytes
+
+        segment = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self.segments.append(segment)
+
+        handles = []
+        for array, offset in zip(arrays, offsets):
+            view = np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf, offset=offset)
+            view[...] = array
+            del view  # The segment cannot be closed while views of it exist
+            handles.append(SharedArray(segment.name, array.shape, array.dtype.str, offset))
+        return handles
+
+    def publish_frame(self, dataset):
+        """Publish `dataset`, so worker processes can attach to it without copying
+
+        Parameters
+        ----------
+        dataset: pandas.DataFrame
+            The dataset to publish
+
+        Returns
+        -------
+        :class:`SharedFrame`, or :class:`MappedFrame`
+            Handle of `dataset`. If `dataset` was mapped into memory by
+            :func:`utils.file_utils.read_dataset`, and still has all the rows of its file (see
+            :func:`_has_mapped_rows`), it is not copied into shared memory, and its handle is a
+            :class:`MappedFrame`"""
+        read_params = getattr(dataset, "attrs", {}).get("memory_map")
+        if isinstance(read_params, dict) and _has_mapped_rows(dataset):
+            return MappedFrame(read_params, list(dataset.columns))
+
+        # Extension arrays (like categoricals, and tz-aware datetimes) are kept, to be pickled
+        columns = [dataset.iloc[:, _] for _ in range(dataset.shape[1])]
+        values = [_.values if isinstance(_.dtype, np.dtype) else _.array for _ in columns]
+
+        index = dataset.index
+        share_index = not isinstance(index, pd.RangeIndex) and isinstance(index.dtype, np.dtype)
+        if share_index:
+            values.append(index.values)
+
+        shared = [_ for _ in range(len(values)) if _is_shareable(values[_])]
+        for i, handle in zip(shared, self.publish_arrays([values[_] for _ in shared])):
+            values[i] = handle
+
+        if share_index:
+            index = values.pop()
+        return SharedFrame(list(zip(dataset.columns, values)), index, index_name=dataset.index.name)
+
+
+def _has_mapped_rows(dataset):
+    """Determine whether the rows of `dataset` are exactly those of the file it was mapped from by
+    :func:`utils.file_utils.read_dataset`, so workers can map the file again, instead. Operations
+    that select rows (like `DataFrame.sample`) keep the `attrs` marking `dataset` as memory-mapped,
+    although its rows no longer match the file
+
+    Parameters
+    ----------
+    dataset: pandas.DataFrame
+        A dataset marked as memory-mapped in its `attrs`
+
+    Returns
+    -------
+    Boolean
+        True if `dataset` has the number of rows recorded in the "memory_map_rows" key of its
+        `attrs`, and a `RangeIndex` starting at 0, like the dataset read from the file"""
+    index = dataset.index
+    if not isinstance(index, pd.RangeIndex) or index.start != 0 or index.step != 1:
+        return False
+    return len(index) == dataset.attrs.get("memory_map_rows")
+
+
+def _is_shareable(values):
+    """Determine whether `values` can be copied into shared memory
+
+    Parameters
+    ----------
+    values: Array-like
+        The values of a column, or index
+
+    Returns
+    -------
+    Boolean
+        True if `values` is a `numpy.ndarray` whose dtype kind is in :data:`SHAREABLE_DTYPE_KINDS`
+
+    Examples
+    --------
+    >>> _is_shareable(np.array([1.0, 2.0])), _is_shareable(np.array(["a", "b"], dtype=object))
+    (True, False)
+    >>> _is_shareable(pd.Categorical(["a", "b"]))
+    False"""
+    return isinstance(values, np.ndarray) and values.dtype.kind in SHAREABLE_DTYPE_KINDS
+
+
+if __name__ == "__main__":
+    pass
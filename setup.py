@@ -49,7 +49,7 @@ setup(
         "numpy",
         "pandas",
         "scikit-learn",
-        "scikit-optimize",
+        "scikit-optimize>=0.5,<0.6",
         "scipy",
         "simplejson",
         "wrapt",
@@ -3,9 +3,16 @@
 ##################################################
 from hyperparameter_hunter import Environment, CVExperiment, Real, Integer, Categorical
 from hyperparameter_hunter import BayesianOptimization, ExtraTreesOptimization, lambda_callback
+from hyperparameter_hunter import HyperbandOptimization
 from hyperparameter_hunter.callbacks.recipes import confusion_matrix_oof, confusion_matrix_holdout
+from hyperparameter_hunter.pruners import MedianPruner
 from hyperparameter_hunter.recorders import YAMLDescriptionRecorder, UnsortedIDLeaderboardRecorder
 from hyperparameter_hunter.result_reader import has_experiment_result_file
+from hyperparameter_hunter.settings import G
+from hyperparameter_hunter.space import dimension_subset
+from hyperparameter_hunter.utils.file_utils import read_json
+from hyperparameter_hunter.utils.optimization_utils import AskingOptimizer
+from hyperparameter_hunter.utils.shared_memory_utils import SharedDataPlane
 from hyperparameter_hunter.utils.learning_utils import (
     get_toy_classification_data,
     get_breast_cancer_data,
@@ -14,6 +21,7 @@ from hyperparameter_hunter.utils.learning_utils import (
 ##################################################
 # Import Miscellaneous Assets
 ##################################################
+import numpy as np
 import pytest
 
 ##################################################
@@ -36,6 +44,20 @@ assets_dir = "hyperparameter_hunter/__TEST__HyperparameterHunterAssets__"
 ##################################################
 # Environment Fixtures
 ##################################################
+def _make_environment(results_path, cv_params=None, cv_type=StratifiedKFold, **kwargs):
+    """Activate an `Environment` for the breast cancer dataset that saves results to `results_path`.
+    `cv_params` defaults to 3 shuffled splits, and `kwargs` are given to `Environment`"""
+    return Environment(
+        train_dataset=get_breast_cancer_data(),
+        results_path=results_path,
+        target_column="diagnosis",
+        metrics=["roc_auc_score"],
+        cv_type=cv_type,
+        cv_params=cv_params or dict(n_splits=3, shuffle=True, random_state=32),
+        **kwargs,
+    )
+
+
 @pytest.fixture(scope="function", autouse=False)
 def env_0():
     def do_full_save(experiment_result):
@@ -142,15 +164,7 @@ def env_4():
     ],
 )
 def env_5(request):
-    return Environment(
-        train_dataset=get_breast_cancer_data(),
-        results_path=assets_dir,
-        target_column="diagnosis",
-        metrics=["roc_auc_score"],
-        cv_type=StratifiedKFold,
-        cv_params=dict(n_splits=3, shuffle=True, random_state=32),
-        experiment_recorders=request.param,
-    )
+    return _make_environment(assets_dir, experiment_recorders=request.param)
 
 
 ##################################################
@@ -223,6 +237,18 @@ def opt_dtc_0():
     yield optimizer
 
 
+#################### GradientBoostingClassifier Optimization Protocols ####################
+@pytest.fixture(scope="function", autouse=False)
+def opt_gbc_0():
+    optimizer = BayesianOptimization(iterations=4, random_state=32, n_parallel=2)
+    optimizer.set_experiment_guidelines(
+        model_initializer=GradientBoostingClassifier,
+        model_init_params=dict(n_estimators=Integer(5, 20), learning_rate=Real(0.05, 0.5)),
+    )
+    optimizer.go()
+    yield optimizer
+
+
 # TODO: 1-18-19 - Add test scenarios below that use `sentinels`
 
 
@@ -272,3 +298,386 @@ def test_multi_metric(env_4, exp_svc_0, opt_svc_0):
 #################### recorder_example ####################
 def test_lambda_callback(env_5, exp_gbc_1):
     assert has_experiment_result_file(assets_dir, exp_gbc_1)
+
+
+#################### n_parallel ####################
+def test_n_parallel(env_5, opt_gbc_0):
+    assert opt_gbc_0.successful_iterations == 4
+    assert len(set(opt_gbc_0.tested_keys)) == len(opt_gbc_0.tested_keys)
+    assert has_experiment_result_file(
+        assets_dir, opt_gbc_0.best_experiment, ["Descriptions", "PredictionsOOF"]
+    )
+
+
+#################### n_jobs ####################
+def _n_jobs_experiment(n_jobs, experiment_callbacks=None):
+    _make_environment(
+        None,
+        cv_params=dict(n_splits=3, n_repeats=2, random_state=32),
+        cv_type=RepeatedStratifiedKFold,
+        runs=2,
+        n_jobs=n_jobs,
+        experiment_callbacks=experiment_callbacks,
+    )
+    return CVExperiment(GradientBoostingClassifier, dict(subsample=0.5, n_estimators=10))
+
+
+@pytest.mark.parametrize("n_jobs", [2, -1])
+def test_n_jobs(n_jobs):
+    """Check that fitting in worker processes produces the same results as fitting serially"""
+    serial_exp = _n_jobs_experiment(1)
+    parallel_exp = _n_jobs_experiment(n_jobs)
+    assert parallel_exp._do_fit_in_parallel()
+    assert serial_exp.last_evaluation_results == parallel_exp.last_evaluation_results
+    seeds = serial_exp.experiment_params["random_seeds"]
+    assert seeds == parallel_exp.experiment_params["random_seeds"]
+    assert np.shape(parallel_exp.stat_aggregates["times"]["runs"]) == (2, 3, 2)
+    assert all(_ > 0 for _ in np.ravel(parallel_exp.stat_aggregates["times"]["runs"]))
+
+
+@pytest.mark.skipif(not SharedDataPlane.available, reason="Requires shared memory")
+def test_n_jobs_shared_data():
+    """Check that training data is published once for the Environment, then released when another
+    Environment is activated"""
+    first_exp = _n_jobs_experiment(2)
+    env = G.Env
+    published = env._shared_data
+    assert published is not None
+
+    second_exp = CVExperiment(GradientBoostingClassifier, dict(subsample=0.5, n_estimators=5))
+    assert env._shared_data is published  # Same training data, so it is not published again
+    assert second_exp._get_data_key() == first_exp._get_data_key()
+
+    _n_jobs_experiment(1)
+    assert env._shared_data is None
+    assert published[1].segments == []
+
+
+def test_n_jobs_affects_fit():
+    """Check that Models are fit serially if a callback may change them before they are fit"""
+
+    def on_run_start(model_init_params, _run):
+        model_init_params["n_estimators"] = 5 + _run
+
+    callback = lambda_callback(on_run_start=on_run_start)
+    assert callback.affects_fit
+    assert not lambda_callback(on_run_end=on_run_start).affects_fit
+
+    serial_exp = _n_jobs_experiment(1, [callback])
+    parallel_exp = _n_jobs_experiment(2, [callback])
+    assert not parallel_exp._do_fit_in_parallel()
+    assert serial_exp.last_evaluation_results == parallel_exp.last_evaluation_results
+
+
+#################### Fold Checkpoints ####################
+def _checkpoint_experiment(results_path, interrupt_at=None):
+    def on_fold_end(_rep, _fold):
+        if (_rep, _fold) == interrupt_at:
+            raise RuntimeError("Simulated interruption")
+
+    _make_environment(
+        results_path,
+        cv_params=dict(n_splits=3, n_repeats=2, random_state=32),
+        cv_type=RepeatedStratifiedKFold,
+        holdout_dataset=get_breast_cancer_data(),
+        test_dataset=get_breast_cancer_data(),
+        runs=2,
+        experiment_callbacks=[lambda_callback(on_fold_end=on_fold_end)],
+    )
+    return CVExperiment(GradientBoostingClassifier, dict(subsample=0.5, n_estimators=10))
+
+
+@pytest.mark.parametrize("interrupt_at", [(0, 1), (1, 0), (1, 2)])
+def test_checkpoint_resume(tmpdir, interrupt_at):
+    """Check that an interrupted Experiment resumes from its last completed fold, and produces the
+    same results as an uninterrupted Experiment"""
+    expected_exp = _checkpoint_experiment(str(tmpdir.join("expected")))
+
+    with pytest.raises(RuntimeError):
+        _checkpoint_experiment(str(tmpdir.join("resumed")), interrupt_at=interrupt_at)
+    checkpoints_dir = tmpdir.join("resumed", "HyperparameterHunterAssets", "Experiments")
+    checkpoints_dir = checkpoints_dir.join("Checkpoints")
+    assert len(checkpoints_dir.listdir()[0].listdir()) == 1
+
+    resumed_exp = _checkpoint_experiment(str(tmpdir.join("resumed")))
+    assert resumed_exp.last_evaluation_results == expected_exp.last_evaluation_results
+    expected_evaluations = expected_exp.stat_aggregates["evaluations"]
+    assert resumed_exp.stat_aggregates["evaluations"] == expected_evaluations
+    assert resumed_exp.final_test_predictions.equals(expected_exp.final_test_predictions)
+    assert len(checkpoints_dir.listdir()[0].listdir()) == 0
+
+
+#################### Optimization States ####################
+def _state_optimization(results_path, interrupt_at=None):
+    n_started = []
+
+    def on_experiment_start():
+        n_started.append(1)
+        if len(n_started) == interrupt_at:
+            raise RuntimeError("Simulated interruption")
+
+    _make_environment(
+        results_path,
+        experiment_callbacks=[lambda_callback(on_experiment_start=on_experiment_start)],
+    )
+    optimizer = BayesianOptimization(iterations=4, random_state=32, n_initial_points=2)
+    optimizer.set_experiment_guidelines(
+        model_initializer=GradientBoostingClassifier,
+        model_init_params=dict(n_estimators=Integer(5, 20), learning_rate=Real(0.05, 0.5)),
+    )
+    optimizer.go()
+    return optimizer
+
+
+@pytest.mark.parametrize("interrupt_at", [2, 4])
+def test_optimization_state_resume(tmpdir, interrupt_at):
+    """Check that an interrupted Optimization Protocol resumes from its last saved state, and
+    follows the same search trajectory as an uninterrupted Optimization Protocol"""
+    expected_opt = _state_optimization(str(tmpdir.join("expected")))
+
+    with pytest.raises(RuntimeError):
+        _state_optimization(str(tmpdir.join("resumed")), interrupt_at=interrupt_at)
+    states_dir = tmpdir.join("resumed", "HyperparameterHunterAssets", "OptimizationStates")
+    assert len(states_dir.listdir()[0].listdir()) == 1
+
+    resumed_opt = _state_optimization(str(tmpdir.join("resumed")))
+    assert resumed_opt.similar_experiments == []
+    assert resumed_opt.successful_iterations == 4
+    assert resumed_opt.optimizer.Xi == expected_opt.optimizer.Xi
+    assert resumed_opt.optimizer.yi == expected_opt.optimizer.yi
+    assert resumed_opt.best_score == expected_opt.best_score
+    assert len(states_dir.listdir()[0].listdir()) == 0
+
+
+#################### Pruning ####################
+def _pruning_optimization(results_path, iterations, n_parallel=1):
+    _make_environment(results_path, cv_params=dict(n_splits=5, shuffle=True, random_state=32))
+    optimizer = BayesianOptimization(
+        iterations=iterations,
+        random_state=32,
+        n_parallel=n_parallel,
+        pruner=MedianPruner(n_startup_experiments=1),
+    )
+    optimizer.set_experiment_guidelines(
+        model_initializer=DecisionTreeClassifier,
+        model_init_params=dict(max_depth=Integer(1, 20), min_samples_leaf=Integer(1, 100)),
+    )
+    optimizer.go()
+    return optimizer
+
+
+def test_pruning(tmpdir):
+    optimizer = _pruning_optimization(str(tmpdir), 6)
+
+    assert optimizer.successful_iterations + len(optimizer.pruned_experiments) == 6
+    assert optimizer.best_experiment not in optimizer.pruned_experiments
+    assert len(optimizer.optimizer.yi) == 6
+    descriptions_dir = tmpdir.join("HyperparameterHunterAssets", "Experiments", "Descriptions")
+    for experiment_id in optimizer.pruned_experiments:
+        assert not has_experiment_result_file(str(tmpdir), experiment_id, ["PredictionsOOF"])
+        description = read_json(str(descriptions_dir.join(f"{experiment_id}.json")))
+        assert description["pruned"] is True
+        # Execution time is estimated for all folds, so pruned hyperparameters do not look cheap
+        times = description["aggregates"]["times"]
+        assert times["total_elapsed"] >= sum(times["folds"])
+
+    # Pruned Experiments are read by later protocols, so none of the 6 are repeated
+    second_opt = _pruning_optimization(str(tmpdir), 1)
+    similar_ids = [_[2] for _ in second_opt.similar_experiments]
+    assert len(similar_ids) == 6
+    assert set(optimizer.pruned_experiments).issubset(similar_ids)
+
+
+def test_pruning_n_parallel(tmpdir):
+    optimizer = _pruning_optimization(str(tmpdir), 6, n_parallel=2)
+
+    assert optimizer.pruner is not None
+    assert optimizer.pruner.n_experiments == 6
+    assert optimizer.successful_iterations + len(optimizer.pruned_experiments) == 6
+    assert optimizer.best_experiment not in optimizer.pruned_experiments
+
+
+#################### Per-Second Acquisition Functions ####################
+def _per_second_optimization(results_path, iterations):
+    _make_environment(results_path)
+    optimizer = BayesianOptimization(
+        iterations=iterations, random_state=32, n_initial_points=2, acquisition_function="EIps"
+    )
+    optimizer.set_experiment_guidelines(
+        model_initializer=GradientBoostingClassifier,
+        model_init_params=dict(n_estimators=Integer(5, 20), learning_rate=Real(0.05, 0.5)),
+    )
+    optimizer.go()
+    return optimizer
+
+
+def test_per_second_acquisition(tmpdir):
+    """Check that "EIps" learns execution times of new Experiments, and of saved Experiments"""
+    first_opt = _per_second_optimization(str(tmpdir), 3)
+    assert all(len(_) == 2 for _ in first_opt.optimizer.yi)
+
+    second_opt = _per_second_optimization(str(tmpdir), 1)
+    assert len(second_opt.similar_experiments) == 3
+    assert all(_[3] > 0 for _ in second_opt.similar_experiments)
+    assert len(second_opt.optimizer.yi) == 4
+
+
+def test_similar_experiments_single_tell(tmpdir, monkeypatch):
+    """Check that all saved Experiments are told to the optimizer in exactly one `tell` call"""
+    _per_second_optimization(str(tmpdir), 3)
+
+    tell_calls = []
+    original_tell = AskingOptimizer.tell
+
+    def spy_tell(self, x, y, fit=True):
+        tell_calls.append((x, y))
+        return original_tell(self, x, y, fit=fit)
+
+    monkeypatch.setattr(AskingOptimizer, "tell", spy_tell)
+    second_opt = _per_second_optimization(str(tmpdir), 1)
+
+    # One `tell` for all saved Experiments, then one for the single new Experiment
+    assert len(tell_calls) == 2
+    told_points, told_values = tell_calls[0]
+    saved_points = [
+        dimension_subset(_[0], second_opt.space.names()) for _ in second_opt.similar_experiments
+    ]
+    assert len(told_points) == len(told_values) == len(saved_points) == 3
+    assert sorted(told_points) == sorted(saved_points)
+    # Per-second acquisition functions are told a (score, time) pair for each saved Experiment
+    assert all(len(_) == 2 for _ in told_values)
+
+
+#################### Hyperband ####################
+def _hyperband_optimization(results_path, budget, min_budget, max_budget):
+    _make_environment(results_path, cv_params=dict(n_splits=6, shuffle=True, random_state=32))
+    optimizer = HyperbandOptimization(budget, min_budget, max_budget, iterations=1)
+    optimizer.set_experiment_guidelines(
+        model_initializer=GradientBoostingClassifier,
+        model_init_params=dict(
+            max_depth=Integer(1, 5), learning_rate=Real(0.05, 0.5), n_estimators=10
+        ),
+    )
+    optimizer.go()
+    return optimizer
+
+
+@pytest.mark.parametrize(
+    ["budget", "min_budget", "max_budget", "n_cross_experiment_keys"],
+    [
+        (("model_init_params", "n_estimators"), 5, 45, 1),
+        (("cv_params", "n_splits"), 2, 6, 2),
+        ("train_rows", 1 / 3, 1.0, 2),
+    ],
+)
+def test_hyperband(tmpdir, budget, min_budget, max_budget, n_cross_experiment_keys):
+    """Check that Hyperband executes the Experiments of its first bracket, saves low-budget
+    Environment results under separate keys, and reads saved scores instead of repeating them"""
+    optimizer = _hyperband_optimization(str(tmpdir), budget, min_budget, max_budget)
+    n_experiments = sum(n_configurations for (n_configurations, _) in optimizer.brackets[0])
+
+    assert optimizer.successful_iterations == n_experiments
+    assert optimizer.best_experiment is not None
+    tested_keys_dir = tmpdir.join("HyperparameterHunterAssets", "TestedKeys")
+    assert len(tested_keys_dir.listdir(fil="*.json")) == n_cross_experiment_keys
+
+    repeated_optimizer = _hyperband_optimization(str(tmpdir), budget, min_budget, max_budget)
+    assert repeated_optimizer.successful_iterations == 0
+    assert repeated_optimizer.skipped_iterations == n_experiments
+    assert repeated_optimizer.best_experiment == optimizer.best_experiment
+    assert repeated_optimizer.best_score == optimizer.best_score
+
+
+@pytest.mark.parametrize(
+    ["budget", "min_budget", "max_budget"],
+    [("epochs", 1, 9), (("cv_params",), 2, 6), ("train_rows", 0.5, 2), ("runs", 3, 1)],
+)
+def test_hyperband_invalid_budget(env_0, budget, min_budget, max_budget):
+    with pytest.raises(ValueError):
+        HyperbandOptimization(budget, min_budget, max_budget)
+
+
+#################### Staged Boosting Results ####################
+def test_staged_estimators(tmpdir):
+    """Check that staged results match the results of Experiments fit with fewer boosting rounds,
+    and that they are saved as separate Experiments"""
+    _make_environment(str(tmpdir), holdout_dataset=get_breast_cancer_data())
+    staged_exp = CVExperiment(
+        GradientBoostingClassifier, dict(n_estimators=10), staged_estimators=[6, 3, 3]
+    )
+    assert [_["n_rounds"] for _ in staged_exp.staged_results] == [3, 6]
+
+    for staged_result in staged_exp.staged_results:
+        assert has_experiment_result_file(str(tmpdir), staged_result["experiment_id"])
+        exp = CVExperiment(GradientBoostingClassifier, dict(n_estimators=staged_result["n_rounds"]))
+        assert exp.hyperparameter_key.key == staged_result["hyperparameter_key"]
+        for data_type in ["oof", "holdout"]:
+            expected = staged_result["final_evaluations"][data_type]["roc_auc_score"]
+            actual = exp.last_evaluation_results[data_type]["roc_auc_score"]
+            assert actual == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("staged_estimators", [[10], [0], [5, 20]])
+def test_staged_estimators_invalid(env_0, staged_estimators):
+    with pytest.raises(ValueError):
+        CVExperiment(
+            GradientBoostingClassifier, dict(n_estimators=10), staged_estimators=staged_estimators
+        )
+
+
+def test_staged_optimization(tmpdir):
+    """Check that optimizers are told the staged results of each Experiment they execute"""
+    _make_environment(str(tmpdir), holdout_dataset=get_breast_cancer_data())
+    optimizer = BayesianOptimization(iterations=3, random_state=32, n_stages=2)
+    optimizer.set_experiment_guidelines(
+        model_initializer=GradientBoostingClassifier,
+        model_init_params=dict(n_estimators=Integer(5, 20), learning_rate=Real(0.05, 0.5)),
+    )
+    optimizer.go()
+
+    assert optimizer.successful_iterations == 3
+    assert len(optimizer.optimizer.yi) > 3
+    assert len(optimizer.tested_keys) > 3
+
+
+#################### Repeated Key Pre-Check ####################
+def _repeated_key_optimization(results_path, iterations, read_experiments=True):
+    _make_environment(results_path)
+    optimizer = BayesianOptimization(
+        iterations=iterations,
+        random_state=32,
+        n_initial_points=2,
+        read_experiments=read_experiments,
+    )
+    optimizer.set_experiment_guidelines(
+        model_initializer=DecisionTreeClassifier,
+        model_init_params=dict(max_depth=2, criterion=Categorical(["gini", "entropy"])),
+    )
+    optimizer.go()
+    return optimizer
+
+
+def test_repeated_key_pre_check(tmpdir, monkeypatch):
+    """Check that keys made before initializing Experiments match the keys made by Experiments,
+    so repeated hyperparameters are skipped without initializing an Experiment"""
+    optimizer = _repeated_key_optimization(str(tmpdir), 2)
+    experiment_key = optimizer.current_experiment.hyperparameter_key.key
+    assert optimizer._make_current_hyperparameter_key() == experiment_key
+    assert set(optimizer.tested_keys) == optimizer._get_saved_keys()
+
+    experiments = []
+    original_init = CVExperiment.__init__
+
+    def spy_init(self, *args, **kwargs):
+        experiments.append(self)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(CVExperiment, "__init__", spy_init)
+
+    # Without reading saved Experiments, the optimizer suggests both tested points again
+    repeated_optimizer = _repeated_key_optimization(str(tmpdir), 2, read_experiments=False)
+    assert experiments == []
+    assert repeated_optimizer.successful_iterations == 0
+    # The second repeated key exhausts the search space, which ends the loop before it is counted
+    assert repeated_optimizer.skipped_iterations == 1
+    assert sorted(repeated_optimizer.tested_keys) == sorted(optimizer.tested_keys)
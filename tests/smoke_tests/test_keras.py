@@ -2,6 +2,7 @@
 # Import Own Assets
 ##################################################
 from hyperparameter_hunter import Environment, Real, Integer, Categorical, DummySearch
+from hyperparameter_hunter import CVExperiment, BayesianOptimization
 from hyperparameter_hunter.utils.learning_utils import get_breast_cancer_data, get_diabetes_data
 
 ##################################################
@@ -94,13 +95,60 @@ def test_regressor_opt(env_0, opt_regressor):
     ...
 
 
+##################################################
+# Staged Epoch Results
+##################################################
+def _build_fn_staged(input_shape):
+    model = Sequential(
+        [
+            Dense(20, activation="relu", input_shape=input_shape),
+            Dense(1, activation="sigmoid"),
+        ]
+    )
+    model.compile(optimizer="adam", loss="binary_crossentropy", metrics=["accuracy"])
+    return model
+
+
+def test_staged_epochs(tmpdir):
+    """Check that a Keras Experiment saves separate results for fewer epochs, which are told to
+    the optimizer with the Experiment's own result"""
+    Environment(
+        train_dataset=get_breast_cancer_data(target="target"),
+        results_path=str(tmpdir),
+        metrics=["roc_auc_score"],
+        cv_type="KFold",
+        cv_params=dict(n_splits=2, shuffle=True, random_state=32),
+    )
+    optimizer = BayesianOptimization(iterations=2, random_state=32, n_stages=2)
+    optimizer.set_experiment_guidelines(
+        model_initializer=KerasClassifier,
+        model_init_params=dict(build_fn=_build_fn_staged),
+        model_extra_params=dict(epochs=Integer(2, 6), batch_size=128, verbose=0),
+    )
+    optimizer.go()
+
+    epochs = optimizer.current_experiment.model_extra_params["epochs"]
+    assert all(0 < _["n_rounds"] < epochs for _ in optimizer.current_experiment.staged_results)
+    assert len(optimizer.optimizer.yi) > 2
+
+
+def test_staged_epochs_invalid(env_0):
+    with pytest.raises(ValueError):
+        CVExperiment(
+            KerasClassifier,
+            dict(build_fn=_build_fn_staged),
+            dict(epochs=2, batch_size=128, verbose=0),
+            staged_estimators=[2],
+        )
+
+
 ##################################################
 # Keras Initialization Matching Tests
 ##################################################
 def in_similar_experiment_ids(opt_0, opt_1):
     """Determine whether the `experiment_id` of `opt_0`'s `current_experiment` is included in
     `opt_1`'s list of `similar_experiments`"""
-    return opt_0.current_experiment.experiment_id in [_[-1] for _ in opt_1.similar_experiments]
+    return opt_0.current_experiment.experiment_id in [_[2] for _ in opt_1.similar_experiments]
 
 
 def run_initialization_matching_optimization_0(build_fn):
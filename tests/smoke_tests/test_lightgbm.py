@@ -3,8 +3,10 @@
 ##################################################
 from hyperparameter_hunter import Environment, CVExperiment, Real, Integer, Categorical
 from hyperparameter_hunter import BayesianOptimization
+from hyperparameter_hunter.models import LightGBMModel, NativeBoosterEstimator, NATIVE_DATASET_CACHE
 from hyperparameter_hunter.result_reader import has_experiment_result_file
 from hyperparameter_hunter.utils.learning_utils import get_breast_cancer_data
+from hyperparameter_hunter.utils.learning_utils import get_toy_classification_data
 
 ##################################################
 # Import Miscellaneous Assets
@@ -105,3 +107,51 @@ def test_lgb_0(env_0, exp_lgb_0, opt_lgb_0):
         assert has_experiment_result_file(
             assets_dir, similar_experiment[2], ["Descriptions", "Heartbeats", "PredictionsOOF"]
         )
+
+
+##################################################
+# Native Dataset Scenarios
+##################################################
+NATIVE_TRAINING = dict(native_training=True)
+
+
+def _fit_lgb_model(data, dataset_key, native_training=True):
+    model = LightGBMModel(
+        LGBMClassifier,
+        dict(n_estimators=10, num_leaves=5, verbose=-1),
+        dict(native_training=native_training),
+        train_input=data.drop(columns="target"),
+        train_target=data[["target"]],
+        do_predict_proba=True,
+    )
+    model.dataset_key = dataset_key
+    model.fit()
+    return model
+
+
+@pytest.mark.parametrize("n_classes", [2, 3])
+def test_native_fit(n_classes):
+    data = get_toy_classification_data(n_classes=n_classes, n_informative=4).rename(columns=str)
+    input_data = data.drop(columns="target")
+    native_model = _fit_lgb_model(data, ("test_native_fit", n_classes))
+    standard_model = _fit_lgb_model(data, None, native_training=False)
+
+    assert isinstance(native_model.model, NativeBoosterEstimator)
+    assert native_model.predict(input_data) == pytest.approx(standard_model.predict(input_data))
+    assert native_model.staged_predict(input_data, [5])[5] == pytest.approx(
+        standard_model.staged_predict(input_data, [5])[5]
+    )
+
+
+def test_native_dataset_cache(env_0):
+    NATIVE_DATASET_CACHE.clear()
+    CVExperiment(LGBMClassifier, dict(n_estimators=5, verbose=-1))
+    assert len(NATIVE_DATASET_CACHE) == 0  # Native training is opt-in
+
+    for num_leaves in [3, 5]:
+        params = dict(n_estimators=5, num_leaves=num_leaves, verbose=-1)
+        CVExperiment(LGBMClassifier, params, NATIVE_TRAINING)
+        assert len(NATIVE_DATASET_CACHE) == 2  # One `Dataset` for each fold, reused by both
+
+    CVExperiment(LGBMClassifier, dict(n_estimators=5, max_bin=31, verbose=-1), NATIVE_TRAINING)
+    assert len(NATIVE_DATASET_CACHE) == 4  # Binning parameters require new datasets
@@ -2,7 +2,8 @@
 # Import Own Assets
 ##################################################
 from hyperparameter_hunter import Environment, CVExperiment, Real, Integer, Categorical
-from hyperparameter_hunter import RandomForestOptimization
+from hyperparameter_hunter import RandomForestOptimization, lambda_callback
+from hyperparameter_hunter.models import XGBoostModel, NativeBoosterEstimator, NATIVE_DATASET_CACHE
 from hyperparameter_hunter.result_reader import has_experiment_result_file
 from hyperparameter_hunter.utils.learning_utils import get_toy_classification_data
 
@@ -81,3 +82,80 @@ def test_classification_experiment(env_0, exp_xgb_0):
 
 def test_classification_optimization(env_0, opt_xgb_0):
     ...
+
+
+##################################################
+# Native Dataset Scenarios
+##################################################
+NATIVE_TRAINING = dict(native_training=True)
+
+
+def _fit_xgb_model(data, dataset_key, native_training=True):
+    model = XGBoostModel(
+        XGBClassifier,
+        dict(n_estimators=10, max_depth=3),
+        dict(native_training=native_training),
+        train_input=data.drop(columns="target"),
+        train_target=data[["target"]],
+        do_predict_proba=True,
+    )
+    model.dataset_key = dataset_key
+    model.fit()
+    return model
+
+
+@pytest.mark.parametrize("n_classes", [2, 3])
+def test_native_fit(n_classes):
+    data = get_toy_classification_data(n_classes=n_classes, n_informative=4).rename(columns=str)
+    input_data = data.drop(columns="target")
+    native_model = _fit_xgb_model(data, ("test_native_fit", n_classes))
+    standard_model = _fit_xgb_model(data, None, native_training=False)
+
+    assert isinstance(native_model.model, NativeBoosterEstimator)
+    assert native_model.predict(input_data) == pytest.approx(standard_model.predict(input_data))
+    assert native_model.staged_predict(input_data, [5])[5] == pytest.approx(
+        standard_model.staged_predict(input_data, [5])[5]
+    )
+
+
+def test_native_dataset_cache(env_0):
+    NATIVE_DATASET_CACHE.clear()
+    CVExperiment(XGBClassifier, dict(n_estimators=5))
+    assert len(NATIVE_DATASET_CACHE) == 0  # Native training is opt-in
+
+    for max_depth in [2, 3]:
+        CVExperiment(XGBClassifier, dict(n_estimators=5, max_depth=max_depth), NATIVE_TRAINING)
+        assert len(NATIVE_DATASET_CACHE) == 6  # One `DMatrix` for each of the 3x2 folds
+
+
+def _callback_env(callback):
+    return Environment(
+        train_dataset=get_toy_classification_data(),
+        results_path=assets_dir,
+        metrics=["roc_auc_score"],
+        cv_type="RepeatedStratifiedKFold",
+        cv_params=dict(n_splits=3, n_repeats=2, random_state=32),
+        experiment_callbacks=[callback],
+    )
+
+
+def test_native_dataset_cache_callbacks(env_0, monkeypatch):
+    """Check that native datasets are not reused after callbacks change the training data, or if
+    callbacks may replace fold datasets before fitting"""
+    monkeypatch.setattr(NATIVE_DATASET_CACHE, "max_size", 12)
+    NATIVE_DATASET_CACHE.clear()
+    CVExperiment(XGBClassifier, dict(n_estimators=5), NATIVE_TRAINING)
+    assert len(NATIVE_DATASET_CACHE) == 6
+
+    def _zero_first_feature(train_input_data):
+        train_input_data.loc[:, train_input_data.columns[0]] = 0.0
+
+    # Same `cross_experiment_key`, but different training data, so new datasets are built
+    _callback_env(lambda_callback(on_experiment_start=_zero_first_feature))
+    CVExperiment(XGBClassifier, dict(n_estimators=5), NATIVE_TRAINING)
+    assert len(NATIVE_DATASET_CACHE) == 12
+
+    # Callbacks that may replace fold datasets (`affects_fit`) disable the cache
+    _callback_env(lambda_callback(on_fold_start=lambda: None))
+    CVExperiment(XGBClassifier, dict(n_estimators=5), NATIVE_TRAINING)
+    assert len(NATIVE_DATASET_CACHE) == 12
@@ -127,6 +127,28 @@ def test_environment_init_cross_experiment_params(runs, cv_type, _cv_params, exp
     assert env == expected
 
 
+##################################################
+# Dataset Loading Scenarios
+##################################################
+def test_environment_csv_dataset_cache(tmpdir, monkeypatch):
+    file_path = str(tmpdir.join("train.csv"))
+    train_dataset.to_csv(file_path, index=False)
+    env_params = dict(
+        default_env_params,
+        train_dataset=file_path,
+        test_dataset=file_path,
+        results_path=str(tmpdir),
+        data_loading_params=dict(downcast="integer"),
+    )
+    env_0 = Environment(**env_params)
+    assert len(tmpdir.join("HyperparameterHunterAssets", "DatasetCache").listdir()) == 1
+
+    monkeypatch.setattr(pd, "read_csv", None)  # Later Environments should only read the cache
+    env_1 = Environment(**env_params)
+    assert env_1 == env_0.cross_experiment_key
+    assert env_1.train_dataset["diagnosis"].dtype == np.int64  # Target columns are not downcast
+
+
 ##################################################
 # `define_holdout_set` Scenarios
 ##################################################
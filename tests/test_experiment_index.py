@@ -0,0 +1,133 @@
+##################################################
+# Import Own Assets
+##################################################
+from hyperparameter_hunter.experiment_index import ExperimentIndex
+
+##################################################
+# Import Miscellaneous Assets
+##################################################
+from collections import OrderedDict
+import numpy as np
+import pytest
+import sqlite3
+
+
+##################################################
+# Dummy Objects for Testing
+##################################################
+def make_description(
+    experiment_id, algorithm_name="SVC", cross_experiment_key="a", score=0.5, elapsed=None
+):
+    return OrderedDict(
+        [
+            ("experiment_id", experiment_id),
+            ("algorithm_name", algorithm_name),
+            ("module_name", "sklearn"),
+            ("hyperparameter_key", f"h_{experiment_id}"),
+            ("cross_experiment_key", cross_experiment_key),
+            ("final_evaluations", dict(oof=dict(roc_auc_score=np.float64(score)))),
+            ("hyperparameters", dict(model_init_params=dict(C=1.0, max_iter=np.int64(100)))),
+            ("notes", "Not stored in the index"),
+            ("aggregates", dict(times=dict(total_elapsed=elapsed, folds=[1.0, 2.0]))),
+        ]
+    )
+
+
+@pytest.fixture(scope="function", autouse=False)
+def index_0(tmpdir):
+    index = ExperimentIndex(str(tmpdir.join("ExperimentIndex.db")))
+    index.add_entry(make_description("id_0", score=0.1))
+    index.add_entries(
+        [
+            make_description("id_1", score=0.2, elapsed=np.float64(3.5)),
+            make_description("id_2", algorithm_name="KNeighborsClassifier"),
+            make_description("id_3", cross_experiment_key="b"),
+        ]
+    )
+    return index
+
+
+##################################################
+# `ExperimentIndex` Scenarios
+##################################################
+def test_get_entries_missing_index(tmpdir):
+    assert ExperimentIndex(str(tmpdir.join("ExperimentIndex.db"))).get_entries("a") == {}
+    assert not tmpdir.join("ExperimentIndex.db").exists()
+
+
+@pytest.mark.parametrize(
+    ["cross_experiment_key", "algorithm_name", "expected_ids"],
+    [
+        ("a", None, ["id_0", "id_1", "id_2"]),
+        ("a", "SVC", ["id_0", "id_1"]),
+        ("a", "KNeighborsClassifier", ["id_2"]),
+        ("b", None, ["id_3"]),
+        ("b", "KNeighborsClassifier", []),
+        ("c", None, []),
+    ],
+)
+def test_get_entries(index_0, cross_experiment_key, algorithm_name, expected_ids):
+    entries = index_0.get_entries(cross_experiment_key, algorithm_name)
+    assert sorted(entries.keys()) == expected_ids
+
+
+def test_get_entries_content(index_0):
+    entry = index_0.get_entries("a", "SVC")["id_1"]
+    assert entry == dict(
+        experiment_id="id_1",
+        algorithm_name="SVC",
+        module_name="sklearn",
+        hyperparameter_key="h_id_1",
+        cross_experiment_key="a",
+        final_evaluations=dict(oof=dict(roc_auc_score=0.2)),
+        hyperparameters=dict(model_init_params=dict(C=1.0, max_iter=100)),
+        aggregates=dict(times=dict(total_elapsed=3.5)),
+        pruned=False,
+    )
+
+
+def test_get_entries_missing_elapsed(index_0):
+    assert index_0.get_entries("a", "SVC")["id_0"]["aggregates"] == dict(
+        times=dict(total_elapsed=None)
+    )
+
+
+def test_add_entry_replaces(index_0):
+    index_0.add_entry(make_description("id_0", score=0.9))
+    entries = index_0.get_entries("a", "SVC")
+    assert len(entries) == 2
+    assert entries["id_0"]["final_evaluations"]["oof"]["roc_auc_score"] == 0.9
+
+
+def test_old_index_columns_added(tmpdir):
+    """Check that entries of an index made before a column was introduced are excluded until they
+    are added again, at which point the new column is populated"""
+    path = str(tmpdir.join("ExperimentIndex.db"))
+    old_columns = [_ for _ in ExperimentIndex.columns if _ not in ["total_elapsed", "pruned"]]
+    connection = sqlite3.connect(path)
+    with connection:
+        connection.execute(
+            "CREATE TABLE experiments ({}, PRIMARY KEY (experiment_id))".format(
+                ", ".join(f"{_} TEXT" for _ in old_columns)
+            )
+        )
+        connection.execute(
+            "INSERT INTO experiments VALUES (?, ?, ?, ?, ?, ?, ?)",
+            ["id_0", "SVC", "sklearn", "h_id_0", "a", "{}", "{}"],
+        )
+    connection.close()
+
+    index = ExperimentIndex(path)
+    assert index.get_entries("a") == {}
+
+    index.add_entry(make_description("id_0", elapsed=2.0))
+    entries = index.get_entries("a")
+    assert entries["id_0"]["aggregates"]["times"]["total_elapsed"] == 2.0
+    assert entries["id_0"]["pruned"] is False
+
+
+def test_pruned_entry(index_0):
+    index_0.add_entry(dict(make_description("id_4", score=0.0, elapsed=1.0), pruned=True))
+    entries = index_0.get_entries("a", "SVC")
+    assert entries["id_4"]["pruned"] is True
+    assert entries["id_0"]["pruned"] is False
@@ -1,13 +1,17 @@
 ##################################################
 # Import Own Assets
 ##################################################
-from hyperparameter_hunter.experiments import get_cv_indices
+from hyperparameter_hunter.experiments import get_cv_indices, select_columns, slice_fold_data
+from hyperparameter_hunter.experiments import _attach_fold_data, get_fold_indices
+from hyperparameter_hunter.experiments import FOLD_INDICES_CACHE
+from hyperparameter_hunter.utils.shared_memory_utils import SharedDataPlane
 
 ##################################################
 # Import Miscellaneous Assets
 ##################################################
 import numpy as np
 from numpy.testing import assert_equal
+import pandas as pd
 import pytest
 
 ##################################################
@@ -184,3 +188,126 @@ def test_get_cv_indices(folds, cv_params, input_data, target_data, expected_indi
     # assert_array_equal(result, expected_indices)
     result = list(list(_) for _ in get_cv_indices(folds, cv_params, input_data, target_data))
     assert_equal(result, expected_indices)
+
+
+##################################################
+# `get_fold_indices` Tests
+##################################################
+def test_get_fold_indices(tmpdir):
+    input_data = pd.DataFrame(dict(a=range(10)))
+    target_data = pd.Series(range(10))
+    cv_params = dict(n_splits=3, n_repeats=2, random_state=32)
+    expected = list(
+        list(_) for _ in get_cv_indices(RepeatedKFold(**cv_params), cv_params, input_data, None)
+    )
+    FOLD_INDICES_CACHE.clear()
+
+    result = get_fold_indices(
+        RepeatedKFold(**cv_params), cv_params, input_data, target_data, "key", str(tmpdir)
+    )
+    assert_equal(result, expected)
+    assert all(_.dtype == np.int32 for rep in result for fold in rep for _ in fold)
+    assert tmpdir.join("key.npz").check()
+
+    #################### Reuse Cached Indices ####################
+    assert get_fold_indices(None, cv_params, input_data, target_data, "key", str(tmpdir)) is result
+
+    #################### Read Saved Indices ####################
+    FOLD_INDICES_CACHE.clear()
+    saved = get_fold_indices(None, cv_params, input_data, target_data, "key", str(tmpdir))
+    assert saved is not result
+    assert_equal(saved, expected)
+
+
+def test_get_fold_indices_n_rows(tmpdir):
+    """Check that saved indices are not reused for datasets with a different number of rows"""
+    cv_params = dict(n_splits=3, n_repeats=2, random_state=32)
+    FOLD_INDICES_CACHE.clear()
+    for n_rows in [10, 12]:
+        input_data, target_data = pd.DataFrame(dict(a=range(n_rows))), pd.Series(range(n_rows))
+        expected = get_cv_indices(RepeatedKFold(**cv_params), cv_params, input_data, None)
+
+        result = get_fold_indices(
+            RepeatedKFold(**cv_params), cv_params, input_data, target_data, "key", str(tmpdir)
+        )
+        assert_equal(result, list(list(_) for _ in expected))
+
+        FOLD_INDICES_CACHE.clear()
+        saved = get_fold_indices(
+            RepeatedKFold(**cv_params), cv_params, input_data, target_data, "key", str(tmpdir)
+        )
+        assert_equal(saved, result)
+
+
+@pytest.mark.parametrize(
+    ["cv_type", "cv_params"],
+    [(KFold, dict(n_splits=3, shuffle=True)), (RepeatedKFold, dict(n_splits=3, n_repeats=2))],
+)
+def test_get_fold_indices_random_split(tmpdir, cv_type, cv_params):
+    """Check that indices of splitters that shuffle without a `random_state` are not cached"""
+    input_data, target_data = pd.DataFrame(dict(a=range(10))), pd.Series(range(10))
+    FOLD_INDICES_CACHE.clear()
+
+    get_fold_indices(cv_type(**cv_params), cv_params, input_data, target_data, "key", str(tmpdir))
+    assert len(FOLD_INDICES_CACHE) == 0
+    assert not tmpdir.join("key.npz").check()
+
+
+##################################################
+# `slice_fold_data` Tests
+##################################################
+@pytest.mark.parametrize(
+    "index",
+    [[0, 1, 2], [4, 5], [3, 1, 4], [0, 2, 4], []],
+    ids=["start", "end", "unsorted", "gaps", "empty"],
+)
+@pytest.mark.parametrize("do_copy", [False, True])
+def test_slice_fold_data(index, do_copy):
+    df = pd.DataFrame(dict(a=range(6), b=list("abcdef")))
+    result = slice_fold_data(df, np.array(index, dtype=int), do_copy=do_copy)
+    assert result.equals(df.iloc[index])
+
+
+def test_slice_fold_data_view():
+    df = pd.DataFrame(dict(a=np.arange(6, dtype=float)))
+    assert np.shares_memory(slice_fold_data(df, np.array([2, 3]))["a"].values, df["a"].values)
+    assert not np.shares_memory(
+        slice_fold_data(df, np.array([2, 3]), do_copy=True)["a"].values, df["a"].values
+    )
+
+
+##################################################
+# `select_columns` Tests
+##################################################
+def test_select_columns_memory_mapped():
+    array = np.arange(12, dtype=float).reshape(4, 3)
+    df = pd.DataFrame({_: array[:, i] for i, _ in enumerate("abc")}, copy=False)
+    df.attrs["memory_map"] = "train.npy"
+
+    selected = select_columns(df, ["c", "a"])
+    assert selected.equals(df.loc[:, ["c", "a"]])
+    assert selected.attrs == df.attrs
+    assert np.shares_memory(selected["c"].values, array)
+
+
+##################################################
+# `_attach_fold_data` Tests
+##################################################
+@pytest.mark.skipif(not SharedDataPlane.available, reason="Requires shared memory")
+@pytest.mark.parametrize("do_copy", [False, True])
+def test_attach_fold_data(do_copy):
+    input_data = pd.DataFrame(dict(a=np.arange(6, dtype=float), b=list("abcdef")))
+    target_data = pd.DataFrame(dict(t=[0, 1] * 3))
+    train_index, validation_index = np.array([0, 1, 4, 5]), np.array([2, 3])
+
+    with SharedDataPlane() as plane:
+        handles = [plane.publish_frame(input_data), plane.publish_frame(target_data)]
+        handles += plane.publish_arrays([train_index, validation_index])
+        fold_data = _attach_fold_data(*handles, do_copy=do_copy)
+
+        assert fold_data["train_input"].equals(input_data.iloc[train_index])
+        assert fold_data["validation_input"].equals(input_data.iloc[validation_index])
+        assert fold_data["train_target"].equals(target_data.iloc[train_index])
+        assert fold_data["validation_target"].equals(target_data.iloc[validation_index])
+        shared_a = handles[0].columns[0][1].attach()
+        assert np.shares_memory(fold_data["validation_input"]["a"].values, shared_a) is not do_copy
@@ -0,0 +1,250 @@
+##################################################
+# Import Own Assets
+##################################################
+from hyperparameter_hunter.utils.file_utils import (
+    add_to_json,
+    atomic_write,
+    downcast_dataset,
+    is_memory_mapped,
+    read_dataset,
+    read_json,
+    write_json,
+    read_predictions,
+    save_predictions,
+    validate_prediction_format,
+)
+
+##################################################
+# Import Miscellaneous Assets
+##################################################
+from multiprocessing import get_all_start_methods, get_context
+import numpy as np
+import os
+import pandas as pd
+import pytest
+
+
+##################################################
+# Dummy Objects for Testing
+##################################################
+def add_values(file_path, worker, n_values):
+    for i in range(n_values):
+        add_to_json(file_path, f"{worker}_{i}", key="values", append_value=True)
+
+
+##################################################
+# `add_to_json` Scenarios
+##################################################
+@pytest.mark.skipif("fork" not in get_all_start_methods(), reason="Requires 'fork' start method")
+def test_add_to_json_concurrent(tmpdir):
+    file_path = str(tmpdir.join("tested_keys.json"))
+    write_json(file_path, dict(values=[]))
+
+    processes = [
+        get_context("fork").Process(target=add_values, args=(file_path, worker, 25))
+        for worker in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    values = read_json(file_path)["values"]
+    assert sorted(values) == sorted(f"{w}_{i}" for w in range(4) for i in range(25))
+
+
+##################################################
+# `atomic_write` Scenarios
+##################################################
+def test_atomic_write(tmpdir):
+    file_path = str(tmpdir.join("file.txt"))
+    with atomic_write(file_path) as f:
+        f.write("new")
+    assert open(file_path).read() == "new"
+    assert os.listdir(str(tmpdir)) == ["file.txt"]
+
+
+def test_atomic_write_error(tmpdir):
+    file_path = str(tmpdir.join("file.txt"))
+    write_json(file_path, "old")
+
+    with pytest.raises(ValueError):
+        with atomic_write(file_path) as f:
+            f.write("partial")
+            raise ValueError()
+
+    assert read_json(file_path) == "old"
+    assert os.listdir(str(tmpdir)) == ["file.txt"]
+
+
+def test_atomic_write_missing_directory(tmpdir):
+    with pytest.raises(FileNotFoundError):
+        with atomic_write(str(tmpdir.join("missing", "file.txt"))) as f:
+            f.write("new")
+
+
+##################################################
+# Prediction File Scenarios
+##################################################
+@pytest.fixture()
+def predictions():
+    return pd.DataFrame(dict(id=["a", "b", "c"], target=[0.25, 0.5, 0.75]))
+
+
+@pytest.mark.parametrize("prediction_format", ["csv", "npz", "memmap"])
+def test_save_read_predictions(tmpdir, predictions, prediction_format):
+    kwargs = dict(index=False) if prediction_format == "csv" else dict()
+    file_path = str(tmpdir.join("exp_id"))
+    saved_path = save_predictions(predictions, file_path, prediction_format, "id", **kwargs)
+
+    assert os.path.splitext(saved_path)[1] != ""
+    # Find file by Experiment ID, regardless of extension
+    assert np.array_equal(read_predictions(file_path)["id"], predictions["id"])
+    assert np.allclose(read_predictions(saved_path)["target"], predictions["target"])
+
+
+@pytest.mark.parametrize("prediction_format", ["csv", "npz", "memmap"])
+def test_read_predictions_columns(tmpdir, predictions, prediction_format):
+    kwargs = dict(index=False) if prediction_format == "csv" else dict()
+    file_path = str(tmpdir.join("exp_id"))
+    save_predictions(predictions, file_path, prediction_format, "id", **kwargs)
+    assert list(read_predictions(file_path, columns=["target"]).columns) == ["target"]
+
+
+def test_save_predictions_memmap_float32(tmpdir, predictions):
+    file_path = save_predictions(predictions, str(tmpdir.join("exp_id")), "memmap", "id")
+    assert np.load(file_path, mmap_mode="r").dtype["target"] == np.float32
+
+
+@pytest.mark.parametrize("copy", [False, True])
+def test_read_predictions_memmap_copy(tmpdir, predictions, copy):
+    file_path = save_predictions(predictions, str(tmpdir.join("exp_id")), "memmap", "id")
+    target = read_predictions(file_path, copy=copy)["target"].values
+    # Views of the read-only memory map can't be written to
+    assert target.flags.writeable is copy
+    assert np.allclose(target, predictions["target"])
+
+
+def test_read_predictions_file_not_found(tmpdir):
+    with pytest.raises(FileNotFoundError):
+        read_predictions(str(tmpdir.join("missing")))
+
+
+def test_validate_prediction_format_value_error():
+    with pytest.raises(ValueError):
+        validate_prediction_format("hdf")
+
+
+##################################################
+# Dataset File Scenarios
+##################################################
+@pytest.fixture()
+def dataset():
+    return pd.DataFrame(dict(a=[1, 2, 3, 4], b=[0.5, 1.5, 2.5, 3.5], c=list("xxyx"), t=[0, 1] * 2))
+
+
+@pytest.fixture()
+def dataset_csv(tmpdir, dataset):
+    file_path = str(tmpdir.join("train.csv"))
+    dataset.to_csv(file_path, index=False)
+    return file_path
+
+
+def _fail_read_csv(*args, **kwargs):
+    raise AssertionError("Cached dataset should not be parsed again")
+
+
+@pytest.mark.parametrize("cache_key", ["mtime", "content"])
+def test_read_dataset_cache(tmpdir, monkeypatch, dataset, dataset_csv, cache_key):
+    cache_dir = str(tmpdir.join("DatasetCache"))
+    assert read_dataset(dataset_csv, cache_dir, cache_key=cache_key).equals(dataset)
+    assert len(os.listdir(cache_dir)) == 1
+
+    with monkeypatch.context() as m:
+        m.setattr(pd, "read_csv", _fail_read_csv)
+        assert read_dataset(dataset_csv, cache_dir, cache_key=cache_key).equals(dataset)
+
+
+def test_read_dataset_cache_invalidation(tmpdir, dataset, dataset_csv):
+    cache_dir = str(tmpdir.join("DatasetCache"))
+    read_dataset(dataset_csv, cache_dir)
+
+    dataset.iloc[0, 0] = 100
+    dataset.to_csv(dataset_csv, index=False)
+    stat = os.stat(dataset_csv)
+    os.utime(dataset_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    assert read_dataset(dataset_csv, cache_dir).equals(dataset)
+    assert len(os.listdir(cache_dir)) == 1  # The stale cache file was removed
+
+
+def test_read_dataset_cache_params(tmpdir, dataset_csv):
+    cache_dir = str(tmpdir.join("DatasetCache"))
+    read_dataset(dataset_csv, cache_dir)
+    cached = read_dataset(dataset_csv, cache_dir, downcast="all", exclude_columns=["t"])
+    assert cached.dtypes.astype(str).tolist() == ["int8", "float32", "object", "int64"]
+
+
+def test_read_dataset_parquet(tmpdir, monkeypatch, dataset):
+    pytest.importorskip("pyarrow")
+    file_path = str(tmpdir.join("train.parquet"))
+    dataset.to_parquet(file_path)
+
+    monkeypatch.setattr(pd, "read_csv", _fail_read_csv)
+    assert read_dataset(file_path).equals(dataset)
+
+
+@pytest.mark.parametrize(
+    "params", [dict(cache_format="hdf"), dict(cache_key="size"), dict(downcast="double")]
+)
+def test_read_dataset_value_error(dataset_csv, params):
+    with pytest.raises(ValueError, match="must be one of"):
+        read_dataset(dataset_csv, **params)
+
+
+def test_read_dataset_npy(tmpdir):
+    file_path = str(tmpdir.join("train.npy"))
+    np.save(file_path, np.arange(12, dtype=float).reshape(4, 3))
+
+    mapped = read_dataset(file_path, memory_map=True, columns=["a", "b", "t"])
+    assert is_memory_mapped(mapped)
+    assert mapped.columns.tolist() == ["a", "b", "t"]
+    assert mapped["b"].tolist() == [1.0, 4.0, 7.0, 10.0]
+    assert not is_memory_mapped(read_dataset(file_path, columns=["a", "b", "t"]))
+
+
+def test_read_dataset_npy_structured(tmpdir, dataset):
+    file_path = str(tmpdir.join("train.npy"))
+    np.save(file_path, dataset[["a", "b", "t"]].to_records(index=False))
+
+    mapped = read_dataset(file_path, memory_map=True)
+    assert is_memory_mapped(mapped)
+    assert mapped.equals(dataset[["a", "b", "t"]])
+
+
+def test_read_dataset_csv_memory_map(tmpdir, monkeypatch, dataset, dataset_csv):
+    pytest.importorskip("pyarrow")
+    cache_dir = str(tmpdir.join("DatasetCache"))
+    mapped = read_dataset(dataset_csv, cache_dir, cache_format="feather", memory_map=True)
+    assert is_memory_mapped(mapped)
+    assert mapped.equals(dataset)
+
+    with monkeypatch.context() as m:
+        m.setattr(pd, "read_csv", _fail_read_csv)
+        cached = read_dataset(dataset_csv, cache_dir, cache_format="feather", memory_map=True)
+        assert cached.equals(dataset)
+
+
+def test_read_dataset_memory_map_value_error(tmpdir, dataset_csv):
+    with pytest.raises(ValueError, match="memory_map requires"):
+        read_dataset(dataset_csv, str(tmpdir), memory_map=True)
+
+    file_path = str(tmpdir.join("train.npy"))
+    np.save(file_path, np.zeros((4, 2)))
+    with pytest.raises(ValueError, match="cannot be used with memory_map"):
+        read_dataset(file_path, memory_map=True, downcast="float")
+
+
+def test_downcast_dataset(dataset):
+    dataset = downcast_dataset(dataset, "all", categorical_threshold=0.5, exclude_columns=["t"])
+    assert dataset.dtypes.astype(str).tolist() == ["int8", "float32", "category", "int64"]
@@ -1,6 +1,7 @@
 ##################################################
 # Import Own Assets
 ##################################################
+from hyperparameter_hunter.utils.general_utils import LRUCache
 from hyperparameter_hunter.utils.general_utils import to_standard_string, standard_equality
 
 ###############################################
@@ -33,3 +34,32 @@ def test_to_standard_string(string, expected_string):
 )
 def test_standard_equality(string_1, string_2, expected_equality):
     assert standard_equality(string_1, string_2) is expected_equality
+
+
+###############################################
+# `LRUCache` Scenarios
+###############################################
+def test_lru_cache_eviction():
+    cache, made = LRUCache(max_size=2), []
+    make = lambda _: lambda: made.append(_) or _
+
+    assert [cache.get_or_set(_, make(_)) for _ in ["a", "b", "a", "c", "a"]] == list("abaca")
+    assert made == ["a", "b", "c"]
+    assert "b" not in cache and len(cache) == 2
+
+    cache.max_size = 1
+    cache.get_or_set("d", make("d"))
+    assert "d" in cache and len(cache) == 1
+
+
+def test_lru_cache_failed_value():
+    cache = LRUCache(max_size=2)
+    with pytest.raises(ZeroDivisionError):
+        cache.get_or_set("a", lambda: 1 / 0)
+    assert "a" not in cache
+
+
+def test_lru_cache_disabled():
+    cache = LRUCache(max_size=0)
+    assert cache.get_or_set("a", lambda: 1) == 1
+    assert len(cache) == 0
@@ -104,15 +104,22 @@ scenarios_dict = [
     [dict(foo=10, bar=20), "9HnwEsXdYmfufzs6He31LRWV03wnLltwkgHh-AKG3Ko="],
     [dict(bar=20, foo=10), "9HnwEsXdYmfufzs6He31LRWV03wnLltwkgHh-AKG3Ko="],
 ]
+df_foo_bar = pd.DataFrame(data=[[10, 15], [20, 25]], columns=["foo", "bar"])
 scenarios_dataframe = [
-    [pd.DataFrame(), "_EMr0fJ5U8Z5MetmSTxLIrBChcdGLN2RM1Nlh6H1HSg="],
+    # Equal contents hash equally, regardless of object identity
+    [df_foo_bar, df_foo_bar.copy(), True],
+    [pd.DataFrame(), pd.DataFrame(), True],
+    # Column names, column order, index, values, and dtypes are all hashed
+    [df_foo_bar, df_foo_bar.rename(columns=dict(foo="baz")), False],
+    [df_foo_bar, df_foo_bar[["bar", "foo"]], False],
+    [df_foo_bar, df_foo_bar.set_index(pd.Index([1, 2])), False],
+    [df_foo_bar, df_foo_bar.replace(25, 26), False],
+    [df_foo_bar, df_foo_bar.astype(float), False],
+    # Values hidden from the truncated `repr` of large DataFrames are hashed
     [
-        pd.DataFrame(data=[[10, 15], [20, 25]], columns=["foo", "bar"]),
-        "CtUj-FraurT-ppSV5q-MN-FGiG4-NZw_WpmIssbqal8=",
-    ],
-    [
-        pd.DataFrame(data=[[10, 15], [20, 25]], columns=["bar", "foo"]),
-        "yFS_JgF__tIUVIvQta7C89zzSvkNNqAWQY8aLNxQeVk=",
+        pd.DataFrame(dict(a=range(10_000))),
+        pd.DataFrame(dict(a=range(10_000))).replace(5000, 0),
+        False,
     ],
 ]
 # FLAG: Below test cases are highly sensitive. Any changes to declarations above (including comments), ...
@@ -194,9 +201,21 @@ def test_make_hash_sha256_dict(obj, expected):
     assert key_handler.make_hash_sha256(obj) == expected
 
 
-@pytest.mark.parametrize(["obj", "expected"], **args_ids_for(scenarios_dataframe))
-def test_make_hash_sha256_dataframe(obj, expected):
-    assert key_handler.make_hash_sha256(obj) == expected
+@pytest.mark.parametrize(["df_0", "df_1", "expected"], **args_ids_for(scenarios_dataframe))
+def test_make_hash_sha256_dataframe(df_0, df_1, expected):
+    assert (key_handler.make_hash_sha256(df_0) == key_handler.make_hash_sha256(df_1)) is expected
+
+
+def test_hash_dataframe_chunk_size():
+    df = pd.DataFrame(dict(a=range(1000), b=[str(_) for _ in range(1000)]))
+    assert key_handler.hash_dataframe(df.copy(), chunk_size=7) == key_handler.hash_dataframe(df)
+
+
+def test_hash_dataframe_cached(monkeypatch):
+    df = pd.DataFrame(dict(a=range(10)))
+    df_hash = key_handler.hash_dataframe(df)
+    monkeypatch.setattr(pd.util, "hash_pandas_object", None)  # Would raise TypeError if called
+    assert key_handler.hash_dataframe(df) == df_hash
 
 
 @pytest.mark.parametrize(["obj", "expected"], **args_ids_for(scenarios_lambda))
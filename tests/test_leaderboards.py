@@ -0,0 +1,122 @@
+##################################################
+# Import Own Assets
+##################################################
+from hyperparameter_hunter.leaderboards import (
+    compact_leaderboard,
+    GlobalLeaderboard,
+    LeaderboardLog,
+)
+
+##################################################
+# Import Miscellaneous Assets
+##################################################
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+import pytest
+
+
+##################################################
+# Dummy Objects for Testing
+##################################################
+def make_entry(experiment_id, evaluations):
+    entry = OrderedDict(evaluations)
+    entry["experiment_id"] = experiment_id
+    entry["hyperparameter_key"] = f"h_{experiment_id}"
+    entry["cross_experiment_key"] = "c"
+    entry["algorithm_name"] = "SVC"
+    return entry
+
+
+entry_0 = make_entry("id_0", [("oof_roc_auc_score", np.float64(0.7))])
+entry_1 = make_entry("id_1", [("oof_roc_auc_score", 0.9)])
+entry_2 = make_entry("id_2", [("oof_roc_auc_score", 0.8), ("holdout_roc_auc_score", 0.6)])
+entry_3 = make_entry("id_3", [("oof_roc_auc_score", 0.8)])
+
+
+@pytest.fixture(scope="function", autouse=False)
+def paths(tmpdir):
+    leaderboards_dir = tmpdir.join("Leaderboards")
+    return str(leaderboards_dir.join("GlobalLeaderboard.csv")), str(leaderboards_dir.join("Log"))
+
+
+##################################################
+# `LeaderboardLog` Scenarios
+##################################################
+def test_leaderboard_log(paths):
+    log = LeaderboardLog(paths[1])
+    assert log.read() == []
+
+    log.append(entry_0)
+    log.append(entry_2)
+    entries = log.read()
+    assert entries == [entry_0, entry_2]
+    assert list(entries[1].keys()) == list(entry_2.keys())
+
+    log.clear()
+    assert log.read() == []
+    log.clear()
+
+
+##################################################
+# `compact_leaderboard` Scenarios
+##################################################
+def test_compact_leaderboard_empty_log(paths):
+    assert compact_leaderboard(*paths) is None
+    assert GlobalLeaderboard.from_path(paths[0]).data.empty
+
+
+def test_compact_leaderboard(paths):
+    log = LeaderboardLog(paths[1])
+    for entry in [entry_0, entry_1]:
+        log.append(entry)
+    compact_leaderboard(*paths)
+
+    for entry in [entry_2, entry_3]:
+        log.append(entry)
+    leaderboard = compact_leaderboard(*paths)
+    assert log.read() == []
+
+    data = pd.read_csv(paths[0])
+    pd.testing.assert_frame_equal(data, leaderboard.data.reset_index(drop=True))
+    assert list(data.columns) == [
+        "oof_roc_auc_score",
+        "holdout_roc_auc_score",
+        "experiment_id",
+        "hyperparameter_key",
+        "cross_experiment_key",
+        "algorithm_name",
+        "experiment_#",
+    ]
+    assert data["experiment_id"].tolist() == ["id_1", "id_3", "id_2", "id_0"]
+    assert data["experiment_#"].tolist() == [1, 3, 2, 0]
+    assert data["holdout_roc_auc_score"].isnull().tolist() == [True, True, False, True]
+
+
+def test_compact_leaderboard_ascending(paths):
+    log = LeaderboardLog(paths[1])
+    for entry in [entry_0, entry_1, entry_2, entry_3]:
+        log.append(entry)
+    compact_leaderboard(*paths, ascending=True)
+    assert pd.read_csv(paths[0])["experiment_id"].tolist() == ["id_0", "id_3", "id_2", "id_1"]
+
+
+def test_compact_leaderboard_idempotent(paths):
+    """Check that entries left in the log after they were merged are not merged again"""
+    log = LeaderboardLog(paths[1])
+    for entry in [entry_0, entry_1]:
+        log.append(entry)
+    compact_leaderboard(*paths)
+
+    # Simulate a process stopped after saving the leaderboard, but before clearing the log
+    for entry in [entry_0, entry_1, entry_2, entry_2]:
+        log.append(entry)
+    leaderboard = compact_leaderboard(*paths)
+    assert sorted(leaderboard.data["experiment_id"]) == ["id_0", "id_1", "id_2"]
+    assert log.read() == []
+
+    log.append(entry_1)
+    assert compact_leaderboard(*paths) is None
+    assert log.read() == []
+    assert len(pd.read_csv(paths[0])) == 3
+
@@ -2,16 +2,25 @@
 # Import Own Assets
 ##################################################
 from hyperparameter_hunter.utils.optimization_utils import (
+    AskingOptimizer,
     does_fit_in_space,
+    filter_by_guidelines,
     filter_by_space,
+    flatten_hyperparameters,
     get_choice_dimensions,
+    get_hyperband_brackets,
+    get_hyperparameter_table,
     get_ids_by,
+    MAPPING,
+    MISSING,
+    SEQUENCE,
 )
 from hyperparameter_hunter.space import Real, Integer, Categorical, Space
 
 ##################################################
 # Import Miscellaneous Assets
 ##################################################
+import numpy as np
 import pytest
 
 ##################################################
@@ -116,6 +125,21 @@ def test_filter_by_space(space_fixture, scored_hyperparameters, expected):
     assert filter_by_space(scored_hyperparameters, space_fixture) == expected
 
 
+sh_2 = (dict(model_init_params=dict(a=None, b=dict(c="bar")), model_extra_params=dict(e=16)), 2)
+sh_3 = (dict(model_init_params=dict(a="0.5", b=dict(c="bar")), model_extra_params=dict(e=16)), 3)
+sh_4 = (dict(model_init_params=dict(a=0.9, b=dict(c="bar")), model_extra_params=dict(e=12)), 4)
+sh_5 = (dict(model_init_params=dict(a=0.1, b=dict(c=["bar"])), model_extra_params=dict(e=18)), 5)
+sh_6 = (dict(model_init_params=dict(a=0.1, b=dict(c="bar")), model_extra_params=dict()), 6)
+sh_7 = (dict(model_init_params=dict(a=True, b=dict(c="baz")), model_extra_params=dict(e=12.0)), 7)
+
+
+def test_filter_by_space_matches_does_fit_in_space(space_fixture):
+    scored_hyperparameters = [sh_0, sh_1, sh_2, sh_3, sh_4, sh_5, sh_6, sh_7]
+    expected = [_ for _ in scored_hyperparameters if does_fit_in_space(_[0], space_fixture)]
+    assert expected == [sh_0, sh_4]
+    assert filter_by_space(scored_hyperparameters, space_fixture) == expected
+
+
 # TODO: Add more tests dealing with Keras-specific issues like layers, callbacks and initializers
 ##################################################
 # `does_fit_in_space` Scenarios
@@ -125,3 +149,239 @@ def test_filter_by_space(space_fixture, scored_hyperparameters, expected):
 )
 def test_does_fit_in_space(space_fixture, params, does_fit):
     assert does_fit_in_space(params, space_fixture) is does_fit
+
+
+##################################################
+# `flatten_hyperparameters` Scenarios
+##################################################
+scenarios_flatten_hyperparameters = [
+    (dict(), {(): MAPPING}),
+    (dict(a=1, b=None), {(): MAPPING, ("a",): 1, ("b",): None}),
+    (
+        dict(a=dict(b=[1, (2, "x")], c={}), d="foo"),
+        {
+            (): MAPPING,
+            ("a",): MAPPING,
+            ("a", "b"): SEQUENCE,
+            ("a", "b", 0): 1,
+            ("a", "b", 1): SEQUENCE,
+            ("a", "b", 1, 0): 2,
+            ("a", "b", 1, 1): "x",
+            ("a", "c"): MAPPING,
+            ("d",): "foo",
+        },
+    ),
+]
+
+
+@pytest.mark.parametrize(["params", "expected"], **args_ids_for(scenarios_flatten_hyperparameters))
+def test_flatten_hyperparameters(params, expected):
+    assert flatten_hyperparameters(params) == expected
+
+
+def test_flatten_hyperparameters_drop_prune():
+    params = dict(a=dict(b=dict(verbose=True), c={}), verbose=False, d=dict(e={}))
+    flat = flatten_hyperparameters(
+        params, drop=lambda path: path[-1] == "verbose", prune=lambda path: path[:1] == ("a",)
+    )
+    assert flat == {(): MAPPING, ("d",): MAPPING, ("d", "e"): MAPPING}
+
+
+def test_get_hyperparameter_table():
+    table = get_hyperparameter_table([dict(a=1, b=dict(c="x")), dict(a=None, d=[2])])
+    assert list(table.columns) == [(), ("a",), ("b",), ("b", "c"), ("d",), ("d", 0)]
+    assert table[("a",)].tolist() == [1, None]
+    assert table[("b", "c")].tolist() == ["x", MISSING]
+    assert table[("d",)].tolist() == [MISSING, SEQUENCE]
+
+
+def test_get_hyperparameter_table_paths():
+    table = get_hyperparameter_table(
+        [dict(a=1, b=dict(c="x")), dict(a=None, b=[2])], paths=[("b", "c"), ("b",), ("e",)]
+    )
+    assert list(table.columns) == [("b", "c"), ("b",), ("e",)]
+    assert table[("b", "c")].tolist() == ["x", MISSING]
+    assert table[("b",)].tolist() == [dict(c="x"), [2]]
+    assert table[("e",)].tolist() == [MISSING, MISSING]
+
+
+##################################################
+# `filter_by_guidelines` Scenarios
+##################################################
+def _guidelines(model_init_params, model_extra_params=None):
+    return dict(
+        model_init_params=model_init_params,
+        model_extra_params=model_extra_params,
+        preprocessing_pipeline=None,
+        preprocessing_params=None,
+        feature_selector=None,
+    )
+
+
+def _scored(i, model_init_params, model_extra_params=None):
+    hyperparameters = dict(
+        model_init_params=model_init_params,
+        model_extra_params=model_extra_params or {},
+        preprocessing_pipeline={},
+        preprocessing_params={},
+        feature_selector=[],
+    )
+    return (hyperparameters, i)
+
+
+gh_0 = _scored(0, dict(a=0.5, b=dict(c="bar", d=9), g=[1, 2]))
+gh_1 = _scored(1, dict(a=0.3, b=dict(c="foo", d=9), g=[1, 2], verbose=2, random_state=32))
+gh_2 = _scored(2, dict(a=0.5, b=dict(c="bar", d=8), g=[1, 2]))
+gh_3 = _scored(3, dict(a=0.5, b=dict(c="bar", d=9), g=[1, 2, 3]))
+gh_4 = _scored(4, dict(a=0.5, b=dict(c="bar", d=9), g=[1, 2]), dict(fit=dict(verbose=True)))
+gh_5 = _scored(5, dict(a=0.5, b=dict(c="bar", d=9), g=[1, 2]), dict(fit=dict(epochs=5)))
+gh_6 = _scored(6, dict(a=0.5, b=dict(c="bar", d=9), g=[1, 2], h=None))
+gh_7 = _scored(7, dict(a=0.5, b=dict(c="bar", d=9.0), g=[1, 2], n_jobs=4))
+
+
+@pytest.mark.parametrize(
+    ["guidelines", "expected"],
+    [
+        (_guidelines(dict(b=dict(d=9), g=(1, 2))), [gh_0, gh_1, gh_4, gh_7]),
+        (_guidelines(dict(b=dict(d=9), g=[1, 2]), dict(fit=dict(epochs=5))), [gh_5]),
+        (_guidelines(dict(b=dict(d=9), g=[1, 2], h=None)), [gh_6]),
+        (_guidelines(dict(b=dict(d=8), g=[1, 2], verbose=1)), [gh_2]),
+        (_guidelines(dict(b=dict(d=9), g=[1, 2, 3])), [gh_3]),
+        (_guidelines(dict(b=dict(d=9), g=[1, 2], e="not_in_any")), []),
+    ],
+)
+def test_filter_by_guidelines(space_fixture, guidelines, expected):
+    scored_hyperparameters = [gh_0, gh_1, gh_2, gh_3, gh_4, gh_5, gh_6, gh_7]
+    assert filter_by_guidelines(scored_hyperparameters, space_fixture, **guidelines) == expected
+
+
+##################################################
+# AskingOptimizer Scenarios
+##################################################
+def test_asking_optimizer_batch_tell():
+    """Check that telling many points at once fits the surrogate model only once"""
+    space = Space([Real(0.0, 1.0), Integer(1, 10)])
+    optimizer = AskingOptimizer(space, base_estimator="GP", n_initial_points=3, random_state=32)
+    points = [[0.1 * _, _ + 1] for _ in range(8)]
+    scores = [(_ - 4) ** 2 for _ in range(8)]
+
+    result = optimizer.tell(points, scores, fit=True)
+    assert optimizer.Xi == points
+    assert optimizer.yi == scores
+    assert len(optimizer.models) == 1
+    assert result.fun == 0
+
+
+@pytest.mark.parametrize("acq_func", ["EIps", "PIps"])
+def test_asking_optimizer_per_second(acq_func):
+    """Check that per-second acquisition functions learn log times, but compare only objectives"""
+    space = Space([Real(0.0, 1.0), Integer(1, 10)])
+    optimizer = AskingOptimizer(
+        space, base_estimator="GP", n_initial_points=3, acq_func=acq_func, random_state=32
+    )
+    points = [[0.1 * _, _ + 1] for _ in range(6)]
+    scores = [(_ - 4) ** 2 for _ in range(6)]
+    times = [float(_ + 1) for _ in range(6)]
+
+    optimizer.tell(points, [[s, t] for s, t in zip(scores, times)], fit=True)
+    assert optimizer.objective_values == scores
+    assert [_[1] for _ in optimizer.yi] == pytest.approx(list(np.log(times)))
+    assert len(optimizer.models) == 1
+
+    asked = optimizer.ask(n_points=2)
+    assert len(asked) == 2
+    assert all(_ in space for _ in asked)
+    assert len(optimizer.yi) == 6  # Constant liar points are only told to a copy
+
+
+@pytest.mark.parametrize(
+    ["strategy", "expected"], [("cl_min", (0, 0.0)), ("cl_max", (16, np.log(6.0)))]
+)
+def test_asking_optimizer_per_second_lies(monkeypatch, strategy, expected):
+    """Check that per-second lies are computed from the objective values and the log times apart"""
+    space = Space([Real(0.0, 1.0), Integer(1, 10)])
+    optimizer = AskingOptimizer(
+        space, base_estimator="GP", n_initial_points=3, acq_func="EIps", random_state=32
+    )
+    points = [[0.1 * _, _ + 1] for _ in range(6)]
+    optimizer.tell(points, [[(_ - 4) ** 2, float(_ + 1)] for _ in range(6)], fit=True)
+    assert np.min(optimizer.yi) == 0
+
+    lies, _tell = [], AskingOptimizer._tell
+
+    def _spy_tell(self, x, y, fit=True):
+        if np.ndim(x) == 1:  # Skip the observed points told to the copy that is lied to
+            lies.append(y)
+        return _tell(self, x, y, fit=fit)
+
+    monkeypatch.setattr(AskingOptimizer, "_tell", _spy_tell)
+    optimizer.ask(n_points=2, strategy=strategy)
+    assert len(lies) == 2
+    assert all(_ == pytest.approx(expected) for _ in lies)
+
+
+def test_asking_optimizer_is_evaluated():
+    space = Space([Real(0.0, 1.0), Integer(1, 10), Categorical(["a", "b"])])
+    optimizer = AskingOptimizer(space, base_estimator="GP", n_initial_points=3, random_state=32)
+    optimizer.tell([[0.5, 2, "a"], [0.25, 3, "b"]], [1.0, 2.0], fit=False)
+
+    assert optimizer.is_evaluated([0.5, 2, "a"])
+    assert optimizer.is_evaluated((0.25, np.int64(3), "b"))
+    assert optimizer.is_evaluated([0.5 + 1e-10, 2, "a"])  # Within distance of 1e-8
+    assert not optimizer.is_evaluated([0.5, 2, "b"])
+    assert not optimizer.is_evaluated([0.5 + 1e-6, 2, "a"])
+
+    optimizer.tell([0.75, 4, "a"], 3.0, fit=False)  # The index is updated as points are told
+    assert optimizer.is_evaluated([0.75, 4, "a"])
+
+
+def test_asking_optimizer_repeated_ask():
+    """Check that a repeated point suggested by the surrogate model is replaced by an unevaluated
+    candidate, without refitting the surrogate model"""
+    space = Space([Real(0.0, 1.0), Integer(1, 10)])
+    optimizer = AskingOptimizer(space, base_estimator="GP", n_initial_points=3, random_state=32)
+    optimizer.tell([[0.1 * _, _ + 1] for _ in range(8)], [(_ - 4) ** 2 for _ in range(8)])
+
+    optimizer._next_x = optimizer.Xi[4]
+    asked = optimizer.ask()
+    assert asked in space
+    assert not optimizer.is_evaluated(asked)
+    assert len(optimizer.models) == 1
+    assert len(optimizer.Xi) == 8
+
+
+##################################################
+# `get_hyperband_brackets` Scenarios
+##################################################
+@pytest.mark.parametrize(
+    ["min_budget", "max_budget", "reduction_factor", "expected"],
+    [
+        (10, 90, 3, [[(9, 10), (3, 30), (1, 90)], [(5, 30), (1, 90)], [(3, 90)]]),
+        (
+            10,
+            270,
+            3,
+            [
+                [(27, 10), (9, 30), (3, 90), (1, 270)],
+                [(12, 30), (4, 90), (1, 270)],
+                [(6, 90), (2, 270)],
+                [(4, 270)],
+            ],
+        ),
+        (1, 10, 3, [[(9, 1), (3, 3), (1, 10)], [(5, 3), (1, 10)], [(3, 10)]]),
+        (2, 8, 2, [[(4, 2), (2, 4), (1, 8)], [(3, 4), (1, 8)], [(3, 8)]]),
+        (5, 5, 3, [[(1, 5)]]),
+    ],
+)
+def test_get_hyperband_brackets(min_budget, max_budget, reduction_factor, expected):
+    assert get_hyperband_brackets(min_budget, max_budget, reduction_factor) == expected
+
+
+def test_get_hyperband_brackets_fractions():
+    brackets = get_hyperband_brackets(1 / 9, 1.0, 3, integer=False)
+    assert [[_[0] for _ in bracket] for bracket in brackets] == [[9, 3, 1], [5, 1], [3]]
+    assert [[_[1] for _ in bracket] for bracket in brackets] == [
+        [pytest.approx(1 / 9), pytest.approx(1 / 3), 1.0],
+        [pytest.approx(1 / 3), 1.0],
+        [1.0],
+    ]
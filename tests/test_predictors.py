@@ -0,0 +1,83 @@
+##################################################
+# Import Own Assets
+##################################################
+from hyperparameter_hunter.callbacks.predictors import (
+    _PredictionAccumulator,
+    _format_prediction_values,
+)
+
+##################################################
+# Import Miscellaneous Assets
+##################################################
+import numpy as np
+from numpy.testing import assert_array_equal, assert_allclose
+import pytest
+
+
+##################################################
+# `_format_prediction_values` Scenarios
+##################################################
+@pytest.mark.parametrize(
+    ["predictions", "target_column", "expected"],
+    [
+        (np.array([0, 1, 1]), ["t"], [[0.0], [1.0], [1.0]]),
+        (np.array([[0.5], [0.25]]), ["t"], [[0.5], [0.25]]),
+        (np.array([0, 2, 1]), ["a", "b", "c"], [[1, 0, 0], [0, 0, 1], [0, 1, 0]]),
+        (np.array([[0.1, 0.9], [0.8, 0.2]]), ["a", "b"], [[0.1, 0.9], [0.8, 0.2]]),
+    ],
+)
+def test_format_prediction_values(predictions, target_column, expected):
+    result = _format_prediction_values(predictions, target_column)
+    assert result.dtype == np.float64
+    assert_array_equal(result, expected)
+
+
+##################################################
+# `_PredictionAccumulator` Scenarios
+##################################################
+def test_prediction_accumulator():
+    n_repeats, n_splits, runs = 2, 3, 2
+    accumulator = _PredictionAccumulator(4, ["t"])
+    expected = 0
+
+    for rep in range(n_repeats):
+        accumulator.reset("repetition")
+        for fold in range(n_splits):
+            accumulator.reset("fold")
+            for run in range(runs):
+                predictions = np.arange(4) * (rep + fold + run)
+                run_frame = accumulator.add_run(predictions)
+                assert_array_equal(run_frame.values[:, 0], predictions)
+                expected = expected + predictions / (runs * n_splits * n_repeats)
+            accumulator.end_fold(runs)
+            assert_allclose(
+                accumulator.frame("fold").values[:, 0], np.arange(4) * (rep + fold + 0.5)
+            )
+        accumulator.end_repetition(n_splits)
+        assert_allclose(accumulator.frame("repetition").values[:, 0], np.arange(4) * (rep + 1.5))
+    accumulator.end_experiment(n_repeats)
+    assert_allclose(accumulator.frame("final").values[:, 0], expected)
+
+
+def test_prediction_accumulator_frame_copy():
+    """Check that DataFrames of an accumulator's values are unaffected by its in-place updates"""
+    accumulator = _PredictionAccumulator(3, ["t"])
+    fold_frame = accumulator.reset("fold")
+    accumulator.add_run(np.array([1.0, 2.0, 3.0]))
+
+    assert not np.shares_memory(fold_frame.values, accumulator.values["fold"])
+    assert_array_equal(fold_frame.values[:, 0], [0, 0, 0])
+    assert_array_equal(accumulator.frame("fold").values[:, 0], [1, 2, 3])
+
+
+def test_prediction_accumulator_index():
+    """Check that runs added with `index` only accumulate into the rows at positions `index`"""
+    accumulator = _PredictionAccumulator(5, ["t"])
+    accumulator.reset("fold")
+
+    for predictions in [np.array([1.0, 2.0]), np.array([3.0, 4.0])]:
+        run_view = accumulator.add_run(predictions, index=[1, 3])
+        assert_array_equal(run_view.index, [1, 3])
+        assert_array_equal(run_view.values[:, 0], predictions)
+
+    assert_array_equal(accumulator.values["fold"][:, 0], [0, 4, 0, 6, 0])
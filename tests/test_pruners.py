@@ -0,0 +1,125 @@
+##################################################
+# Import Own Assets
+##################################################
+from hyperparameter_hunter.pruners import MedianPruner, PercentilePruner, SuccessiveHalvingPruner
+
+##################################################
+# Import Miscellaneous Assets
+##################################################
+import pytest
+
+
+def _fill_history(pruner, experiments):
+    """Report the interim scores of each completed Experiment in `experiments` to `pruner`"""
+    for scores in experiments:
+        pruner.start_experiment()
+        for step, score in enumerate(scores, start=1):
+            pruner.report(step, score)
+        pruner.end_experiment()
+    pruner.start_experiment()
+    return pruner
+
+
+##################################################
+# MedianPruner Scenarios
+##################################################
+@pytest.mark.parametrize(
+    ["do_maximize", "score", "expected"],
+    [(True, 0.55, True), (True, 0.65, False), (False, 0.55, False), (False, 0.65, True)],
+)
+def test_median_pruner(do_maximize, score, expected):
+    pruner = MedianPruner(n_startup_experiments=3)
+    pruner.do_maximize = do_maximize
+    _fill_history(pruner, [[0.5, 0.5], [0.6, 0.6], [0.7, 0.7]])
+    assert pruner.report(1, score) is expected
+
+
+def test_median_pruner_startup():
+    pruner = _fill_history(MedianPruner(n_startup_experiments=4), [[0.5], [0.6], [0.7]])
+    assert pruner.report(1, 0.1) is False
+
+
+def test_median_pruner_warmup():
+    pruner = _fill_history(MedianPruner(1, n_warmup_steps=1), [[0.5, 0.5], [0.7, 0.7]])
+    assert pruner.report(1, 0.1) is False
+    assert pruner.report(2, 0.1) is True
+
+
+def test_pruner_without_history_at_step():
+    pruner = _fill_history(MedianPruner(n_startup_experiments=1), [[0.5]])
+    assert pruner.report(2, 0.1) is False
+
+
+def test_pruner_nan_score():
+    pruner = _fill_history(MedianPruner(n_startup_experiments=1), [[0.5]])
+    assert pruner.report(1, float("nan")) is True
+
+
+##################################################
+# PercentilePruner Scenarios
+##################################################
+@pytest.mark.parametrize(
+    ["percentile", "score", "expected"],
+    [(25.0, 0.7, True), (25.0, 0.8, False), (90.0, 0.2, False), (90.0, 0.05, True)],
+)
+def test_percentile_pruner(percentile, score, expected):
+    history = [[_ / 10] for _ in range(11)]
+    pruner = _fill_history(PercentilePruner(percentile, n_startup_experiments=1), history)
+    assert pruner.report(1, score) is expected
+
+
+@pytest.mark.parametrize("percentile", [0, -5, 100.5])
+def test_percentile_pruner_invalid(percentile):
+    with pytest.raises(ValueError, match="percentile must be in the range"):
+        PercentilePruner(percentile)
+
+
+##################################################
+# SuccessiveHalvingPruner Scenarios
+##################################################
+@pytest.mark.parametrize(
+    ["min_steps", "reduction_factor", "expected"],
+    [(1, 3, [1, 3, 9]), (2, 2, [2, 4, 8]), (3, 3, [3, 9])],
+)
+def test_successive_halving_rungs(min_steps, reduction_factor, expected):
+    pruner = SuccessiveHalvingPruner(min_steps=min_steps, reduction_factor=reduction_factor)
+    assert [_ for _ in range(1, 10) if pruner.is_rung(_)] == expected
+
+
+def test_successive_halving_pruner():
+    history = [[0.1, 0.1, 0.1], [0.2, 0.2, 0.2], [0.3, 0.3, 0.3], [0.4, 0.4, 0.4]]
+    pruner = _fill_history(SuccessiveHalvingPruner(reduction_factor=2), history)
+    assert pruner.report(1, 0.35) is False  # Top 2 of 5 at rung 1
+    assert pruner.report(3, 0.05) is False  # Not a rung
+    assert pruner.report(4, 0.05) is False  # No history at step 4
+    assert pruner.report(1, 0.25) is True
+
+
+##################################################
+# Penalized Score Scenarios
+##################################################
+@pytest.mark.parametrize(
+    ["do_maximize", "score", "expected"],
+    [(True, 0.55, 0.5), (True, 0.45, 0.45), (False, 0.65, 0.7), (False, 0.75, 0.75)],
+)
+def test_penalized_score(do_maximize, score, expected):
+    pruner = MedianPruner(n_startup_experiments=1)
+    pruner.do_maximize = do_maximize
+    _fill_history(pruner, [[0.5], [0.7]])
+    assert pruner.penalized_score(1, score) == expected
+
+
+def test_end_experiment_worker_scores():
+    """Check that interim scores reported to a worker's copy of a Pruner can be added to history"""
+    pruner = _fill_history(MedianPruner(n_startup_experiments=1), [[0.5, 0.6]])
+    pruner.end_experiment({1: 0.7, 2: 0.8})
+    assert pruner.history == {1: [0.5, 0.7], 2: [0.6, 0.8]}
+    assert pruner.n_experiments == 2
+
+
+def test_pruner_repr():
+    assert repr(MedianPruner(2, 1)) == "MedianPruner(n_startup_experiments=2, n_warmup_steps=1)"
+    assert repr(SuccessiveHalvingPruner()) == (
+        "SuccessiveHalvingPruner(min_steps=1, reduction_factor=3, n_startup_experiments=0, "
+        "n_warmup_steps=0)"
+    )
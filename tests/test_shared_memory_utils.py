@@ -0,0 +1,99 @@
+##################################################
+# Import Own Assets
+##################################################
+from hyperparameter_hunter.utils.file_utils import read_dataset
+from hyperparameter_hunter.utils.shared_memory_utils import (
+    MappedFrame,
+    SharedDataPlane,
+    SharedFrame,
+)
+
+##################################################
+# Import Miscellaneous Assets
+##################################################
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_all_start_methods, get_context
+import numpy as np
+import pandas as pd
+import pickle
+import pytest
+
+pytestmark = pytest.mark.skipif(not SharedDataPlane.available, reason="Requires shared memory")
+
+
+##################################################
+# Dummy Objects for Testing
+##################################################
+@pytest.fixture()
+def dataset():
+    data = dict(a=[1, 2, 3, 4], b=[0.5, 1.5, 2.5, 3.5], c=list("wxyz"))
+    return pd.DataFrame(dict(data, d=pd.Categorical(list("xxyx"))), index=[10, 20, 30, 40])
+
+
+def _attach_sum(handle, column):
+    return handle.attach()[column].sum()
+
+
+##################################################
+# SharedDataPlane Scenarios
+##################################################
+def test_publish_arrays():
+    arrays = [np.arange(5), np.linspace(0, 1, 3), np.array([True, False])]
+
+    with SharedDataPlane() as plane:
+        handles = plane.publish_arrays(arrays)
+        for array, handle in zip(arrays, handles):
+            attached = handle.attach()
+            np.testing.assert_array_equal(attached, array)
+            assert attached.dtype == array.dtype
+            assert not attached.flags.writeable
+
+    assert plane.segments == []
+
+
+def test_publish_frame(dataset):
+    with SharedDataPlane() as plane:
+        handle = plane.publish_frame(dataset)
+        assert isinstance(handle, SharedFrame)
+        assert pickle.loads(pickle.dumps(handle)).attach().equals(dataset)
+
+
+@pytest.mark.skipif("fork" not in get_all_start_methods(), reason="Requires 'fork' start method")
+def test_publish_frame_workers(dataset):
+    executor = ProcessPoolExecutor(max_workers=2, mp_context=get_context("fork"))
+    with SharedDataPlane() as plane, executor:
+        handle = plane.publish_frame(dataset)
+        futures = [executor.submit(_attach_sum, handle, _) for _ in ["a", "b"]]
+        assert [_.result() for _ in futures] == [10, 8.0]
+
+
+def test_publish_frame_memory_mapped(tmpdir):
+    file_path = str(tmpdir.join("train.npy"))
+    np.save(file_path, np.arange(12, dtype=float).reshape(4, 3))
+    dataset = read_dataset(file_path, memory_map=True, columns=["a", "b", "t"])
+
+    with SharedDataPlane() as plane:
+        handle = plane.publish_frame(dataset[["t", "a"]])
+        assert isinstance(handle, MappedFrame)
+        assert plane.segments == []
+        assert handle.attach().equals(dataset[["t", "a"]])
+
+
+@pytest.mark.parametrize(
+    "select_rows",
+    [
+        lambda _: _.sample(frac=0.5, random_state=32).sort_index(),
+        lambda _: _.sample(frac=0.5, random_state=32).reset_index(drop=True),
+        lambda _: _.iloc[1:],
+    ],
+)
+def test_publish_frame_memory_mapped_rows(tmpdir, select_rows):
+    """Check that memory-mapped datasets whose rows no longer match their file are shared"""
+    file_path = str(tmpdir.join("train.npy"))
+    np.save(file_path, np.arange(12, dtype=float).reshape(4, 3))
+    dataset = select_rows(read_dataset(file_path, memory_map=True, columns=["a", "b", "t"]))
+
+    with SharedDataPlane() as plane:
+        handle = plane.publish_frame(dataset)
+        assert isinstance(handle, SharedFrame)
+        assert handle.attach().equals(dataset)